@@ -1,6 +1,8 @@
-import { createSafeDsServices } from '@safe-ds/lang';
+import { createSafeDsServices, SafeDsServices } from '@safe-ds/lang';
+import { URI } from 'langium';
 import { NodeFileSystem } from 'langium/node';
-import { extractDocuments } from '../helpers/documents.js';
+import { extractDocuments, extractUris } from '../helpers/documents.js';
+import { runInWorkers } from '../helpers/workers.js';
 import { diagnosticToString, getDiagnostics } from '../helpers/diagnostics.js';
 import { Diagnostic, DiagnosticSeverity } from 'vscode-languageserver';
 import chalk from 'chalk';
@@ -11,9 +13,9 @@ export const check = async (fsPaths: string[], options: CheckOptions): Promise<v
 
     let errorCount = 0;
 
-    for (const document of await extractDocuments(services, fsPaths)) {
-        for (const diagnostic of getDiagnostics(document)) {
-            console.log(diagnosticToString(document.uri, diagnostic, options));
+    for (const { uri, diagnostics } of await checkDocuments(services, fsPaths, options)) {
+        for (const diagnostic of diagnostics) {
+            console.log(diagnosticToString(uri, diagnostic, options));
 
             if (isError(diagnostic, options)) {
                 errorCount++;
@@ -29,6 +31,20 @@ export const check = async (fsPaths: string[], options: CheckOptions): Promise<v
     }
 };
 
+const checkDocuments = async (
+    services: SafeDsServices,
+    fsPaths: string[],
+    options: CheckOptions,
+): Promise<{ uri: URI; diagnostics: Diagnostic[] }[]> => {
+    if (options.jobs > 1) {
+        const results = await runInWorkers(services, extractUris(services, fsPaths), { kind: 'check' }, options.jobs);
+        return results.map((it) => ({ uri: URI.parse(it.uri), diagnostics: it.diagnostics }));
+    } else {
+        const documents = await extractDocuments(services, fsPaths);
+        return documents.map((it) => ({ uri: it.uri, diagnostics: getDiagnostics(it) }));
+    }
+};
+
 /**
  * Command line options for the `check` command.
  */
@@ -37,6 +53,11 @@ export interface CheckOptions {
      * Whether the program should fail on warnings.
      */
     strict: boolean;
+
+    /**
+     * The number of worker threads that validate the documents.
+     */
+    jobs: number;
 }
 
 const isError = (diagnostic: Diagnostic, options: CheckOptions) => {
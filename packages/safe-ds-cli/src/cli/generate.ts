@@ -1,15 +1,66 @@
-import { createSafeDsServices } from '@safe-ds/lang';
+import { createSafeDsServices, FileReadMemoizationKey, SafeDsServices } from '@safe-ds/lang';
 import chalk from 'chalk';
 import { URI } from 'langium';
 import { NodeFileSystem } from 'langium/node';
 import fs from 'node:fs';
 import path from 'node:path';
-import { extractDocuments } from '../helpers/documents.js';
-import { makeParentDirectoriesSync } from '../helpers/files.js';
-import { exitIfDocumentHasErrors } from '../helpers/diagnostics.js';
+import { extractDocuments, extractUris, processPaths } from '../helpers/documents.js';
+import {
+    diagnosticToString,
+    exitIfDiagnosticsContainErrors,
+    exitIfDocumentHasErrors,
+    getDiagnostics,
+    isErrorDiagnostic,
+} from '../helpers/diagnostics.js';
+import {
+    GeneratedDocument,
+    generatePythonCode,
+    removeGeneratedDocuments,
+    writeGeneratedDocuments,
+} from '../helpers/generation.js';
+import { GenerationManifest, readManifest, writeManifest } from '../helpers/manifest.js';
+import { runInWorkers } from '../helpers/workers.js';
+
+/**
+ * The interval in milliseconds in which the input files are checked for changes in watch mode.
+ */
+const WATCH_INTERVAL_MS = 500;
 
 export const generate = async (fsPaths: string[], options: GenerateOptions): Promise<void> => {
     const services = (await createSafeDsServices(NodeFileSystem)).SafeDs;
+    const outDir = path.resolve(options.out);
+    const manifest = readManifest(outDir, {
+        sourcemaps: options.sourcemaps,
+        fileReadMemoizationKey: options.fileReadMemoizationKey,
+        optimize: options.optimize,
+        parallelize: options.parallelize,
+    });
+
+    // Remember the state of the inputs before generating, so changes during the first run are not missed
+    const fileStates = options.watch ? getFileStates(extractUris(services, fsPaths)) : new Map<string, string>();
+
+    let generatedDocuments: GeneratedDocument[];
+    if (options.jobs > 1) {
+        generatedDocuments = await generateInWorkers(services, fsPaths, outDir, manifest, options.jobs);
+    } else {
+        generatedDocuments = await generateInMainThread(services, fsPaths, outDir, manifest);
+    }
+
+    const newManifest = writeGeneratedDocuments(outDir, manifest, generatedDocuments);
+    writeManifest(outDir, newManifest);
+    console.log(chalk.green(`Python code generated successfully.`), summarize(generatedDocuments));
+
+    if (options.watch) {
+        watch(services, fsPaths, outDir, newManifest, fileStates);
+    }
+};
+
+const generateInMainThread = async (
+    services: SafeDsServices,
+    fsPaths: string[],
+    outDir: string,
+    manifest: GenerationManifest,
+): Promise<GeneratedDocument[]> => {
     const documents = await extractDocuments(services, fsPaths);
 
     // Exit if any document has errors before generating code
@@ -18,22 +69,140 @@ export const generate = async (fsPaths: string[], options: GenerateOptions): Pro
     }
 
     // Generate code
+    return generatePythonCode(services, documents, documents, { outDir, manifest });
+};
+
+const generateInWorkers = async (
+    services: SafeDsServices,
+    fsPaths: string[],
+    outDir: string,
+    manifest: GenerationManifest,
+    jobs: number,
+): Promise<GeneratedDocument[]> => {
+    const uris = extractUris(services, fsPaths);
+    const results = await runInWorkers(services, uris, { kind: 'generate', outDir, manifest }, jobs);
+
+    // Exit if any document has errors before writing code. Workers only generate code if none of their documents
+    // has errors, so we must not write anything unless all documents are free of errors.
+    for (const result of results) {
+        exitIfDiagnosticsContainErrors(URI.parse(result.uri), result.diagnostics);
+    }
+
+    return results.map((it) => it.generatedDocument!);
+};
+
+// Watch mode ----------------------------------------------------------------------------------------------------------
+
+/**
+ * Regenerates code whenever an input file changes. Documents are kept in memory, so only changed documents and the
+ * documents that depend on them are rebuilt. The manifest ensures that code is only generated for documents whose
+ * inputs changed. Since it also holds the options of the generator, code is generated the same way as in the first run.
+ */
+const watch = (
+    services: SafeDsServices,
+    fsPaths: string[],
+    outDir: string,
+    initialManifest: GenerationManifest,
+    initialFileStates: Map<string, string>,
+): void => {
+    const documentBuilder = services.shared.workspace.DocumentBuilder;
+    documentBuilder.updateBuildOptions.validation = true;
+
+    let manifest = initialManifest;
+    let fileStates = initialFileStates;
+    let isLoaded = false;
+    let isRunning = false;
+
+    console.log(chalk.blue(`Watching for changes...`));
+
+    setInterval(async () => {
+        if (isRunning) {
+            return;
+        }
+
+        const uris = processPaths(services, fsPaths);
+        if (uris.isErr) {
+            console.error(chalk.red(uris.error.message));
+            return;
+        }
+
+        const newFileStates = getFileStates(uris.value);
+        const changed = uris.value.filter((it) => newFileStates.get(it.toString()) !== fileStates.get(it.toString()));
+        const deleted = Array.from(fileStates.keys())
+            .filter((it) => !newFileStates.has(it))
+            .map((it) => URI.parse(it));
+        fileStates = newFileStates;
+
+        if (changed.length === 0 && deleted.length === 0) {
+            return;
+        }
+
+        isRunning = true;
+        try {
+            // The first run might have happened in workers, so the main thread must load all documents once
+            await documentBuilder.update(isLoaded ? changed : uris.value, deleted);
+            isLoaded = true;
+
+            manifest = regenerate(services, uris.value, deleted, outDir, manifest);
+        } catch (error) {
+            console.error(chalk.red(String(error)));
+        } finally {
+            isRunning = false;
+        }
+    }, WATCH_INTERVAL_MS);
+};
+
+const regenerate = (
+    services: SafeDsServices,
+    uris: URI[],
+    deleted: URI[],
+    outDir: string,
+    manifest: GenerationManifest,
+): GenerationManifest => {
+    const langiumDocuments = services.shared.workspace.LangiumDocuments;
+    const documents = uris.map((it) => langiumDocuments.getDocument(it)).filter((it) => it !== undefined);
+
+    // Keep the old code if there are errors
+    let errorCount = 0;
     for (const document of documents) {
-        const generatedFiles = services.generation.PythonGenerator.generate(document, {
-            destination: URI.file(path.resolve(options.out)),
-            createSourceMaps: options.sourcemaps,
-            targetStatements: undefined,
-            disableRunnerIntegration: false,
-        });
-
-        for (const file of generatedFiles) {
-            const fsPath = URI.parse(file.uri).fsPath;
-            makeParentDirectoriesSync(fsPath);
-            fs.writeFileSync(fsPath, file.getText());
+        for (const error of getDiagnostics(document).filter(isErrorDiagnostic)) {
+            console.error(diagnosticToString(document.uri, error));
+            errorCount++;
         }
     }
+    if (errorCount > 0) {
+        console.error(chalk.red(`Found ${errorCount} ${errorCount === 1 ? 'error' : 'errors'}.`));
+        return manifest;
+    }
+
+    const generatedDocuments = generatePythonCode(services, documents, documents, { outDir, manifest });
+    let newManifest = writeGeneratedDocuments(outDir, manifest, generatedDocuments);
+    newManifest = removeGeneratedDocuments(outDir, newManifest, deleted);
+    writeManifest(outDir, newManifest);
 
-    console.log(chalk.green(`Python code generated successfully.`));
+    console.log(chalk.green(`Python code generated successfully.`), summarize(generatedDocuments));
+    return newManifest;
+};
+
+/**
+ * Returns a string that changes whenever the content of a file changes, keyed by the URI of the file.
+ */
+const getFileStates = (uris: URI[]): Map<string, string> => {
+    const result = new Map<string, string>();
+    for (const uri of uris) {
+        try {
+            const stat = fs.statSync(uri.fsPath);
+            result.set(uri.toString(), `${stat.mtimeMs}:${stat.size}`);
+        } catch {
+            // The file was deleted in the meantime
+        }
+    }
+    return result;
+};
+
+const summarize = (generatedDocuments: GeneratedDocument[]): string => {
+    const upToDateCount = generatedDocuments.filter((it) => it.files === undefined).length;
+    return chalk.gray(`(${upToDateCount} of ${generatedDocuments.length} files were up to date)`);
 };
 
 /**
@@ -42,4 +211,29 @@ export const generate = async (fsPaths: string[], options: GenerateOptions): Pro
 export interface GenerateOptions {
     out: string;
     sourcemaps: boolean;
+
+    /**
+     * How memoized calls that read files detect whether the files changed.
+     */
+    fileReadMemoizationKey: FileReadMemoizationKey;
+
+    /**
+     * Whether the generated code should skip computations whose results are never used.
+     */
+    optimize: boolean;
+
+    /**
+     * Whether independent statements of pipelines should be executed in parallel.
+     */
+    parallelize: boolean;
+
+    /**
+     * The number of worker threads that validate the documents and generate code for them.
+     */
+    jobs: number;
+
+    /**
+     * Whether code should be regenerated whenever an input file changes.
+     */
+    watch: boolean;
 }
@@ -1,23 +1,38 @@
-import { Command } from 'commander';
-import { createRequire } from 'node:module';
-import { fileURLToPath } from 'node:url';
+import { FileReadMemoizationKey } from '@safe-ds/lang';
+import { Command, InvalidArgumentError } from 'commander';
 import { generate } from './generate.js';
 import { check } from './check.js';
 import { format } from './format.js';
 import { doDocument } from './document.js';
+import { getCliVersion } from '../helpers/version.js';
 
 const program = new Command();
 
 // Version command
-const packagePath = fileURLToPath(new URL('../../package.json', import.meta.url));
-const require = createRequire(import.meta.url);
-program.version(require(packagePath).version);
+program.version(getCliVersion());
+
+// Option parsers
+const parseJobs = (value: string): number => {
+    const result = Number(value);
+    if (!Number.isInteger(result) || result < 1) {
+        throw new InvalidArgumentError('Must be a positive integer.');
+    }
+    return result;
+};
+
+const parseFileReadMemoizationKey = (value: string): FileReadMemoizationKey => {
+    if (value !== 'mtime' && value !== 'content_hash') {
+        throw new InvalidArgumentError("Must be 'mtime' or 'content_hash'.");
+    }
+    return value;
+};
 
 // Check command
 program
     .command('check')
     .argument('<paths...>', `list of files or directories to check`)
     .option('-s, --strict', 'whether the program should fail on warnings', false)
+    .option('-j, --jobs <n>', 'number of worker threads that validate files in parallel', parseJobs, 1)
     .description('check Safe-DS code')
     .action(check);
 
@@ -42,6 +57,16 @@ program
     .argument('<paths...>', `list of files or directories to generate Python code for`)
     .option('-o, --out <dir>', 'destination directory for generation', 'generated')
     .option('-s, --sourcemaps', 'whether source maps should be generated', false)
+    .option('-j, --jobs <n>', 'number of worker threads that generate code in parallel', parseJobs, 1)
+    .option(
+        '--file-read-memoization-key <key>',
+        "how memoized calls detect changed files ('mtime' or 'content_hash')",
+        parseFileReadMemoizationKey,
+        'mtime',
+    )
+    .option('--optimize', 'whether computations whose results are never used should be removed', false)
+    .option('--parallelize', 'whether independent statements of pipelines should run in parallel', false)
+    .option('-w, --watch', 'whether code should be regenerated when files change', false)
     .description('generate Python code')
     .action(generate);
 
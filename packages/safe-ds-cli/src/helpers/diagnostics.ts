@@ -89,11 +89,18 @@ const colorizeBySeverity = (diagnostic: Diagnostic, message: string, options: Di
  * Exits the process if the given document has errors.
  */
 export const exitIfDocumentHasErrors = function (document: LangiumDocument): void {
-    const errors = getErrors(document);
+    exitIfDiagnosticsContainErrors(document.uri, getDiagnostics(document));
+};
+
+/**
+ * Exits the process if the given diagnostics of the file with the given URI contain errors.
+ */
+export const exitIfDiagnosticsContainErrors = function (uri: URI, diagnostics: Diagnostic[]): void {
+    const errors = diagnostics.filter(isErrorDiagnostic);
     if (errors.length > 0) {
-        console.error(chalk.red(`The file '${uriToRelativePath(document.uri)}' has errors:`));
+        console.error(chalk.red(`The file '${uriToRelativePath(uri)}' has errors:`));
         for (const error of errors) {
-            console.error(diagnosticToString(document.uri, error));
+            console.error(diagnosticToString(uri, error));
         }
         process.exit(ExitCode.FileHasErrors);
     }
@@ -113,8 +120,15 @@ export const exitIfDocumentHasSyntaxErrors = function (document: LangiumDocument
     }
 };
 
+/**
+ * Returns whether the given diagnostic is an error.
+ */
+export const isErrorDiagnostic = (diagnostic: Diagnostic): boolean => {
+    return diagnostic.severity === DiagnosticSeverity.Error;
+};
+
 const getErrors = (document: LangiumDocument): Diagnostic[] => {
-    return getDiagnostics(document).filter((it) => it.severity === DiagnosticSeverity.Error);
+    return getDiagnostics(document).filter(isErrorDiagnostic);
 };
 
 const getSyntaxErrors = (document: LangiumDocument): Diagnostic[] => {
@@ -19,15 +19,24 @@ export const extractDocuments = async function (
     const documentBuilder = services.shared.workspace.DocumentBuilder;
 
     // Build documents
+    const uris = extractUris(services, fsPaths);
+    const documents = await Promise.all(uris.map((uri) => langiumDocuments.getOrCreateDocument(uri)));
+    await documentBuilder.build(documents, { validation: true });
+    return documents;
+};
+
+/**
+ * Extracts the URIs of the documents at the given paths without loading them. Exits the process if the paths are
+ * invalid.
+ */
+export const extractUris = function (services: LangiumServices, fsPaths: string[]): URI[] {
     const uris = processPaths(services, fsPaths);
     if (uris.isErr) {
         console.error(chalk.red(uris.error.message));
         process.exit(uris.error.code);
     }
 
-    const documents = await Promise.all(uris.value.map((uri) => langiumDocuments.getOrCreateDocument(uri)));
-    await documentBuilder.build(documents, { validation: true });
-    return documents;
+    return uris.value;
 };
 
 /**
@@ -0,0 +1,126 @@
+import { SafeDsServices } from '@safe-ds/lang';
+import { LangiumDocument, URI } from 'langium';
+import {
+    computeDocumentHashes,
+    DocumentHashes,
+    GenerationManifest,
+    isUpToDate,
+    writeGeneratedFiles,
+} from './manifest.js';
+
+/**
+ * Generates Python code for the given documents. Documents whose files are up to date according to the manifest are
+ * skipped.
+ *
+ * @param services The services of the language.
+ * @param allDocuments All input documents. They must be linked, so their dependencies are known.
+ * @param documentsToGenerate The documents to generate code for. This must be a subset of `allDocuments`.
+ * @param options Options for the generation.
+ */
+export const generatePythonCode = (
+    services: SafeDsServices,
+    allDocuments: LangiumDocument[],
+    documentsToGenerate: LangiumDocument[],
+    options: GeneratePythonCodeOptions,
+): GeneratedDocument[] => {
+    const hashes = computeDocumentHashes(services, allDocuments);
+
+    return documentsToGenerate.map((document) => {
+        const uri = document.uri.toString();
+        const documentHashes = hashes.get(uri)!;
+
+        if (isUpToDate(options.manifest.documents[uri], documentHashes, options.outDir)) {
+            return { uri, hashes: documentHashes, files: undefined };
+        }
+
+        const files = services.generation.PythonGenerator.generate(document, {
+            destination: URI.file(options.outDir),
+            createSourceMaps: options.manifest.sourcemaps,
+            targetStatements: undefined,
+            disableRunnerIntegration: false,
+            fileReadMemoizationKey: options.manifest.fileReadMemoizationKey,
+            optimize: options.manifest.optimize,
+            parallelize: options.manifest.parallelize,
+        }).map((file) => ({ fsPath: URI.parse(file.uri).fsPath, text: file.getText() }));
+
+        return { uri, hashes: documentHashes, files };
+    });
+};
+
+/**
+ * Writes the files of the given documents and returns the updated manifest. Entries of documents that are not part of
+ * this run are kept, so running the generator on a subset of the inputs does not discard the others.
+ */
+export const writeGeneratedDocuments = (
+    outDir: string,
+    manifest: GenerationManifest,
+    generatedDocuments: GeneratedDocument[],
+): GenerationManifest => {
+    const documents = { ...manifest.documents };
+
+    for (const { uri, hashes, files } of generatedDocuments) {
+        if (files) {
+            const outputs = writeGeneratedFiles(outDir, files, documents[uri]);
+            documents[uri] = { ...hashes, outputs };
+        }
+    }
+
+    return { ...manifest, documents };
+};
+
+/**
+ * Deletes the files that were generated for the given documents and returns the updated manifest.
+ */
+export const removeGeneratedDocuments = (
+    outDir: string,
+    manifest: GenerationManifest,
+    uris: URI[],
+): GenerationManifest => {
+    const documents = { ...manifest.documents };
+
+    for (const uri of uris.map((it) => it.toString())) {
+        if (documents[uri]) {
+            writeGeneratedFiles(outDir, [], documents[uri]);
+            delete documents[uri];
+        }
+    }
+
+    return { ...manifest, documents };
+};
+
+/**
+ * Options for the `generatePythonCode` function.
+ */
+export interface GeneratePythonCodeOptions {
+    /**
+     * The absolute path of the output directory.
+     */
+    readonly outDir: string;
+
+    /**
+     * The manifest of the previous run. It also holds the options that are passed to the Python generator, so all
+     * runs that share a manifest generate code the same way.
+     */
+    readonly manifest: GenerationManifest;
+}
+
+/**
+ * The result of generating Python code for a document.
+ */
+export interface GeneratedDocument {
+    readonly uri: string;
+    readonly hashes: DocumentHashes;
+
+    /**
+     * The generated files, or `undefined` if the files of the last run are still up to date.
+     */
+    readonly files: GeneratedFile[] | undefined;
+}
+
+/**
+ * A generated file.
+ */
+export interface GeneratedFile {
+    readonly fsPath: string;
+    readonly text: string;
+}
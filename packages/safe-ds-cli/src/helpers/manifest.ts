@@ -0,0 +1,201 @@
+import { FileReadMemoizationKey, SafeDsServices } from '@safe-ds/lang';
+import { LangiumDocument } from 'langium';
+import crypto from 'node:crypto';
+import fs from 'node:fs';
+import path from 'node:path';
+import { makeParentDirectoriesSync } from './files.js';
+import { type GeneratedFile } from './generation.js';
+import { getCliVersion } from './version.js';
+
+/**
+ * The name of the manifest file in the output directory.
+ */
+export const MANIFEST_FILE_NAME = '.safe-ds-manifest.json';
+
+/**
+ * The version of the manifest format. Manifests with another version are ignored.
+ */
+const MANIFEST_VERSION = 2;
+
+/**
+ * Records which inputs were used to generate the files in an output directory. Generation can be skipped for a
+ * document if neither its content nor the content of the documents it references changed since the last run.
+ * References to builtin declarations are not tracked. Instead, the manifest is discarded if the version of the CLI
+ * changes.
+ */
+export interface GenerationManifest extends GeneratorOptions {
+    readonly version: number;
+    readonly cliVersion: string;
+
+    /**
+     * Maps the URI of an input document to information about its last generation.
+     */
+    readonly documents: Record<string, ManifestDocumentEntry>;
+}
+
+/**
+ * The options that are passed to the Python generator. Files that were generated with other options are outdated.
+ */
+export interface GeneratorOptions {
+    readonly sourcemaps: boolean;
+    readonly fileReadMemoizationKey: FileReadMemoizationKey;
+    readonly optimize: boolean;
+    readonly parallelize: boolean;
+}
+
+/**
+ * Information about the last generation of code for a document.
+ */
+export interface ManifestDocumentEntry extends DocumentHashes {
+    /**
+     * Maps the paths of the generated files, relative to the output directory and with `/` as separator, to the hashes
+     * of their content.
+     */
+    readonly outputs: Record<string, string>;
+}
+
+/**
+ * The hashes that determine whether code for a document must be generated again.
+ */
+export interface DocumentHashes {
+    /**
+     * The hash of the content of the document.
+     */
+    readonly contentHash: string;
+
+    /**
+     * The hash of the content of all input documents the document references, directly or indirectly.
+     */
+    readonly dependencyHash: string;
+}
+
+/**
+ * Reads the manifest in the given output directory. If it does not exist, cannot be read, or was created with other
+ * options or another version of the CLI, an empty manifest is returned.
+ */
+export const readManifest = (outDir: string, options: GeneratorOptions): GenerationManifest => {
+    const emptyManifest: GenerationManifest = {
+        version: MANIFEST_VERSION,
+        cliVersion: getCliVersion(),
+        sourcemaps: options.sourcemaps,
+        fileReadMemoizationKey: options.fileReadMemoizationKey,
+        optimize: options.optimize,
+        parallelize: options.parallelize,
+        documents: {},
+    };
+
+    const manifestPath = path.join(outDir, MANIFEST_FILE_NAME);
+    if (!fs.existsSync(manifestPath)) {
+        return emptyManifest;
+    }
+
+    try {
+        const manifest: GenerationManifest = JSON.parse(fs.readFileSync(manifestPath, 'utf-8'));
+        if (
+            manifest.version !== emptyManifest.version ||
+            manifest.cliVersion !== emptyManifest.cliVersion ||
+            manifest.sourcemaps !== options.sourcemaps ||
+            manifest.fileReadMemoizationKey !== options.fileReadMemoizationKey ||
+            manifest.optimize !== options.optimize ||
+            manifest.parallelize !== options.parallelize
+        ) {
+            return emptyManifest;
+        }
+
+        return manifest;
+    } catch {
+        return emptyManifest;
+    }
+};
+
+/**
+ * Writes the manifest to the given output directory.
+ */
+export const writeManifest = (outDir: string, manifest: GenerationManifest): void => {
+    const manifestPath = path.join(outDir, MANIFEST_FILE_NAME);
+    makeParentDirectoriesSync(manifestPath);
+    fs.writeFileSync(manifestPath, JSON.stringify(manifest, null, 4));
+};
+
+/**
+ * Computes the hashes of the given input documents. Only references to other input documents are considered for the
+ * dependency hash.
+ */
+export const computeDocumentHashes = (
+    services: SafeDsServices,
+    documents: LangiumDocument[],
+): Map<string, DocumentHashes> => {
+    const documentDependencies = services.workspace.DocumentDependencies;
+
+    const contentHashes = new Map<string, string>();
+    for (const document of documents) {
+        contentHashes.set(document.uri.toString(), hashText(document.textDocument.getText()));
+    }
+
+    const result = new Map<string, DocumentHashes>();
+    for (const [uri, contentHash] of contentHashes) {
+        const dependencies = Array.from(documentDependencies.getReferencedDocuments([uri]))
+            .filter((it) => contentHashes.has(it))
+            .sort()
+            .map((it) => `${it}\n${contentHashes.get(it)}`);
+
+        result.set(uri, { contentHash, dependencyHash: hashText(dependencies.join('\n')) });
+    }
+    return result;
+};
+
+/**
+ * Returns whether the files generated for a document are up to date. This is the case if the hashes of the document
+ * did not change and all generated files still exist.
+ */
+export const isUpToDate = (
+    entry: ManifestDocumentEntry | undefined,
+    hashes: DocumentHashes,
+    outDir: string,
+): boolean => {
+    return (
+        entry !== undefined &&
+        entry.contentHash === hashes.contentHash &&
+        entry.dependencyHash === hashes.dependencyHash &&
+        Object.keys(entry.outputs).every((it) => fs.existsSync(path.join(outDir, it)))
+    );
+};
+
+/**
+ * Writes the files that were generated for a document. Files are only written if their content changed, so their
+ * modification time is kept otherwise. Files that were generated for the document in the last run but not in this one
+ * are deleted.
+ *
+ * @returns The outputs that should be stored in the manifest.
+ */
+export const writeGeneratedFiles = (
+    outDir: string,
+    files: GeneratedFile[],
+    previousEntry: ManifestDocumentEntry | undefined,
+): Record<string, string> => {
+    const outputs: Record<string, string> = {};
+
+    for (const { fsPath, text } of files) {
+        const outputPath = path.relative(outDir, fsPath).split(path.sep).join('/');
+        const hash = hashText(text);
+        outputs[outputPath] = hash;
+
+        if (!fs.existsSync(fsPath) || fs.readFileSync(fsPath, 'utf-8') !== text) {
+            makeParentDirectoriesSync(fsPath);
+            fs.writeFileSync(fsPath, text);
+        }
+    }
+
+    // Remove stale outputs
+    for (const outputPath of Object.keys(previousEntry?.outputs ?? {})) {
+        if (!(outputPath in outputs)) {
+            fs.rmSync(path.join(outDir, outputPath), { force: true });
+        }
+    }
+
+    return outputs;
+};
+
+const hashText = (text: string): string => {
+    return crypto.createHash('sha256').update(text).digest('hex');
+};
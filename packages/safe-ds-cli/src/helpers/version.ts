@@ -0,0 +1,11 @@
+import { createRequire } from 'node:module';
+import { fileURLToPath } from 'node:url';
+
+/**
+ * Returns the version of the CLI.
+ */
+export const getCliVersion = (): string => {
+    const packagePath = fileURLToPath(new URL('../../package.json', import.meta.url));
+    const require = createRequire(import.meta.url);
+    return require(packagePath).version;
+};
@@ -0,0 +1,50 @@
+import { createSafeDsServices } from '@safe-ds/lang';
+import { URI } from 'langium';
+import { NodeFileSystem } from 'langium/node';
+import { parentPort, workerData } from 'node:worker_threads';
+import { isErrorDiagnostic } from './diagnostics.js';
+import { generatePythonCode } from './generation.js';
+import { WorkerDocumentResult, WorkerInput } from './workers.js';
+
+/**
+ * The entry point of a worker that is started by `runInWorkers`.
+ */
+const run = async (input: WorkerInput): Promise<WorkerDocumentResult[]> => {
+    const services = (await createSafeDsServices(NodeFileSystem)).SafeDs;
+    const langiumDocuments = services.shared.workspace.LangiumDocuments;
+    const documentBuilder = services.shared.workspace.DocumentBuilder;
+    const documentValidator = services.validation.DocumentValidator;
+
+    // Own documents might reference the other documents, so all of them must be indexed and linked
+    const documents = await Promise.all(
+        input.uris.map((uri) => langiumDocuments.getOrCreateDocument(URI.parse(uri))),
+    );
+    await documentBuilder.build(documents, { validation: false });
+
+    // Validation is the expensive part, so we only do it for our own documents
+    const ownDocuments = input.ownIndices.map((index) => documents[index]!);
+    for (const document of ownDocuments) {
+        document.diagnostics = await documentValidator.validateDocument(document);
+    }
+
+    // Generate code only if it is not discarded anyway
+    const task = input.task;
+    const hasErrors = ownDocuments.some((document) => document.diagnostics!.some(isErrorDiagnostic));
+    const generatedDocuments =
+        task.kind === 'generate' && !hasErrors
+            ? generatePythonCode(services, documents, ownDocuments, task)
+            : ownDocuments.map(() => undefined);
+
+    return ownDocuments.map((document, index) => ({
+        uri: document.uri.toString(),
+        diagnostics: document.diagnostics!,
+        generatedDocument: generatedDocuments[index],
+    }));
+};
+
+/* c8 ignore start */
+if (parentPort) {
+    const port = parentPort;
+    run(workerData).then((result) => port.postMessage(result));
+}
+/* c8 ignore stop */
@@ -0,0 +1,159 @@
+import { SafeDsServices } from '@safe-ds/lang';
+import { URI } from 'langium';
+import { Worker } from 'node:worker_threads';
+import { Diagnostic } from 'vscode-languageserver';
+import { type GeneratedDocument } from './generation.js';
+import { type GenerationManifest } from './manifest.js';
+
+/**
+ * Processes the documents with the given URIs on multiple worker threads. Each worker validates and generates code
+ * for its own partition of the documents. It only loads the documents that its partition depends on (see
+ * {@link createWorkerInputs}). The builtin files are loaded from the snapshot that is shared by all workers, so they
+ * are not parsed again by each worker.
+ *
+ * @param services The services of the language.
+ * @param uris The URIs of the documents. They must already be sorted.
+ * @param task The task that should be performed for each document.
+ * @param jobs The maximum number of workers.
+ *
+ * @returns The results for the documents, in the same order as the given URIs.
+ */
+export const runInWorkers = async (
+    services: SafeDsServices,
+    uris: URI[],
+    task: WorkerTask,
+    jobs: number,
+): Promise<WorkerDocumentResult[]> => {
+    const workerCount = Math.max(1, Math.min(jobs, uris.length));
+
+    // Assign documents round-robin, so neighbouring files, which are often similar in size, end up on different workers
+    const partitions: number[][] = Array.from({ length: workerCount }, () => []);
+    uris.forEach((_, index) => partitions[index % workerCount]!.push(index));
+
+    const inputs = await createWorkerInputs(services, uris, partitions, task);
+    const partitionResults = await Promise.all(inputs.map(runWorker));
+
+    // Restore the sorted order, so the output does not depend on the number of workers
+    const result: WorkerDocumentResult[] = new Array(uris.length);
+    partitions.forEach((ownIndices, workerIndex) => {
+        ownIndices.forEach((documentIndex, resultIndex) => {
+            result[documentIndex] = partitionResults[workerIndex]![resultIndex]!;
+        });
+    });
+    return result;
+};
+
+/**
+ * Creates the inputs of the workers for the given partitions. The documents of a partition depend on the documents in
+ * the packages they can see without qualification and on the documents they reference, directly or indirectly. A
+ * worker needs all of them to link and validate its own documents, but no others.
+ *
+ * To find these documents, all documents are loaded and linked once, but they are not validated.
+ *
+ * @param services The services of the language.
+ * @param uris The URIs of the documents.
+ * @param partitions The indices of the documents in `uris` that each worker is responsible for.
+ * @param task The task that should be performed for each document.
+ */
+export const createWorkerInputs = async (
+    services: SafeDsServices,
+    uris: URI[],
+    partitions: number[][],
+    task: WorkerTask,
+): Promise<WorkerInput[]> => {
+    const langiumDocuments = services.shared.workspace.LangiumDocuments;
+    const documentBuilder = services.shared.workspace.DocumentBuilder;
+    const documentDependencies = services.workspace.DocumentDependencies;
+
+    const documents = await Promise.all(uris.map((uri) => langiumDocuments.getOrCreateDocument(uri)));
+    await documentBuilder.build(documents, { validation: false });
+
+    const uriStrings = uris.map((it) => it.toString());
+    return partitions.map((ownIndices) => {
+        const ownUris = ownIndices.map((index) => uriStrings[index]!);
+        const visibleUris = documentDependencies.getDocumentsInVisiblePackages(ownUris);
+        const requiredUris = new Set([...visibleUris, ...documentDependencies.getReferencedDocuments(visibleUris)]);
+
+        // Builtin files are not part of the input, since each worker loads them anyway. The order of the documents is
+        // kept, so the output does not depend on the number of workers.
+        const workerUris = uriStrings.filter((it) => requiredUris.has(it));
+        return {
+            task,
+            uris: workerUris,
+            ownIndices: ownUris.map((it) => workerUris.indexOf(it)),
+        };
+    });
+};
+
+const runWorker = (input: WorkerInput): Promise<WorkerDocumentResult[]> => {
+    return new Promise((resolve, reject) => {
+        const worker = new Worker(new URL('./workerMain.js', import.meta.url), { workerData: input });
+        worker.once('message', resolve);
+        worker.once('error', reject);
+        worker.once('exit', (code) => {
+            if (code !== 0) {
+                reject(new Error(`Worker stopped with exit code ${code}.`));
+            }
+        });
+    });
+};
+
+/**
+ * The task a worker performs for each of its documents.
+ */
+export type WorkerTask = CheckWorkerTask | GenerateWorkerTask;
+
+/**
+ * Validate the documents.
+ */
+export interface CheckWorkerTask {
+    readonly kind: 'check';
+}
+
+/**
+ * Validate the documents and generate Python code for them. Code is only generated if none of the documents of the
+ * worker has errors.
+ */
+export interface GenerateWorkerTask {
+    readonly kind: 'generate';
+
+    /**
+     * The absolute path of the output directory.
+     */
+    readonly outDir: string;
+
+    /**
+     * The manifest of the previous run. Documents whose files are up to date are skipped.
+     */
+    readonly manifest: GenerationManifest;
+}
+
+/**
+ * The input that is passed to a worker.
+ */
+export interface WorkerInput {
+    readonly task: WorkerTask;
+
+    /**
+     * The URIs of the documents the worker must load. These are its own documents and the documents they depend on.
+     */
+    readonly uris: string[];
+
+    /**
+     * The indices of the documents in `uris` the worker is responsible for.
+     */
+    readonly ownIndices: number[];
+}
+
+/**
+ * The result a worker computed for one of its documents.
+ */
+export interface WorkerDocumentResult {
+    readonly uri: string;
+    readonly diagnostics: Diagnostic[];
+
+    /**
+     * The generated code. This is `undefined` if the task is `check` or code could not be generated.
+     */
+    readonly generatedDocument: GeneratedDocument | undefined;
+}
@@ -1,7 +1,9 @@
-import { execSync, spawnSync } from 'node:child_process';
+import { execSync, spawn, spawnSync } from 'node:child_process';
 import fs from 'node:fs';
+import os from 'node:os';
+import path from 'node:path';
 import { fileURLToPath } from 'url';
-import { afterAll, beforeAll, describe, expect, it } from 'vitest';
+import { afterAll, beforeAll, describe, expect, it, vi } from 'vitest';
 import { ExitCode } from '../../src/cli/exitCode.js';
 
 const projectRoot = new URL('../..', import.meta.url);
@@ -80,6 +82,20 @@ describe('safe-ds', () => {
             expect(process.status).toBe(ExitCode.FileHasErrors);
         });
 
+        it('should show the same errors in the same order if multiple jobs are used', () => {
+            const singleThreadedProcess = spawnCheckProcess([], ['.']);
+            const multiThreadedProcess = spawnCheckProcess(['-j', '2'], ['.']);
+            expect(multiThreadedProcess.stdout.toString()).toBe(singleThreadedProcess.stdout.toString());
+            expect(multiThreadedProcess.stderr.toString()).toBe(singleThreadedProcess.stderr.toString());
+            expect(multiThreadedProcess.status).toBe(ExitCode.FileHasErrors);
+        });
+
+        it('should show an error if the number of jobs is invalid', () => {
+            const process = spawnCheckProcess(['-j', '0'], ['correct.sdsdev']);
+            expect(process.stderr.toString()).toContain('Must be a positive integer.');
+            expect(process.status).not.toBe(ExitCode.Success);
+        });
+
         it('should show an error if the file does not exist', () => {
             const process = spawnCheckProcess([], ['missing.sdsdev']);
             expect(process.stderr.toString()).toMatch(/Path .* does not exist\./u);
@@ -244,6 +260,85 @@ describe('safe-ds', () => {
             expect(process.status).toBe(ExitCode.Success);
         });
 
+        it('should skip documents whose inputs did not change', () => {
+            const outputStats = () => {
+                const manifestPath = new URL('generated/.safe-ds-manifest.json', testResourcesRoot);
+                const manifest = JSON.parse(fs.readFileSync(manifestPath, 'utf-8'));
+                return Object.values<any>(manifest.documents).flatMap((entry) =>
+                    Object.keys(entry.outputs).map((it) => fs.statSync(new URL(`generated/${it}`, testResourcesRoot))),
+                );
+            };
+
+            spawnGenerateProcess([], ['correct.sdsdev']);
+            const statsBefore = outputStats();
+
+            const process = spawnGenerateProcess([], ['correct.sdsdev']);
+            expect(process.stdout.toString()).toContain('1 of 1 files were up to date');
+            expect(process.status).toBe(ExitCode.Success);
+            expect(outputStats().map((it) => it.mtimeMs)).toStrictEqual(statsBefore.map((it) => it.mtimeMs));
+        });
+
+        it('should generate Python code again if the optimization is toggled', () => {
+            spawnGenerateProcess([], ['correct.sdsdev']);
+
+            const process = spawnGenerateProcess(['--optimize'], ['correct.sdsdev']);
+            expect(process.stdout.toString()).toContain('0 of 1 files were up to date');
+            expect(process.status).toBe(ExitCode.Success);
+        });
+
+        it('should generate Python code if multiple jobs are used', () => {
+            const process = spawnGenerateProcess(['-j', '2'], ['correct.sdsdev', 'references builtins.sdsdev']);
+            expect(process.stdout.toString()).toContain('Python code generated successfully.');
+            expect(process.status).toBe(ExitCode.Success);
+        });
+
+        it('should show an error if a Safe-DS file has errors and multiple jobs are used', () => {
+            const process = spawnGenerateProcess(['-j', '2'], ['.']);
+            expect(process.stderr.toString()).toContain(
+                "Could not find a declaration named 'Unresolved' in this context.",
+            );
+            expect(process.status).toBe(ExitCode.FileHasErrors);
+        });
+
+        it('should regenerate Python code with the same options if a file changes in watch mode', async () => {
+            const inputDir = fs.mkdtempSync(path.join(os.tmpdir(), 'safe-ds-watch-'));
+            const inputPath = path.join(inputDir, 'watched.sdsdev');
+            const watchOut = path.join(inputDir, 'generated');
+            fs.writeFileSync(inputPath, 'package test\n\npipeline myPipeline {}\n');
+
+            const readManifest = () =>
+                JSON.parse(fs.readFileSync(path.join(watchOut, '.safe-ds-manifest.json'), 'utf-8'));
+            const readGeneratedCode = () =>
+                Object.values<any>(readManifest().documents)
+                    .flatMap((entry) => Object.keys(entry.outputs))
+                    .map((it) => fs.readFileSync(path.join(watchOut, it), 'utf-8'))
+                    .join('\n');
+
+            const process = spawn('node', ['./bin/cli', 'generate', '-o', watchOut, '--parallelize', '-w', inputPath], {
+                cwd: projectRoot,
+            });
+            let stdout = '';
+            process.stdout.on('data', (data) => (stdout += data.toString()));
+
+            try {
+                await vi.waitFor(() => expect(stdout).toContain('Watching for changes...'), {
+                    timeout: 30000,
+                    interval: 100,
+                });
+                expect(readGeneratedCode()).toContain('myPipeline');
+
+                fs.writeFileSync(inputPath, 'package test\n\npipeline myChangedPipeline {}\n');
+                await vi.waitFor(() => expect(readGeneratedCode()).toContain('myChangedPipeline'), {
+                    timeout: 30000,
+                    interval: 100,
+                });
+                expect(readManifest().parallelize).toBeTruthy();
+            } finally {
+                process.kill();
+                fs.rmSync(inputDir, { recursive: true, force: true });
+            }
+        }, 60000);
+
         it('should show an error if the file does not exist', () => {
             const process = spawnGenerateProcess([], ['missing.sdsdev']);
             expect(process.stderr.toString()).toMatch(/Path .* does not exist./u);
@@ -0,0 +1,36 @@
+import { createSafeDsServices } from '@safe-ds/lang';
+import { URI } from 'langium';
+import { NodeFileSystem } from 'langium/node';
+import { fileURLToPath } from 'node:url';
+import { describe, expect, it } from 'vitest';
+import { createWorkerInputs } from '../../src/helpers/workers.js';
+
+describe('createWorkerInputs', async () => {
+    const services = (await createSafeDsServices(NodeFileSystem)).SafeDs;
+    const testResourcesRoot = new URL('../resources/workers/', import.meta.url);
+    const uriOf = (fileName: string) => URI.file(fileURLToPath(new URL(fileName, testResourcesRoot)));
+
+    const declaring = uriOf('declaring.sdsdev');
+    const referencing = uriOf('referencing.sdsdev');
+    const samePackage = uriOf('samePackage.sdsdev');
+    const unrelated = uriOf('unrelated.sdsdev');
+    const uris = [declaring, referencing, samePackage, unrelated];
+
+    const inputs = await createWorkerInputs(services, uris, [[1], [3]], { kind: 'check' });
+
+    it('should include referenced documents', () => {
+        expect(inputs[0]).toStrictEqual({
+            task: { kind: 'check' },
+            uris: [declaring.toString(), referencing.toString()],
+            ownIndices: [1],
+        });
+    });
+
+    it('should include documents in the same package', () => {
+        expect(inputs[1]).toStrictEqual({
+            task: { kind: 'check' },
+            uris: [samePackage.toString(), unrelated.toString()],
+            ownIndices: [1],
+        });
+    });
+});
@@ -1 +1,5 @@
 export const imageWidthToHeightRatio = 1 + 1 / 3;
+export const tableWindowPageSize = 200; // Number of rows fetched per request for tables that are loaded in windows
+export const profilingHistogramBins = 10; // Number of bins of the histograms of numerical columns in the profiling
+export const profilingMaxCategories = 10; // Categorical columns with more distinct values show no histogram
+export const approximateSampleSize = 100000; // Number of rows plots are drawn from in approximate statistics mode
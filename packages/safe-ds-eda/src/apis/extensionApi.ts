@@ -1,8 +1,10 @@
 import { get } from 'svelte/store';
-import type { HistoryEntry } from '../../types/state';
-import { profilingLoading, table, history } from '../webviewState';
+import type { HistoryEntry, StatisticsMode, TableWindowSource } from '../../types/state';
+import { profilingLoading, table, history, statisticsMode } from '../webviewState';
 import type { ExecuteRunnerAllEntry } from '../../types/messaging';
 import { filterHistoryOnlyInternal } from '../filterHistory';
+import { tableWindowPageSize } from '../../consts.config';
+import { tableWindowRequests } from '../tableWindows';
 
 export const createInfoToast = function (message: string) {
     window.injVscode.postMessage({ command: 'setInfo', value: message });
@@ -103,14 +105,37 @@ export const executeRunner = function (state: HistoryEntry[], entry: HistoryEntr
     }
 };
 
-export const refreshProfiling = function (historyId: number) {
-    profilingLoading.set(true);
+export const cancelRunner = function (historyId: number) {
+    window.injVscode.postMessage({ command: 'cancelRunner', value: { historyId } });
+};
+
+export const refreshProfiling = function (historyId: number, exact = false) {
+    // Exact profiling runs in the background, so the approximate profiling stays visible until it is done
+    if (!exact) {
+        profilingLoading.set(true);
+    }
 
     window.injVscode.postMessage({
         command: 'refreshProfiling',
         value: {
             historyEntries: get(history).slice(0, historyId + 1),
             historyId,
+            exact,
         },
     });
 };
+
+export const setStatisticsMode = function (mode: StatisticsMode) {
+    statisticsMode.set(mode);
+    window.injVscode.postMessage({ command: 'setStatisticsMode', value: mode });
+};
+
+export const requestTableRows = function (source: TableWindowSource, firstRow: number, lastRow: number) {
+    // Rows are requested in fixed pages, so the extension can cache them. Pages that are loaded or pending are skipped.
+    for (const begin of tableWindowRequests.start(get(table), source, firstRow, lastRow)) {
+        window.injVscode.postMessage({
+            command: 'getTableWindow',
+            value: { source, begin, size: tableWindowPageSize },
+        });
+    }
+};
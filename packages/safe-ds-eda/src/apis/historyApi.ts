@@ -27,7 +27,7 @@ import {
     initialTable,
     profilingOutdated,
 } from '../webviewState';
-import { executeRunner, executeRunnerAll, executeRunnerAllFuture } from './extensionApi';
+import { cancelRunner, executeRunner, executeRunnerAll, executeRunnerAllFuture } from './extensionApi';
 import { doesEntryActionInvalidateProfiling, filterHistoryOnlyInternal } from '../filterHistory';
 
 // Wait for results to return from the server
@@ -345,6 +345,7 @@ export const cancelExecuteExternalHistoryEntry = function (entry: HistoryEntry,
     const index = asyncQueue.findIndex((queueEntry) => queueEntry.id === entry.id);
     if (index !== -1) {
         asyncQueue.splice(index, 1);
+        cancelRunner(entry.id); // Also stop the execution on the runner, so it is free for the next action
         if (entry.type === 'external-visualizing' && entry.existingTabId) {
             cancelTabIdsWaiting.update((ids) => {
                 return ids.concat([entry.existingTabId!]);
@@ -733,11 +734,13 @@ const deployResult = function (
                 ...state,
                 columns: updatedColumns,
                 totalRows: initialTable?.totalRows ?? 0,
-                visibleRows:
-                    updatedColumns.reduce((acc, column) => {
-                        if (column.values.length > acc) return column.values.length;
-                        return acc;
-                    }, 0) ?? 0,
+                visibleRows: resultContent.content.windowSource
+                    ? resultContent.content.visibleRows
+                    : (updatedColumns.reduce((acc, column) => {
+                          if (column.values.length > acc) return column.values.length;
+                          return acc;
+                      }, 0) ?? 0),
+                windowSource: resultContent.content.windowSource,
             };
         });
 
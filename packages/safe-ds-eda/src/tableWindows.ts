@@ -0,0 +1,51 @@
+import type { Table, TableWindowSource } from '../types/state';
+import { tableWindowPageSize } from '../consts.config';
+
+/**
+ * Keeps track of the pages of rows that were requested for tables that are loaded lazily. A page is only requested if
+ * its rows are not in the table yet and no request for it is pending. Whether a page was loaded is read from the table
+ * itself, so pages are requested again if the table is replaced.
+ */
+export class TableWindowRequests {
+    // Keys of the pages that were requested but not received yet
+    private readonly pending = new Set<string>();
+
+    /**
+     * Returns the first rows of the pages that contain the given rows and must be requested. These pages are marked as
+     * pending until {@link finish} is called for them.
+     */
+    start(currentTable: Table | undefined, source: TableWindowSource, firstRow: number, lastRow: number): number[] {
+        const firstPage = Math.floor(Math.max(0, firstRow) / tableWindowPageSize);
+        const lastPage = Math.floor(Math.max(0, lastRow) / tableWindowPageSize);
+
+        const result: number[] = [];
+        for (let page = firstPage; page <= lastPage; page++) {
+            const begin = page * tableWindowPageSize;
+            const key = this.getKey(source, begin);
+            if (this.pending.has(key) || isLoaded(currentTable, begin)) continue;
+
+            this.pending.add(key);
+            result.push(begin);
+        }
+        return result;
+    }
+
+    /**
+     * Marks the page that starts at the given row as no longer pending. This must be called whether the page could be
+     * loaded or not, so it can be requested again if its rows are still missing.
+     */
+    finish(source: TableWindowSource, begin: number): void {
+        this.pending.delete(this.getKey(source, begin));
+    }
+
+    private getKey(source: TableWindowSource, begin: number): string {
+        return `${source.pipelineExecutionId}:${source.placeholderName}:${begin}`;
+    }
+}
+
+const isLoaded = (currentTable: Table | undefined, begin: number): boolean => {
+    const values = currentTable?.columns[0]?.values;
+    return values !== undefined && values[begin] !== undefined;
+};
+
+export const tableWindowRequests = new TableWindowRequests();
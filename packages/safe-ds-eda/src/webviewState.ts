@@ -1,7 +1,8 @@
 import type { FromExtensionMessage } from '../types/messaging';
-import type { HistoryEntry, PossibleColumnFilter, Profiling, Tab, Table } from '../types/state';
+import type { HistoryEntry, PossibleColumnFilter, Profiling, StatisticsMode, Tab, Table } from '../types/state';
 import { get, writable } from 'svelte/store';
 import { filterHistoryOnlyProfilingInvalidating } from './filterHistory';
+import { tableWindowRequests } from './tableWindows';
 // import { filterHistoryOnlyProfilingInvalidating } from './filterHistory';
 
 const tabs = writable<Tab[]>([]);
@@ -23,6 +24,8 @@ const showProfiling = writable<boolean>(false);
 const profilingOutdated = writable<boolean>(false);
 const profilingLoading = writable<boolean>(false);
 
+const statisticsMode = writable<StatisticsMode>('exact');
+
 // Define the stores, current state to default in case the extension never calls setWebviewState( Shouldn't happen)
 const table = writable<Table | undefined>();
 
@@ -117,6 +120,37 @@ window.addEventListener('message', (event) => {
                 setProfiling(message.value);
             }
             break;
+        case 'setStatisticsMode':
+            statisticsMode.set(message.value);
+            break;
+        case 'setTableWindow': {
+            tableWindowRequests.finish(message.value.source, message.value.begin);
+            const columns = message.value.columns;
+            if (!columns) {
+                break; // Loading the rows failed, so they are requested again when the table scrolls
+            }
+
+            table.update((currentTable) => {
+                const source = currentTable?.windowSource;
+                if (
+                    !source ||
+                    source.pipelineExecutionId !== message.value.source.pipelineExecutionId ||
+                    source.placeholderName !== message.value.source.placeholderName
+                ) {
+                    return currentTable; // Table changed in the meantime
+                }
+
+                for (const column of currentTable!.columns) {
+                    const values = columns[column.name];
+                    if (!values) continue;
+                    for (let i = 0; i < values.length; i++) {
+                        column.values[message.value.begin + i] = values[i];
+                    }
+                }
+                return currentTable;
+            });
+            break;
+        }
     }
 });
 
@@ -228,4 +262,5 @@ export {
     tableKey,
     tabKey,
     showProfiling,
+    statisticsMode,
 };
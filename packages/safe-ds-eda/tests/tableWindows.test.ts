@@ -0,0 +1,84 @@
+import { describe, expect, it } from 'vitest';
+import { tableWindowPageSize } from '../consts.config';
+import { TableWindowRequests } from '../src/tableWindows';
+import type { Table, TableWindowSource } from '../types/state';
+
+const source: TableWindowSource = { pipelineExecutionId: 'execution', placeholderName: 'table' };
+
+/**
+ * Creates a table with the given number of rows, of which only the first `loadedRowCount` are loaded.
+ */
+const createTable = (rowCount: number, loadedRowCount: number): Table => ({
+    name: 'table',
+    columns: [
+        {
+            type: 'numerical',
+            name: 'column',
+            values: Array.from({ length: loadedRowCount }, (_, index) => index),
+            hidden: false,
+            highlighted: false,
+            appliedSort: null,
+            appliedFilters: [],
+            coloredHighLow: false,
+        },
+    ],
+    totalRows: rowCount,
+    appliedFilters: {},
+    windowSource: source,
+});
+
+describe('TableWindowRequests', () => {
+    it('should return the pages that contain the given rows', () => {
+        const requests = new TableWindowRequests();
+        const table = createTable(10 * tableWindowPageSize, 0);
+
+        expect(requests.start(table, source, tableWindowPageSize - 1, 2 * tableWindowPageSize)).toStrictEqual([
+            0,
+            tableWindowPageSize,
+            2 * tableWindowPageSize,
+        ]);
+    });
+
+    it('should skip pages that are already loaded', () => {
+        const requests = new TableWindowRequests();
+        const table = createTable(10 * tableWindowPageSize, tableWindowPageSize);
+
+        expect(requests.start(table, source, 0, tableWindowPageSize)).toStrictEqual([tableWindowPageSize]);
+    });
+
+    it('should skip pages that are pending', () => {
+        const requests = new TableWindowRequests();
+        const table = createTable(10 * tableWindowPageSize, 0);
+        requests.start(table, source, 0, 0);
+
+        expect(requests.start(table, source, 0, tableWindowPageSize)).toStrictEqual([tableWindowPageSize]);
+    });
+
+    it('should return pages again that could not be loaded', () => {
+        const requests = new TableWindowRequests();
+        const table = createTable(10 * tableWindowPageSize, 0);
+        requests.start(table, source, 0, 0);
+        requests.finish(source, 0);
+
+        expect(requests.start(table, source, 0, 0)).toStrictEqual([0]);
+    });
+
+    it('should return pages again that are missing in a new table with the same source', () => {
+        const requests = new TableWindowRequests();
+        requests.start(createTable(10 * tableWindowPageSize, 0), source, tableWindowPageSize, tableWindowPageSize);
+        requests.finish(source, tableWindowPageSize);
+
+        const newTable = createTable(10 * tableWindowPageSize, tableWindowPageSize);
+        expect(requests.start(newTable, source, tableWindowPageSize, tableWindowPageSize)).toStrictEqual([
+            tableWindowPageSize,
+        ]);
+    });
+
+    it('should distinguish the pages of different tables', () => {
+        const requests = new TableWindowRequests();
+        const otherSource: TableWindowSource = { pipelineExecutionId: 'execution', placeholderName: 'other' };
+        requests.start(undefined, source, 0, 0);
+
+        expect(requests.start(undefined, otherSource, 0, 0)).toStrictEqual([0]);
+    });
+});
@@ -9,7 +9,10 @@ type ToExtensionCommand =
     | 'executeRunner'
     | 'executeRunnerAll'
     | 'executeRunnerAllFuture'
-    | 'refreshProfiling';
+    | 'refreshProfiling'
+    | 'getTableWindow'
+    | 'setStatisticsMode'
+    | 'cancelRunner';
 
 interface ToExtensionCommandMessage {
     command: ToExtensionCommand;
@@ -67,9 +70,29 @@ export interface ToExtensionRefreshProfilingMessage extends ToExtensionCommandMe
     value: {
         historyId: number;
         historyEntries: defaultTypes.HistoryEntry[];
+        exact?: boolean;
     };
 }
 
+export interface ToExtensionGetTableWindowMessage extends ToExtensionCommandMessage {
+    command: 'getTableWindow';
+    value: {
+        source: defaultTypes.TableWindowSource;
+        begin: number;
+        size: number;
+    };
+}
+
+export interface ToExtensionCancelRunnerMessage extends ToExtensionCommandMessage {
+    command: 'cancelRunner';
+    value: { historyId: number };
+}
+
+export interface ToExtensionSetStatisticsModeMessage extends ToExtensionCommandMessage {
+    command: 'setStatisticsMode';
+    value: defaultTypes.StatisticsMode;
+}
+
 interface ToExtensionExecuteAllRunnerMessage extends ToExtensionCommandMessage {
     command: 'executeRunnerAll';
     value: { entries: ExecuteRunnerAllEntry[]; jumpedToHistoryId: number };
@@ -82,7 +105,10 @@ export type ToExtensionMessage =
     | ToExtensionExecuteRunnerExcludingHiddenColumnsMessage
     | ToExtensionExecuteAllRunnerMessage
     | ToExtensionExecuteAllFutureRunnerMessage
-    | ToExtensionRefreshProfilingMessage;
+    | ToExtensionRefreshProfilingMessage
+    | ToExtensionGetTableWindowMessage
+    | ToExtensionSetStatisticsModeMessage
+    | ToExtensionCancelRunnerMessage;
 
 // From extension
 type FromExtensionCommand =
@@ -90,7 +116,9 @@ type FromExtensionCommand =
     | 'setProfiling'
     | 'runnerExecutionResult'
     | 'multipleRunnerExecutionResult'
-    | 'cancelRunnerExecution';
+    | 'cancelRunnerExecution'
+    | 'setTableWindow'
+    | 'setStatisticsMode';
 
 interface FromExtensionCommandMessage {
     command: FromExtensionCommand;
@@ -146,9 +174,25 @@ export interface CancelRunnerExecutionMessage extends FromExtensionCommandMessag
     value: defaultTypes.HistoryEntry;
 }
 
+export interface FromExtensionSetTableWindowMessage extends FromExtensionCommandMessage {
+    command: 'setTableWindow';
+    value: {
+        source: defaultTypes.TableWindowSource;
+        begin: number;
+        columns: { [columnName: string]: any[] } | undefined; // Undefined if the rows could not be loaded
+    };
+}
+
+export interface FromExtensionSetStatisticsModeMessage extends FromExtensionCommandMessage {
+    command: 'setStatisticsMode';
+    value: defaultTypes.StatisticsMode;
+}
+
 export type FromExtensionMessage =
     | FromExtensionSetInitialTableMessage
     | FromExtensionSetProfilingMessage
     | RunnerExecutionResultMessage
     | CancelRunnerExecutionMessage
-    | MultipleRunnerExecutionResultMessage;
+    | MultipleRunnerExecutionResultMessage
+    | FromExtensionSetTableWindowMessage
+    | FromExtensionSetStatisticsModeMessage;
@@ -31,6 +31,7 @@ interface ExternalVisualizingHistoryEntryBaseExisting extends HistoryEntryBase {
     columnNumber: 'one' | 'two' | 'none';
     existingTabId: string;
     newTabId?: never;
+    exact?: boolean; // Compute on the full table even if the panel is in approximate statistics mode
 }
 
 interface ExternalVisualizingHistoryEntryBaseNew extends HistoryEntryBase {
@@ -39,6 +40,7 @@ interface ExternalVisualizingHistoryEntryBaseNew extends HistoryEntryBase {
     columnNumber: 'one' | 'two' | 'none';
     newTabId: string;
     existingTabId?: never;
+    exact?: boolean; // Compute on the full table even if the panel is in approximate statistics mode
 }
 
 type ExternalVisualizingHistoryEntryBase =
@@ -145,6 +147,10 @@ export type FullExternalManipulatingHistoryEntry = ExternalManipulatingHistoryEn
 export type FullInternalHistoryEntry = InternalHistoryEntry & ExtendedInfo;
 export type HistoryEntry = (InternalHistoryEntry | ExternalHistoryEntry) & ExtendedInfo;
 
+// ------------------ Types for the Statistics ------------------
+// In approximate mode, plots are drawn from a sample and profiling may use sketches, so large tables stay explorable
+export type StatisticsMode = 'exact' | 'approximate';
+
 // ------------------ Types for the Tabs ------------------
 export type TwoColumnTabTypes = 'linePlot' | 'scatterPlot';
 export type OneColumnTabTypes = 'histogram' | 'boxPlot' | 'infoPanel';
@@ -168,6 +174,7 @@ interface ImageTabObject extends TabObject {
     content: {
         encodedImage: Base64Image;
     };
+    approximate?: boolean; // Whether the image was drawn from a sample of the rows
 }
 
 interface OneColumnTabContent {
@@ -234,6 +241,12 @@ export interface Table {
     visibleRows?: number;
     totalRows: number;
     appliedFilters: TableFilter;
+    windowSource?: TableWindowSource; // If set, the columns only contain the rows loaded so far, more can be requested
+}
+
+export interface TableWindowSource {
+    pipelineExecutionId: string;
+    placeholderName: string;
 }
 
 // ------------ Types for the Profiling -----------
@@ -241,13 +254,14 @@ export interface Profiling {
     validRatio: ProfilingDetailStatistical;
     missingRatio: ProfilingDetailStatistical;
     other: ProfilingDetail[];
+    approximate?: boolean; // Whether the statistics were estimated from sketches or a sample of the rows
 }
 
 type BaseInterpretation = 'warn' | 'error' | 'default' | 'important' | 'good';
 
 interface ProfilingDetailBase {
-    type: 'numerical' | 'image' | 'text';
-    value: string | Base64Image;
+    type: 'numerical' | 'image' | 'histogram' | 'text';
+    value: string | Base64Image | ProfilingHistogramData;
 }
 
 export interface ProfilingDetailStatistical extends ProfilingDetailBase {
@@ -262,13 +276,27 @@ export interface ProfilingDetailImage extends ProfilingDetailBase {
     value: Base64Image;
 }
 
+export interface ProfilingDetailHistogram extends ProfilingDetailBase {
+    type: 'histogram';
+    value: ProfilingHistogramData;
+}
+
+export interface ProfilingHistogramData {
+    labels: string[]; // One label per bar, e.g. the range of a bin or the value of a category
+    counts: number[];
+}
+
 export interface ProfilingDetailName extends ProfilingDetailBase {
     type: 'text';
     value: string;
     interpretation: BaseInterpretation;
 }
 
-export type ProfilingDetail = ProfilingDetailStatistical | ProfilingDetailImage | ProfilingDetailName;
+export type ProfilingDetail =
+    | ProfilingDetailStatistical
+    | ProfilingDetailImage
+    | ProfilingDetailHistogram
+    | ProfilingDetailName;
 
 // ------------ Types for the Columns -----------
 export type PossibleSorts = 'asc' | 'desc';
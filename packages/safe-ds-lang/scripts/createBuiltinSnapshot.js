@@ -0,0 +1,12 @@
+// Creates the snapshot of the builtin files, so they need not be parsed at startup. Must run after the build.
+import fs from 'node:fs';
+import { NodeFileSystem } from 'langium/node';
+import { getBuiltinSnapshotPath } from '../lib/language/builtins/safe-ds-builtin-snapshot.js';
+import { createSafeDsServices } from '../lib/language/index.js';
+
+// An outdated snapshot would prevent the builtin files from being loaded
+const snapshotPath = getBuiltinSnapshotPath();
+fs.rmSync(snapshotPath, { force: true });
+
+const services = (await createSafeDsServices(NodeFileSystem)).SafeDs;
+fs.writeFileSync(snapshotPath, JSON.stringify(services.builtins.Snapshot.createSnapshot()));
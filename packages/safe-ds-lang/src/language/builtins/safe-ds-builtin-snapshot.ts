@@ -0,0 +1,181 @@
+import { AstNode, JsonSerializer, LangiumDocument, LangiumDocumentFactory, LangiumDocuments, Linker } from 'langium';
+import fs from 'node:fs';
+import path from 'node:path';
+import { resourceNameToUri, uriToShortenedResourceName } from '../../helpers/resources.js';
+import { SafeDsServices } from '../safe-ds-module.js';
+import { listBuiltinFiles } from './fileFinder.js';
+
+/**
+ * The version of the snapshot format. Snapshots with another version are ignored.
+ */
+const BUILTIN_SNAPSHOT_VERSION = 2;
+
+/**
+ * The resource name of the snapshot. It is created by the build, so it only exists in `lib/resources/`.
+ */
+const BUILTIN_SNAPSHOT_RESOURCE_NAME = 'builtins.snapshot.json';
+
+/**
+ * Gives access to a precomputed snapshot of the builtin files. It contains their serialized ASTs. If the snapshot
+ * exists, the builtin files are not parsed at startup. Instead, their documents are created from the serialized ASTs
+ * and then indexed, scoped, and linked by the document builder like any other document.
+ */
+export class SafeDsBuiltinSnapshot {
+    private readonly documentFactory: LangiumDocumentFactory;
+    private readonly langiumDocuments: LangiumDocuments;
+    private readonly linker: () => Linker;
+    private readonly serializer: () => JsonSerializer;
+
+    /**
+     * The loaded snapshot, `null` if it does not exist, or `undefined` if we did not try to load it yet.
+     */
+    private snapshot: BuiltinSnapshot | null | undefined = undefined;
+
+    constructor(services: SafeDsServices) {
+        this.documentFactory = services.shared.workspace.LangiumDocumentFactory;
+        this.langiumDocuments = services.shared.workspace.LangiumDocuments;
+        this.linker = () => services.references.Linker;
+        this.serializer = () => services.serializer.JsonSerializer;
+    }
+
+    /**
+     * Returns whether a snapshot of the builtin files exists. In this case, the builtin files must not be parsed.
+     */
+    isAvailable(): boolean {
+        return this.getSnapshot() !== null;
+    }
+
+    /**
+     * Uses the given snapshot instead of the one that is created by the build. This must be called before the
+     * workspace is initialized.
+     */
+    setSnapshot(snapshot: BuiltinSnapshot | null): void {
+        this.snapshot = snapshot?.version === BUILTIN_SNAPSHOT_VERSION ? snapshot : null;
+    }
+
+    /**
+     * Creates the documents of the builtin files from the snapshot. They are only parsed, so the document builder must
+     * still build them. Since they have no concrete syntax tree, they are not validated.
+     */
+    createDocuments(): LangiumDocument[] {
+        return (this.getSnapshot()?.documents ?? []).map((entry) => {
+            const uri = resourceNameToUri(path.join('builtins', entry.path));
+            const root = this.reviveNode(JSON.parse(entry.ast));
+            return this.documentFactory.fromModel(root, uri);
+        });
+    }
+
+    /**
+     * Creates a snapshot of the builtin files. They must be loaded into the workspace.
+     *
+     * @throws Error If a builtin file is not loaded.
+     */
+    createSnapshot(): BuiltinSnapshot {
+        const documents = listBuiltinFiles().map((uri): BuiltinSnapshotDocument => {
+            const document = this.langiumDocuments.getDocument(uri);
+            if (!document) {
+                /* c8 ignore next 2 */
+                throw new Error(`The builtin file '${uri}' is not loaded.`);
+            }
+
+            return {
+                path: uriToShortenedResourceName(uri, 'builtins').split(path.sep).join('/'),
+                ast: this.serializer().serialize(document.parseResult.value, { comments: true, refText: true }),
+            };
+        });
+
+        return { version: BUILTIN_SNAPSHOT_VERSION, documents };
+    }
+
+    /**
+     * Restores the container properties and references of a node that was parsed from JSON. References are resolved
+     * when the document is linked.
+     */
+    private reviveNode(node: any, container?: AstNode, containerProperty?: string, containerIndex?: number): AstNode {
+        if (container) {
+            node.$container = container;
+            node.$containerProperty = containerProperty;
+            node.$containerIndex = containerIndex;
+        }
+
+        for (const [property, value] of Object.entries(node)) {
+            if (property.startsWith('$')) {
+                continue;
+            } else if (Array.isArray(value)) {
+                value.forEach((it, index) => {
+                    if (isObject(it)) {
+                        value[index] = this.reviveValue(it, node, property, index);
+                    }
+                });
+            } else if (isObject(value)) {
+                node[property] = this.reviveValue(value, node, property);
+            }
+        }
+
+        return node;
+    }
+
+    private reviveValue(value: any, container: AstNode, property: string, index?: number): unknown {
+        if (typeof value.$type === 'string') {
+            return this.reviveNode(value, container, property, index);
+        } else {
+            return this.linker().buildReference(container, property, undefined, value.$refText ?? '');
+        }
+    }
+
+    private getSnapshot(): BuiltinSnapshot | null {
+        if (this.snapshot === undefined) {
+            this.snapshot = readBuiltinSnapshot();
+        }
+
+        return this.snapshot;
+    }
+}
+
+/**
+ * Returns the path where the snapshot of the builtin files is stored.
+ */
+export const getBuiltinSnapshotPath = (): string => {
+    return resourceNameToUri(BUILTIN_SNAPSHOT_RESOURCE_NAME).fsPath;
+};
+
+const readBuiltinSnapshot = (): BuiltinSnapshot | null => {
+    const snapshotPath = getBuiltinSnapshotPath();
+    if (!fs.existsSync(snapshotPath)) {
+        return null;
+    }
+
+    /* c8 ignore start */
+    try {
+        const snapshot: BuiltinSnapshot = JSON.parse(fs.readFileSync(snapshotPath, 'utf-8'));
+        return snapshot.version === BUILTIN_SNAPSHOT_VERSION ? snapshot : null;
+    } catch {
+        // Fall back to parsing the builtin files
+        return null;
+    }
+    /* c8 ignore stop */
+};
+
+const isObject = (value: unknown): value is object => {
+    return typeof value === 'object' && value !== null;
+};
+
+/**
+ * A precomputed snapshot of the builtin files.
+ */
+export interface BuiltinSnapshot {
+    readonly version: number;
+    readonly documents: BuiltinSnapshotDocument[];
+}
+
+export interface BuiltinSnapshotDocument {
+    /**
+     * The path of the file relative to `src/resources/builtins/`, with `/` as separator.
+     */
+    readonly path: string;
+
+    /**
+     * The serialized AST.
+     */
+    readonly ast: string;
+}
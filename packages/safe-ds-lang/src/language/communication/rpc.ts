@@ -1,6 +1,7 @@
 import { MessageDirection, NotificationType0, RequestType0 } from 'vscode-languageserver';
 import { NotificationType } from 'vscode-languageserver-protocol';
 import { UUID } from 'node:crypto';
+import type { MemoizationStats } from '../runtime/messages.js';
 
 export namespace InstallRunnerNotification {
     export const method = 'runner/install' as const;
@@ -22,9 +23,14 @@ export namespace RunnerStartedNotification {
 
 export interface RunnerStartedParams {
     /**
-     * The port the runner is listening on.
+     * The port the first runner process is listening on.
      */
     port: number;
+
+    /**
+     * The ports all runner processes of the pool are listening on.
+     */
+    ports?: number[];
 }
 
 export namespace UpdateRunnerNotification {
@@ -91,3 +97,9 @@ export namespace IsRunnerReadyRequest {
     export const messageDirection = MessageDirection.clientToServer;
     export const type = new RequestType0(method);
 }
+
+export namespace GetMemoizationStatsRequest {
+    export const method = 'runner/memoizationStats' as const;
+    export const messageDirection = MessageDirection.clientToServer;
+    export const type = new RequestType0<MemoizationStats | null, void>(method);
+}
@@ -1,4 +1,5 @@
-import { AstNode, type AstNodeLocator, AstUtils, stream, WorkspaceCache } from 'langium';
+import { AstNode, AstUtils, stream } from 'langium';
+import { DependencyTrackedNodeCache } from '../workspace/safe-ds-document-dependencies.js';
 import {
     isSdsBlockLambda,
     isSdsCall,
@@ -26,9 +27,12 @@ import type { SafeDsServices } from '../safe-ds-module.js';
 import {
     EvaluatedCallable,
     EvaluatedEnumVariant,
+    hashSubstitutions,
     NamedCallable,
     ParameterSubstitutions,
+    streamAstNodesOfSubstitutions,
     substitutionsAreEqual,
+    SubstitutionsMap,
     UnknownEvaluatedNode,
 } from '../partialEvaluation/model.js';
 import { CallGraph } from './model.js';
@@ -39,7 +43,6 @@ import { isEmpty } from '../../helpers/collections.js';
 import { SafeDsPartialEvaluator } from '../partialEvaluation/safe-ds-partial-evaluator.js';
 
 export class SafeDsCallGraphComputer {
-    private readonly astNodeLocator: AstNodeLocator;
     private readonly nodeMapper: SafeDsNodeMapper;
     private readonly partialEvaluator: SafeDsPartialEvaluator;
     private readonly typeComputer: SafeDsTypeComputer;
@@ -47,21 +50,20 @@ export class SafeDsCallGraphComputer {
     /**
      * Stores the calls inside the node with the given ID.
      */
-    private readonly callCache: WorkspaceCache<string, SdsCall[]>;
+    private readonly callCache: DependencyTrackedNodeCache<SdsCall[]>;
 
     /**
-     * Stores the call graph for the callable with the given ID if it is called without substitutions.
+     * Stores the call graphs for the call/callable with the given ID and different parameter substitutions.
      */
-    private readonly callGraphCache: WorkspaceCache<string, CallGraph>;
+    private readonly callGraphCache: DependencyTrackedNodeCache<SubstitutionsMap<CallGraph>>;
 
     constructor(services: SafeDsServices) {
-        this.astNodeLocator = services.workspace.AstNodeLocator;
         this.nodeMapper = services.helpers.NodeMapper;
         this.partialEvaluator = services.evaluation.PartialEvaluator;
         this.typeComputer = services.typing.TypeComputer;
 
-        this.callCache = new WorkspaceCache(services.shared);
-        this.callGraphCache = new WorkspaceCache(services.shared);
+        this.callCache = new DependencyTrackedNodeCache(services);
+        this.callGraphCache = new DependencyTrackedNodeCache(services);
     }
 
     /**
@@ -92,25 +94,22 @@ export class SafeDsCallGraphComputer {
      * of any containing callables, i.e. the context of the call/callable.
      */
     getCallGraph(node: SdsCall | SdsCallable, substitutions: ParameterSubstitutions = NO_SUBSTITUTIONS): CallGraph {
-        // Cache the result if no substitutions are given
-        if (isEmpty(substitutions)) {
-            const key = this.getNodeId(node);
-            return this.callGraphCache.get(key, () => {
-                return this.doGetCallGraph(node, substitutions);
+        return this.callGraphCache
+            .get(node, () => new SubstitutionsMap())
+            .get(substitutions, () => {
+                const callGraph = this.doGetCallGraph(node, substitutions);
+                this.callGraphCache.addDependencies(node, streamAstNodesOfSubstitutions(substitutions));
+                return callGraph;
             });
-        } else {
-            /* c8 ignore next 2 */
-            return this.doGetCallGraph(node, substitutions);
-        }
     }
 
     private doGetCallGraph(node: SdsCall | SdsCallable, substitutions: ParameterSubstitutions): CallGraph {
         if (isSdsCall(node)) {
             const call = this.createSyntheticCallForCall(node, substitutions);
-            return this.getCallGraphWithRecursionCheck(call, []);
+            return this.getCallGraphWithRecursionCheck(call, new SyntheticCallSet());
         } else {
             const children = this.getExecutedCallsInCallable(node, substitutions).map((it) => {
-                return this.getCallGraphWithRecursionCheck(it, []);
+                return this.getCallGraphWithRecursionCheck(it, new SyntheticCallSet());
             });
             return new CallGraph(
                 node,
@@ -120,21 +119,22 @@ export class SafeDsCallGraphComputer {
         }
     }
 
-    private getCallGraphWithRecursionCheck(syntheticCall: SyntheticCall, visited: SyntheticCall[]): CallGraph {
+    private getCallGraphWithRecursionCheck(syntheticCall: SyntheticCall, visited: SyntheticCallSet): CallGraph {
         const evaluatedCallable = syntheticCall.callable;
 
         // Handle unknown callables & recursive calls
         if (!evaluatedCallable) {
             return new CallGraph(undefined, [], false);
-        } else if (visited.some((it) => it.equals(syntheticCall))) {
+        } else if (visited.has(syntheticCall)) {
             return new CallGraph(evaluatedCallable.callable, [], true);
         }
 
-        // Visit all calls in the callable
-        const newVisited = [...visited, syntheticCall];
+        // Visit all calls in the callable. The call is only visited while we are inside it.
+        visited.add(syntheticCall);
         const children = this.getExecutedCalls(syntheticCall).map((it) => {
-            return this.getCallGraphWithRecursionCheck(it, newVisited);
+            return this.getCallGraphWithRecursionCheck(it, visited);
         });
+        visited.delete(syntheticCall);
 
         return new CallGraph(
             evaluatedCallable.callable,
@@ -325,14 +325,7 @@ export class SafeDsCallGraphComputer {
             return [];
         }
 
-        const key = this.getNodeId(node);
-        return this.callCache.get(key, () => AstUtils.streamAst(node).filter(isSdsCall).toArray());
-    }
-
-    private getNodeId(node: AstNode) {
-        const documentUri = AstUtils.getDocument(node).uri.toString();
-        const nodePath = this.astNodeLocator.getAstNodePath(node);
-        return `${documentUri}~${nodePath}`;
+        return this.callCache.get(node, () => AstUtils.streamAst(node).filter(isSdsCall).toArray());
     }
 }
 
@@ -342,6 +335,14 @@ class SyntheticCall {
         readonly substitutions: ParameterSubstitutions,
     ) {}
 
+    /**
+     * A hash of the call. Equal calls have the same hash.
+     */
+    get hash(): string {
+        const substitutionsOnCreation = this.callable?.substitutionsOnCreation ?? NO_SUBSTITUTIONS;
+        return `${hashSubstitutions(substitutionsOnCreation)}|${hashSubstitutions(this.substitutions)}`;
+    }
+
     equals(other: SyntheticCall): boolean {
         if (!this.callable) {
             /* c8 ignore next 2 */
@@ -352,4 +353,42 @@ class SyntheticCall {
     }
 }
 
+/**
+ * A set of synthetic calls. Calls are grouped by their callable and hash, so a lookup only compares a call to calls
+ * in the same group.
+ */
+class SyntheticCallSet {
+    private readonly groups = new Map<SdsCallable | SdsParameter | undefined, Map<string, SyntheticCall[]>>();
+
+    has(call: SyntheticCall): boolean {
+        return this.getGroup(call)?.some((it) => it.equals(call)) ?? false;
+    }
+
+    add(call: SyntheticCall): void {
+        const callable = call.callable?.callable;
+        if (!this.groups.has(callable)) {
+            this.groups.set(callable, new Map());
+        }
+
+        const groupsByHash = this.groups.get(callable)!;
+        const hash = call.hash;
+        if (!groupsByHash.has(hash)) {
+            groupsByHash.set(hash, []);
+        }
+        groupsByHash.get(hash)!.push(call);
+    }
+
+    delete(call: SyntheticCall): void {
+        const group = this.getGroup(call);
+        const index = group?.findIndex((it) => it.equals(call)) ?? -1;
+        if (index !== -1) {
+            group!.splice(index, 1);
+        }
+    }
+
+    private getGroup(call: SyntheticCall): SyntheticCall[] | undefined {
+        return this.groups.get(call.callable?.callable)?.get(call.hash);
+    }
+}
+
 const NO_SUBSTITUTIONS: ParameterSubstitutions = new Map();
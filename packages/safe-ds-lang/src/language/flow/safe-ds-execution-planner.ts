@@ -0,0 +1,79 @@
+import { AstUtils } from 'langium';
+import { isSdsAssignment, isSdsPlaceholder, isSdsReference, SdsPlaceholder, SdsStatement } from '../generated/ast.js';
+import { getAssignees } from '../helpers/nodeProperties.js';
+import { ImpurityReason } from '../purity/model.js';
+import { SafeDsPurityComputer } from '../purity/safe-ds-purity-computer.js';
+import { SafeDsServices } from '../safe-ds-module.js';
+
+/**
+ * Computes in which order the statements of a block can be executed, so independent statements can run in parallel.
+ */
+export class SafeDsExecutionPlanner {
+    private readonly purityComputer: SafeDsPurityComputer;
+
+    constructor(services: SafeDsServices) {
+        this.purityComputer = services.purity.PurityComputer;
+    }
+
+    /**
+     * Splits the given statements into stages. A statement depends on an earlier one if
+     * - it references a placeholder that is declared by the earlier statement, or
+     * - an impurity reason of one of them can affect an impurity reason of the other. A write to a file must, for
+     *   instance, neither run before nor after a read of the same file, if they are in the opposite order in the code.
+     *
+     * Each statement is put into the first stage after all stages of the statements it depends on. Statements in the
+     * same stage are independent of each other, so they can be executed in any order or in parallel, once all previous
+     * stages are completed. Within a stage, statements keep their original order.
+     */
+    computeExecutionStages(statements: SdsStatement[]): SdsStatement[][] {
+        const stages: SdsStatement[][] = [];
+        const stageIndices = new Map<SdsStatement, number>();
+        const declaringStatements = new Map<SdsPlaceholder, SdsStatement>();
+        const impureStatements: [SdsStatement, ImpurityReason[]][] = [];
+
+        for (const statement of statements) {
+            const impurityReasons = this.purityComputer.getImpurityReasonsForStatement(statement);
+            const dependencies = [
+                ...this.getReferencedPlaceholders(statement).flatMap((it) => declaringStatements.get(it) ?? []),
+                ...impureStatements
+                    .filter(([, earlierReasons]) => conflict(earlierReasons, impurityReasons))
+                    .map(([earlierStatement]) => earlierStatement),
+            ];
+            const stageIndex = Math.max(-1, ...dependencies.map((it) => stageIndices.get(it)!)) + 1;
+
+            stageIndices.set(statement, stageIndex);
+            if (stageIndex === stages.length) {
+                stages.push([]);
+            }
+            stages[stageIndex]!.push(statement);
+
+            if (impurityReasons.length > 0) {
+                impureStatements.push([statement, impurityReasons]);
+            }
+            if (isSdsAssignment(statement)) {
+                getAssignees(statement)
+                    .filter(isSdsPlaceholder)
+                    .forEach((it) => declaringStatements.set(it, statement));
+            }
+        }
+
+        return stages;
+    }
+
+    private getReferencedPlaceholders(node: SdsStatement): SdsPlaceholder[] {
+        return AstUtils.streamAllContents(node)
+            .flatMap((it) => (isSdsReference(it) && isSdsPlaceholder(it.target.ref) ? [it.target.ref] : []))
+            .toArray();
+    }
+}
+
+/**
+ * Returns whether the order of statements with the given impurity reasons matters.
+ */
+const conflict = (earlierReasons: ImpurityReason[], laterReasons: ImpurityReason[]): boolean => {
+    return earlierReasons.some((earlier) =>
+        laterReasons.some(
+            (later) => earlier.canAffectFutureImpurityReason(later) || later.canAffectFutureImpurityReason(earlier),
+        ),
+    );
+};
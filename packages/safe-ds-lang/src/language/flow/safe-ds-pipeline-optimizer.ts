@@ -0,0 +1,245 @@
+import { AstNode, AstUtils } from 'langium';
+import {
+    isSdsAssignment,
+    isSdsCall,
+    isSdsExpression,
+    isSdsList,
+    isSdsMemberAccess,
+    isSdsPlaceholder,
+    isSdsReference,
+    isSdsWildcard,
+    SdsAssignment,
+    SdsCall,
+    SdsExpression,
+    SdsPlaceholder,
+    SdsStatement,
+} from '../generated/ast.js';
+import { getArguments, getAssignees } from '../helpers/nodeProperties.js';
+import { IdManager } from '../helpers/idManager.js';
+import { SafeDsNodeMapper } from '../helpers/safe-ds-node-mapper.js';
+import {
+    BooleanConstant,
+    FloatConstant,
+    IntConstant,
+    isConstant,
+    NullConstant,
+    StringConstant,
+} from '../partialEvaluation/model.js';
+import { SafeDsPartialEvaluator } from '../partialEvaluation/safe-ds-partial-evaluator.js';
+import { SafeDsPurityComputer } from '../purity/safe-ds-purity-computer.js';
+import { SafeDsServices } from '../safe-ds-module.js';
+
+/**
+ * Removes statements from a block that do not contribute to its effects or results, and finds assignments that compute
+ * the same value as an earlier one.
+ */
+export class SafeDsPipelineOptimizer {
+    private readonly nodeMapper: SafeDsNodeMapper;
+    private readonly partialEvaluator: SafeDsPartialEvaluator;
+    private readonly purityComputer: SafeDsPurityComputer;
+
+    constructor(services: SafeDsServices) {
+        this.nodeMapper = services.helpers.NodeMapper;
+        this.partialEvaluator = services.evaluation.PartialEvaluator;
+        this.purityComputer = services.purity.PurityComputer;
+    }
+
+    /**
+     * Optimizes the given statements of a block:
+     * - An assignment that calls a pure function with the same arguments as an earlier assignment reuses the values of
+     *   the earlier one.
+     * - A statement is removed if it has no side effects and none of the placeholders it declares are needed by the
+     *   remaining statements.
+     *
+     * @param statements
+     * The statements of the block.
+     *
+     * @param observedPlaceholders
+     * Placeholders that are observable from the outside, e.g. because the runner is queried for their values, so
+     * assignments to them must be kept.
+     */
+    optimizeBlock(statements: SdsStatement[], observedPlaceholders: SdsPlaceholder[] = []): OptimizedBlock {
+        const reusedAssignments = this.findReusedAssignments(statements);
+        const neededPlaceholders = new Set<SdsPlaceholder>(observedPlaceholders);
+        const keptStatements: SdsStatement[] = [];
+
+        for (const statement of [...statements].reverse()) {
+            if (!this.isNeeded(statement, neededPlaceholders)) {
+                continue;
+            }
+
+            keptStatements.unshift(statement);
+
+            const reusedAssignment = isSdsAssignment(statement) ? reusedAssignments.get(statement) : undefined;
+            if (reusedAssignment) {
+                getAssignees(reusedAssignment)
+                    .filter(isSdsPlaceholder)
+                    .forEach((it) => neededPlaceholders.add(it));
+            } else {
+                this.collectNeededPlaceholders(statement, neededPlaceholders);
+            }
+        }
+
+        // Assignments that were removed cannot be reused
+        const keptReusedAssignments = new Map(
+            Array.from(reusedAssignments).filter(([assignment]) => keptStatements.includes(assignment)),
+        );
+        return { statements: keptStatements, reusedAssignments: keptReusedAssignments };
+    }
+
+    /**
+     * Returns whether the given expression is replaced by its constant value during code generation. In this case, the
+     * placeholders it references are not needed to compute it.
+     */
+    isInlinedConstant(node: SdsExpression): boolean {
+        if (this.purityComputer.expressionHasSideEffects(node)) {
+            return false;
+        }
+
+        const value = this.partialEvaluator.evaluate(node);
+        return (
+            value instanceof BooleanConstant ||
+            value instanceof FloatConstant ||
+            value instanceof IntConstant ||
+            value instanceof StringConstant ||
+            value === NullConstant
+        );
+    }
+
+    private isNeeded(statement: SdsStatement, neededPlaceholders: Set<SdsPlaceholder>): boolean {
+        if (!isSdsAssignment(statement) || this.purityComputer.expressionHasSideEffects(statement.expression)) {
+            return true;
+        }
+
+        return getAssignees(statement).some((it) => {
+            if (isSdsPlaceholder(it)) {
+                return neededPlaceholders.has(it);
+            } else {
+                // Yields and results of block lambdas are always needed
+                return !isSdsWildcard(it);
+            }
+        });
+    }
+
+    private collectNeededPlaceholders(node: AstNode, result: Set<SdsPlaceholder>): void {
+        if (isSdsExpression(node) && this.isInlinedConstant(node)) {
+            return;
+        }
+
+        if (isSdsReference(node) && isSdsPlaceholder(node.target.ref)) {
+            result.add(node.target.ref);
+        }
+
+        for (const child of AstUtils.streamContents(node)) {
+            this.collectNeededPlaceholders(child, result);
+        }
+    }
+
+    /**
+     * Maps each assignment that calls a pure function with the same arguments as an earlier assignment to the earlier
+     * one. The placeholders of the earlier assignment must hold all values the later assignment needs.
+     */
+    private findReusedAssignments(statements: SdsStatement[]): Map<SdsAssignment, SdsAssignment> {
+        const result = new Map<SdsAssignment, SdsAssignment>();
+        const ids = new IdManager<AstNode>();
+        const assignmentsByKey = new Map<string, SdsAssignment>();
+
+        for (const statement of statements) {
+            if (!isSdsAssignment(statement) || !isSdsCall(statement.expression)) {
+                continue;
+            }
+
+            const key = this.getValueKey(statement.expression, ids);
+            if (key === undefined) {
+                continue;
+            }
+
+            const earlierAssignment = assignmentsByKey.get(key);
+            if (!earlierAssignment) {
+                assignmentsByKey.set(key, statement);
+            } else if (this.canReuse(statement, earlierAssignment)) {
+                result.set(statement, earlierAssignment);
+            }
+        }
+
+        return result;
+    }
+
+    private canReuse(assignment: SdsAssignment, earlierAssignment: SdsAssignment): boolean {
+        const earlierAssignees = getAssignees(earlierAssignment);
+        return getAssignees(assignment).every(
+            (it, index) => isSdsWildcard(it) || isSdsPlaceholder(earlierAssignees[index]),
+        );
+    }
+
+    /**
+     * Returns a key that is equal for two expressions if they are pure and compute the same value. If this cannot be
+     * determined, `undefined` is returned.
+     */
+    private getValueKey(node: SdsExpression | undefined, ids: IdManager<AstNode>): string | undefined {
+        if (!node || !this.purityComputer.isPureExpression(node)) {
+            return undefined;
+        }
+
+        const value = this.partialEvaluator.evaluate(node);
+        if (isConstant(value)) {
+            // The string representations of constants of different types differ
+            return value.toString();
+        }
+
+        if (isSdsReference(node)) {
+            const target = node.target.ref;
+            return target ? `#${ids.assignId(target)}` : undefined;
+        } else if (isSdsMemberAccess(node)) {
+            const receiver = this.getValueKey(node.receiver, ids);
+            const member = node.member?.target.ref;
+            if (receiver === undefined || !member) {
+                return undefined;
+            }
+            return `${receiver}${node.isNullSafe ? '?.' : '.'}#${ids.assignId(member)}`;
+        } else if (isSdsList(node)) {
+            const elements = node.elements.map((it) => this.getValueKey(it, ids));
+            return elements.every((it) => it !== undefined) ? `[${elements.join(', ')}]` : undefined;
+        } else if (isSdsCall(node)) {
+            return this.getCallKey(node, ids);
+        } else {
+            return undefined;
+        }
+    }
+
+    private getCallKey(node: SdsCall, ids: IdManager<AstNode>): string | undefined {
+        const receiver = this.getValueKey(node.receiver, ids);
+        if (receiver === undefined) {
+            return undefined;
+        }
+
+        // Arguments are identified by their parameter, so it does not matter whether they are passed by name
+        const args: string[] = [];
+        for (const argument of getArguments(node)) {
+            const parameter = this.nodeMapper.argumentToParameter(argument);
+            const value = this.getValueKey(argument.value, ids);
+            if (!parameter || value === undefined) {
+                return undefined;
+            }
+            args.push(`#${ids.assignId(parameter)}=${value}`);
+        }
+
+        return `${receiver}${node.isNullSafe ? '?' : ''}(${args.sort().join(', ')})`;
+    }
+}
+
+/**
+ * The result of {@link SafeDsPipelineOptimizer.optimizeBlock}.
+ */
+export interface OptimizedBlock {
+    /**
+     * The statements that must be kept, in their original order.
+     */
+    readonly statements: SdsStatement[];
+
+    /**
+     * Maps assignments to earlier assignments whose placeholders already hold the values they compute. Both are part
+     * of `statements`.
+     */
+    readonly reusedAssignments: Map<SdsAssignment, SdsAssignment>;
+}
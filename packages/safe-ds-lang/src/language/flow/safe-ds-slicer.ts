@@ -1,27 +1,47 @@
 import { SafeDsServices } from '../safe-ds-module.js';
 import { isSdsAssignment, isSdsPlaceholder, isSdsReference, SdsPlaceholder, SdsStatement } from '../generated/ast.js';
-import { AstUtils, Stream } from 'langium';
+import { AstUtils } from 'langium';
 import { ImpurityReason } from '../purity/model.js';
 import { getAssignees } from '../helpers/nodeProperties.js';
 import { SafeDsPurityComputer } from '../purity/safe-ds-purity-computer.js';
+import { DependencyTrackedNodeCache } from '../workspace/safe-ds-document-dependencies.js';
 
 export class SafeDsSlicer {
     private readonly purityComputer: SafeDsPurityComputer;
 
+    /**
+     * Maps statements to the placeholders they reference and their impurity reasons. This lets repeated slices of the
+     * same pipeline skip the analysis of statements.
+     */
+    private readonly statementInfoCache: DependencyTrackedNodeCache<StatementInfo>;
+
     constructor(services: SafeDsServices) {
         this.purityComputer = services.purity.PurityComputer;
+
+        this.statementInfoCache = new DependencyTrackedNodeCache(services);
     }
 
     /**
      * Computes the subset of the given statements that are needed to calculate the target placeholders.
+     *
+     * Resident statements are statements whose results are already available, so they do not need to be computed
+     * again. They are kept in the slice if needed, but the statements they depend on are not.
      */
-    computeBackwardSliceToTargets(statements: SdsStatement[], targets: SdsStatement[]): SdsStatement[] {
-        const aggregator = new BackwardSliceAggregator(this.purityComputer);
+    computeBackwardSliceToTargets(
+        statements: SdsStatement[],
+        targets: SdsStatement[],
+        isResident: (statement: SdsStatement) => boolean = () => false,
+    ): SdsStatement[] {
+        const targetSet = new Set(targets);
+        const aggregator = new BackwardSliceAggregator(isResident);
+
+        for (let index = statements.length - 1; index >= 0; index--) {
+            const statement = statements[index]!;
+            const info = this.getStatementInfo(statement);
 
-        for (const statement of statements.reverse()) {
             // Keep if it is a target
-            if (targets.includes(statement)) {
-                aggregator.addStatement(statement);
+            if (targetSet.has(statement)) {
+                aggregator.addStatement(statement, info);
             }
 
             // Keep if it declares a referenced placeholder
@@ -29,72 +49,128 @@ export class SafeDsSlicer {
                 isSdsAssignment(statement) &&
                 getAssignees(statement).some((it) => isSdsPlaceholder(it) && aggregator.referencedPlaceholders.has(it))
             ) {
-                aggregator.addStatement(statement);
+                aggregator.addStatement(statement, info);
             }
 
             // Keep if it has an impurity reason that affects a future impurity reason
-            else if (
-                this.purityComputer
-                    .getImpurityReasonsForStatement(statement)
-                    .some((pastReason) =>
-                        aggregator.impurityReasons.some((futureReason) =>
-                            pastReason.canAffectFutureImpurityReason(futureReason),
-                        ),
-                    )
-            ) {
-                aggregator.addStatement(statement);
+            else if (info.impurityReasons.some((it) => aggregator.impurityReasons.canBeAffectedBy(it))) {
+                aggregator.addStatement(statement, info);
             }
         }
 
-        return aggregator.statements;
+        return aggregator.statements.reverse();
+    }
+
+    private getStatementInfo(statement: SdsStatement): StatementInfo {
+        return this.statementInfoCache.get(statement, () => ({
+            referencedPlaceholders: getReferencedPlaceholders(statement),
+            impurityReasons: this.purityComputer.getImpurityReasonsForStatement(statement),
+        }));
     }
 }
 
 class BackwardSliceAggregator {
-    private readonly purityComputer: SafeDsPurityComputer;
-
     /**
-     * The statements that are needed to calculate the target statements.
+     * The statements that are needed to calculate the target statements, in reverse order.
      */
     readonly statements: SdsStatement[] = [];
 
     /**
      * The placeholders that are needed to calculate the target statements.
      */
-    readonly referencedPlaceholders: Set<SdsPlaceholder>;
+    readonly referencedPlaceholders: Set<SdsPlaceholder> = new Set();
 
     /**
      * The impurity reasons of the collected statements.
      */
-    readonly impurityReasons: ImpurityReason[] = [];
+    readonly impurityReasons = new FutureImpurityReasons();
 
-    constructor(purityComputer: SafeDsPurityComputer) {
-        this.purityComputer = purityComputer;
+    /**
+     * Whether the result of a statement is already available.
+     */
+    private readonly isResident: (statement: SdsStatement) => boolean;
 
-        this.referencedPlaceholders = new Set();
+    constructor(isResident: (statement: SdsStatement) => boolean) {
+        this.isResident = isResident;
     }
 
-    addStatement(statement: SdsStatement): void {
-        this.statements.unshift(statement);
+    addStatement(statement: SdsStatement, info: StatementInfo): void {
+        this.statements.push(statement);
+
+        // Resident statements are not computed again, so they have no dependencies
+        if (this.isResident(statement)) {
+            return;
+        }
 
         // Remember all referenced placeholders
-        this.getReferencedPlaceholders(statement).forEach((it) => {
+        info.referencedPlaceholders.forEach((it) => {
             this.referencedPlaceholders.add(it);
         });
 
         // Remember all impurity reasons
-        this.purityComputer.getImpurityReasonsForStatement(statement).forEach((it) => {
-            this.impurityReasons.push(it);
+        info.impurityReasons.forEach((it) => {
+            this.impurityReasons.add(it);
         });
     }
+}
 
-    private getReferencedPlaceholders(node: SdsStatement): Stream<SdsPlaceholder> {
-        return AstUtils.streamAllContents(node).flatMap((it) => {
+/**
+ * The impurity reasons of statements that are executed later. Reasons are grouped into buckets by their kind and the
+ * affected file, so equal reasons of many statements are only compared once to each past reason.
+ */
+class FutureImpurityReasons {
+    /**
+     * One reason per bucket, in the order the buckets were created.
+     */
+    private readonly buckets: ImpurityReason[] = [];
+    private readonly bucketKeys = new Set<string>();
+
+    /**
+     * Maps the key of a past reason to the number of buckets it was already compared to without an effect, or to -1 if
+     * it affects one of them. Since buckets are only added, these results stay valid.
+     */
+    private readonly comparedBuckets = new Map<string, number>();
+
+    add(reason: ImpurityReason): void {
+        const key = reason.toKey();
+        if (!this.bucketKeys.has(key)) {
+            this.bucketKeys.add(key);
+            this.buckets.push(reason);
+        }
+    }
+
+    canBeAffectedBy(past: ImpurityReason): boolean {
+        const key = past.toKey();
+        const start = this.comparedBuckets.get(key) ?? 0;
+        if (start === -1) {
+            return true;
+        }
+
+        for (let index = start; index < this.buckets.length; index++) {
+            if (past.canAffectFutureImpurityReason(this.buckets[index]!)) {
+                this.comparedBuckets.set(key, -1);
+                return true;
+            }
+        }
+
+        this.comparedBuckets.set(key, this.buckets.length);
+        return false;
+    }
+}
+
+interface StatementInfo {
+    readonly referencedPlaceholders: SdsPlaceholder[];
+    readonly impurityReasons: ImpurityReason[];
+}
+
+const getReferencedPlaceholders = (node: SdsStatement): SdsPlaceholder[] => {
+    return AstUtils.streamAllContents(node)
+        .flatMap((it) => {
             if (isSdsReference(it) && isSdsPlaceholder(it.target.ref)) {
                 return [it.target.ref];
             } else {
                 return [];
             }
-        });
-    }
-}
+        })
+        .toArray();
+};
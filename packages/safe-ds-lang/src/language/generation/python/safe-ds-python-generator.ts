@@ -72,6 +72,7 @@ import {
     SdsParameter,
     SdsParameterList,
     SdsPipeline,
+    SdsPlaceholder,
     SdsReference,
     SdsSegment,
     SdsStatement,
@@ -114,6 +115,8 @@ import {
     UtilityFunction,
 } from './utilityFunctions.js';
 import { CODEGEN_PREFIX } from './constants.js';
+import { SafeDsExecutionPlanner } from '../../flow/safe-ds-execution-planner.js';
+import { SafeDsPipelineOptimizer } from '../../flow/safe-ds-pipeline-optimizer.js';
 import { SafeDsSlicer } from '../../flow/safe-ds-slicer.js';
 import { SafeDsTypeChecker } from '../../typing/safe-ds-type-checker.js';
 import { SafeDsCoreTypes } from '../../typing/safe-ds-core-types.js';
@@ -129,6 +132,10 @@ const YIELD_PREFIX = `${CODEGEN_PREFIX}yield_`;
 const RUNNER_PACKAGE = 'safeds_runner';
 const MEMOIZED_DYNAMIC_CALL = `${RUNNER_PACKAGE}.memoized_dynamic_call`;
 const MEMOIZED_STATIC_CALL = `${RUNNER_PACKAGE}.memoized_static_call`;
+const LOAD_PLACEHOLDER = `${RUNNER_PACKAGE}.load_placeholder`;
+const FILE_MTIME = `${RUNNER_PACKAGE}.file_mtime`;
+const FILE_CONTENT_HASH = `${RUNNER_PACKAGE}.file_content_hash`;
+const RUN_PARALLEL = `${RUNNER_PACKAGE}.run_parallel`;
 const PYTHON_INDENT = '    ';
 
 const SPACING = new CompositeGeneratorNode(NL, NL);
@@ -139,6 +146,8 @@ export class SafeDsPythonGenerator {
     private readonly nodeMapper: SafeDsNodeMapper;
     private readonly partialEvaluator: SafeDsPartialEvaluator;
     private readonly purityComputer: SafeDsPurityComputer;
+    private readonly executionPlanner: SafeDsExecutionPlanner;
+    private readonly pipelineOptimizer: SafeDsPipelineOptimizer;
     private readonly slicer: SafeDsSlicer;
     private readonly syntheticProperties: SafeDsSyntheticProperties;
     private readonly typeChecker: SafeDsTypeChecker;
@@ -150,6 +159,8 @@ export class SafeDsPythonGenerator {
         this.nodeMapper = services.helpers.NodeMapper;
         this.partialEvaluator = services.evaluation.PartialEvaluator;
         this.purityComputer = services.purity.PurityComputer;
+        this.executionPlanner = services.flow.ExecutionPlanner;
+        this.pipelineOptimizer = services.flow.PipelineOptimizer;
         this.slicer = services.flow.Slicer;
         this.syntheticProperties = services.helpers.SyntheticProperties;
         this.typeChecker = services.typing.TypeChecker;
@@ -366,6 +377,9 @@ export class SafeDsPythonGenerator {
             false,
             undefined,
             generateOptions.disableRunnerIntegration,
+            undefined,
+            generateOptions.fileReadMemoizationKey,
+            generateOptions.optimize,
         );
         const segmentResult = segment.resultList?.results || [];
         const segmentBlock = this.generateBlock(segment.body, infoFrame);
@@ -433,6 +447,10 @@ export class SafeDsPythonGenerator {
             true,
             targetStatements,
             generateOptions.disableRunnerIntegration,
+            new Set(generateOptions.residentPlaceholders),
+            generateOptions.fileReadMemoizationKey,
+            generateOptions.optimize,
+            generateOptions.parallelize,
         );
         return expandTracedToNode(pipeline)`def ${traceToNode(
             pipeline,
@@ -483,19 +501,30 @@ export class SafeDsPythonGenerator {
         frame: GenerationInfoFrame,
         generateLambda: boolean = false,
     ): CompositeGeneratorNode {
-        // TODO: if there are no target statements, only generate code that causes side-effects
         let statements = getStatements(block).filter((stmt) => this.statementDoesSomething(stmt));
-        if (frame.targetStatements) {
-            const targetStatements = frame.targetStatements.flatMap((it) => {
-                return getStatements(block)[it] ?? [];
-            });
-            if (!isEmpty(targetStatements)) {
-                statements = this.slicer.computeBackwardSliceToTargets(statements, targetStatements);
-            }
+        const targetStatements = (frame.targetStatements ?? []).flatMap((it) => {
+            return getStatements(block)[it] ?? [];
+        });
+        if (!isEmpty(targetStatements)) {
+            statements = this.slicer.computeBackwardSliceToTargets(
+                statements,
+                targetStatements,
+                (stmt) => !generateLambda && this.isResidentStatement(stmt, frame),
+            );
+        } else if (frame.optimize) {
+            // The runner only queries placeholders of target statements, so no placeholder is observable here
+            const optimizedBlock = this.pipelineOptimizer.optimizeBlock(statements);
+            statements = optimizedBlock.statements;
+            frame.addReusedAssignments(optimizedBlock.reusedAssignments);
         }
         if (statements.length === 0) {
             return traceToNode(block)('pass');
         }
+        if (frame.parallelize && frame.isInsidePipeline && !generateLambda && !frame.disableRunnerIntegration) {
+            return joinTracedToNode(block, 'statements')(this.generateExecutionStages(statements, frame), {
+                separator: NL,
+            })!;
+        }
         return joinTracedToNode(block, 'statements')(
             statements,
             (stmt) => this.generateStatement(stmt, frame, generateLambda),
@@ -505,6 +534,47 @@ export class SafeDsPythonGenerator {
         )!;
     }
 
+    /**
+     * Generates the statements of a pipeline stage by stage (see {@link SafeDsExecutionPlanner}). Parallelizable
+     * assignments of a stage are submitted together to the runner, at the position of the first one.
+     */
+    private generateExecutionStages(statements: SdsStatement[], frame: GenerationInfoFrame): Generated[] {
+        const result: Generated[] = [];
+
+        for (const stage of this.executionPlanner.computeExecutionStages(statements)) {
+            const parallelAssignments = stage.filter((stmt): stmt is SdsAssignment =>
+                this.isParallelizableStatement(stmt, frame),
+            );
+
+            for (const statement of stage) {
+                if (parallelAssignments.length < 2 || !parallelAssignments.includes(<SdsAssignment>statement)) {
+                    result.push(this.generateStatement(statement, frame, false));
+                } else if (statement === parallelAssignments[0]) {
+                    result.push(this.generateParallelAssignments(parallelAssignments, frame));
+                }
+            }
+        }
+
+        return result;
+    }
+
+    /**
+     * Returns whether the given statement can be executed on another worker. It must assign the value of a pure
+     * expression to placeholders, which must be computed.
+     */
+    private isParallelizableStatement(node: SdsStatement, frame: GenerationInfoFrame): boolean {
+        if (!isSdsAssignment(node) || this.isResidentStatement(node, frame) || frame.getReusedAssignment(node)) {
+            return false;
+        }
+
+        const assignees = getAssignees(node);
+        return (
+            assignees.some(isSdsPlaceholder) &&
+            assignees.every((it) => isSdsPlaceholder(it) || isSdsWildcard(it)) &&
+            this.purityComputer.isPureExpression(node.expression)
+        );
+    }
+
     /**
      * Returns whether the given statement does something. It must either
      *     - create a placeholder,
@@ -527,10 +597,28 @@ export class SafeDsPythonGenerator {
         }
     }
 
+    /**
+     * Returns whether the values of all placeholders declared by the statement are already kept by the runner, so the
+     * statement does not need to be computed again.
+     */
+    private isResidentStatement(node: SdsStatement, frame: GenerationInfoFrame): boolean {
+        if (!frame.isInsidePipeline || frame.disableRunnerIntegration || !isSdsAssignment(node)) {
+            return false;
+        }
+
+        const assignees = getAssignees(node);
+        return (
+            assignees.some(isSdsPlaceholder) &&
+            assignees.every((it) => isSdsWildcard(it) || (isSdsPlaceholder(it) && frame.isResidentPlaceholder(it)))
+        );
+    }
+
     private generateStatement(statement: SdsStatement, frame: GenerationInfoFrame, generateLambda: boolean): Generated {
         const result: Generated[] = [];
 
-        if (isSdsAssignment(statement)) {
+        if (!generateLambda && this.isResidentStatement(statement, frame)) {
+            result.push(this.generateResidentAssignment(<SdsAssignment>statement, frame));
+        } else if (isSdsAssignment(statement)) {
             const assignment = this.generateAssignment(statement, frame, generateLambda);
             result.push(...frame.getExtraStatements(), assignment);
         } else if (isSdsExpressionStatement(statement)) {
@@ -566,7 +654,10 @@ export class SafeDsPythonGenerator {
         if (assignees.some((value) => !isSdsWildcard(value))) {
             const actualAssignees = assignees.map(this.generateAssignee);
             const assignmentStatements = [];
-            if (requiredAssignees === actualAssignees.length) {
+            const reusedAssignment = frame.getReusedAssignment(assignment);
+            if (reusedAssignment) {
+                assignmentStatements.push(this.generateReusedAssignment(assignment, reusedAssignment));
+            } else if (requiredAssignees === actualAssignees.length) {
                 assignmentStatements.push(
                     expandTracedToNode(assignment)`${joinToNode(actualAssignees, (actualAssignee) => actualAssignee, {
                         separator: ', ',
@@ -601,6 +692,86 @@ export class SafeDsPythonGenerator {
         }
     }
 
+    private generateParallelAssignments(assignments: SdsAssignment[], frame: GenerationInfoFrame): Generated {
+        frame.addImport({ importPath: RUNNER_PACKAGE });
+
+        const targets = assignments.map((assignment) => {
+            const rhsType = this.typeComputer.computeType(assignment.expression);
+            const requiredAssignees = rhsType instanceof NamedTupleType ? rhsType.length : 1;
+            const actualAssignees = getAssignees(assignment).map(this.generateAssignee);
+
+            if (requiredAssignees === 1 && actualAssignees.length === 1) {
+                return actualAssignees[0]!;
+            } else {
+                return expandToNode`(${joinToNode(
+                    actualAssignees.concat(Array(requiredAssignees - actualAssignees.length).fill('_')),
+                    (actualAssignee) => actualAssignee,
+                    { separator: ', ' },
+                )})`;
+            }
+        });
+        const tasks = assignments.map(
+            (assignment) =>
+                expandTracedToNode(assignment)`lambda: ${this.generateExpression(assignment.expression!, frame)}`,
+        );
+
+        // Receivers of memoized calls are computed before the tasks are submitted
+        const result: Generated[] = [...frame.getExtraStatements()];
+        frame.resetExtraStatements();
+
+        // Each task gets its own line, so errors in a task can be mapped back to its assignment
+        result.push(
+            expandToNode`${joinToNode(targets, (target) => target, { separator: ', ' })} = ${RUN_PARALLEL}(`
+                .appendNewLine()
+                .indent({
+                    indentedChildren: [joinToNode(tasks, (task) => task, { suffix: ',', separator: NL })],
+                    indentation: PYTHON_INDENT,
+                })
+                .appendNewLine()
+                .append(')'),
+        );
+        for (const placeholder of assignments.flatMap((it) => getAssignees(it).filter(isSdsPlaceholder))) {
+            result.push(
+                expandTracedToNode(
+                    placeholder,
+                )`${RUNNER_PACKAGE}.save_placeholder('${placeholder.name}', ${PLACEHOLDER_PREFIX}${placeholder.name})`,
+            );
+        }
+
+        return joinToNode(result, (stmt) => stmt, { separator: NL })!;
+    }
+
+    private generateReusedAssignment(assignment: SdsAssignment, reusedAssignment: SdsAssignment): Generated {
+        const reusedAssignees = getAssignees(reusedAssignment);
+
+        return joinTracedToNode(assignment)(
+            getAssignees(assignment).flatMap((assignee, index) => {
+                if (isSdsWildcard(assignee)) {
+                    return [];
+                }
+
+                const reusedPlaceholder = <SdsPlaceholder>reusedAssignees[index];
+                return expandTracedToNode(
+                    assignee,
+                )`${this.generateAssignee(assignee)} = ${PLACEHOLDER_PREFIX}${reusedPlaceholder.name}`;
+            }),
+            { separator: NL },
+        )!;
+    }
+
+    private generateResidentAssignment(assignment: SdsAssignment, frame: GenerationInfoFrame): Generated {
+        frame.addImport({ importPath: RUNNER_PACKAGE });
+
+        return joinTracedToNode(assignment)(
+            getAssignees(assignment).filter(isSdsPlaceholder),
+            (placeholder) =>
+                expandTracedToNode(
+                    placeholder,
+                )`${PLACEHOLDER_PREFIX}${placeholder.name} = ${LOAD_PLACEHOLDER}('${placeholder.name}')`,
+            { separator: NL },
+        )!;
+    }
+
     private generateOutputStatement(node: SdsOutputStatement, frame: GenerationInfoFrame): Generated {
         const valueNames = this.syntheticProperties.getValueNamesForExpression(node.expression);
         const assignmentStatements: Generated[] = [];
@@ -1156,13 +1327,12 @@ export class SafeDsPythonGenerator {
         const impurityReasons = this.purityComputer.getImpurityReasonsForCallable(
             this.nodeMapper.callToCallable(expression),
         );
+        const fileKeyFunction = frame.fileReadMemoizationKey === 'content_hash' ? FILE_CONTENT_HASH : FILE_MTIME;
         const hiddenParameters: Generated[] = [];
         for (const reason of impurityReasons) {
             if (reason instanceof FileRead) {
                 if (typeof reason.path === 'string') {
-                    hiddenParameters.push(
-                        expandTracedToNode(expression)`${RUNNER_PACKAGE}.file_mtime('${reason.path}')`,
-                    );
+                    hiddenParameters.push(expandTracedToNode(expression)`${fileKeyFunction}('${reason.path}')`);
                 } else if (isSdsParameter(reason.path)) {
                     const argument = this.nodeMapper
                         .parametersToArguments([reason.path], getArguments(expression))
@@ -1174,10 +1344,7 @@ export class SafeDsPythonGenerator {
                         );
                     }
                     hiddenParameters.push(
-                        expandTracedToNode(argument)`${RUNNER_PACKAGE}.file_mtime(${this.generateArgument(
-                            argument,
-                            frame,
-                        )})`,
+                        expandTracedToNode(argument)`${fileKeyFunction}(${this.generateArgument(argument, frame)})`,
                     );
                 }
             }
@@ -1307,6 +1474,11 @@ class GenerationInfoFrame {
     public readonly isInsidePipeline: boolean;
     public readonly targetStatements: number[] | undefined;
     public readonly disableRunnerIntegration: boolean;
+    private readonly residentPlaceholders: Set<string>;
+    public readonly fileReadMemoizationKey: FileReadMemoizationKey;
+    public readonly optimize: boolean;
+    public readonly parallelize: boolean;
+    private readonly reusedAssignments: Map<SdsAssignment, SdsAssignment>;
     private extraStatements = new Map<SdsExpression, Generated>();
 
     constructor(
@@ -1316,6 +1488,11 @@ class GenerationInfoFrame {
         insidePipeline: boolean = false,
         targetStatements: number[] | undefined = undefined,
         disableRunnerIntegration: boolean = false,
+        residentPlaceholders: Set<string> = new Set<string>(),
+        fileReadMemoizationKey: FileReadMemoizationKey = 'mtime',
+        optimize: boolean = false,
+        parallelize: boolean = false,
+        reusedAssignments: Map<SdsAssignment, SdsAssignment> = new Map(),
         idManager: IdManager<SdsExpression> = new IdManager(),
     ) {
         this.idManager = idManager;
@@ -1325,6 +1502,28 @@ class GenerationInfoFrame {
         this.isInsidePipeline = insidePipeline;
         this.targetStatements = targetStatements;
         this.disableRunnerIntegration = disableRunnerIntegration;
+        this.residentPlaceholders = residentPlaceholders;
+        this.fileReadMemoizationKey = fileReadMemoizationKey;
+        this.optimize = optimize;
+        this.parallelize = parallelize;
+        this.reusedAssignments = reusedAssignments;
+    }
+
+    isResidentPlaceholder(placeholder: SdsPlaceholder): boolean {
+        return this.residentPlaceholders.has(placeholder.name);
+    }
+
+    addReusedAssignments(reusedAssignments: Map<SdsAssignment, SdsAssignment>): void {
+        reusedAssignments.forEach((earlierAssignment, assignment) =>
+            this.reusedAssignments.set(assignment, earlierAssignment),
+        );
+    }
+
+    /**
+     * Returns the earlier assignment whose placeholders already hold the values that are computed by the given one.
+     */
+    getReusedAssignment(assignment: SdsAssignment): SdsAssignment | undefined {
+        return this.reusedAssignments.get(assignment);
     }
 
     addImport(importData: ImportData | undefined) {
@@ -1384,6 +1583,11 @@ class GenerationInfoFrame {
             this.isInsidePipeline,
             this.targetStatements,
             this.disableRunnerIntegration,
+            this.residentPlaceholders,
+            this.fileReadMemoizationKey,
+            this.optimize,
+            this.parallelize,
+            this.reusedAssignments,
             this.idManager,
         );
     }
@@ -1412,4 +1616,50 @@ export interface GenerateOptions {
      * Whether to disable the integration with the `safe-ds-runner` package and instead generate plain Python code.
      */
     disableRunnerIntegration: boolean;
+
+    /**
+     * The names of placeholders whose values are already kept by the runner from a previous execution in the same
+     * session. Instead of computing them again, the generated code loads them from the runner. Statements that are
+     * only needed to compute resident placeholders are omitted.
+     *
+     * If undefined, no placeholders are resident.
+     */
+    residentPlaceholders?: string[];
+
+    /**
+     * How memoized calls that read files detect whether the files changed (see {@link FileReadMemoizationKey}).
+     *
+     * If undefined, `mtime` is used.
+     */
+    fileReadMemoizationKey?: FileReadMemoizationKey;
+
+    /**
+     * Whether to optimize the bodies of pipelines, segments, and block lambdas if there are no target statements:
+     * - Statements without side effects are omitted if nothing depends on them.
+     * - An assignment that calls a pure function with the same arguments as an earlier assignment reuses its values.
+     *
+     * If undefined, the code is not optimized.
+     */
+    optimize?: boolean;
+
+    /**
+     * Whether statements of pipelines that do not depend on each other should be executed in parallel. Assignments of
+     * pure expressions that can run at the same time are submitted together to the runner, which executes them on a
+     * pool of workers. The values of placeholders are the same as for a sequential execution. This has no effect if
+     * the runner integration is disabled.
+     *
+     * If undefined, statements are executed sequentially.
+     */
+    parallelize?: boolean;
 }
+
+/**
+ * The value that is added to the memoization key of a call for each file it reads:
+ * - `mtime`: The modification time of the file (`safeds_runner.file_mtime`). This is cheap, but a file that is
+ *   checked out again with the same content causes a miss, and on file systems with a coarse resolution of
+ *   modification times, a changed file can cause a hit.
+ * - `content_hash`: A hash of the content of the file (`safeds_runner.file_content_hash`). The runner hashes files
+ *   incrementally and caches the hashes by inode, size, and modification time, so large files are only hashed again
+ *   if they might have changed.
+ */
+export type FileReadMemoizationKey = 'mtime' | 'content_hash';
@@ -28,6 +28,7 @@ export * as rpc from './communication/rpc.js';
 
 // Generation
 export { CODEGEN_PREFIX } from './generation/python/constants.js';
+export type { FileReadMemoizationKey } from './generation/python/safe-ds-python-generator.js';
 
 // Dependencies
 export const dependencies = {
@@ -20,15 +20,18 @@ export class SafeDsExecuteCommandHandler extends AbstractExecuteCommandHandler {
     }
 
     override registerCommands(acceptor: ExecuteCommandAcceptor) {
-        acceptor(COMMAND_EXPLORE_TABLE, ([name, [documentUri, nodePath]]) =>
-            this.runner.exploreTable(name, documentUri, nodePath),
+        // Cancelling the command request also cancels the pipeline execution on the runner
+        acceptor(COMMAND_EXPLORE_TABLE, ([name, [documentUri, nodePath]], cancelToken) =>
+            this.runner.exploreTable(name, documentUri, nodePath, cancelToken),
         );
-        acceptor(COMMAND_PRINT_VALUE, ([name, [documentUri, nodePath]]) =>
-            this.runner.printValue(name, documentUri, nodePath),
+        acceptor(COMMAND_PRINT_VALUE, ([name, [documentUri, nodePath]], cancelToken) =>
+            this.runner.printValue(name, documentUri, nodePath, cancelToken),
         );
-        acceptor(COMMAND_RUN_PIPELINE, ([documentUri, nodePath]) => this.runner.runPipeline(documentUri, nodePath));
-        acceptor(COMMAND_SHOW_IMAGE, ([name, [documentUri, nodePath]]) =>
-            this.runner.showImage(name, documentUri, nodePath),
+        acceptor(COMMAND_RUN_PIPELINE, ([documentUri, nodePath], cancelToken) =>
+            this.runner.runPipeline(documentUri, nodePath, cancelToken),
+        );
+        acceptor(COMMAND_SHOW_IMAGE, ([name, [documentUri, nodePath]], cancelToken) =>
+            this.runner.showImage(name, documentUri, nodePath, cancelToken),
         );
     }
 }
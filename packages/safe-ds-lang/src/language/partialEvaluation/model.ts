@@ -1,4 +1,4 @@
-import { stream } from 'langium';
+import { type AstNode, EMPTY_STREAM, type Stream, stream } from 'langium';
 import {
     type SdsAbstractResult,
     type SdsBlockLambda,
@@ -41,6 +41,13 @@ export abstract class EvaluatedNode {
     unwrap(): EvaluatedNode {
         return this;
     }
+
+    /**
+     * Returns the AST nodes that the node and its nested nodes refer to.
+     */
+    streamAstNodes(): Stream<AstNode> {
+        return EMPTY_STREAM;
+    }
 }
 
 // -------------------------------------------------------------------------------------------------
@@ -152,6 +159,10 @@ export abstract class EvaluatedCallable extends EvaluatedNode {
     abstract readonly callable: SdsCallable | SdsParameter;
     abstract readonly substitutionsOnCreation: ParameterSubstitutions;
     override readonly isFullyEvaluated: boolean = false;
+
+    override streamAstNodes(): Stream<AstNode> {
+        return stream<AstNode>([this.callable]).concat(streamAstNodesOfSubstitutions(this.substitutionsOnCreation));
+    }
 }
 
 export class BlockLambdaClosure extends EvaluatedCallable {
@@ -291,6 +302,10 @@ export class EvaluatedEnumVariant extends EvaluatedNode {
             return `${this.variant.name}(${parameterValues})`;
         }
     }
+
+    override streamAstNodes(): Stream<AstNode> {
+        return stream<AstNode>([this.variant]).concat(streamAstNodesOfSubstitutions(this.substitutions));
+    }
 }
 
 export class EvaluatedList extends EvaluatedNode {
@@ -329,6 +344,10 @@ export class EvaluatedList extends EvaluatedNode {
     override toString(): string {
         return `[${this.elements.join(', ')}]`;
     }
+
+    override streamAstNodes(): Stream<AstNode> {
+        return stream(this.elements).flatMap((it) => it.streamAstNodes());
+    }
 }
 
 export class EvaluatedMap extends EvaluatedNode {
@@ -373,6 +392,10 @@ export class EvaluatedMap extends EvaluatedNode {
     override toString(): string {
         return `{${this.entries.join(', ')}}`;
     }
+
+    override streamAstNodes(): Stream<AstNode> {
+        return stream(this.entries).flatMap((it) => it.streamAstNodes());
+    }
 }
 
 export class EvaluatedMapEntry extends EvaluatedNode {
@@ -398,6 +421,10 @@ export class EvaluatedMapEntry extends EvaluatedNode {
     override toString(): string {
         return `${this.key}: ${this.value}`;
     }
+
+    override streamAstNodes(): Stream<AstNode> {
+        return this.key.streamAstNodes().concat(this.value.streamAstNodes());
+    }
 }
 
 /**
@@ -461,6 +488,10 @@ export class EvaluatedNamedTuple extends EvaluatedNode {
         const entryString = Array.from(this.entries, ([result, value]) => `${result.name} = ${value}`).join(', ');
         return `(${entryString})`;
     }
+
+    override streamAstNodes(): Stream<AstNode> {
+        return streamAstNodesOfSubstitutions(this.entries);
+    }
 }
 
 class UnknownEvaluatedNodeClass extends EvaluatedNode {
@@ -501,3 +532,105 @@ export const substitutionsAreEqual = (
         return aEntry === bEntry && aValue.equals(bValue);
     });
 };
+
+/**
+ * Returns the declarations of the given substitutions and the AST nodes that their values refer to.
+ */
+export const streamAstNodesOfSubstitutions = (
+    substitutions: Map<SdsDeclaration, EvaluatedNode> | undefined,
+): Stream<AstNode> => {
+    if (!substitutions) {
+        return EMPTY_STREAM;
+    }
+
+    return stream(substitutions).flatMap(([declaration, value]) =>
+        stream<AstNode>([declaration]).concat(value.streamAstNodes()),
+    );
+};
+
+const substitutionsHashes = new WeakMap<ParameterSubstitutions, string>();
+
+/**
+ * Returns a hash of the given parameter substitutions. Equal substitutions have the same hash, but substitutions with
+ * the same hash need not be equal. Substitutions must not be modified after their hash has been computed.
+ */
+export const hashSubstitutions = (substitutions: ParameterSubstitutions): string => {
+    let hash = substitutionsHashes.get(substitutions);
+    if (hash === undefined) {
+        hash = Array.from(substitutions, ([parameter, value]) => `${parameter.name}=${value}`).join(', ');
+        substitutionsHashes.set(substitutions, hash);
+    }
+
+    return hash;
+};
+
+/**
+ * Maps parameter substitutions to values. Substitutions are grouped by their hash, so a lookup only compares them to
+ * substitutions with the same hash.
+ */
+export class SubstitutionsMap<V> {
+    private readonly buckets = new Map<string, [ParameterSubstitutions, V][]>();
+    private _size = 0;
+
+    /**
+     * The number of stored substitutions.
+     */
+    get size(): number {
+        return this._size;
+    }
+
+    has(substitutions: ParameterSubstitutions): boolean {
+        return this.findEntry(substitutions) !== undefined;
+    }
+
+    get(substitutions: ParameterSubstitutions): V | undefined;
+    get(substitutions: ParameterSubstitutions, provider: () => V): V;
+    get(substitutions: ParameterSubstitutions, provider?: () => V): V | undefined {
+        const entry = this.findEntry(substitutions);
+        if (entry) {
+            return entry[1];
+        } else if (provider) {
+            const value = provider();
+            this.set(substitutions, value);
+            return value;
+        } else {
+            return undefined;
+        }
+    }
+
+    set(substitutions: ParameterSubstitutions, value: V): void {
+        const entry = this.findEntry(substitutions);
+        if (entry) {
+            entry[1] = value;
+            return;
+        }
+
+        const hash = hashSubstitutions(substitutions);
+        if (!this.buckets.has(hash)) {
+            this.buckets.set(hash, []);
+        }
+        this.buckets.get(hash)!.push([substitutions, value]);
+        this._size++;
+    }
+
+    delete(substitutions: ParameterSubstitutions): void {
+        const hash = hashSubstitutions(substitutions);
+        const bucket = this.buckets.get(hash);
+        const index = bucket?.findIndex(([it]) => substitutionsAreEqual(it, substitutions)) ?? -1;
+        if (index === -1) {
+            return;
+        }
+
+        bucket!.splice(index, 1);
+        this._size--;
+        if (bucket!.length === 0) {
+            this.buckets.delete(hash);
+        }
+    }
+
+    private findEntry(substitutions: ParameterSubstitutions): [ParameterSubstitutions, V] | undefined {
+        return this.buckets
+            .get(hashSubstitutions(substitutions))
+            ?.find(([it]) => it === substitutions || substitutionsAreEqual(it, substitutions));
+    }
+}
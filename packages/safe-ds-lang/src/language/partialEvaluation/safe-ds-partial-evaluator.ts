@@ -1,4 +1,5 @@
-import { AstNode, AstNodeLocator, AstUtils, WorkspaceCache } from 'langium';
+import { AstNode, AstUtils } from 'langium';
+import { DependencyTrackedNodeCache } from '../workspace/safe-ds-document-dependencies.js';
 import { isEmpty } from '../../helpers/collections.js';
 import {
     isSdsArgument,
@@ -72,27 +73,29 @@ import {
     NumberConstant,
     ParameterSubstitutions,
     StringConstant,
-    substitutionsAreEqual,
+    streamAstNodesOfSubstitutions,
+    SubstitutionsMap,
     UnknownEvaluatedNode,
 } from './model.js';
 import type { SafeDsTypeComputer } from '../typing/safe-ds-type-computer.js';
 import { SafeDsCoreTypes } from '../typing/safe-ds-core-types.js';
 
 export class SafeDsPartialEvaluator {
-    private readonly astNodeLocator: AstNodeLocator;
     private readonly coreTypes: SafeDsCoreTypes;
     private readonly nodeMapper: SafeDsNodeMapper;
     private readonly typeComputer: () => SafeDsTypeComputer;
 
-    private readonly cache: WorkspaceCache<string, EvaluatedNode>;
+    /**
+     * Stores the results of evaluating a node with different parameter substitutions.
+     */
+    private readonly cache: DependencyTrackedNodeCache<SubstitutionsMap<EvaluatedNode>>;
 
     constructor(services: SafeDsServices) {
-        this.astNodeLocator = services.workspace.AstNodeLocator;
         this.coreTypes = services.typing.CoreTypes;
         this.nodeMapper = services.helpers.NodeMapper;
         this.typeComputer = () => services.typing.TypeComputer;
 
-        this.cache = new WorkspaceCache(services.shared);
+        this.cache = new DependencyTrackedNodeCache(services);
     }
 
     // -----------------------------------------------------------------------------------------------------------------
@@ -100,43 +103,64 @@ export class SafeDsPartialEvaluator {
     // -----------------------------------------------------------------------------------------------------------------
 
     evaluate(node: AstNode | undefined, substitutions: ParameterSubstitutions = NO_SUBSTITUTIONS): EvaluatedNode {
-        return this.evaluateWithRecursionCheck(node, substitutions, [])?.unwrap();
+        return this.evaluateWithRecursionCheck(node, substitutions, new VisitedStates())?.unwrap();
     }
 
     private evaluateWithRecursionCheck(
         node: AstNode | undefined,
         substitutions: ParameterSubstitutions,
-        visited: VisitedState[],
+        visited: VisitedStates,
     ): EvaluatedNode {
-        if (!node || visited.some((it) => visitedStatesAreEqual(it, [node, substitutions]))) {
+        if (!node || visited.cutsOff(node, substitutions)) {
             return UnknownEvaluatedNode;
         }
 
-        // Remember that we have already visited this node
-        const newVisited: VisitedState[] = [...visited, [node, substitutions]];
+        // Remember that we are visiting this node, until its evaluation is done
+        visited.add(node, substitutions);
+        try {
+            const results = this.cache.get(node, () => new SubstitutionsMap());
+
+            // Try to evaluate the node without parameter substitutions first
+            const resultWithoutSubstitutions = this.getOrEvaluate(results, node, NO_SUBSTITUTIONS, visited);
+            if (resultWithoutSubstitutions.isFullyEvaluated || isEmpty(substitutions)) {
+                return resultWithoutSubstitutions;
+            } else {
+                // Try again with parameter substitutions
+                return this.getOrEvaluate(results, node, substitutions, visited);
+            }
+        } finally {
+            visited.delete(node, substitutions);
+        }
+    }
+
+    private getOrEvaluate(
+        results: SubstitutionsMap<EvaluatedNode>,
+        node: AstNode,
+        substitutions: ParameterSubstitutions,
+        visited: VisitedStates,
+    ): EvaluatedNode {
+        const cachedResult = results.get(substitutions);
+        if (cachedResult) {
+            return cachedResult;
+        }
 
-        // Try to evaluate the node without parameter substitutions and cache the result
-        const resultWithoutSubstitutions = this.cache.get(this.getNodeId(node), () =>
-            this.doEvaluateWithRecursionCheck(node, NO_SUBSTITUTIONS, newVisited),
+        const [result, dependsOnContext] = visited.track(() =>
+            this.doEvaluateWithRecursionCheck(node, substitutions, visited),
         );
-        if (resultWithoutSubstitutions.isFullyEvaluated || isEmpty(substitutions)) {
-            return resultWithoutSubstitutions;
-        } else {
-            // Try again with parameter substitutions but don't cache the result
-            return this.doEvaluateWithRecursionCheck(node, substitutions, newVisited);
+
+        // If the evaluation of an enclosing node was cut off, the result is only valid in the current context
+        if (!dependsOnContext && results.size < MAX_CACHED_SUBSTITUTIONS_PER_NODE) {
+            results.set(substitutions, result);
+            this.cache.addDependencies(node, streamAstNodesOfSubstitutions(substitutions));
         }
-    }
 
-    private getNodeId(node: AstNode) {
-        const documentUri = AstUtils.getDocument(node).uri.toString();
-        const nodePath = this.astNodeLocator.getAstNodePath(node);
-        return `${documentUri}~${nodePath}`;
+        return result;
     }
 
     private doEvaluateWithRecursionCheck(
         node: AstNode | undefined,
         substitutions: ParameterSubstitutions,
-        visited: VisitedState[],
+        visited: VisitedStates,
     ): EvaluatedNode {
         if (isSdsAssignee(node)) {
             return this.evaluateAssignee(node, substitutions, visited);
@@ -152,7 +176,7 @@ export class SafeDsPartialEvaluator {
     private evaluateAssignee(
         node: SdsAssignee,
         substitutions: ParameterSubstitutions,
-        visited: VisitedState[],
+        visited: VisitedStates,
     ): EvaluatedNode {
         const containingAssignment = AstUtils.getContainerOfType(node, isSdsAssignment);
         if (!containingAssignment) {
@@ -178,7 +202,7 @@ export class SafeDsPartialEvaluator {
     private evaluateDeclaration(
         node: SdsDeclaration,
         substitutions: ParameterSubstitutions,
-        visited: VisitedState[],
+        visited: VisitedStates,
     ): EvaluatedNode {
         if (isSdsClass(node)) {
             return new NamedCallable(node);
@@ -199,7 +223,7 @@ export class SafeDsPartialEvaluator {
     private evaluateExpression(
         node: SdsExpression,
         substitutions: ParameterSubstitutions,
-        visited: VisitedState[],
+        visited: VisitedStates,
     ): EvaluatedNode {
         // Base cases
         if (isSdsBoolean(node)) {
@@ -255,7 +279,7 @@ export class SafeDsPartialEvaluator {
     private evaluateInfixOperation(
         node: SdsInfixOperation,
         substitutions: ParameterSubstitutions,
-        visited: VisitedState[],
+        visited: VisitedStates,
     ): EvaluatedNode {
         // Handle operators that can short-circuit
         const evaluatedLeft = this.evaluateWithRecursionCheck(node.leftOperand, substitutions, visited);
@@ -365,7 +389,7 @@ export class SafeDsPartialEvaluator {
         evaluatedLeft: EvaluatedNode,
         rightOperand: SdsExpression,
         substitutions: ParameterSubstitutions,
-        visited: VisitedState[],
+        visited: VisitedStates,
     ): EvaluatedNode {
         // Short-circuit
         if (evaluatedLeft.equals(trueConstant)) {
@@ -388,7 +412,7 @@ export class SafeDsPartialEvaluator {
         evaluatedLeft: EvaluatedNode,
         rightOperand: SdsExpression,
         substitutions: ParameterSubstitutions,
-        visited: VisitedState[],
+        visited: VisitedStates,
     ): EvaluatedNode {
         // Short-circuit
         if (evaluatedLeft.equals(falseConstant)) {
@@ -411,7 +435,7 @@ export class SafeDsPartialEvaluator {
         evaluatedLeft: EvaluatedNode,
         rightOperand: SdsExpression,
         substitutions: ParameterSubstitutions,
-        visited: VisitedState[],
+        visited: VisitedStates,
     ): EvaluatedNode {
         // Short-circuit
         if (evaluatedLeft instanceof Constant && !evaluatedLeft.equals(NullConstant)) {
@@ -456,13 +480,13 @@ export class SafeDsPartialEvaluator {
         return UnknownEvaluatedNode;
     }
 
-    private evaluateList(node: SdsList, substitutions: ParameterSubstitutions, visited: VisitedState[]): EvaluatedNode {
+    private evaluateList(node: SdsList, substitutions: ParameterSubstitutions, visited: VisitedStates): EvaluatedNode {
         return new EvaluatedList(
             node.elements.map((it) => this.evaluateWithRecursionCheck(it, substitutions, visited)),
         );
     }
 
-    private evaluateMap(node: SdsMap, substitutions: ParameterSubstitutions, visited: VisitedState[]): EvaluatedNode {
+    private evaluateMap(node: SdsMap, substitutions: ParameterSubstitutions, visited: VisitedStates): EvaluatedNode {
         return new EvaluatedMap(
             node.entries.map((it) => {
                 const key = this.evaluateWithRecursionCheck(it.key, substitutions, visited);
@@ -475,7 +499,7 @@ export class SafeDsPartialEvaluator {
     private evaluatePrefixOperation(
         node: SdsPrefixOperation,
         substitutions: ParameterSubstitutions,
-        visited: VisitedState[],
+        visited: VisitedStates,
     ): EvaluatedNode {
         const evaluatedOperand = this.evaluateWithRecursionCheck(node.operand, substitutions, visited);
         if (evaluatedOperand === UnknownEvaluatedNode) {
@@ -500,7 +524,7 @@ export class SafeDsPartialEvaluator {
     private evaluateTemplateString(
         node: SdsTemplateString,
         substitutions: ParameterSubstitutions,
-        visited: VisitedState[],
+        visited: VisitedStates,
     ): EvaluatedNode {
         const expressions = node.expressions.map((it) => this.evaluateWithRecursionCheck(it, substitutions, visited));
         if (expressions.every(isConstant)) {
@@ -510,7 +534,7 @@ export class SafeDsPartialEvaluator {
         return UnknownEvaluatedNode;
     }
 
-    private evaluateCall(node: SdsCall, substitutions: ParameterSubstitutions, visited: VisitedState[]): EvaluatedNode {
+    private evaluateCall(node: SdsCall, substitutions: ParameterSubstitutions, visited: VisitedStates): EvaluatedNode {
         const receiver = this.evaluateWithRecursionCheck(node.receiver, substitutions, visited).unwrap();
         const args = getArguments(node);
 
@@ -535,7 +559,7 @@ export class SafeDsPartialEvaluator {
         receiver: EvaluatedEnumVariant,
         args: SdsArgument[],
         substitutions: Map<SdsParameter, EvaluatedNode>,
-        visited: VisitedState[],
+        visited: VisitedStates,
     ) {
         // The enum variant has already been instantiated
         if (receiver.hasBeenInstantiated) {
@@ -558,7 +582,7 @@ export class SafeDsPartialEvaluator {
         args: SdsArgument[],
         substitutionsOnCreation: ParameterSubstitutions,
         substitutionsOnCall: ParameterSubstitutions,
-        visited: VisitedState[],
+        visited: VisitedStates,
     ) {
         if (!isSdsCallable(callable)) {
             /* c8 ignore next 2 */
@@ -594,7 +618,7 @@ export class SafeDsPartialEvaluator {
         args: SdsArgument[],
         substitutionsOnCreation: ParameterSubstitutions,
         substitutionsOnCall: ParameterSubstitutions,
-        visited: VisitedState[],
+        visited: VisitedStates,
     ): ParameterSubstitutions {
         if (!callable || isSdsParameter(callable)) {
             /* c8 ignore next 2 */
@@ -633,7 +657,7 @@ export class SafeDsPartialEvaluator {
     private evaluateIndexedAccess(
         node: SdsIndexedAccess,
         substitutions: ParameterSubstitutions,
-        visited: VisitedState[],
+        visited: VisitedStates,
     ): EvaluatedNode {
         const receiver = this.evaluateWithRecursionCheck(node.receiver, substitutions, visited).unwrap();
 
@@ -655,7 +679,7 @@ export class SafeDsPartialEvaluator {
     private evaluateMemberAccess(
         node: SdsMemberAccess,
         substitutions: ParameterSubstitutions,
-        visited: VisitedState[],
+        visited: VisitedStates,
     ): EvaluatedNode {
         const member = node.member?.target?.ref;
         if (!member) {
@@ -689,7 +713,13 @@ export class SafeDsPartialEvaluator {
     ): ParameterSubstitutions {
         const callable = this.nodeMapper.callToCallable(call);
         const args = getArguments(call);
-        return this.getParameterSubstitutionsAfterCall(callable, args, NO_SUBSTITUTIONS, substitutions, []);
+        return this.getParameterSubstitutionsAfterCall(
+            callable,
+            args,
+            NO_SUBSTITUTIONS,
+            substitutions,
+            new VisitedStates(),
+        );
     }
 
     // -----------------------------------------------------------------------------------------------------------------
@@ -745,6 +775,62 @@ const falseConstant = new BooleanConstant(false);
 const trueConstant = new BooleanConstant(true);
 const zeroConstants = [new IntConstant(0n), new FloatConstant(0.0), new FloatConstant(-0.0)];
 
-type VisitedState = [AstNode, ParameterSubstitutions];
+/**
+ * How many results with different parameter substitutions are cached for a node at most.
+ */
+const MAX_CACHED_SUBSTITUTIONS_PER_NODE = 32;
+
+/**
+ * The nodes that are currently being evaluated together with their parameter substitutions. Evaluating one of them
+ * again would lead to an infinite recursion, so the evaluation is cut off there.
+ */
+class VisitedStates {
+    // Maps the visited states to their depth in the stack of evaluations
+    private readonly depths = new Map<AstNode, SubstitutionsMap<number>>();
+    private depth = 0;
 
-const visitedStatesAreEqual = (a: VisitedState, b: VisitedState) => a[0] === b[0] && substitutionsAreEqual(a[1], b[1]);
+    // The lowest depth of a state where an evaluation was cut off since the innermost call of `track` started
+    private lowestCutOffDepth = Infinity;
+
+    /**
+     * Returns whether the node is currently evaluated with the given substitutions. If so, the cut-off is recorded.
+     */
+    cutsOff(node: AstNode, substitutions: ParameterSubstitutions): boolean {
+        const depth = this.depths.get(node)?.get(substitutions);
+        if (depth === undefined) {
+            return false;
+        }
+
+        this.lowestCutOffDepth = Math.min(this.lowestCutOffDepth, depth);
+        return true;
+    }
+
+    add(node: AstNode, substitutions: ParameterSubstitutions): void {
+        if (!this.depths.has(node)) {
+            this.depths.set(node, new SubstitutionsMap());
+        }
+        this.depths.get(node)!.set(substitutions, this.depth++);
+    }
+
+    delete(node: AstNode, substitutions: ParameterSubstitutions): void {
+        this.depths.get(node)?.delete(substitutions);
+        this.depth--;
+    }
+
+    /**
+     * Runs the given evaluation of the innermost visited state. Also returns whether its result depends on the context,
+     * i.e. whether an evaluation of an enclosing state was cut off. Such results must not be cached, since evaluating
+     * the node in another context can yield a different result.
+     */
+    track<T>(evaluate: () => T): [T, boolean] {
+        const outerLowestCutOffDepth = this.lowestCutOffDepth;
+        this.lowestCutOffDepth = Infinity;
+
+        try {
+            const result = evaluate();
+            return [result, this.lowestCutOffDepth < this.depth - 1];
+        } finally {
+            this.lowestCutOffDepth = Math.min(outerLowestCutOffDepth, this.lowestCutOffDepth);
+        }
+    }
+}
@@ -1,4 +1,5 @@
 import { isSdsParameter, type SdsParameter } from '../generated/ast.js';
+import { IdManager } from '../helpers/idManager.js';
 import { getQualifiedName } from '../helpers/nodeProperties.js';
 
 /**
@@ -20,6 +21,12 @@ export abstract class ImpurityReason {
      */
     abstract toString(): string;
 
+    /**
+     * Returns a key that is equal for two impurity reasons if, and only if, they are equal. Unlike the string
+     * representation, it distinguishes different parameters with the same qualified name.
+     */
+    abstract toKey(): string;
+
     /**
      * Returns whether this impurity reason can affect a future impurity reason.
      *
@@ -54,6 +61,10 @@ export class FileRead extends ImpurityReason {
         }
     }
 
+    override toKey(): string {
+        return `FileRead(${pathToKey(this.path)})`;
+    }
+
     override canAffectFutureImpurityReason(_future: ImpurityReason): boolean {
         // Reads can't affect other reasons
         return false;
@@ -86,6 +97,10 @@ export class FileWrite extends ImpurityReason {
         }
     }
 
+    override toKey(): string {
+        return `FileWrite(${pathToKey(this.path)})`;
+    }
+
     override canAffectFutureImpurityReason(future: ImpurityReason): boolean {
         if (future instanceof FileWrite || future instanceof FileRead) {
             if (typeof this.path === 'string' && typeof future.path === 'string') {
@@ -121,6 +136,10 @@ export class PotentiallyImpureParameterCall extends ImpurityReason {
         }
     }
 
+    override toKey(): string {
+        return `PotentiallyImpureParameterCall(${pathToKey(this.parameter)})`;
+    }
+
     override canAffectFutureImpurityReason(future: ImpurityReason): boolean {
         return future !== EndlessRecursion;
     }
@@ -140,6 +159,10 @@ class UnknownCallableCallClass extends ImpurityReason {
         return 'Unknown callable call';
     }
 
+    override toKey(): string {
+        return 'UnknownCallableCall';
+    }
+
     canAffectFutureImpurityReason(future: ImpurityReason): boolean {
         /* c8 ignore next 2 */
         return future !== EndlessRecursion;
@@ -162,6 +185,10 @@ class EndlessRecursionClass extends ImpurityReason {
         return 'Endless recursion';
     }
 
+    override toKey(): string {
+        return 'EndlessRecursion';
+    }
+
     override canAffectFutureImpurityReason(_future: ImpurityReason): boolean {
         /* c8 ignore next 3 */
         // Endless recursions don't have any effect on others
@@ -185,6 +212,10 @@ class OtherImpurityReasonClass extends ImpurityReason {
         return 'Other';
     }
 
+    override toKey(): string {
+        return 'OtherImpurityReason';
+    }
+
     canAffectFutureImpurityReason(future: ImpurityReason): boolean {
         return future !== EndlessRecursion;
     }
@@ -194,3 +225,15 @@ class OtherImpurityReasonClass extends ImpurityReason {
  * A function is impure due to some reason that is not covered by the other impurity reasons.
  */
 export const OtherImpurityReason = new OtherImpurityReasonClass();
+
+const parameterIds = new IdManager<SdsParameter>();
+
+const pathToKey = (path: SdsParameter | string | undefined): string => {
+    if (isSdsParameter(path)) {
+        return `#${parameterIds.assignId(path)}`;
+    } else if (typeof path === 'string') {
+        return JSON.stringify(path);
+    } else {
+        return '?';
+    }
+};
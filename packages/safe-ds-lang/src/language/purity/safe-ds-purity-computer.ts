@@ -1,4 +1,5 @@
-import { type AstNode, type AstNodeLocator, AstUtils, EMPTY_STREAM, Stream, WorkspaceCache } from 'langium';
+import { AstUtils, EMPTY_STREAM, Stream } from 'langium';
+import { DependencyTrackedNodeCache } from '../workspace/safe-ds-document-dependencies.js';
 import { isEmpty } from '../../helpers/collections.js';
 import type { SafeDsCallGraphComputer } from '../flow/safe-ds-call-graph-computer.js';
 import type { SafeDsServices } from '../safe-ds-module.js';
@@ -36,20 +37,18 @@ import { getParameters } from '../helpers/nodeProperties.js';
 import { isContainedInOrEqual } from '../helpers/astUtils.js';
 
 export class SafeDsPurityComputer {
-    private readonly astNodeLocator: AstNodeLocator;
     private readonly builtinAnnotations: SafeDsAnnotations;
     private readonly builtinImpurityReasons: SafeDsImpurityReasons;
     private readonly callGraphComputer: SafeDsCallGraphComputer;
 
-    private readonly reasonsCache: WorkspaceCache<string, ImpurityReason[]>;
+    private readonly reasonsCache: DependencyTrackedNodeCache<ImpurityReason[]>;
 
     constructor(services: SafeDsServices) {
-        this.astNodeLocator = services.workspace.AstNodeLocator;
         this.builtinAnnotations = services.builtins.Annotations;
         this.builtinImpurityReasons = services.builtins.ImpurityReasons;
         this.callGraphComputer = services.flow.CallGraphComputer;
 
-        this.reasonsCache = new WorkspaceCache(services.shared);
+        this.reasonsCache = new DependencyTrackedNodeCache(services);
     }
 
     // We need separate methods for callables and expressions because lambdas are both. The caller must decide whether
@@ -200,8 +199,7 @@ export class SafeDsPurityComputer {
 
         // Cache the result if no substitutions are given
         if (isEmpty(substitutions)) {
-            const key = this.getNodeId(node);
-            return this.reasonsCache.get(key, () => this.doGetImpurityReasons(node, substitutions));
+            return this.reasonsCache.get(node, () => this.doGetImpurityReasons(node, substitutions));
         } else {
             /* c8 ignore next 2 */
             return this.doGetImpurityReasons(node, substitutions);
@@ -284,12 +282,6 @@ export class SafeDsPurityComputer {
 
         return getParameters(node).find((it) => it.name === parameterName.value);
     }
-
-    private getNodeId(node: AstNode) {
-        const documentUri = AstUtils.getDocument(node).uri.toString();
-        const nodePath = this.astNodeLocator.getAstNodePath(node);
-        return `${documentUri}~${nodePath}`;
-    }
 }
 
 const NO_SUBSTITUTIONS: ParameterSubstitutions = new Map();
@@ -0,0 +1,170 @@
+import {
+    ColumnarBuffer,
+    ColumnarColumn,
+    ColumnarTable,
+    PlaceholderValueMessage,
+    PythonServerMessage,
+} from './messages.js';
+
+const HEADER_LENGTH_BYTES = 4;
+const BODY_ALIGNMENT = 8;
+
+/**
+ * A table that was decoded from a binary frame. The keys are the column names. Numeric columns without missing values
+ * are typed arrays that share memory with the received frame. All other columns are regular arrays, where missing
+ * values are `null`.
+ */
+export type DecodedColumnarTable = Record<string, ArrayLike<unknown> & Iterable<unknown>>;
+
+/**
+ * Parse a binary frame sent by the runner. The header is returned as a message. If it contains a {@link ColumnarTable},
+ * its value is replaced by the decoded table (see {@link decodeColumnarTable}).
+ *
+ * @throws Error If the frame is malformed.
+ */
+export const parseBinaryMessage = (frame: Uint8Array): PythonServerMessage => {
+    if (frame.byteLength < HEADER_LENGTH_BYTES) {
+        throw new Error(`Binary frame is too short (${frame.byteLength} bytes).`);
+    }
+
+    const headerLength = new DataView(frame.buffer, frame.byteOffset, frame.byteLength).getUint32(0, true);
+    const headerEnd = HEADER_LENGTH_BYTES + headerLength;
+    if (headerEnd > frame.byteLength) {
+        throw new Error(`Header length ${headerLength} exceeds the frame length ${frame.byteLength}.`);
+    }
+
+    const headerText = new TextDecoder().decode(frame.subarray(HEADER_LENGTH_BYTES, headerEnd));
+    const message: PythonServerMessage = JSON.parse(headerText);
+    if (!isColumnarPlaceholderValueMessage(message)) {
+        return message;
+    }
+
+    const bodyStart = Math.ceil(headerEnd / BODY_ALIGNMENT) * BODY_ALIGNMENT;
+    const body = frame.subarray(Math.min(bodyStart, frame.byteLength));
+
+    return {
+        ...message,
+        data: {
+            ...message.data,
+            value: <any>decodeColumnarTable(message.data.value, body),
+        },
+    };
+};
+
+const isColumnarPlaceholderValueMessage = (
+    message: PythonServerMessage,
+): message is PlaceholderValueMessage & { data: { value: ColumnarTable } } => {
+    return (
+        message.type === 'placeholder_value' &&
+        typeof message.data.value === 'object' &&
+        (<any>message.data.value)?.format === 'columnar'
+    );
+};
+
+/**
+ * Decode the columns of a table that was sent in the `columnar` format.
+ *
+ * @param table The description of the table from the header of the frame.
+ * @param body The body of the frame.
+ *
+ * @throws Error If a buffer lies outside the body or the data type is unknown.
+ */
+export const decodeColumnarTable = (table: ColumnarTable, body: Uint8Array): DecodedColumnarTable => {
+    const result: DecodedColumnarTable = {};
+    for (const column of table.columns) {
+        result[column.name] = decodeColumn(column, table.rowCount, body);
+    }
+    return result;
+};
+
+const decodeColumn = (column: ColumnarColumn, rowCount: number, body: Uint8Array): DecodedColumnarTable[string] => {
+    const validity = column.validity ? getBytes(body, column.validity) : undefined;
+    const isValid = (index: number) => !validity || (validity[index >> 3]! & (1 << (index & 7))) !== 0;
+
+    switch (column.dataType) {
+        case 'bool': {
+            const bytes = getBytes(body, column.data);
+            return Array.from({ length: rowCount }, (_, i) => (isValid(i) ? bytes[i] !== 0 : null));
+        }
+        case 'utf8': {
+            if (!column.offsets) {
+                throw new Error(`Column '${column.name}' has type utf8 but no offsets.`);
+            }
+
+            const bytes = getBytes(body, column.data);
+            const offsets = getTypedArray(Int32Array, body, column.offsets);
+            const decoder = new TextDecoder();
+            return Array.from({ length: rowCount }, (_, i) =>
+                isValid(i) ? decoder.decode(bytes.subarray(offsets[i], offsets[i + 1])) : null,
+            );
+        }
+        default: {
+            const constructor = typedArrayConstructors[column.dataType];
+            if (!constructor) {
+                throw new Error(`Column '${column.name}' has unknown type '${column.dataType}'.`);
+            }
+
+            const values = getTypedArray(constructor, body, column.data);
+            if (!validity) {
+                return values;
+            } else {
+                return Array.from({ length: rowCount }, (_, i) => (isValid(i) ? values[i]! : null));
+            }
+        }
+    }
+};
+
+const getBytes = (body: Uint8Array, buffer: ColumnarBuffer): Uint8Array => {
+    if (buffer.offset < 0 || buffer.length < 0 || buffer.offset + buffer.length > body.byteLength) {
+        const end = buffer.offset + buffer.length;
+        throw new Error(`Buffer [${buffer.offset}, ${end}) lies outside the body of length ${body.byteLength}.`);
+    }
+
+    return body.subarray(buffer.offset, buffer.offset + buffer.length);
+};
+
+/**
+ * Create a typed array for the buffer. If the buffer is suitably aligned, the typed array is a view on the body, so no
+ * data is copied. Otherwise, the bytes are copied first.
+ */
+const getTypedArray = <T extends NumericArray>(
+    constructor: NumericArrayConstructor<T>,
+    body: Uint8Array,
+    buffer: ColumnarBuffer,
+): T => {
+    const bytes = getBytes(body, buffer);
+    const length = Math.floor(bytes.byteLength / constructor.BYTES_PER_ELEMENT);
+
+    if (bytes.byteOffset % constructor.BYTES_PER_ELEMENT === 0) {
+        return new constructor(bytes.buffer, bytes.byteOffset, length);
+    } else {
+        return new constructor(bytes.slice().buffer, 0, length);
+    }
+};
+
+type NumericArray =
+    | Int8Array
+    | Int16Array
+    | Int32Array
+    | Uint8Array
+    | Uint16Array
+    | Uint32Array
+    | Float32Array
+    | Float64Array;
+
+interface NumericArrayConstructor<T extends NumericArray> {
+    readonly BYTES_PER_ELEMENT: number;
+
+    new (buffer: ArrayBufferLike, byteOffset: number, length: number): T;
+}
+
+const typedArrayConstructors: Partial<Record<string, NumericArrayConstructor<NumericArray>>> = {
+    int8: Int8Array,
+    int16: Int16Array,
+    int32: Int32Array,
+    uint8: Uint8Array,
+    uint16: Uint16Array,
+    uint32: Uint32Array,
+    float32: Float32Array,
+    float64: Float64Array,
+};
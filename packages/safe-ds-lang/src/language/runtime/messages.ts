@@ -8,14 +8,24 @@
  */
 export type PythonServerMessage =
     | ProgramMessage
+    | ProgramCodeCachedMessage
     | PlaceholderQueryMessage
+    | PlaceholderQueryBatchMessage
     | PlaceholderTypeMessage
     | PlaceholderValueMessage
+    | PlaceholderValueBatchMessage
+    | ProfilingQueryMessage
+    | ProfilingMessage
     | RuntimeErrorMessage
     | RuntimeProgressMessage
+    | MemoizationStatsMessage
+    | CapabilitiesQueryMessage
+    | CapabilitiesMessage
+    | SessionCloseMessage
+    | CancelMessage
     | ShutdownMessage;
 
-export type RuntimeProgress = 'done';
+export type RuntimeProgress = 'done' | 'cancelled';
 
 // Extension to Runner
 /**
@@ -34,6 +44,76 @@ export interface ProgramPackageMap {
     code: ProgramCodeMap;
     main: ProgramMainInformation;
     cwd?: string;
+
+    /**
+     * Modules that were already sent in earlier programs, referenced by the hash of their code (see
+     * {@link ProgramCodeCachedMessage}). The runner takes their code from its cache. Only hashes that the runner
+     * acknowledged are referenced.
+     */
+    codeRefs?: ProgramCodeRefMap;
+
+    /**
+     * The id of the session the program belongs to. If set, the runner keeps the values of all placeholders that are
+     * saved by the program after the execution is done. Later programs of the same session can load them with
+     * `safeds_runner.load_placeholder` instead of computing them again, and placeholder queries for any execution of
+     * the session can access them. The values are kept until a {@link SessionCloseMessage} is received.
+     *
+     * This field is only set for runners that announced the capability `session`.
+     */
+    session?: string;
+
+    /**
+     * How the runner should memoize calls of pure functions. If unset, the runner keeps its current policy. Runners
+     * that do not support memoization policies ignore this field.
+     */
+    memoization?: MemoizationPolicy;
+}
+
+/**
+ * Controls the cache that the runner uses for `safeds_runner.memoized_static_call` and
+ * `safeds_runner.memoized_dynamic_call`.
+ */
+export interface MemoizationPolicy {
+    /**
+     * The maximum total size of the values in the in-memory cache in bytes. Once it is exceeded, entries are evicted
+     * according to the eviction policy. If unset, the cache is unbounded.
+     */
+    maxBytes?: number;
+
+    /**
+     * Which entries are evicted first once the budget is exceeded. The default is `lru`.
+     */
+    eviction?: MemoizationEvictionPolicy;
+
+    /**
+     * An additional cache on disk. If it is set, the runner writes memoized values there, so they survive a restart of
+     * the runner. Entries that are evicted from memory can also be restored from disk. If unset, values are only kept
+     * in memory.
+     */
+    disk?: MemoizationDiskTier;
+}
+
+/**
+ * How the runner selects entries to evict from the in-memory cache:
+ * - `lru`: The least recently used entry is evicted first.
+ * - `cost_aware`: The entry with the lowest ratio of computation time to size is evicted first, so expensive results
+ *   like model fits stay in memory longer than cheap but large ones.
+ */
+export type MemoizationEvictionPolicy = 'lru' | 'cost_aware';
+
+/**
+ * The on-disk tier of the memoization cache.
+ */
+export interface MemoizationDiskTier {
+    /**
+     * The directory where memoized values are stored.
+     */
+    directory: string;
+
+    /**
+     * The maximum total size of the values on disk in bytes. If unset, the disk cache is unbounded.
+     */
+    maxBytes?: number;
 }
 
 /**
@@ -50,6 +130,14 @@ export interface ProgramModuleMap {
     [key: string]: string;
 }
 
+/**
+ * Contains references to cached python modules grouped by a virtual directory structure. The key is a path,
+ * directories are separated by '.'. The value maps module names to the hash of their code.
+ */
+export interface ProgramCodeRefMap {
+    [key: string]: { [key: string]: string };
+}
+
 /**
  * Contains execution information about a pipeline.
  */
@@ -70,6 +158,20 @@ export interface ProgramMainInformation {
     pipeline: string;
 }
 
+// Runner to Extension
+/**
+ * Message that lists the modules of a program that the runner stored in its code cache. Each module is identified by
+ * the hex-encoded SHA-256 hash of its UTF-8 encoded code. Later programs may reference these modules in
+ * {@link ProgramPackageMap.codeRefs} instead of sending their code again.
+ *
+ * Runners that do not have a code cache never send this message, so they always receive the full code.
+ */
+export interface ProgramCodeCachedMessage {
+    type: 'program_code_cached';
+    id: string;
+    data: string[];
+}
+
 // Extension to Runner
 /**
  * Message that contains a request to send back the value of a specified placeholder
@@ -93,8 +195,23 @@ export interface PlaceholderQuery {
      * Optional windowing information to request a subset of the available data.
      */
     window: PlaceholderQueryWindow;
+
+    /**
+     * The preferred format of the response. If omitted, the value is sent as JSON.
+     */
+    format?: PlaceholderValueFormat;
 }
 
+/**
+ * The format in which the value of a placeholder should be sent back.
+ *
+ * - `json`: The value is serialized as JSON and sent in a text frame. Every runner supports this.
+ * - `columnar`: Tables are sent in a binary frame with one buffer per column (see {@link ColumnarTable}). Values that
+ *   are not tables, like scalars or images, are still sent as JSON. Runners that do not support this format ignore it
+ *   and respond with JSON, so it is always safe to request it.
+ */
+export type PlaceholderValueFormat = 'json' | 'columnar';
+
 /**
  * Windowing information for the placeholder query.
  */
@@ -110,6 +227,20 @@ export interface PlaceholderQueryWindow {
     size?: number;
 }
 
+// Extension to Runner
+/**
+ * Message that contains a request to send back the values of several placeholders of the same execution at once. The
+ * runner responds with a single {@link PlaceholderValueBatchMessage}. In a batch, the requested formats are ignored and
+ * all values are sent as JSON.
+ *
+ * This message is only sent to runners that announced the capability `placeholder_query_batch`.
+ */
+export interface PlaceholderQueryBatchMessage {
+    type: 'placeholder_query_batch';
+    id: string;
+    data: PlaceholderQuery[];
+}
+
 // Runner to Extension
 /**
  * Message that contains information about a calculated placeholder.
@@ -169,6 +300,16 @@ export interface PlaceholderValue {
     window?: PlaceholderValueWindow;
 }
 
+/**
+ * Message that contains the values of several calculated placeholders. It is the response to a
+ * {@link PlaceholderQueryBatchMessage} and contains one value per query, in the same order.
+ */
+export interface PlaceholderValueBatchMessage {
+    type: 'placeholder_value_batch';
+    id: string;
+    data: PlaceholderValue[];
+}
+
 /**
  * Windowing information for a placeholder value response.
  */
@@ -189,6 +330,264 @@ export interface PlaceholderValueWindow {
     max: number;
 }
 
+// Runner to Extension (binary)
+/**
+ * Value of a table placeholder that was sent in the `columnar` format.
+ *
+ * The runner sends it as a binary frame with the following layout:
+ *
+ * | Bytes                | Content                                                                               |
+ * |----------------------|---------------------------------------------------------------------------------------|
+ * | 4                    | Length `n` of the header in bytes (unsigned 32-bit integer, little endian).           |
+ * | `n`                  | Header: UTF-8 encoded JSON of a {@link PlaceholderValueMessage}, whose value is this. |
+ * | 0-7                  | Padding, so the body starts at a multiple of 8 bytes.                                 |
+ * | rest                 | Body: the column buffers referenced by the header.                                    |
+ *
+ * All numbers in the body are stored in little endian byte order.
+ */
+export interface ColumnarTable {
+    format: 'columnar';
+
+    /**
+     * The number of rows that were sent.
+     */
+    rowCount: number;
+
+    /**
+     * Descriptions of the columns, in order.
+     */
+    columns: ColumnarColumn[];
+}
+
+/**
+ * Description of a single column in a {@link ColumnarTable}.
+ */
+export interface ColumnarColumn {
+    /**
+     * Name of the column.
+     */
+    name: string;
+
+    /**
+     * Type of the elements of the column.
+     */
+    dataType: ColumnarDataType;
+
+    /**
+     * The values of the column. For `utf8` columns, this contains the concatenated UTF-8 bytes of all strings. For
+     * `bool` columns, this contains one byte per row.
+     */
+    data: ColumnarBuffer;
+
+    /**
+     * Only for `utf8` columns: `rowCount + 1` signed 32-bit integers, where string `i` spans the bytes from
+     * `offsets[i]` to `offsets[i + 1]` of the data buffer.
+     */
+    offsets?: ColumnarBuffer;
+
+    /**
+     * Optional bitmap that marks valid (non-missing) values. Bit `i % 8` of byte `i / 8` is set if row `i` is valid. If
+     * omitted, all values are valid.
+     */
+    validity?: ColumnarBuffer;
+}
+
+/**
+ * Type of the elements of a {@link ColumnarColumn}.
+ */
+export type ColumnarDataType =
+    | 'bool'
+    | 'int8'
+    | 'int16'
+    | 'int32'
+    | 'uint8'
+    | 'uint16'
+    | 'uint32'
+    | 'float32'
+    | 'float64'
+    | 'utf8';
+
+/**
+ * A range of bytes in the body of a binary frame.
+ */
+export interface ColumnarBuffer {
+    /**
+     * Offset of the first byte, relative to the start of the body.
+     */
+    offset: number;
+
+    /**
+     * Number of bytes.
+     */
+    length: number;
+}
+
+// Extension to Runner
+/**
+ * Message that contains a request to profile all columns of a table placeholder. The runner computes the statistics of
+ * all columns in a single pass over the table and responds with a {@link ProfilingMessage}.
+ *
+ * This message is only sent to runners that announced the capability `profiling_query`.
+ */
+export interface ProfilingQueryMessage {
+    type: 'profiling_query';
+    id: string;
+    data: ProfilingQuery;
+}
+
+/**
+ * A request to profile a table placeholder.
+ */
+export interface ProfilingQuery {
+    /**
+     * The name of the table placeholder.
+     */
+    name: string;
+
+    /**
+     * The number of bins of the histograms of numerical columns.
+     */
+    histogramBins: number;
+
+    /**
+     * The quantiles to compute for numerical columns, each between 0 and 1.
+     */
+    quantiles: number[];
+
+    /**
+     * The maximum number of distinct values of a categorical column for which the count of each value is sent back.
+     */
+    maxCategories: number;
+
+    /**
+     * Whether the statistics may be estimated, so tables that do not fit in memory can be profiled in a single streaming
+     * pass. Distinct counts can then be estimated by HyperLogLog sketches, quantiles by t-digests, and histograms from a
+     * reservoir sample.
+     */
+    approximate?: boolean;
+}
+
+// Runner to Extension
+/**
+ * Message that contains the profiling of a table placeholder. It is the response to a {@link ProfilingQueryMessage}.
+ */
+export interface ProfilingMessage {
+    type: 'profiling';
+    id: string;
+    data: TableProfiling;
+}
+
+/**
+ * The statistics of all columns of a table.
+ */
+export interface TableProfiling {
+    /**
+     * The name of the table placeholder.
+     */
+    name: string;
+
+    /**
+     * The number of rows of the table.
+     */
+    rowCount: number;
+
+    /**
+     * The statistics of the columns, in the order of the columns.
+     */
+    columns: ColumnProfiling[];
+
+    /**
+     * Whether the statistics are estimates. This can only be the case if the query allowed it.
+     */
+    approximate?: boolean;
+}
+
+/**
+ * The statistics of a single column. Statistics that do not apply to the column are omitted.
+ */
+export interface ColumnProfiling {
+    /**
+     * The name of the column.
+     */
+    name: string;
+
+    /**
+     * Whether the column contains numbers.
+     */
+    isNumeric: boolean;
+
+    /**
+     * The number of missing values.
+     */
+    missingCount: number;
+
+    /**
+     * The number of distinct values, not counting missing values.
+     */
+    distinctCount: number;
+
+    /**
+     * The smallest value of a numerical column.
+     */
+    min?: number;
+
+    /**
+     * The largest value of a numerical column.
+     */
+    max?: number;
+
+    /**
+     * The mean of a numerical column.
+     */
+    mean?: number;
+
+    /**
+     * The requested quantiles of a numerical column, in the order of the request.
+     */
+    quantiles?: number[];
+
+    /**
+     * The histogram of a numerical column.
+     */
+    histogram?: ProfilingHistogram;
+
+    /**
+     * How often each value occurs in a categorical column. This is only sent if the column has at most
+     * {@link ProfilingQuery.maxCategories} distinct values.
+     */
+    categories?: ProfilingCategory[];
+}
+
+/**
+ * A histogram with bins of equal width.
+ */
+export interface ProfilingHistogram {
+    /**
+     * The edges of the bins in ascending order. There is one more edge than bins.
+     */
+    binEdges: number[];
+
+    /**
+     * The number of values in each bin.
+     */
+    counts: number[];
+}
+
+/**
+ * How often a value occurs in a categorical column.
+ */
+export interface ProfilingCategory {
+    /**
+     * The string representation of the value.
+     */
+    value: string;
+
+    /**
+     * The number of occurrences of the value.
+     */
+    count: number;
+}
+
 // Runner to Extension
 /**
  * Message that contains information about a runtime error that occurred during execution.
@@ -212,8 +611,16 @@ export interface RuntimeErrorDescription {
      * Array of stackframes at the moment of raising the error.
      */
     backtrace: RuntimeErrorBacktraceFrame[];
+    /**
+     * The kind of the error if the runner classifies it. Runners with the capability `session` report the kind
+     * `session_missing` if a program loads a placeholder that they do not keep for the session (anymore), e.g. because
+     * the runner process was restarted or the session was evicted.
+     */
+    kind?: RuntimeErrorKind;
 }
 
+export type RuntimeErrorKind = 'session_missing';
+
 /**
  * Contains debugging information about a stackframe.
  */
@@ -232,9 +639,10 @@ export interface RuntimeErrorBacktraceFrame {
 // Runner to Extension
 /**
  * Message that contains information about the current execution progress.
- * Field data currently supports on of the following: 'done'
+ * Field data currently supports on of the following: 'done', 'cancelled'
  *
- * A progress value of 'done' means that the pipeline execution completed.
+ * A progress value of 'done' means that the pipeline execution completed. A progress value of 'cancelled' means that
+ * the pipeline execution was stopped because of a {@link CancelMessage}.
  */
 export interface RuntimeProgressMessage {
     type: 'runtime_progress';
@@ -242,29 +650,180 @@ export interface RuntimeProgressMessage {
     data: RuntimeProgress;
 }
 
+// Runner to Extension
+/**
+ * Message that contains statistics about the memoization cache of the runner. It is sent after an execution is done, so
+ * the id is the id of the execution. The statistics are cumulative since the runner was started.
+ *
+ * Runners that do not support memoization policies never send this message.
+ */
+export interface MemoizationStatsMessage {
+    type: 'memoization_stats';
+    id: string;
+    data: MemoizationStats;
+}
+
+/**
+ * Statistics about the memoization cache of the runner.
+ */
+export interface MemoizationStats {
+    /**
+     * How often a value was found in memory.
+     */
+    hits: number;
+
+    /**
+     * How often a value was found on disk but not in memory.
+     */
+    diskHits: number;
+
+    /**
+     * How often a value had to be computed.
+     */
+    misses: number;
+
+    /**
+     * How often a value was evicted from memory to stay within the budget.
+     */
+    evictions: number;
+
+    /**
+     * The number of values in memory.
+     */
+    entryCount: number;
+
+    /**
+     * The total size of the values in memory in bytes.
+     */
+    sizeBytes: number;
+
+    /**
+     * The total size of the values on disk in bytes. This is 0 if there is no disk tier.
+     */
+    diskSizeBytes: number;
+}
+
 export const createProgramMessage = function (id: string, data: ProgramPackageMap): PythonServerMessage {
     return { type: 'program', id, data };
 };
 
+export const createPlaceholderQuery = function (
+    placeholderName: string,
+    windowBegin: number | undefined = undefined,
+    windowSize: number | undefined = undefined,
+    format: PlaceholderValueFormat | undefined = undefined,
+): PlaceholderQuery {
+    return {
+        name: placeholderName,
+        window: {
+            begin: !windowBegin ? undefined : Math.round(windowBegin),
+            size: !windowSize ? undefined : Math.round(windowSize),
+        },
+        format,
+    };
+};
+
 export const createPlaceholderQueryMessage = function (
     id: string,
     placeholderName: string,
     windowBegin: number | undefined = undefined,
     windowSize: number | undefined = undefined,
+    format: PlaceholderValueFormat | undefined = undefined,
 ): PythonServerMessage {
     return {
         type: 'placeholder_query',
         id,
-        data: {
-            name: placeholderName,
-            window: {
-                begin: !windowBegin ? undefined : Math.round(windowBegin),
-                size: !windowSize ? undefined : Math.round(windowSize),
-            },
-        },
+        data: createPlaceholderQuery(placeholderName, windowBegin, windowSize, format),
     };
 };
 
+export const createPlaceholderQueryBatchMessage = function (
+    id: string,
+    queries: PlaceholderQuery[],
+): PythonServerMessage {
+    return { type: 'placeholder_query_batch', id, data: queries };
+};
+
+export const createProfilingQueryMessage = function (id: string, query: ProfilingQuery): PythonServerMessage {
+    return { type: 'profiling_query', id, data: query };
+};
+
+// Extension to Runner
+/**
+ * Message that asks the runner which optional features it supports. It is sent right after connecting to a runner
+ * process, and the runner answers with a {@link CapabilitiesMessage} with the same id.
+ *
+ * Runners that do not know this message never answer. Until a runner announced a capability, it is treated as
+ * unsupported, so optional features are never enabled or disabled based on timeouts.
+ *
+ * The data field is empty.
+ */
+export interface CapabilitiesQueryMessage {
+    type: 'capabilities_query';
+    id: string;
+    data: '';
+}
+
+export const createCapabilitiesQueryMessage = function (id: string): PythonServerMessage {
+    return { type: 'capabilities_query', id, data: '' };
+};
+
+// Runner to Extension
+/**
+ * Message that lists the optional features that the runner supports. It is the response to a
+ * {@link CapabilitiesQueryMessage}.
+ */
+export interface CapabilitiesMessage {
+    type: 'capabilities';
+    id: string;
+    data: RunnerCapability[];
+}
+
+/**
+ * An optional feature of the runner:
+ * - `placeholder_query_batch`: The runner answers {@link PlaceholderQueryBatchMessage}s.
+ * - `profiling_query`: The runner answers {@link ProfilingQueryMessage}s.
+ * - `session`: The runner keeps the placeholders of sessions (see {@link ProgramPackageMap.session}).
+ * - `run_parallel`: The runner provides `safeds_runner.run_parallel` to execute independent statements in parallel.
+ */
+export type RunnerCapability = 'placeholder_query_batch' | 'profiling_query' | 'session' | 'run_parallel';
+
+// Extension to Runner
+/**
+ * Message that instructs the runner to discard all placeholder values that are kept for a session. The id is the id of
+ * the session.
+ *
+ * There will be no response to this message, the data field is therefore empty.
+ */
+export interface SessionCloseMessage {
+    type: 'session_close';
+    id: string;
+    data: '';
+}
+
+export const createSessionCloseMessage = function (sessionId: string): PythonServerMessage {
+    return { type: 'session_close', id: sessionId, data: '' };
+};
+
+// Extension to Runner
+/**
+ * Message that instructs the runner to stop a pipeline execution as soon as possible. The id is the id of the
+ * execution. The runner discards the memoized values that were computed by the execution and answers with a
+ * {@link RuntimeProgressMessage} with the value 'cancelled'. If the execution is already completed, the message is
+ * ignored.
+ *
+ * The data field is empty.
+ */
+export interface CancelMessage {
+    type: 'cancel';
+    id: string;
+    data: '';
+}
+
+export const createCancelMessage = function (pipelineExecutionId: string): PythonServerMessage {
+    return { type: 'cancel', id: pipelineExecutionId, data: '' };
+};
+
 // Extension to Runner
 /**
  * Message that instructs the runner to shut itself down as soon as possible.
@@ -3,7 +3,18 @@ import treeKill from 'tree-kill';
 import { SafeDsLogger, SafeDsMessagingProvider } from '../communication/safe-ds-messaging-provider.js';
 import child_process from 'child_process';
 import WebSocket from 'ws';
-import { createShutdownMessage, PythonServerMessage } from './messages.js';
+import crypto from 'node:crypto';
+import {
+    createCapabilitiesQueryMessage,
+    createProgramMessage,
+    createShutdownMessage,
+    MemoizationStats,
+    ProgramCodeMap,
+    ProgramCodeRefMap,
+    PythonServerMessage,
+    RunnerCapability,
+} from './messages.js';
+import { parseBinaryMessage } from './columnar.js';
 import { Disposable } from 'langium';
 import { SafeDsSettingsProvider } from '../workspace/safe-ds-settings-provider.js';
 import semver from 'semver';
@@ -21,15 +32,53 @@ const LOWEST_UNSUPPORTED_RUNNER_VERSION = '0.19.0';
 const npmVersionRange = `>=${LOWEST_SUPPORTED_RUNNER_VERSION} <${LOWEST_UNSUPPORTED_RUNNER_VERSION}`;
 export const pipVersionRange = `>=${LOWEST_SUPPORTED_RUNNER_VERSION},<${LOWEST_UNSUPPORTED_RUNNER_VERSION}`;
 
+/**
+ * Modules that every runner process imports right after it is started, so the first pipeline execution does not have
+ * to wait for them.
+ */
+const WARM_UP_MODULES = ['safeds', 'polars', 'sklearn'];
+
+/**
+ * How many pipeline executions we remember the runner process for. Placeholder queries for older executions are sent
+ * to the first runner process.
+ */
+const MAX_TRACKED_EXECUTIONS = 1000;
+
+/**
+ * Prefix of the IDs of the executions that import the {@link WARM_UP_MODULES}.
+ */
+const WARM_UP_ID_PREFIX = 'warm-up-';
+
+/**
+ * Prefix of the IDs of the messages that ask a runner process for its capabilities.
+ */
+const CAPABILITIES_ID_PREFIX = 'capabilities-';
+
 /* c8 ignore start */
+/**
+ * Manages a pool of runner processes. Messages for a pipeline execution are always sent to the process that runs it,
+ * while independent executions are spread over all processes. Callers can treat the pool like a single server.
+ */
 export class SafeDsPythonServer {
     private readonly logger: SafeDsLogger;
     private readonly messaging: SafeDsMessagingProvider;
     private readonly settingsProvider: SafeDsSettingsProvider;
 
-    private state: State = stopped;
-    private restartTracker = new RestartTracker();
+    private state: PoolState = 'stopped';
+    private command: string | undefined = undefined;
+    private workers: PythonServerWorker[] = [];
     private messageCallbacks: Map<PythonServerMessage['type'], ((message: PythonServerMessage) => void)[]> = new Map();
+    private connectionCallbacks = new Set<() => void>();
+
+    /**
+     * Maps the ID of a pipeline execution to the runner process that runs it.
+     */
+    private readonly executionOwners = new Map<string, PythonServerWorker>();
+
+    /**
+     * Maps the ID of a session to the runner process that keeps its placeholder values.
+     */
+    private readonly sessionOwners = new Map<string, PythonServerWorker>();
 
     constructor(services: SafeDsServices) {
         this.logger = services.communication.MessagingProvider.createTaggedLogger('Python Server');
@@ -41,6 +90,14 @@ export class SafeDsPythonServer {
             await this.start();
         });
 
+        // Restart with the new number of processes if the pool size changes
+        services.workspace.SettingsProvider.onRunnerPoolSizeUpdate(async () => {
+            if (this.state === 'started') {
+                await this.stop();
+                await this.start();
+            }
+        });
+
         // Start if specifically requested. This can happen if the updater installed a new version of the runner but the
         // runner command did not have to be changed.
         this.messaging.onNotification(StartRunnerNotification.type, async () => {
@@ -59,85 +116,121 @@ export class SafeDsPythonServer {
      * Whether the Python server is started and ready to accept requests.
      */
     get isStarted(): boolean {
-        return isStarted(this.state);
+        return this.workers.some((it) => it.isStarted);
     }
 
     /**
-     * Start the Python server and connect to it.
+     * Start the runner processes and connect to them.
      */
     private async start(): Promise<void> {
-        if (!isStopped(this.state)) {
+        if (this.state !== 'stopped') {
             return;
         }
-        this.state = starting();
+        this.state = 'starting';
         this.logger.info('Starting...');
 
         // Get the runner command
         const command = await this.getValidRunnerCommand();
         if (!command) {
-            this.state = stopped;
+            this.state = 'stopped';
             return;
         }
+        this.command = command;
 
-        // Start the server at a free port
-        const port = await this.getFreePort();
-        this.startServerProcess(command, port);
+        // Start all processes in parallel, each at its own free port
+        const poolSize = this.settingsProvider.getRunnerPoolSize();
+        this.workers = Array.from({ length: poolSize }, (_, index) => this.createWorker(index, poolSize));
+        await Promise.all(this.workers.map((worker) => worker.start(command)));
 
-        // Connect to the server
-        await this.connectToServer(port);
+        const ports = this.workers.filter((it) => it.isStarted).map((it) => it.port!);
+        if (ports.length === 0) {
+            await this.stop();
+            return;
+        }
+        this.state = 'started';
 
         // Notify the services in the language client that the process has started.
         // TODO: Removed once all the execution logic is in the language server.
-        if (isStarted(this.state)) {
-            this.logger.info('Started successfully.');
-            await this.messaging.sendNotification(RunnerStartedNotification.type, { port });
-        }
+        this.logger.info(`Started ${ports.length} of ${poolSize} runner processes successfully.`);
+        await this.messaging.sendNotification(RunnerStartedNotification.type, { port: ports[0]!, ports });
     }
 
     /**
-     * Stop the Python server.
+     * Stop all runner processes.
      */
     // TODO make private once the execution logic is fully handled in the language server
     async stop(): Promise<void> {
-        if (!isStarting(this.state) && !isStarted(this.state)) {
+        if (this.state !== 'starting' && this.state !== 'started') {
             return;
         }
-        this.state = stopping(this.state?.serverProcess, this.state?.serverConnection);
+        this.state = 'stopping';
         this.logger.info('Stopping...');
 
-        // Attempt a graceful shutdown first
-        await this.stopServerProcessGracefully(2500);
-        if (isStopped(this.state)) {
-            this.logger.info('Stopped successfully.');
-            return;
-        }
+        const results = await Promise.all(this.workers.map((worker) => worker.stop()));
+        this.workers = [];
+        this.executionOwners.clear();
+        this.sessionOwners.clear();
 
-        // If the graceful shutdown failed, kill the server process
-        this.logger.debug('Graceful shutdown failed. Killing the server process...');
-        await this.killServerProcess();
-        if (isStopped(this.state)) {
+        if (results.every((it) => it)) {
             this.logger.info('Stopped successfully.');
-            return;
+            this.state = 'stopped';
+        } else {
+            // Some process could not be stopped
+            this.logger.error('Could not stop the server.');
+            this.state = 'failed';
         }
+    }
 
-        // The server could not be stopped
-        this.logger.error('Could not stop the server.');
-        this.state = failed;
+    private createWorker(index: number, poolSize: number): PythonServerWorker {
+        const tag = poolSize === 1 ? 'Python Server' : `Python Server #${index + 1}`;
+        return new PythonServerWorker(this.messaging.createTaggedLogger(tag), {
+            onMessage: (worker, message) => this.handleMessage(worker, message),
+            onConnected: (worker) => this.handleConnected(worker),
+            onUnexpectedClose: (worker) => this.handleUnexpectedClose(worker),
+        });
     }
 
     /**
-     * Stop the Python server and start it again.
-     *
-     * @param shouldBeTracked Whether the restart should be tracked. If `false`, the restart will always be executed.
+     * Restart a single runner process after its connection was unexpectedly closed. Executions that ran on it fail,
+     * but the other processes are not affected.
      */
-    private async restart(shouldBeTracked: boolean): Promise<void> {
-        if (shouldBeTracked && !this.restartTracker.shouldRestart()) {
-            this.logger.error('Restarting too frequently. Aborting.');
+    private async handleUnexpectedClose(worker: PythonServerWorker): Promise<void> {
+        for (const id of worker.runningExecutions) {
+            this.dispatchMessage({
+                type: 'runtime_error',
+                id,
+                data: { message: 'The runner process terminated unexpectedly.', backtrace: [] },
+            });
+        }
+        this.forgetWorker(worker);
+
+        if (!worker.shouldRestart()) {
+            worker.logger.error('Restarting too frequently. Aborting.');
             return;
         }
 
-        await this.stop();
-        await this.start();
+        await worker.stop();
+        if (this.command && this.state === 'started' && this.workers.includes(worker)) {
+            await worker.start(this.command);
+        }
+    }
+
+    private forgetWorker(worker: PythonServerWorker): void {
+        worker.runningExecutions.clear();
+        worker.cachedCodeHashes.clear();
+        worker.capabilities.clear();
+        worker.memoizationStats = undefined;
+
+        for (const [id, owner] of this.executionOwners) {
+            if (owner === worker) {
+                this.executionOwners.delete(id);
+            }
+        }
+        for (const [id, owner] of this.sessionOwners) {
+            if (owner === worker) {
+                this.sessionOwners.delete(id);
+            }
+        }
     }
 
     // Command handling ------------------------------------------------------------------------------------------------
@@ -235,19 +328,461 @@ export class SafeDsPythonServer {
         return semver.satisfies(version, npmVersionRange);
     }
 
-    // Port handling ---------------------------------------------------------------------------------------------------
+    // User interaction ------------------------------------------------------------------------------------------------
 
     /**
-     * Get a random free port on the local machine.
+     * Report to the user that the runner cannot be started with the configured command.
      */
-    private async getFreePort(): Promise<number> {
-        return new Promise((resolve) => {
-            const server = net.createServer();
-            server.listen(0, '127.0.0.1', () => {
-                const port = (server.address() as AddressInfo).port;
-                server.close(() => resolve(port));
-            });
+    private async reportBadRunnerCommand(command: string, error: unknown): Promise<void> {
+        const message = error instanceof Error ? error.message : String(error);
+        this.logger.error(`Could not start runner with command "${command}": ${message}`);
+
+        // Show an error message to the user and offer to install the runner
+        const action = await this.messaging.showErrorMessage(`The runner could not be started.`, {
+            title: 'Install runner',
         });
+        if (action?.title === 'Install runner') {
+            await this.messaging.sendNotification(InstallRunnerNotification.type);
+        }
+    }
+
+    /**
+     * Report to the user that the runner version does not match the required version range.
+     */
+    private async reportInvalidRunnerVersion(version: string): Promise<void> {
+        this.logger.error(`Installed runner version ${version} is not in range "${pipVersionRange}".`);
+
+        // Show an error message to the user and offer to update the runner
+        const action = await this.messaging.showErrorMessage(
+            `The runner must be updated to a version in the range "${pipVersionRange}".`,
+            { title: 'Update runner' },
+        );
+        if (action?.title === 'Update runner') {
+            await this.messaging.sendNotification(UpdateRunnerNotification.type);
+        }
+    }
+
+    /**
+     * Report to the user that the installed runner is outdated.
+     *
+     * @returns Whether the user decided to update the runner. Returning `true` aborts the start process.
+     */
+    private async reportOutdatedRunner(installedVersion: string, availableVersion: string): Promise<boolean> {
+        this.logger.info(
+            `Installed runner version ${installedVersion} is outdated. Latest version is ${availableVersion}.`,
+        );
+
+        // Show an error message to the user and offer to update the runner
+        const action = await this.messaging.showInformationMessage(`A new version of the runner is available.`, {
+            title: 'Update runner',
+        });
+        if (action?.title === 'Update runner') {
+            await this.messaging.sendNotification(UpdateRunnerNotification.type);
+            return true;
+        } else {
+            return false;
+        }
+    }
+
+    // Message handling ------------------------------------------------------------------------------------------------
+
+    /**
+     * Send a message to the python server using the websocket connection. Messages that belong to a pipeline execution
+     * or session are sent to the runner process that runs it. New executions go to the least busy process.
+     *
+     * @param message Message to be sent to the python server. This message should be serializable to JSON.
+     */
+    public sendMessageToPythonServer(message: PythonServerMessage): void {
+        if (message.type === 'shutdown') {
+            this.workers.forEach((worker) => worker.send(message));
+            return;
+        }
+
+        const worker = this.selectWorker(message);
+        if (!worker) {
+            return;
+        }
+
+        if (message.type === 'program') {
+            this.trackExecution(worker, message.id, message.data.session);
+            worker.send(this.replaceCachedCodeByRefs(worker, message));
+        } else {
+            worker.send(message);
+        }
+    }
+
+    private selectWorker(message: PythonServerMessage): PythonServerWorker | undefined {
+        const startedWorkers = this.workers.filter((it) => it.isStarted);
+
+        if (message.type === 'program') {
+            // Later programs of a session need the placeholder values that the first one kept
+            const sessionOwner = message.data.session ? this.sessionOwners.get(message.data.session) : undefined;
+            if (sessionOwner?.isStarted) {
+                return sessionOwner;
+            }
+
+            let result = startedWorkers[0];
+            for (const worker of startedWorkers) {
+                if (worker.runningExecutions.size < result!.runningExecutions.size) {
+                    result = worker;
+                }
+            }
+            return result;
+        } else if (message.type === 'session_close') {
+            const sessionOwner = this.sessionOwners.get(message.id);
+            this.sessionOwners.delete(message.id);
+            return sessionOwner;
+        } else {
+            return this.executionOwners.get(message.id) ?? startedWorkers[0];
+        }
+    }
+
+    private trackExecution(worker: PythonServerWorker, id: string, sessionId: string | undefined): void {
+        worker.runningExecutions.add(id);
+        this.executionOwners.set(id, worker);
+        if (sessionId) {
+            this.sessionOwners.set(sessionId, worker);
+        }
+
+        // Forget the oldest executions. Maps iterate in insertion order.
+        while (this.executionOwners.size > MAX_TRACKED_EXECUTIONS) {
+            this.executionOwners.delete(this.executionOwners.keys().next().value!);
+        }
+    }
+
+    /**
+     * Replace the code of modules that the runner process has already cached by a reference to its hash.
+     */
+    private replaceCachedCodeByRefs(
+        worker: PythonServerWorker,
+        message: Extract<PythonServerMessage, { type: 'program' }>,
+    ): PythonServerMessage {
+        if (worker.cachedCodeHashes.size === 0) {
+            return message;
+        }
+
+        const code: ProgramCodeMap = {};
+        const codeRefs: ProgramCodeRefMap = { ...message.data.codeRefs };
+        let hasCodeRefs = false;
+
+        for (const [modulePath, modules] of Object.entries(message.data.code)) {
+            for (const [moduleName, moduleCode] of Object.entries(modules)) {
+                const hash = crypto.createHash('sha256').update(moduleCode).digest('hex');
+                if (worker.cachedCodeHashes.has(hash)) {
+                    codeRefs[modulePath] = { ...codeRefs[modulePath], [moduleName]: hash };
+                    hasCodeRefs = true;
+                } else {
+                    code[modulePath] = { ...code[modulePath], [moduleName]: moduleCode };
+                }
+            }
+        }
+
+        if (!hasCodeRefs) {
+            return message;
+        }
+
+        return { ...message, data: { ...message.data, code, codeRefs } };
+    }
+
+    private handleMessage(worker: PythonServerWorker, message: PythonServerMessage): void {
+        if (message.type === 'program_code_cached') {
+            message.data.forEach((hash) => worker.cachedCodeHashes.add(hash));
+        } else if (message.type === 'capabilities') {
+            worker.logger.debug(`Runner supports the capabilities [${message.data.join(', ')}].`);
+            message.data.forEach((capability) => worker.capabilities.add(capability));
+            return;
+        } else if (message.type === 'memoization_stats') {
+            worker.memoizationStats = message.data;
+        } else if (message.type === 'runtime_progress' || message.type === 'runtime_error') {
+            worker.runningExecutions.delete(message.id);
+        }
+
+        // Nobody waits for the warm-up, and a missing optional module is no error
+        if (message.id.startsWith(WARM_UP_ID_PREFIX)) {
+            worker.logger.debug(`Warm-up finished with message of type '${message.type}'.`);
+            return;
+        }
+
+        this.dispatchMessage(message);
+    }
+
+    /**
+     * Get the statistics about the memoization caches of all runner processes, summed over the processes. Each process
+     * reports its statistics after an execution. If no process reported any yet, `undefined` is returned.
+     */
+    getMemoizationStats(): MemoizationStats | undefined {
+        const reportedStats = this.workers.flatMap((it) => (it.memoizationStats ? [it.memoizationStats] : []));
+        if (reportedStats.length === 0) {
+            return undefined;
+        }
+
+        return reportedStats.reduce((a, b) => ({
+            hits: a.hits + b.hits,
+            diskHits: a.diskHits + b.diskHits,
+            misses: a.misses + b.misses,
+            evictions: a.evictions + b.evictions,
+            entryCount: a.entryCount + b.entryCount,
+            sizeBytes: a.sizeBytes + b.sizeBytes,
+            // All processes use the same directory for the disk tier
+            diskSizeBytes: Math.max(a.diskSizeBytes, b.diskSizeBytes),
+        }));
+    }
+
+    /**
+     * Returns whether all started runner processes announced that they support the given capability. Each process is
+     * asked for its capabilities right after the connection is established. Until it answered, it supports none.
+     */
+    supports(capability: RunnerCapability): boolean {
+        const startedWorkers = this.workers.filter((it) => it.isStarted);
+        return startedWorkers.length > 0 && startedWorkers.every((it) => it.capabilities.has(capability));
+    }
+
+    private handleConnected(worker: PythonServerWorker): void {
+        this.connectionCallbacks.forEach((callback) => callback());
+
+        // Optional features are only used once the process announced them
+        worker.capabilities.clear();
+        worker.send(createCapabilitiesQueryMessage(`${CAPABILITIES_ID_PREFIX}${crypto.randomUUID()}`));
+
+        // Import heavy modules now, so the first pipeline execution is fast. The process counts as busy meanwhile. Only
+        // the owner of the process does this, so processes that are shared with the language client warm up once.
+        if (!worker.ownsProcess) {
+            return;
+        }
+
+        const id = `${WARM_UP_ID_PREFIX}${crypto.randomUUID()}`;
+        const imports = WARM_UP_MODULES.map((it) => `import ${it}\n`).join('');
+        const message = createProgramMessage(id, {
+            code: { warm_up: { gen_warm_up_imports: imports } },
+            main: { modulepath: 'warm_up', module: 'warm_up', pipeline: 'imports' },
+        });
+
+        this.trackExecution(worker, id, undefined);
+        worker.send(message);
+    }
+
+    /**
+     * Pass a message from the server to all callbacks registered for its type.
+     */
+    private dispatchMessage(pythonServerMessage: PythonServerMessage): void {
+        if (!this.messageCallbacks.has(pythonServerMessage.type)) {
+            this.logger.trace(`Message type '${pythonServerMessage.type}' is not handled`, undefined);
+            return;
+        }
+        for (const callback of this.messageCallbacks.get(pythonServerMessage.type)!) {
+            callback(pythonServerMessage);
+        }
+    }
+
+    /**
+     * Register a callback to execute when a message from the python server arrives.
+     *
+     * @param messageType Message type to register the callback for.
+     * @param callback Callback to execute
+     */
+    public addMessageCallback<M extends PythonServerMessage['type']>(
+        messageType: M,
+        callback: (message: Extract<PythonServerMessage, { type: M }>) => void,
+    ): Disposable {
+        if (!this.messageCallbacks.has(messageType)) {
+            this.messageCallbacks.set(messageType, []);
+        }
+        this.messageCallbacks.get(messageType)!.push(<(message: PythonServerMessage) => void>callback);
+        return Disposable.create(() => {
+            if (!this.messageCallbacks.has(messageType)) {
+                return;
+            }
+            this.messageCallbacks.set(
+                messageType,
+                this.messageCallbacks.get(messageType)!.filter((storedCallback) => storedCallback !== callback),
+            );
+        });
+    }
+
+    /**
+     * Remove a previously registered callback from being called when a message from the python server arrives.
+     *
+     * @param messageType Message type the callback was registered for.
+     * @param callback Callback to remove
+     */
+    public removeMessageCallback<M extends PythonServerMessage['type']>(
+        messageType: M,
+        callback: (message: Extract<PythonServerMessage, { type: M }>) => void,
+    ): void {
+        if (!this.messageCallbacks.has(messageType)) {
+            return;
+        }
+        this.messageCallbacks.set(
+            messageType,
+            this.messageCallbacks.get(messageType)!.filter((storedCallback) => storedCallback !== callback),
+        );
+    }
+
+    /**
+     * Register a callback to execute whenever a connection to a (possibly new) Python server is established. Any state
+     * that was kept by a previous server is lost at this point.
+     *
+     * @param callback Callback to execute.
+     */
+    public onConnected(callback: () => void): Disposable {
+        this.connectionCallbacks.add(callback);
+        return Disposable.create(() => {
+            this.connectionCallbacks.delete(callback);
+        });
+    }
+
+    /**
+     * Connect to runner processes that were started by someone else, e.g. the language server.
+     */
+    async connectToPorts(ports: number[]): Promise<void> {
+        if (this.state !== 'stopped') {
+            return;
+        }
+        this.state = 'starting';
+
+        this.workers = ports.map((_, index) => this.createWorker(index, ports.length));
+        await Promise.all(this.workers.map((worker, index) => worker.connectToPort(ports[index]!)));
+
+        if (this.isStarted) {
+            this.state = 'started';
+        } else {
+            await this.stop();
+        }
+    }
+}
+
+type PoolState = 'stopped' | 'starting' | 'started' | 'stopping' | 'failed';
+
+// Worker --------------------------------------------------------------------------------------------------------------
+
+interface PythonServerWorkerEvents {
+    onMessage(worker: PythonServerWorker, message: PythonServerMessage): void;
+    onConnected(worker: PythonServerWorker): void;
+    onUnexpectedClose(worker: PythonServerWorker): void;
+}
+
+/**
+ * A single runner process and the connection to it.
+ */
+class PythonServerWorker {
+    private state: State = stopped;
+    private readonly restartTracker = new RestartTracker();
+
+    /**
+     * The port the process listens on.
+     */
+    port: number | undefined = undefined;
+
+    /**
+     * IDs of the pipeline executions that are currently running in this process.
+     */
+    readonly runningExecutions = new Set<string>();
+
+    /**
+     * Hashes of the modules that this process has stored in its code cache.
+     */
+    readonly cachedCodeHashes = new Set<string>();
+
+    /**
+     * The optional features that this process announced.
+     */
+    readonly capabilities = new Set<RunnerCapability>();
+
+    /**
+     * The statistics about the memoization cache that this process reported last.
+     */
+    memoizationStats: MemoizationStats | undefined = undefined;
+
+    constructor(
+        readonly logger: SafeDsLogger,
+        private readonly events: PythonServerWorkerEvents,
+    ) {}
+
+    get isStarted(): boolean {
+        return isStarted(this.state);
+    }
+
+    /**
+     * Whether this worker started the process, rather than connecting to a process that was started by someone else.
+     */
+    get ownsProcess(): boolean {
+        return this.state.serverProcess !== undefined;
+    }
+
+    /**
+     * Whether the process should be restarted, i.e. it did not restart too frequently.
+     */
+    shouldRestart(): boolean {
+        return this.restartTracker.shouldRestart();
+    }
+
+    /**
+     * Start the process and connect to it.
+     */
+    async start(command: string): Promise<void> {
+        if (!isStopped(this.state)) {
+            return;
+        }
+        this.state = starting();
+
+        // Start the server at a free port
+        this.port = await getFreePort();
+        this.startServerProcess(command, this.port);
+
+        // Connect to the server
+        await this.connectToServer(this.port);
+    }
+
+    /**
+     * Stop the process.
+     *
+     * @returns Whether the process is stopped.
+     */
+    async stop(): Promise<boolean> {
+        if (!isStarting(this.state) && !isStarted(this.state)) {
+            return true;
+        }
+        this.state = stopping(this.state?.serverProcess, this.state?.serverConnection);
+
+        // Attempt a graceful shutdown first
+        await this.stopServerProcessGracefully(2500);
+        if (isStopped(this.state)) {
+            return true;
+        }
+
+        // If the graceful shutdown failed, kill the server process
+        this.logger.debug('Graceful shutdown failed. Killing the server process...');
+        await this.killServerProcess();
+        if (isStopped(this.state)) {
+            return true;
+        }
+
+        this.state = failed;
+        return false;
+    }
+
+    async connectToPort(port: number): Promise<void> {
+        if (!isStopped(this.state)) {
+            return;
+        }
+        this.state = starting();
+        this.port = port;
+
+        try {
+            await this.doConnectToServer(port);
+        } catch (_error) {
+            await this.stop();
+        }
+    }
+
+    send(message: PythonServerMessage): void {
+        if (!this.state.serverConnection) {
+            return;
+        }
+
+        const messageString = JSON.stringify(message);
+        this.logger.trace(`Sending message to python server: ${messageString}`);
+        this.state.serverConnection.send(messageString);
     }
 
     // Process handling ------------------------------------------------------------------------------------------------
@@ -303,7 +838,7 @@ export class SafeDsPythonServer {
             });
 
             // Send a shutdown message to the server. Do this last, so we don't miss the close event.
-            this.sendMessageToPythonServer(createShutdownMessage());
+            this.send(createShutdownMessage());
         });
     }
 
@@ -367,6 +902,7 @@ export class SafeDsPythonServer {
                 serverConnection.onopen = () => {
                     this.logger.debug(`Connected successfully.`);
                     this.state = started(this.state.serverProcess, serverConnection);
+                    this.events.onConnected(this);
                     resolve();
                 };
 
@@ -380,6 +916,7 @@ export class SafeDsPythonServer {
 
                         if (currentTry > maxConnectionTries) {
                             this.logger.error('Max retries reached. No further attempt at connecting is made.');
+                            reject();
                         } else {
                             this.logger.debug(`Not yet up. Retrying...`);
                             setTimeout(tryConnect, baseTimeoutMs * 2 ** (currentTry - 1)); // use exponential backoff
@@ -395,25 +932,36 @@ export class SafeDsPythonServer {
                 };
 
                 // Handle incoming messages
+                serverConnection.binaryType = 'nodebuffer';
                 serverConnection.onmessage = (event) => {
-                    if (typeof event.data !== 'string') {
-                        this.logger.trace(`Message received: (${event.type}, ${typeof event.data}) ${event.data}`);
-                        return;
-                    }
-                    this.logger.trace(
-                        `Message received: '${
-                            event.data.length > 128 ? event.data.substring(0, 128) + '<truncated>' : event.data
-                        }'`,
-                    );
-
-                    const pythonServerMessage: PythonServerMessage = JSON.parse(<string>event.data);
-                    if (!this.messageCallbacks.has(pythonServerMessage.type)) {
-                        this.logger.trace(`Message type '${pythonServerMessage.type}' is not handled`, undefined);
-                        return;
-                    }
-                    for (const callback of this.messageCallbacks.get(pythonServerMessage.type)!) {
-                        callback(pythonServerMessage);
+                    let pythonServerMessage: PythonServerMessage;
+                    if (typeof event.data === 'string') {
+                        this.logger.trace(
+                            `Message received: '${
+                                event.data.length > 128 ? event.data.substring(0, 128) + '<truncated>' : event.data
+                            }'`,
+                        );
+                        pythonServerMessage = JSON.parse(event.data);
+                    } else {
+                        let frame: Uint8Array;
+                        if (Array.isArray(event.data)) {
+                            frame = Buffer.concat(event.data);
+                        } else if (event.data instanceof Uint8Array) {
+                            frame = event.data;
+                        } else {
+                            frame = new Uint8Array(event.data);
+                        }
+                        this.logger.trace(`Binary message received: ${frame.byteLength} bytes`);
+
+                        try {
+                            pythonServerMessage = parseBinaryMessage(frame);
+                        } catch (error) {
+                            this.logger.error(`Could not parse binary message: ${error}`);
+                            return;
+                        }
                     }
+
+                    this.events.onMessage(this, pythonServerMessage);
                 };
 
                 // Handle the server closing the connection
@@ -424,144 +972,29 @@ export class SafeDsPythonServer {
                         this.state.serverConnection === serverConnection
                     ) {
                         this.logger.error('Connection was unexpectedly closed');
-                        this.restart(true);
+                        this.events.onUnexpectedClose(this);
                     }
                 };
             };
             tryConnect();
         });
     }
+}
 
-    // User interaction ------------------------------------------------------------------------------------------------
-
-    /**
-     * Report to the user that the runner cannot be started with the configured command.
-     */
-    private async reportBadRunnerCommand(command: string, error: unknown): Promise<void> {
-        const message = error instanceof Error ? error.message : String(error);
-        this.logger.error(`Could not start runner with command "${command}": ${message}`);
-
-        // Show an error message to the user and offer to install the runner
-        const action = await this.messaging.showErrorMessage(`The runner could not be started.`, {
-            title: 'Install runner',
-        });
-        if (action?.title === 'Install runner') {
-            await this.messaging.sendNotification(InstallRunnerNotification.type);
-        }
-    }
-
-    /**
-     * Report to the user that the runner version does not match the required version range.
-     */
-    private async reportInvalidRunnerVersion(version: string): Promise<void> {
-        this.logger.error(`Installed runner version ${version} is not in range "${pipVersionRange}".`);
-
-        // Show an error message to the user and offer to update the runner
-        const action = await this.messaging.showErrorMessage(
-            `The runner must be updated to a version in the range "${pipVersionRange}".`,
-            { title: 'Update runner' },
-        );
-        if (action?.title === 'Update runner') {
-            await this.messaging.sendNotification(UpdateRunnerNotification.type);
-        }
-    }
-
-    /**
-     * Report to the user that the installed runner is outdated.
-     *
-     * @returns Whether the user decided to update the runner. Returning `true` aborts the start process.
-     */
-    private async reportOutdatedRunner(installedVersion: string, availableVersion: string): Promise<boolean> {
-        this.logger.info(
-            `Installed runner version ${installedVersion} is outdated. Latest version is ${availableVersion}.`,
-        );
-
-        // Show an error message to the user and offer to update the runner
-        const action = await this.messaging.showInformationMessage(`A new version of the runner is available.`, {
-            title: 'Update runner',
-        });
-        if (action?.title === 'Update runner') {
-            await this.messaging.sendNotification(UpdateRunnerNotification.type);
-            return true;
-        } else {
-            return false;
-        }
-    }
-
-    // TODO ------------------------------------------------------------------------------------------------------------
-
-    /**
-     * Send a message to the python server using the websocket connection.
-     *
-     * @param message Message to be sent to the python server. This message should be serializable to JSON.
-     */
-    public sendMessageToPythonServer(message: PythonServerMessage): void {
-        if (!this.state.serverConnection) {
-            return;
-        }
-
-        const messageString = JSON.stringify(message);
-        this.logger.trace(`Sending message to python server: ${messageString}`);
-        this.state.serverConnection.send(messageString);
-    }
+// Port handling -------------------------------------------------------------------------------------------------------
 
-    /**
-     * Register a callback to execute when a message from the python server arrives.
-     *
-     * @param messageType Message type to register the callback for.
-     * @param callback Callback to execute
-     */
-    public addMessageCallback<M extends PythonServerMessage['type']>(
-        messageType: M,
-        callback: (message: Extract<PythonServerMessage, { type: M }>) => void,
-    ): Disposable {
-        if (!this.messageCallbacks.has(messageType)) {
-            this.messageCallbacks.set(messageType, []);
-        }
-        this.messageCallbacks.get(messageType)!.push(<(message: PythonServerMessage) => void>callback);
-        return Disposable.create(() => {
-            if (!this.messageCallbacks.has(messageType)) {
-                return;
-            }
-            this.messageCallbacks.set(
-                messageType,
-                this.messageCallbacks.get(messageType)!.filter((storedCallback) => storedCallback !== callback),
-            );
+/**
+ * Get a random free port on the local machine.
+ */
+const getFreePort = async (): Promise<number> => {
+    return new Promise((resolve) => {
+        const server = net.createServer();
+        server.listen(0, '127.0.0.1', () => {
+            const port = (server.address() as AddressInfo).port;
+            server.close(() => resolve(port));
         });
-    }
-
-    /**
-     * Remove a previously registered callback from being called when a message from the python server arrives.
-     *
-     * @param messageType Message type the callback was registered for.
-     * @param callback Callback to remove
-     */
-    public removeMessageCallback<M extends PythonServerMessage['type']>(
-        messageType: M,
-        callback: (message: Extract<PythonServerMessage, { type: M }>) => void,
-    ): void {
-        if (!this.messageCallbacks.has(messageType)) {
-            return;
-        }
-        this.messageCallbacks.set(
-            messageType,
-            this.messageCallbacks.get(messageType)!.filter((storedCallback) => storedCallback !== callback),
-        );
-    }
-
-    async connectToPort(port: number): Promise<void> {
-        if (!isStopped(this.state)) {
-            return;
-        }
-        this.state = starting();
-
-        try {
-            await this.doConnectToServer(port);
-        } catch (_error) {
-            await this.stop();
-        }
-    }
-}
+    });
+};
 
 // State ---------------------------------------------------------------------------------------------------------------
 
@@ -1,13 +1,31 @@
 import { SafeDsServices } from '../safe-ds-module.js';
-import { AstNodeLocator, AstUtils, Disposable, LangiumDocument, LangiumDocuments, URI } from 'langium';
+import {
+    AstNodeLocator,
+    AstUtils,
+    CancellationToken,
+    Disposable,
+    LangiumDocument,
+    LangiumDocuments,
+    URI,
+} from 'langium';
 import path from 'path';
 import {
-    createPlaceholderQueryMessage,
+    createCancelMessage,
+    createPlaceholderQuery,
+    createPlaceholderQueryBatchMessage,
+    createProfilingQueryMessage,
     createProgramMessage,
+    createSessionCloseMessage,
+    PlaceholderQuery,
+    PlaceholderValue,
+    PlaceholderValueBatchMessage,
     PlaceholderValueMessage,
+    ProfilingMessage,
+    ProfilingQuery,
     ProgramCodeMap,
     RuntimeErrorBacktraceFrame,
     RuntimeErrorMessage,
+    TableProfiling,
 } from './messages.js';
 import { SourceMapConsumer } from 'source-map-js';
 import { SafeDsAnnotations } from '../builtins/safe-ds-annotations.js';
@@ -23,15 +41,33 @@ import {
 import { SafeDsLogger, SafeDsMessagingProvider } from '../communication/safe-ds-messaging-provider.js';
 import crypto from 'crypto';
 import { SafeDsPythonServer } from './safe-ds-python-server.js';
-import { ExploreTableNotification, IsRunnerReadyRequest, ShowImageNotification } from '../communication/rpc.js';
+import {
+    ExploreTableNotification,
+    GetMemoizationStatsRequest,
+    IsRunnerReadyRequest,
+    ShowImageNotification,
+} from '../communication/rpc.js';
 import { expandToStringLF, joinToNode } from 'langium/generate';
 import { UUID } from 'node:crypto';
 import { CODEGEN_PREFIX } from '../generation/python/constants.js';
+import { listBuiltinFiles } from '../builtins/fileFinder.js';
+import { SafeDsSettingsProvider } from '../workspace/safe-ds-settings-provider.js';
+import { WorkDoneProgressServerReporter } from 'vscode-languageserver';
 
 // Most of the functionality cannot be tested automatically as a functioning runner setup would always be required
 
 const RUNNER_TAG = 'Runner';
 
+/**
+ * How long to wait for a placeholder value before giving up.
+ */
+const PLACEHOLDER_QUERY_TIMEOUT_MS = 30000;
+
+/**
+ * How many generated programs to keep in memory.
+ */
+const GENERATED_CODE_CACHE_SIZE = 16;
+
 /* c8 ignore start */
 export class SafeDsRunner {
     private readonly annotations: SafeDsAnnotations;
@@ -41,6 +77,17 @@ export class SafeDsRunner {
     private readonly logger: SafeDsLogger;
     private readonly messaging: SafeDsMessagingProvider;
     private readonly pythonServer: SafeDsPythonServer;
+    private readonly settingsProvider: SafeDsSettingsProvider;
+
+    /**
+     * Generated code keyed by a hash of everything the generation depends on (see {@link getGenerationCacheKey}).
+     */
+    private readonly generatedCodeCache = new Map<string, [ProgramCodeMap, Map<string, string>]>();
+
+    /**
+     * The URIs of the builtin files. They never change, so they are not part of the cache keys.
+     */
+    private readonly builtinUris = new Set(listBuiltinFiles().map((it) => it.toString()));
 
     constructor(services: SafeDsServices) {
         this.annotations = services.builtins.Annotations;
@@ -50,12 +97,16 @@ export class SafeDsRunner {
         this.logger = services.communication.MessagingProvider.createTaggedLogger(RUNNER_TAG);
         this.messaging = services.communication.MessagingProvider;
         this.pythonServer = services.runtime.PythonServer;
+        this.settingsProvider = services.workspace.SettingsProvider;
 
         this.registerMessageLoggingCallbacks();
 
         this.messaging.onRequest(IsRunnerReadyRequest.type, () => {
             return this.isReady();
         });
+        this.messaging.onRequest(GetMemoizationStatsRequest.type, () => {
+            return this.pythonServer.getMemoizationStats() ?? null;
+        });
     }
 
     /**
@@ -65,7 +116,7 @@ export class SafeDsRunner {
         return this.pythonServer.isStarted;
     }
 
-    async runPipeline(documentUri: string, nodePath: string) {
+    async runPipeline(documentUri: string, nodePath: string, cancelToken?: CancellationToken) {
         const document = this.getDocument(documentUri);
         if (!document) {
             return;
@@ -78,12 +129,17 @@ export class SafeDsRunner {
             return;
         }
 
-        await this.runWithCallbacks(`running pipeline ${node.name} in ${documentUri}`, async (pipelineExecutionId) => {
-            await this.executePipeline(pipelineExecutionId, document, node.name);
-        });
+        await this.runWithCallbacks(
+            `running pipeline ${node.name} in ${documentUri}`,
+            async (pipelineExecutionId) => {
+                await this.executePipeline(pipelineExecutionId, document, node.name);
+            },
+            undefined,
+            cancelToken,
+        );
     }
 
-    async exploreTable(name: string, documentUri: string, nodePath: string) {
+    async exploreTable(name: string, documentUri: string, nodePath: string, cancelToken?: CancellationToken) {
         const document = this.getDocument(documentUri);
         if (!document) {
             return;
@@ -125,10 +181,11 @@ export class SafeDsRunner {
                     });
                 }
             },
+            cancelToken,
         );
     }
 
-    async printValue(name: string, documentUri: string, nodePath: string) {
+    async printValue(name: string, documentUri: string, nodePath: string, cancelToken?: CancellationToken) {
         const document = this.getDocument(documentUri);
         if (!document) {
             return;
@@ -164,10 +221,11 @@ export class SafeDsRunner {
                     this.logger.result(`val ${name} = ${JSON.stringify(data, null, 2)};`);
                 }
             },
+            cancelToken,
         );
     }
 
-    async showImage(name: string, documentUri: string, nodePath: string) {
+    async showImage(name: string, documentUri: string, nodePath: string, cancelToken?: CancellationToken) {
         const document = this.getDocument(documentUri);
         if (!document) {
             return;
@@ -203,6 +261,7 @@ export class SafeDsRunner {
                     await this.messaging.sendNotification(ShowImageNotification.type, { image: data });
                 }
             },
+            cancelToken,
         );
     }
 
@@ -216,18 +275,53 @@ export class SafeDsRunner {
         return document;
     }
 
+    /**
+     * Run the given function, which starts a pipeline execution with the given ID, and report its progress. The
+     * returned promise is resolved once the runner reports that the execution is done, failed, or was cancelled. Until
+     * then, cancelling the given token or the progress indicator cancels the execution on the runner.
+     */
     async runWithCallbacks(
         taskName: string,
         func: (pipelineExecutionId: UUID) => Promise<void>,
         onPlaceholderReady?: (pipelineExecutionId: UUID, placeholderName: string) => Promise<void>,
+        cancelToken: CancellationToken = CancellationToken.None,
     ) {
+        if (cancelToken.isCancellationRequested) {
+            return;
+        } else if (!this.isReady()) {
+            this.messaging.showErrorMessage('The runner is not started.');
+            return;
+        }
+
         const pipelineExecutionId = crypto.randomUUID();
         const start = Date.now();
 
-        const progress = await this.messaging.showProgress('Safe-DS Runner', 'Starting...');
+        // Users can also cancel the execution with the progress indicator, if the client supports it
+        const progress = await this.messaging.showProgress('Safe-DS Runner', 'Starting...', true);
+        const progressToken = (progress as Partial<WorkDoneProgressServerReporter>).token ?? CancellationToken.None;
         this.logger.info(`[${pipelineExecutionId}] Starting ${taskName}.`);
 
-        let disposables: Disposable[] = [];
+        let resolveFinished: () => void = () => {};
+        const finished = new Promise<void>((resolve) => {
+            resolveFinished = resolve;
+        });
+
+        const disposables: Disposable[] = [];
+        const finish = () => {
+            disposables.forEach((it) => {
+                it.dispose();
+            });
+
+            progress.done();
+            resolveFinished();
+        };
+
+        const cancel = () => {
+            finish();
+            this.cancelPipelineExecution(pipelineExecutionId);
+            this.logger.info(`[${pipelineExecutionId}] Cancelled ${taskName}.`);
+        };
+
         disposables.push(
             this.pythonServer.addMessageCallback('placeholder_type', async (message) => {
                 if (message.id === pipelineExecutionId) {
@@ -238,29 +332,32 @@ export class SafeDsRunner {
 
             this.pythonServer.addMessageCallback('runtime_progress', (message) => {
                 if (message.id === pipelineExecutionId) {
-                    disposables.forEach((it) => {
-                        it.dispose();
-                    });
-
-                    progress.done();
+                    finish();
                     const timeElapsed = Date.now() - start;
-                    this.logger.info(`[${pipelineExecutionId}] Finished ${taskName} in ${timeElapsed}ms.`);
+                    const outcome = message.data === 'cancelled' ? 'Runner cancelled' : 'Finished';
+                    this.logger.info(`[${pipelineExecutionId}] ${outcome} ${taskName} in ${timeElapsed}ms.`);
                 }
             }),
 
             this.pythonServer.addMessageCallback('runtime_error', (message) => {
                 if (message.id === pipelineExecutionId) {
-                    disposables.forEach((it) => {
-                        it.dispose();
-                    });
-
-                    progress.done();
+                    finish();
                     this.messaging.showErrorMessage('An error occurred during pipeline execution.');
                 }
             }),
+
+            cancelToken.onCancellationRequested(cancel),
+            progressToken.onCancellationRequested(cancel),
         );
 
-        await func(pipelineExecutionId);
+        try {
+            await func(pipelineExecutionId);
+        } catch (error) {
+            finish();
+            throw error;
+        }
+
+        await finished;
     }
 
     private getPlaceholderName(statement: SdsStatement, name: string): string | undefined {
@@ -274,28 +371,151 @@ export class SafeDsRunner {
     }
 
     private async getPlaceholderValue(placeholder: string, pipelineExecutionId: string): Promise<any | undefined> {
+        this.logger.info('Getting placeholder from Runner ...');
+        const placeholderValue = await this.getPlaceholder(pipelineExecutionId, createPlaceholderQuery(placeholder));
+        return placeholderValue?.value;
+    }
+
+    /**
+     * Get the value of a placeholder that was computed during a pipeline execution.
+     *
+     * @param pipelineExecutionId The id of the execution.
+     * @param query The query to send to the runner.
+     * @returns The value of the placeholder, or `undefined` if the runner did not respond in time.
+     */
+    public async getPlaceholder(
+        pipelineExecutionId: string,
+        query: PlaceholderQuery,
+    ): Promise<PlaceholderValue | undefined> {
         return new Promise((resolve) => {
-            if (placeholder === '') {
+            if (query.name === '') {
                 resolve(undefined);
+                return;
             }
 
             const placeholderValueCallback = (message: PlaceholderValueMessage) => {
-                if (message.id !== pipelineExecutionId || message.data.name !== placeholder) {
+                if (message.id !== pipelineExecutionId || message.data.name !== query.name) {
                     return;
                 }
+                clearTimeout(timeout);
                 this.pythonServer.removeMessageCallback('placeholder_value', placeholderValueCallback);
-                resolve(message.data.value);
+                resolve(message.data);
             };
 
+            const timeout = setTimeout(() => {
+                this.pythonServer.removeMessageCallback('placeholder_value', placeholderValueCallback);
+                resolve(undefined);
+            }, PLACEHOLDER_QUERY_TIMEOUT_MS);
+
             this.pythonServer.addMessageCallback('placeholder_value', placeholderValueCallback);
-            this.logger.info('Getting placeholder from Runner ...');
+            this.pythonServer.sendMessageToPythonServer({
+                type: 'placeholder_query',
+                id: pipelineExecutionId,
+                data: query,
+            });
+        });
+    }
+
+    /**
+     * Get the values of several placeholders that were computed during the same pipeline execution. If the runner
+     * supports it, they are requested in a single round trip. Otherwise, the queries are sent concurrently.
+     *
+     * @param pipelineExecutionId The id of the execution.
+     * @param queries The queries to send to the runner.
+     * @returns The values of the placeholders in the order of the queries. Values that could not be retrieved are
+     * `undefined`.
+     */
+    public async getPlaceholders(
+        pipelineExecutionId: string,
+        queries: PlaceholderQuery[],
+    ): Promise<(PlaceholderValue | undefined)[]> {
+        if (queries.length <= 1 || !this.pythonServer.supports('placeholder_query_batch')) {
+            return Promise.all(queries.map((query) => this.getPlaceholder(pipelineExecutionId, query)));
+        }
+
+        const values = await this.getPlaceholderBatch(pipelineExecutionId, queries);
+        return values ?? queries.map(() => undefined);
+    }
+
+    private async getPlaceholderBatch(
+        pipelineExecutionId: string,
+        queries: PlaceholderQuery[],
+    ): Promise<(PlaceholderValue | undefined)[] | undefined> {
+        return new Promise((resolve) => {
+            const placeholderValueBatchCallback = (message: PlaceholderValueBatchMessage) => {
+                if (message.id !== pipelineExecutionId || !this.isResponseToBatch(message, queries)) {
+                    return;
+                }
+                clearTimeout(timeout);
+                this.pythonServer.removeMessageCallback('placeholder_value_batch', placeholderValueBatchCallback);
+
+                const valuesByName = new Map(message.data.map((value) => [value.name, value]));
+                resolve(
+                    queries.map((query, index) =>
+                        message.data[index]?.name === query.name ? message.data[index] : valuesByName.get(query.name),
+                    ),
+                );
+            };
+
+            const timeout = setTimeout(() => {
+                this.pythonServer.removeMessageCallback('placeholder_value_batch', placeholderValueBatchCallback);
+                resolve(undefined);
+            }, PLACEHOLDER_QUERY_TIMEOUT_MS);
+
+            this.pythonServer.addMessageCallback('placeholder_value_batch', placeholderValueBatchCallback);
             this.pythonServer.sendMessageToPythonServer(
-                createPlaceholderQueryMessage(pipelineExecutionId, placeholder),
+                createPlaceholderQueryBatchMessage(pipelineExecutionId, queries),
             );
+        });
+    }
+
+    /**
+     * Several batches for the same execution may be in flight, so we also compare the requested names.
+     */
+    private isResponseToBatch(message: PlaceholderValueBatchMessage, queries: PlaceholderQuery[]): boolean {
+        const requestedNames = new Set(queries.map((query) => query.name));
+        return message.data.every((value) => requestedNames.has(value.name));
+    }
+
+    /**
+     * Returns whether the runner can profile tables (see {@link getProfiling}). Otherwise, the statistics must be
+     * computed by generated code.
+     */
+    public supportsProfiling(): boolean {
+        return this.pythonServer.supports('profiling_query');
+    }
+
+    /**
+     * Get the statistics of all columns of a table placeholder that was computed during a pipeline execution. The
+     * runner computes them in a single pass over the table.
+     *
+     * @param pipelineExecutionId The id of the execution.
+     * @param query The query to send to the runner.
+     * @returns The profiling of the table, or `undefined` if the runner does not support profiling or did not respond
+     * in time. A timeout does not affect later queries.
+     */
+    public async getProfiling(pipelineExecutionId: string, query: ProfilingQuery): Promise<TableProfiling | undefined> {
+        if (!this.supportsProfiling()) {
+            return undefined;
+        }
 
-            setTimeout(() => {
+        return new Promise((resolve) => {
+            const profilingCallback = (message: ProfilingMessage) => {
+                if (message.id !== pipelineExecutionId || message.data.name !== query.name) {
+                    return;
+                }
+                clearTimeout(timeout);
+                this.pythonServer.removeMessageCallback('profiling', profilingCallback);
+                resolve(message.data);
+            };
+
+            const timeout = setTimeout(() => {
+                this.pythonServer.removeMessageCallback('profiling', profilingCallback);
                 resolve(undefined);
-            }, 30000);
+            }, PLACEHOLDER_QUERY_TIMEOUT_MS);
+
+            this.pythonServer.addMessageCallback('profiling', profilingCallback);
+            this.pythonServer.sendMessageToPythonServer(createProfilingQueryMessage(pipelineExecutionId, query));
         });
     }
 
@@ -341,12 +561,15 @@ export class SafeDsRunner {
      * @param pipelineDocument Document containing the main Safe-DS pipeline to execute.
      * @param pipelineName Name of the pipeline that should be run
      * @param targetStatements The indices of the target statements, used to do partial execution. If undefined is provided, the entire pipeline is run.
+     * @param session The session the execution belongs to. If provided, the runner keeps the computed placeholders, and
+     * resident placeholders of the session are loaded instead of being computed again.
      */
     public async executePipeline(
         id: string,
         pipelineDocument: LangiumDocument,
         pipelineName: string,
         targetStatements: number[] | number | undefined = undefined,
+        session: PipelineSession | undefined = undefined,
     ) {
         const node = pipelineDocument.parseResult.value;
         if (!isSdsModule(node)) {
@@ -357,7 +580,11 @@ export class SafeDsRunner {
         const mainPackage = mainPythonModuleName === undefined ? node.name.split('.') : [mainPythonModuleName];
         const mainModuleName = this.getMainModuleName(pipelineDocument);
         // Code generation
-        const [codeMap, lastGeneratedSources] = this.generateCodeForRunner(pipelineDocument, targetStatements);
+        const [codeMap, lastGeneratedSources] = this.generateCodeForRunner(
+            pipelineDocument,
+            targetStatements,
+            session?.residentPlaceholders,
+        );
         // Store information about the run
         this.executionInformation.set(id, {
             generatedSource: lastGeneratedSources,
@@ -366,7 +593,7 @@ export class SafeDsRunner {
             source: pipelineDocument.textDocument.getText(),
             calculatedPlaceholders: new Map<string, string>(),
         });
-        // Code execution
+        // Code execution. The Python server replaces modules that the runner has cached by references.
         this.pythonServer.sendMessageToPythonServer(
             createProgramMessage(id, {
                 code: codeMap,
@@ -376,17 +603,69 @@ export class SafeDsRunner {
                     pipeline: pipelineName,
                 },
                 cwd: path.parse(pipelineDocument.uri.fsPath).dir,
+                session: session?.id,
+                memoization: this.settingsProvider.getMemoizationPolicy(),
             }),
         );
     }
 
+    /**
+     * Let the runner stop a pipeline execution. The runner discards the memoized values that the execution computed and
+     * answers with a `runtime_progress` message with the value 'cancelled'.
+     *
+     * @param pipelineExecutionId The id of the execution.
+     */
+    public cancelPipelineExecution(pipelineExecutionId: string) {
+        this.logger.debug(`[${pipelineExecutionId}] Cancelling execution.`);
+        this.pythonServer.sendMessageToPythonServer(createCancelMessage(pipelineExecutionId));
+    }
+
+    /**
+     * Returns whether independent statements should be executed in parallel. This requires that the user enabled it
+     * and that the runner provides the needed function.
+     */
+    private shouldExecuteInParallel(): boolean {
+        return this.settingsProvider.shouldExecuteInParallel() && this.pythonServer.supports('run_parallel');
+    }
+
+    /**
+     * Returns whether the runner keeps the placeholders of sessions (see {@link executePipeline}).
+     */
+    public supportsSessions(): boolean {
+        return this.pythonServer.supports('session');
+    }
+
+    /**
+     * Let the runner discard all placeholder values that it keeps for the session.
+     *
+     * @param sessionId The id of the session.
+     */
+    public closeSession(sessionId: string) {
+        this.pythonServer.sendMessageToPythonServer(createSessionCloseMessage(sessionId));
+    }
+
     private registerMessageLoggingCallbacks() {
+        this.pythonServer.addMessageCallback('program_code_cached', (message) => {
+            this.logger.trace(`Runner cached ${message.data.length} modules (${message.id})`, undefined);
+        });
         this.pythonServer.addMessageCallback('placeholder_value', (message) => {
             this.logger.trace(
                 `Placeholder value is (${message.id}): ${message.data.name} of type ${message.data.type} = ${message.data.value}`,
                 undefined,
             );
         });
+        this.pythonServer.addMessageCallback('placeholder_value_batch', (message) => {
+            this.logger.trace(
+                `Placeholder values are (${message.id}): ${message.data.map((value) => value.name).join(', ')}`,
+                undefined,
+            );
+        });
+        this.pythonServer.addMessageCallback('profiling', (message) => {
+            this.logger.trace(
+                `Profiling received (${message.id}): ${message.data.name} with ${message.data.columns.length} columns`,
+                undefined,
+            );
+        });
         this.pythonServer.addMessageCallback('placeholder_type', (message) => {
             this.logger.trace(
                 `Placeholder was calculated (${message.id}): ${message.data.name} of type ${message.data.type}`,
@@ -401,6 +680,12 @@ export class SafeDsRunner {
         this.pythonServer.addMessageCallback('runtime_progress', (message) => {
             this.logger.trace(`Runner-Progress (${message.id}): ${message.data}`, undefined);
         });
+        this.pythonServer.addMessageCallback('memoization_stats', (message) => {
+            const { hits, diskHits, misses, evictions, entryCount, sizeBytes } = message.data;
+            this.logger.debug(
+                `[${message.id}] Memoization: ${hits} hits, ${diskHits} disk hits, ${misses} misses, ${evictions} evictions, ${entryCount} entries (${sizeBytes} bytes)`,
+            );
+        });
         this.pythonServer.addMessageCallback('runtime_error', async (message) => {
             let readableStacktraceSafeDs: string[] = [];
             const execInfo = this.getExecutionContext(message.id)!;
@@ -482,9 +767,95 @@ export class SafeDsRunner {
         return { file: outputPosition.source || '<unknown>', line: outputPosition.line || 0 };
     }
 
+    /**
+     * Generate Python code for the pipeline document. The result is cached, so running the same pipeline again does not
+     * generate its code again, unless the document or any document it depends on has changed.
+     */
     public generateCodeForRunner(
         pipelineDocument: LangiumDocument,
         targetStatements: number[] | number | undefined,
+        residentPlaceholders: string[] | undefined = undefined,
+    ): [ProgramCodeMap, Map<string, string>] {
+        const cacheKey = this.getGenerationCacheKey(pipelineDocument, targetStatements, residentPlaceholders);
+        const cachedResult = this.generatedCodeCache.get(cacheKey);
+        if (cachedResult) {
+            // Move to the end, so it is evicted last
+            this.generatedCodeCache.delete(cacheKey);
+            this.generatedCodeCache.set(cacheKey, cachedResult);
+            return cachedResult;
+        }
+
+        const result = this.doGenerateCodeForRunner(pipelineDocument, targetStatements, residentPlaceholders);
+        this.generatedCodeCache.set(cacheKey, result);
+        if (this.generatedCodeCache.size > GENERATED_CODE_CACHE_SIZE) {
+            this.generatedCodeCache.delete(this.generatedCodeCache.keys().next().value!);
+        }
+        return result;
+    }
+
+    /**
+     * Hash the text of the pipeline document and all documents it transitively references, as well as the generation
+     * options that depend on the execution.
+     */
+    private getGenerationCacheKey(
+        pipelineDocument: LangiumDocument,
+        targetStatements: number[] | number | undefined,
+        residentPlaceholders: string[] | undefined,
+    ): string {
+        const hash = crypto.createHash('sha256');
+        hash.update(
+            JSON.stringify({
+                targetStatements,
+                residentPlaceholders,
+                fileReadMemoizationKey: this.settingsProvider.getFileReadMemoizationKey(),
+                parallelize: this.shouldExecuteInParallel(),
+            }),
+        );
+
+        for (const document of [pipelineDocument, ...this.getTransitiveDependencies(pipelineDocument)]) {
+            hash.update('\0');
+            hash.update(document.uri.toString());
+            hash.update('\0');
+            hash.update(document.textDocument.getText());
+        }
+
+        return hash.digest('hex');
+    }
+
+    /**
+     * Get all documents that contain declarations referenced by the document, directly or indirectly. Builtin files are
+     * not included. The result is sorted by URI.
+     */
+    private getTransitiveDependencies(document: LangiumDocument): LangiumDocument[] {
+        const result = new Map<string, LangiumDocument>();
+        const queue = [document];
+
+        while (queue.length > 0) {
+            const current = queue.pop()!;
+            for (const reference of current.references) {
+                const uri = reference.$nodeDescription?.documentUri;
+                const key = uri?.toString();
+                if (!uri || !key || key === document.uri.toString() || result.has(key) || this.builtinUris.has(key)) {
+                    continue;
+                }
+
+                const dependency = this.langiumDocuments.getDocument(uri);
+                if (dependency) {
+                    result.set(key, dependency);
+                    queue.push(dependency);
+                }
+            }
+        }
+
+        return Array.from(result.entries())
+            .sort(([a], [b]) => a.localeCompare(b))
+            .map(([, dependency]) => dependency);
+    }
+
+    private doGenerateCodeForRunner(
+        pipelineDocument: LangiumDocument,
+        targetStatements: number[] | number | undefined,
+        residentPlaceholders: string[] | undefined,
     ): [ProgramCodeMap, Map<string, string>] {
         const rootGenerationDir = path.parse(pipelineDocument.uri.fsPath).dir;
         const generatedDocuments = this.generator.generate(pipelineDocument, {
@@ -492,6 +863,10 @@ export class SafeDsRunner {
             createSourceMaps: true,
             targetStatements,
             disableRunnerIntegration: false,
+            residentPlaceholders,
+            fileReadMemoizationKey: this.settingsProvider.getFileReadMemoizationKey(),
+            optimize: true,
+            parallelize: this.shouldExecuteInParallel(),
         });
         const lastGeneratedSources = new Map<string, string>();
         let codeMap: ProgramCodeMap = {};
@@ -536,6 +911,22 @@ export class SafeDsRunner {
     }
 }
 
+/**
+ * A series of pipeline executions, where the runner keeps the computed placeholders between executions.
+ */
+export interface PipelineSession {
+    /**
+     * The id of the session.
+     */
+    id: string;
+
+    /**
+     * The names of placeholders that were computed by previous executions of the session and are still kept by the
+     * runner.
+     */
+    residentPlaceholders: string[];
+}
+
 /**
  * Context containing information about the execution of a pipeline.
  */
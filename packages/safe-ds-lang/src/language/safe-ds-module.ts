@@ -10,6 +10,7 @@ import {
 import { SafeDsAnnotations } from './builtins/safe-ds-annotations.js';
 import { SafeDsClasses } from './builtins/safe-ds-classes.js';
 import { SafeDsEnums, SafeDsImpurityReasons } from './builtins/safe-ds-enums.js';
+import { SafeDsBuiltinSnapshot } from './builtins/safe-ds-builtin-snapshot.js';
 import { SafeDsCommentProvider } from './documentation/safe-ds-comment-provider.js';
 import { SafeDsDocumentationProvider } from './documentation/safe-ds-documentation-provider.js';
 import { SafeDsCallGraphComputer } from './flow/safe-ds-call-graph-computer.js';
@@ -34,6 +35,9 @@ import { SafeDsCoreTypes } from './typing/safe-ds-core-types.js';
 import { SafeDsTypeChecker } from './typing/safe-ds-type-checker.js';
 import { SafeDsTypeComputer } from './typing/safe-ds-type-computer.js';
 import { registerValidationChecks } from './validation/safe-ds-validator.js';
+import { SafeDsDocumentBuilder } from './workspace/safe-ds-document-builder.js';
+import { SafeDsDocumentDependencies } from './workspace/safe-ds-document-dependencies.js';
+import { SafeDsNodeIdentities } from './workspace/safe-ds-node-identities.js';
 import { SafeDsPackageManager } from './workspace/safe-ds-package-manager.js';
 import { SafeDsWorkspaceManager } from './workspace/safe-ds-workspace-manager.js';
 import { SafeDsPurityComputer } from './purity/safe-ds-purity-computer.js';
@@ -55,6 +59,8 @@ import { SafeDsExecuteCommandHandler } from './lsp/safe-ds-execute-command-handl
 import { SafeDsServiceRegistry } from './safe-ds-service-registry.js';
 import { SafeDsPythonServer } from './runtime/safe-ds-python-server.js';
 import { SafeDsSlicer } from './flow/safe-ds-slicer.js';
+import { SafeDsPipelineOptimizer } from './flow/safe-ds-pipeline-optimizer.js';
+import { SafeDsExecutionPlanner } from './flow/safe-ds-execution-planner.js';
 import { SafeDsSyntheticProperties } from './helpers/safe-ds-synthetic-properties.js';
 import { SafeDsLinker } from './scoping/safe-ds-linker.js';
 import { SafeDsCodeActionProvider } from './codeActions/safe-ds-code-action-provider.js';
@@ -70,6 +76,7 @@ export type SafeDsAddedServices = {
         Classes: SafeDsClasses;
         Enums: SafeDsEnums;
         ImpurityReasons: SafeDsImpurityReasons;
+        Snapshot: SafeDsBuiltinSnapshot;
     };
     codeActions: {
         QuickfixProvider: SafeDsQuickfixProvider;
@@ -85,6 +92,8 @@ export type SafeDsAddedServices = {
     };
     flow: {
         CallGraphComputer: SafeDsCallGraphComputer;
+        ExecutionPlanner: SafeDsExecutionPlanner;
+        PipelineOptimizer: SafeDsPipelineOptimizer;
         Slicer: SafeDsSlicer;
     };
     generation: {
@@ -113,6 +122,8 @@ export type SafeDsAddedServices = {
         TypeFactory: SafeDsTypeFactory;
     };
     workspace: {
+        DocumentDependencies: SafeDsDocumentDependencies;
+        NodeIdentities: SafeDsNodeIdentities;
         PackageManager: SafeDsPackageManager;
         SettingsProvider: SafeDsSettingsProvider;
     };
@@ -144,6 +155,7 @@ export const SafeDsModule: Module<SafeDsServices, PartialLangiumServices & SafeD
         Classes: (services) => new SafeDsClasses(services),
         Enums: (services) => new SafeDsEnums(services),
         ImpurityReasons: (services) => new SafeDsImpurityReasons(services),
+        Snapshot: (services) => new SafeDsBuiltinSnapshot(services),
     },
     codeActions: {
         QuickfixProvider: (services) => new SafeDsQuickfixProvider(services),
@@ -160,6 +172,8 @@ export const SafeDsModule: Module<SafeDsServices, PartialLangiumServices & SafeD
     },
     flow: {
         CallGraphComputer: (services) => new SafeDsCallGraphComputer(services),
+        ExecutionPlanner: (services) => new SafeDsExecutionPlanner(services),
+        PipelineOptimizer: (services) => new SafeDsPipelineOptimizer(services),
         Slicer: (services) => new SafeDsSlicer(services),
     },
     generation: {
@@ -208,6 +222,8 @@ export const SafeDsModule: Module<SafeDsServices, PartialLangiumServices & SafeD
         TypeFactory: (services) => new SafeDsTypeFactory(services),
     },
     workspace: {
+        DocumentDependencies: (services) => new SafeDsDocumentDependencies(services),
+        NodeIdentities: () => new SafeDsNodeIdentities(),
         PackageManager: (services) => new SafeDsPackageManager(services),
         SettingsProvider: (services) => new SafeDsSettingsProvider(services),
     },
@@ -221,6 +237,7 @@ export const SafeDsSharedModule: Module<SafeDsSharedServices, DeepPartial<SafeDs
         NodeKindProvider: () => new SafeDsNodeKindProvider(),
     },
     workspace: {
+        DocumentBuilder: (sharedServices) => new SafeDsDocumentBuilder(sharedServices),
         WorkspaceManager: (sharedServices) => new SafeDsWorkspaceManager(sharedServices),
     },
 };
@@ -258,6 +275,12 @@ export const createSafeDsServices = async function (
     shared.ServiceRegistry.register(SafeDs);
     registerValidationChecks(SafeDs);
 
+    // Dependencies must be tracked from the start, so caches can drop the entries of dependent documents
+    void SafeDs.workspace.DocumentDependencies;
+
+    // The class hierarchy indexes subclasses whenever documents are linked, so it must listen from the start as well
+    void SafeDs.typing.ClassHierarchy;
+
     // If we don't run inside a language server, initialize the configuration provider instantly
     if (!context.connection) {
         await shared.workspace.ConfigurationProvider.initialized({});
@@ -5,6 +5,7 @@ import {
     AstUtils,
     DefaultScopeProvider,
     EMPTY_SCOPE,
+    MapScope,
     ReferenceInfo,
     Scope,
     WorkspaceCache,
@@ -75,6 +76,7 @@ import { SafeDsServices } from '../safe-ds-module.js';
 import { ClassType, EnumVariantType, LiteralType, TypeVariable } from '../typing/model.js';
 import type { SafeDsClassHierarchy } from '../typing/safe-ds-class-hierarchy.js';
 import { SafeDsTypeComputer } from '../typing/safe-ds-type-computer.js';
+import { DependencyTrackedCache } from '../workspace/safe-ds-document-dependencies.js';
 import { SafeDsPackageManager } from '../workspace/safe-ds-package-manager.js';
 
 export class SafeDsScopeProvider extends DefaultScopeProvider {
@@ -85,6 +87,14 @@ export class SafeDsScopeProvider extends DefaultScopeProvider {
     private readonly typeComputer: SafeDsTypeComputer;
 
     private readonly coreDeclarationCache: WorkspaceCache<string, AstNodeDescription[]>;
+    private readonly documentGlobalScopeCache: DependencyTrackedCache<Scope>;
+
+    /**
+     * Maps the declarations returned by the package manager and an outer scope to a scope that finds declarations by
+     * their name in a hash map. The package manager returns the same array until the declarations of a package change,
+     * so these scopes are shared by all documents that see the same declarations.
+     */
+    private readonly sharedScopes = new WeakMap<AstNodeDescription[], WeakMap<Scope, Scope>>();
 
     constructor(services: SafeDsServices) {
         super(services);
@@ -96,6 +106,7 @@ export class SafeDsScopeProvider extends DefaultScopeProvider {
         this.typeComputer = services.typing.TypeComputer;
 
         this.coreDeclarationCache = new WorkspaceCache(services.shared);
+        this.documentGlobalScopeCache = new DependencyTrackedCache(services, 'visibility');
     }
 
     override getScope(context: ReferenceInfo): Scope {
@@ -433,7 +444,7 @@ export class SafeDsScopeProvider extends DefaultScopeProvider {
     protected override getGlobalScope(referenceType: string, context: ReferenceInfo): Scope {
         const node = context.container;
         const key = `${AstUtils.getDocument(node).uri}~${referenceType}`;
-        return this.globalScopeCache.get(key, () => this.getGlobalScopeForNode(referenceType, node));
+        return this.documentGlobalScopeCache.get(key, () => this.getGlobalScopeForNode(referenceType, node));
     }
 
     private getGlobalScopeForNode(referenceType: string, node: AstNode): Scope {
@@ -441,17 +452,33 @@ export class SafeDsScopeProvider extends DefaultScopeProvider {
 
         // Builtin declarations
         const builtinDeclarations = this.builtinDeclarations(referenceType);
-        let outerScope = this.createScope(builtinDeclarations);
+        let outerScope = this.getSharedScope(builtinDeclarations, EMPTY_SCOPE);
 
         // Declarations in the same package
         const declarationsInSamePackage = this.declarationsInSamePackage(ownPackageName, referenceType);
-        outerScope = this.createScope(declarationsInSamePackage, outerScope);
+        outerScope = this.getSharedScope(declarationsInSamePackage, outerScope);
 
         // Explicitly imported declarations
         const explicitlyImportedDeclarations = this.explicitlyImportedDeclarations(referenceType, node);
         return this.createScope(explicitlyImportedDeclarations, outerScope);
     }
 
+    private getSharedScope(descriptions: AstNodeDescription[], outerScope: Scope): Scope {
+        let scopesByOuterScope = this.sharedScopes.get(descriptions);
+        if (!scopesByOuterScope) {
+            scopesByOuterScope = new WeakMap();
+            this.sharedScopes.set(descriptions, scopesByOuterScope);
+        }
+
+        let result = scopesByOuterScope.get(outerScope);
+        if (!result) {
+            result = createMapScope(descriptions, outerScope);
+            scopesByOuterScope.set(outerScope, result);
+        }
+
+        return result;
+    }
+
     private builtinDeclarations(referenceType: string): AstNodeDescription[] {
         return this.packageManager.getDeclarationsInPackageOrSubpackage('safeds', {
             nodeType: referenceType,
@@ -510,3 +537,18 @@ export class SafeDsScopeProvider extends DefaultScopeProvider {
         return this.createScope(descriptions, outerScope);
     }
 }
+
+/**
+ * Creates a scope that finds elements by their name in a hash map. Like the default scopes, it returns the first
+ * element with a given name.
+ */
+const createMapScope = (descriptions: AstNodeDescription[], outerScope: Scope): Scope => {
+    const firstByName = new Map<string, AstNodeDescription>();
+    for (const description of descriptions) {
+        if (!firstByName.has(description.name)) {
+            firstByName.set(description.name, description);
+        }
+    }
+
+    return new MapScope(firstByName.values(), outerScope);
+};
@@ -1,18 +1,39 @@
-import { AstUtils, CstUtils, EMPTY_STREAM, LangiumDocuments, References, stream, Stream } from 'langium';
+import { AstUtils, DocumentState, EMPTY_STREAM, LangiumDocument, LangiumDocuments, stream, Stream, URI } from 'langium';
 import { SafeDsClasses } from '../builtins/safe-ds-classes.js';
-import { isSdsClass, isSdsNamedType, isSdsParentTypeList, SdsClass, type SdsClassMember } from '../generated/ast.js';
+import { isSdsClass, isSdsNamedType, SdsClass, type SdsClassMember } from '../generated/ast.js';
 import { getClassMembers, getParentTypes, isStatic } from '../helpers/nodeProperties.js';
 import { SafeDsServices } from '../safe-ds-module.js';
+import { DependencyTrackedNodeCache } from '../workspace/safe-ds-document-dependencies.js';
 
 export class SafeDsClassHierarchy {
     private readonly builtinClasses: SafeDsClasses;
     private readonly langiumDocuments: LangiumDocuments;
-    private readonly references: References;
+
+    /**
+     * Maps a class to its proper superclasses. Entries are dropped when a document they depend on changes.
+     */
+    private readonly superclassCache: DependencyTrackedNodeCache<SuperclassChain>;
+
+    /**
+     * Maps a class to its direct subclasses, i.e. the classes whose first parent type refers to it.
+     */
+    private readonly directSubclasses = new Map<SdsClass, Set<SdsClass>>();
+
+    /**
+     * Maps the URI of a document to the pairs of parent class and subclass that were recorded for it, so they can be
+     * removed once the document changes.
+     */
+    private readonly subclassEntriesByDocument = new Map<string, [SdsClass, SdsClass][]>();
 
     constructor(services: SafeDsServices) {
         this.builtinClasses = services.builtins.Classes;
         this.langiumDocuments = services.shared.workspace.LangiumDocuments;
-        this.references = services.references.References;
+
+        this.superclassCache = new DependencyTrackedNodeCache(services);
+
+        const documentBuilder = services.shared.workspace.DocumentBuilder;
+        documentBuilder.onUpdate((changed, deleted) => this.forgetDocuments([...changed, ...deleted]));
+        documentBuilder.onBuildPhase(DocumentState.Linked, (documents) => this.recordSubclasses(documents));
     }
 
     /**
@@ -29,7 +50,7 @@ export class SafeDsClassHierarchy {
             return true;
         }
 
-        return node === other || this.streamProperSuperclasses(node).includes(other);
+        return node === other || this.getSuperclassChain(node).set.has(other);
     }
 
     /**
@@ -42,7 +63,14 @@ export class SafeDsClassHierarchy {
             return EMPTY_STREAM;
         }
 
-        return stream(this.properSuperclassesGenerator(node));
+        return stream(this.getSuperclassChain(node).list);
+    }
+
+    private getSuperclassChain(node: SdsClass): SuperclassChain {
+        return this.superclassCache.get(node, () => {
+            const list = Array.from(this.properSuperclassesGenerator(node));
+            return { list, set: new Set(list) };
+        });
     }
 
     private *properSuperclassesGenerator(node: SdsClass): Generator<SdsClass, void> {
@@ -140,42 +168,69 @@ export class SafeDsClassHierarchy {
             return EMPTY_STREAM;
         }
 
-        return this.references
-            .findReferences(node, {
-                includeDeclaration: false,
-            })
-            .flatMap((it) => {
-                const document = this.langiumDocuments.getDocument(it.sourceUri);
-                if (!document) {
-                    /* c8 ignore next 2 */
-                    return [];
-                }
+        const subclasses = this.directSubclasses.get(node);
+        if (!subclasses) {
+            return EMPTY_STREAM;
+        }
 
-                const rootNode = document.parseResult.value;
-                if (!rootNode.$cstNode) {
-                    /* c8 ignore next 2 */
-                    return [];
-                }
+        // Documents can be removed without a call to `DocumentBuilder.update`
+        return stream(subclasses).filter((it) => this.isCurrent(AstUtils.getDocument(it)));
+    }
 
-                const targetCstNode = CstUtils.findLeafNodeAtOffset(rootNode.$cstNode, it.segment.offset);
-                if (!targetCstNode) {
-                    /* c8 ignore next 2 */
-                    return [];
-                }
+    private isCurrent(document: LangiumDocument): boolean {
+        return this.langiumDocuments.getDocument(document.uri) === document;
+    }
 
-                // Only consider the first parent type
-                const targetNode = targetCstNode.astNode;
-                if (!isSdsParentTypeList(targetNode.$container) || targetNode.$containerIndex !== 0) {
-                    return [];
+    private recordSubclasses(documents: LangiumDocument[]): void {
+        for (const document of documents) {
+            this.forgetDocuments([document.uri]);
+
+            const entries: [SdsClass, SdsClass][] = [];
+            for (const node of AstUtils.streamAst(document.parseResult.value)) {
+                if (!isSdsClass(node)) {
+                    continue;
                 }
 
-                const containingClass = AstUtils.getContainerOfType(targetNode, isSdsClass);
-                if (!containingClass) {
-                    /* c8 ignore next 2 */
-                    return [];
+                const parent = this.parentClass(node);
+                if (parent) {
+                    entries.push([parent, node]);
+                    this.getOrCreateSubclasses(parent).add(node);
                 }
+            }
 
-                return [containingClass];
-            });
+            this.subclassEntriesByDocument.set(document.uri.toString(), entries);
+        }
     }
+
+    private getOrCreateSubclasses(node: SdsClass): Set<SdsClass> {
+        let result = this.directSubclasses.get(node);
+        if (!result) {
+            result = new Set();
+            this.directSubclasses.set(node, result);
+        }
+
+        return result;
+    }
+
+    private forgetDocuments(uris: URI[]): void {
+        for (const uri of uris) {
+            const key = uri.toString();
+            for (const [parent, child] of this.subclassEntriesByDocument.get(key) ?? []) {
+                const subclasses = this.directSubclasses.get(parent);
+                subclasses?.delete(child);
+                if (subclasses?.size === 0) {
+                    this.directSubclasses.delete(parent);
+                }
+            }
+            this.subclassEntriesByDocument.delete(key);
+        }
+    }
+}
+
+/**
+ * The proper superclasses of a class, in order and as a set for fast lookups.
+ */
+interface SuperclassChain {
+    readonly list: SdsClass[];
+    readonly set: Set<SdsClass>;
 }
@@ -19,20 +19,30 @@ import {
 import { SafeDsClassHierarchy } from './safe-ds-class-hierarchy.js';
 import { SafeDsCoreTypes } from './safe-ds-core-types.js';
 import type { SafeDsTypeComputer } from './safe-ds-type-computer.js';
+import { SafeDsTypeFactory } from './safe-ds-type-factory.js';
 import { isEmpty } from '../../helpers/collections.js';
-import { AstUtils } from 'langium';
+import { AstUtils, WorkspaceCache } from 'langium';
 
 export class SafeDsTypeChecker {
     private readonly builtinClasses: SafeDsClasses;
     private readonly classHierarchy: SafeDsClassHierarchy;
     private readonly coreTypes: SafeDsCoreTypes;
+    private readonly factory: SafeDsTypeFactory;
     private readonly typeComputer: () => SafeDsTypeComputer;
 
+    /**
+     * Maps the identities of a type, a potential supertype, and the options to the result of {@link isSubtypeOf}.
+     */
+    private readonly subtypeCache: WorkspaceCache<string, boolean>;
+
     constructor(services: SafeDsServices) {
         this.builtinClasses = services.builtins.Classes;
         this.classHierarchy = services.typing.ClassHierarchy;
         this.coreTypes = services.typing.CoreTypes;
+        this.factory = services.typing.TypeFactory;
         this.typeComputer = () => services.typing.TypeComputer;
+
+        this.subtypeCache = new WorkspaceCache(services.shared);
     }
 
     // -----------------------------------------------------------------------------------------------------------------
@@ -50,6 +60,12 @@ export class SafeDsTypeChecker {
      * Checks whether {@link type} is a subtype of {@link other}.
      */
     isSubtypeOf = (type: Type, other: Type, options: TypeCheckOptions = {}): boolean => {
+        const { ignoreTypeParameters = false, ignoreParameterNames = false } = options;
+        const key = [this.factory.getId(type), this.factory.getId(other), ignoreTypeParameters, ignoreParameterNames];
+        return this.subtypeCache.get(key.join('~'), () => this.doIsSubtypeOf(type, other, options));
+    };
+
+    private doIsSubtypeOf(type: Type, other: Type, options: TypeCheckOptions): boolean {
         // Handle base cases
         if (type.equals(this.coreTypes.Nothing) || other.equals(this.coreTypes.AnyOrNull)) {
             return true;
@@ -100,7 +116,7 @@ export class SafeDsTypeChecker {
         } /* c8 ignore start */ else {
             throw new Error(`Unexpected type: ${type.constructor.name}`);
         } /* c8 ignore stop */
-    };
+    }
 
     private typeVariableIsBoundedByTypeVariable(type: TypeVariable, other: TypeVariable): boolean {
         let current: Type = type;
@@ -1,4 +1,5 @@
-import { AstNode, AstNodeLocator, AstUtils, EMPTY_STREAM, Stream, stream, WorkspaceCache } from 'langium';
+import { AstNode, AstUtils, EMPTY_STREAM, Stream, stream } from 'langium';
+import { DependencyTrackedNodeCache } from '../workspace/safe-ds-document-dependencies.js';
 import { isEmpty } from '../../helpers/collections.js';
 import {
     isSdsAnnotation,
@@ -116,7 +117,6 @@ import { SafeDsClasses } from '../builtins/safe-ds-classes.js';
 import { SafeDsTypeFactory } from './safe-ds-type-factory.js';
 
 export class SafeDsTypeComputer {
-    private readonly astNodeLocator: AstNodeLocator;
     private readonly coreClasses: SafeDsClasses;
     private readonly coreTypes: SafeDsCoreTypes;
     private readonly factory: SafeDsTypeFactory;
@@ -130,10 +130,9 @@ export class SafeDsTypeComputer {
      * of a lambda in turn depends on the substitutions of the call it is passed to.
      */
     private readonly incompleteCalls = new Set<SdsAbstractCall>();
-    private readonly nodeTypeCache: WorkspaceCache<string, Type>;
+    private readonly nodeTypeCache: DependencyTrackedNodeCache<Type>;
 
     constructor(services: SafeDsServices) {
-        this.astNodeLocator = services.workspace.AstNodeLocator;
         this.coreClasses = services.builtins.Classes;
         this.coreTypes = services.typing.CoreTypes;
         this.factory = services.typing.TypeFactory;
@@ -141,7 +140,7 @@ export class SafeDsTypeComputer {
         this.partialEvaluator = services.evaluation.PartialEvaluator;
         this.typeChecker = services.typing.TypeChecker;
 
-        this.nodeTypeCache = new WorkspaceCache(services.shared);
+        this.nodeTypeCache = new DependencyTrackedNodeCache(services);
     }
 
     // -----------------------------------------------------------------------------------------------------------------
@@ -157,15 +156,13 @@ export class SafeDsTypeComputer {
             return UnknownType;
         }
 
-        const id = this.getNodeId(node);
-
         // Only cache fully substituted types
-        let unsubstitutedType: Type | undefined = this.nodeTypeCache.get(id);
+        let unsubstitutedType: Type | undefined = this.nodeTypeCache.get(node);
         if (!unsubstitutedType) {
-            unsubstitutedType = this.doComputeType(node).simplify();
+            unsubstitutedType = this.factory.simplify(this.doComputeType(node));
 
             if (unsubstitutedType.isFullySubstituted) {
-                this.nodeTypeCache.set(id, unsubstitutedType);
+                this.nodeTypeCache.set(node, unsubstitutedType);
             }
         }
 
@@ -174,16 +171,7 @@ export class SafeDsTypeComputer {
         }
 
         // Substitute type parameters
-        const simplifiedSubstitutions = new Map(
-            [...substitutions].map(([typeParameter, type]) => [typeParameter, type.simplify()]),
-        );
-        return unsubstitutedType.substituteTypeParameters(simplifiedSubstitutions);
-    }
-
-    private getNodeId(node: AstNode) {
-        const documentUri = AstUtils.getDocument(node).uri.toString();
-        const nodePath = this.astNodeLocator.getAstNodePath(node);
-        return `${documentUri}~${nodePath}`;
+        return this.factory.substituteTypeParameters(unsubstitutedType, substitutions);
     }
 
     private doComputeType(node: AstNode | undefined): Type {
@@ -722,7 +710,7 @@ export class SafeDsTypeComputer {
      * Returns the non-nullable type for the given type. The result is simplified as much as possible.
      */
     computeNonNullableType(type: Type): Type {
-        return type.withExplicitNullability(false).simplify();
+        return this.factory.simplify(type.withExplicitNullability(false));
     }
 
     /**
@@ -1182,7 +1170,7 @@ export class SafeDsTypeComputer {
             return types;
         }
 
-        const simplifiedType = this.factory.createUnionType(...types).simplify();
+        const simplifiedType = this.factory.simplify(this.factory.createUnionType(...types));
 
         if (simplifiedType instanceof UnionType) {
             return simplifiedType.types;
@@ -1489,17 +1477,20 @@ export class SafeDsTypeComputer {
         for (const type of others) {
             const matchingSubtype = this.computeMatchingSubtype(type, targetTemplate)!;
 
-            // Apply substitutions of the candidate, if type parameter types are still free
+            // Apply substitutions of the candidate, if type parameter types are still free. Types are shared, so we
+            // must create a new one instead of modifying the substitutions of the matching subtype.
+            const substitutions = new Map(matchingSubtype.substitutions);
             for (const typeParameter of getTypeParameters(candidate.declaration)) {
-                if (!matchingSubtype.substitutions.has(typeParameter)) {
+                if (!substitutions.has(typeParameter)) {
                     const substitution = candidate.substitutions.get(typeParameter);
                     if (substitution) {
-                        matchingSubtype.substitutions.set(typeParameter, substitution);
+                        substitutions.set(typeParameter, substitution);
                     }
                 }
             }
 
-            result.push(matchingSubtype);
+            const { declaration, isExplicitlyNullable } = matchingSubtype;
+            result.push(this.factory.createClassType(declaration, substitutions, isExplicitlyNullable));
         }
 
         return result;
@@ -1,3 +1,4 @@
+import { WorkspaceCache } from 'langium';
 import { SafeDsServices } from '../safe-ds-module.js';
 import {
     CallableType,
@@ -26,8 +27,27 @@ import {
     SdsTypeParameter,
 } from '../generated/ast.js';
 
+/**
+ * Creates types. Structurally equal types that are created by this factory are interned, i.e. they are the same
+ * instance. Types must therefore not be modified after their creation.
+ */
 export class SafeDsTypeFactory {
-    constructor(private readonly services: SafeDsServices) {}
+    /**
+     * Assigns numbers to types and declarations, so they can be part of the keys of the caches below. Types that are
+     * created without this factory get their own number, so they are only considered equal to themselves.
+     */
+    private readonly ids = new WeakMap<object, number>();
+    private nextId = 0;
+
+    private readonly internedTypes: WorkspaceCache<string, Type>;
+    private readonly simplifiedTypes: WorkspaceCache<Type, Type>;
+    private readonly substitutedTypes: WorkspaceCache<string, Type>;
+
+    constructor(private readonly services: SafeDsServices) {
+        this.internedTypes = new WorkspaceCache(services.shared);
+        this.simplifiedTypes = new WorkspaceCache(services.shared);
+        this.substitutedTypes = new WorkspaceCache(services.shared);
+    }
 
     createCallableType(
         callable: SdsCallable,
@@ -35,7 +55,14 @@ export class SafeDsTypeFactory {
         inputType: NamedTupleType<SdsParameter>,
         outputType: NamedTupleType<SdsAbstractResult>,
     ): CallableType {
-        return new CallableType(this.services, callable, parameter, inputType, outputType);
+        const key = [
+            'Callable',
+            this.getId(callable),
+            this.getOptionalId(parameter),
+            this.getId(inputType),
+            this.getId(outputType),
+        ].join('~');
+        return this.intern(key, () => new CallableType(this.services, callable, parameter, inputType, outputType));
     }
 
     createClassType(
@@ -43,34 +70,94 @@ export class SafeDsTypeFactory {
         substitutions: TypeParameterSubstitutions,
         isExplicitlyNullable: boolean,
     ): ClassType {
-        return new ClassType(declaration, substitutions, isExplicitlyNullable);
+        const substitutionsKey = this.getSubstitutionsKey(substitutions);
+        const key = `Class~${this.getId(declaration)}~${substitutionsKey}~${isExplicitlyNullable}`;
+
+        // Copy the substitutions, so later changes of the given map don't affect the shared instance
+        return this.intern(key, () => new ClassType(declaration, new Map(substitutions), isExplicitlyNullable));
     }
 
     createEnumType(declaration: SdsEnum, isExplicitlyNullable: boolean): EnumType {
-        return new EnumType(declaration, isExplicitlyNullable);
+        const key = `Enum~${this.getId(declaration)}~${isExplicitlyNullable}`;
+        return this.intern(key, () => new EnumType(declaration, isExplicitlyNullable));
     }
 
     createEnumVariantType(declaration: SdsEnumVariant, isExplicitlyNullable: boolean): EnumVariantType {
-        return new EnumVariantType(declaration, isExplicitlyNullable);
+        const key = `EnumVariant~${this.getId(declaration)}~${isExplicitlyNullable}`;
+        return this.intern(key, () => new EnumVariantType(declaration, isExplicitlyNullable));
     }
 
     createLiteralType(...constants: Constant[]): LiteralType {
-        return new LiteralType(this.services, constants);
+        // The string representations of constants are unique, see `LiteralType.simplify`
+        const key = `Literal~${JSON.stringify(constants.map((it) => it.toString()))}`;
+        return this.intern(key, () => new LiteralType(this.services, constants));
     }
 
     createNamedTupleType<T extends SdsDeclaration>(...entries: NamedTupleEntry<T>[]): NamedTupleType<T> {
-        return new NamedTupleType(this.services, entries);
+        const key = `NamedTuple~${JSON.stringify(
+            entries.map((it) => [this.getOptionalId(it.declaration), it.name, this.getId(it.type)]),
+        )}`;
+        return this.intern(key, () => new NamedTupleType(this.services, entries));
     }
 
     createStaticType(instanceType: NamedType<SdsDeclaration>): StaticType {
-        return new StaticType(this.services, instanceType);
+        const key = `Static~${this.getId(instanceType)}`;
+        return this.intern(key, () => new StaticType(this.services, instanceType));
     }
 
     createTypeVariable(declaration: SdsTypeParameter, isExplicitlyNullable: boolean): TypeVariable {
-        return new TypeVariable(declaration, isExplicitlyNullable);
+        const key = `TypeVariable~${this.getId(declaration)}~${isExplicitlyNullable}`;
+        return this.intern(key, () => new TypeVariable(declaration, isExplicitlyNullable));
     }
 
     createUnionType(...types: Type[]): UnionType {
-        return new UnionType(this.services, types);
+        const key = `Union~${types.map((it) => this.getId(it)).join(',')}`;
+        return this.intern(key, () => new UnionType(this.services, types));
+    }
+
+    /**
+     * Returns the result of {@link Type.simplify} for the given type. Results are cached until the workspace changes.
+     */
+    simplify(type: Type): Type {
+        return this.simplifiedTypes.get(type, () => type.simplify());
+    }
+
+    /**
+     * Simplifies the given substitutions and returns the result of {@link Type.substituteTypeParameters} for the given
+     * type. Results are cached until the workspace changes.
+     */
+    substituteTypeParameters(type: Type, substitutions: TypeParameterSubstitutions): Type {
+        const simplifiedSubstitutions: TypeParameterSubstitutions = new Map(
+            [...substitutions].map(([typeParameter, value]) => [typeParameter, this.simplify(value)]),
+        );
+
+        const key = `${this.getId(type)}~${this.getSubstitutionsKey(simplifiedSubstitutions)}`;
+        return this.substitutedTypes.get(key, () => type.substituteTypeParameters(simplifiedSubstitutions));
+    }
+
+    /**
+     * Returns a number that identifies the given type or declaration. Since types are interned, structurally equal
+     * types that are created by this factory get the same number.
+     */
+    getId(value: Type | SdsDeclaration): number {
+        let result = this.ids.get(value);
+        if (result === undefined) {
+            result = this.nextId++;
+            this.ids.set(value, result);
+        }
+
+        return result;
+    }
+
+    private getOptionalId(value: SdsDeclaration | undefined): string {
+        return value ? String(this.getId(value)) : '';
+    }
+
+    private getSubstitutionsKey(substitutions: TypeParameterSubstitutions): string {
+        return Array.from(substitutions, ([key, value]) => `${this.getId(key)}=${this.getId(value)}`).join(',');
+    }
+
+    private intern<T extends Type>(key: string, provider: () => T): T {
+        return this.internedTypes.get(key, provider) as T;
     }
 }
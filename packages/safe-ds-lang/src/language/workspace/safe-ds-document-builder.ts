@@ -0,0 +1,161 @@
+import {
+    BuildOptions,
+    CancellationToken,
+    DefaultDocumentBuilder,
+    DocumentState,
+    LangiumDocument,
+    URI,
+    WorkspaceLock,
+} from 'langium';
+import { listBuiltinFiles } from '../builtins/fileFinder.js';
+import type { SafeDsMessagingProvider } from '../communication/safe-ds-messaging-provider.js';
+import type { SafeDsSharedServices } from '../safe-ds-module.js';
+
+/**
+ * Builds documents in the order of their importance to the user. Open documents are built and validated first,
+ * followed by the other documents of the workspace and finally the builtin files.
+ *
+ * When documents change while others are open, only the open documents are validated right away. The remaining
+ * documents are validated in the background once no further changes arrive for a while. Since this runs under the
+ * workspace lock, the next change cancels it. Until then, the editor keeps showing the previous diagnostics of these
+ * documents, so errors in the workspace do not disappear while the user is typing.
+ */
+export class SafeDsDocumentBuilder extends DefaultDocumentBuilder {
+    private readonly builtinUris = new Set(listBuiltinFiles().map((it) => it.toString()));
+    private readonly messagingProvider: () => SafeDsMessagingProvider;
+    private readonly openUris: () => Set<string>;
+    private readonly workspaceLock: WorkspaceLock;
+
+    /**
+     * The URIs of the open documents while documents are updated. Validation of all other documents is deferred.
+     */
+    private openUrisDuringUpdate: Set<string> | undefined = undefined;
+
+    /**
+     * The URIs of documents whose validation was deferred and that must be validated in the background.
+     */
+    private readonly deferredUris = new Set<string>();
+    private backgroundValidationTimeout: ReturnType<typeof setTimeout> | undefined = undefined;
+
+    constructor(services: SafeDsSharedServices) {
+        super(services);
+
+        this.messagingProvider = () => services.ServiceRegistry.getSafeDsServices().communication.MessagingProvider;
+        this.openUris = () => new Set(services.workspace.TextDocuments.all().map((it) => it.uri));
+        this.workspaceLock = services.workspace.WorkspaceLock;
+    }
+
+    override async update(changed: URI[], deleted: URI[], cancelToken = CancellationToken.None): Promise<void> {
+        const openUris = this.openUris();
+        this.openUrisDuringUpdate = openUris.size > 0 ? openUris : undefined;
+
+        try {
+            await super.update(changed, deleted, cancelToken);
+        } finally {
+            this.openUrisDuringUpdate = undefined;
+        }
+
+        this.scheduleBackgroundValidation();
+    }
+
+    protected override async buildDocuments(
+        documents: LangiumDocument[],
+        options: BuildOptions,
+        cancelToken: CancellationToken,
+    ): Promise<void> {
+        await super.buildDocuments(this.prioritize(documents), options, cancelToken);
+    }
+
+    protected override shouldValidate(document: LangiumDocument): boolean {
+        // Documents that were created from a serialized AST, like builtin files from the snapshot, have no concrete
+        // syntax tree to report diagnostics on
+        if (!document.parseResult.value.$cstNode || !super.shouldValidate(document)) {
+            return false;
+        }
+
+        const uri = document.uri.toString();
+        if (this.openUrisDuringUpdate && !this.openUrisDuringUpdate.has(uri)) {
+            this.deferredUris.add(uri);
+            return false;
+        }
+
+        this.deferredUris.delete(uri);
+        return true;
+    }
+
+    /**
+     * Sorts the given documents, so open documents come first and builtin files last. The order of documents with the
+     * same priority is kept.
+     */
+    private prioritize(documents: LangiumDocument[]): LangiumDocument[] {
+        const openUris = this.openUrisDuringUpdate ?? this.openUris();
+        const priority = (document: LangiumDocument): number => {
+            const uri = document.uri.toString();
+            if (openUris.has(uri)) {
+                return 0;
+            } else if (this.builtinUris.has(uri)) {
+                return 2;
+            } else {
+                return 1;
+            }
+        };
+
+        return documents
+            .map((document, index) => ({ document, index, priority: priority(document) }))
+            .sort((a, b) => a.priority - b.priority || a.index - b.index)
+            .map((it) => it.document);
+    }
+
+    private scheduleBackgroundValidation(): void {
+        clearTimeout(this.backgroundValidationTimeout);
+        if (this.deferredUris.size === 0) {
+            return;
+        }
+
+        this.backgroundValidationTimeout = setTimeout(() => {
+            this.backgroundValidationTimeout = undefined;
+            void this.workspaceLock.write((token) => this.validateInBackground(token));
+        }, BACKGROUND_VALIDATION_DELAY);
+    }
+
+    private async validateInBackground(cancelToken: CancellationToken): Promise<void> {
+        const documents = Array.from(this.deferredUris).flatMap((uri) => {
+            const document = this.langiumDocuments.getDocument(URI.parse(uri));
+            if (!document || document.state >= DocumentState.Validated) {
+                this.deferredUris.delete(uri);
+                return [];
+            }
+
+            return [document];
+        });
+        if (documents.length === 0) {
+            return;
+        }
+
+        const progress = await this.messagingProvider().showProgress('Safe-DS', 'Validating documents...');
+        try {
+            for (let start = 0; start < documents.length; start += BACKGROUND_VALIDATION_CHUNK_SIZE) {
+                const chunk = documents.slice(start, start + BACKGROUND_VALIDATION_CHUNK_SIZE);
+                await this.buildDocuments(chunk, this.updateBuildOptions, cancelToken);
+
+                const validatedCount = Math.min(start + chunk.length, documents.length);
+                progress.report(
+                    Math.round((validatedCount / documents.length) * 100),
+                    `Validated ${validatedCount} of ${documents.length} documents.`,
+                );
+            }
+        } finally {
+            progress.done();
+        }
+    }
+}
+
+/**
+ * How long to wait after the last change before documents that are not open get validated, in milliseconds.
+ */
+const BACKGROUND_VALIDATION_DELAY = 500;
+
+/**
+ * How many documents to validate in the background before progress is reported.
+ */
+const BACKGROUND_VALIDATION_CHUNK_SIZE = 10;
@@ -0,0 +1,437 @@
+import { SafeDsServices } from '../safe-ds-module.js';
+import { AstNode, AstUtils, Disposable, DocumentState, LangiumDocument, LangiumDocuments, URI } from 'langium';
+import { isSdsModule } from '../generated/ast.js';
+import { getImports, getPackageName } from '../helpers/nodeProperties.js';
+import { BUILTINS_ROOT_PACKAGE } from '../builtins/packageNames.js';
+import { NodeId, SafeDsNodeIdentities } from './safe-ds-node-identities.js';
+
+/**
+ * Keeps track of the dependencies between documents, so caches only have to drop the entries of documents that are
+ * affected by a change.
+ *
+ * There are two kinds of dependencies:
+ * - `references`: A document depends on all documents that contain declarations it references, directly or
+ *   indirectly. Values that are computed for its nodes, like types, may depend on these declarations.
+ * - `visibility`: A document depends on all documents in its own package and in the packages it imports. Their
+ *   declarations are part of its global scope.
+ */
+export class SafeDsDocumentDependencies {
+    private readonly langiumDocuments: LangiumDocuments;
+
+    /**
+     * Maps the URI of a document to the URIs of the documents it references directly.
+     */
+    private readonly referencedDocuments = new Map<string, Set<string>>();
+
+    /**
+     * Maps the URI of a document to the URIs of the documents that reference it directly.
+     */
+    private readonly referencingDocuments = new Map<string, Set<string>>();
+
+    /**
+     * Maps the URI of a document to the name of its package.
+     */
+    private readonly packageNames = new Map<string, string>();
+
+    /**
+     * Maps the URI of a document to the names of the packages whose declarations it can access without qualification.
+     */
+    private readonly visiblePackageNames = new Map<string, Set<string>>();
+
+    /**
+     * Maps the URI of a document to the root node it had when it was last indexed. This lets us detect documents that
+     * were replaced without a call to `DocumentBuilder.update`.
+     */
+    private readonly roots = new Map<string, AstNode>();
+
+    private readonly listeners = new Set<(invalidation: DocumentInvalidation) => void>();
+
+    constructor(services: SafeDsServices) {
+        this.langiumDocuments = services.shared.workspace.LangiumDocuments;
+
+        const documentBuilder = services.shared.workspace.DocumentBuilder;
+        documentBuilder.onUpdate((changed, deleted) => this.handleUpdate(changed, deleted));
+        documentBuilder.onBuildPhase(DocumentState.IndexedContent, (documents) => this.recordPackages(documents));
+        documentBuilder.onBuildPhase(DocumentState.Linked, (documents) => this.recordReferences(documents));
+    }
+
+    /**
+     * Register a callback that is called whenever documents are invalidated.
+     */
+    onInvalidate(callback: (invalidation: DocumentInvalidation) => void): Disposable {
+        this.listeners.add(callback);
+        return Disposable.create(() => {
+            /* c8 ignore next */
+            this.listeners.delete(callback);
+        });
+    }
+
+    /**
+     * Returns the URIs of the given documents and all documents that depend on them. The value `all` means that all
+     * documents depend on them.
+     */
+    getDependentDocuments(uris: Iterable<string>, kind: DependencyKind): Set<string> | 'all' {
+        const seeds = new Set(uris);
+        if (kind === 'references') {
+            return this.getReferencingDocuments(seeds);
+        } else {
+            return this.getDocumentsWithVisiblePackages(seeds, this.getPackagesOfDocuments(seeds));
+        }
+    }
+
+    /**
+     * Returns the URIs of all documents that the given ones reference, directly or indirectly. The given documents are
+     * only included if they are referenced by one of the others.
+     */
+    getReferencedDocuments(uris: Iterable<string>): Set<string> {
+        const result = new Set<string>();
+        const queue = Array.from(uris);
+
+        while (queue.length > 0) {
+            const current = queue.pop()!;
+            for (const referencedUri of this.referencedDocuments.get(current) ?? []) {
+                if (!result.has(referencedUri)) {
+                    result.add(referencedUri);
+                    queue.push(referencedUri);
+                }
+            }
+        }
+
+        return result;
+    }
+
+    /**
+     * Returns the URIs of the given documents and all documents whose declarations are visible in them without
+     * qualification, i.e. the documents in their own packages and in the packages they import. Builtin files are only
+     * included if one of the given documents is in a builtin package or imports one explicitly.
+     */
+    getDocumentsInVisiblePackages(uris: Iterable<string>): Set<string> {
+        const result = new Set(uris);
+
+        const packageNames = new Set<string>();
+        for (const uri of result) {
+            this.visiblePackageNames.get(uri)?.forEach((it) => packageNames.add(it));
+        }
+
+        for (const [uri, packageName] of this.packageNames) {
+            if (packageNames.has(packageName)) {
+                result.add(uri);
+            }
+        }
+
+        return result;
+    }
+
+    private handleUpdate(changed: URI[], deleted: URI[]): void {
+        const changedOrDeleted = new Set([...changed, ...deleted].map((it) => it.toString()));
+
+        // Langium also relinks documents that are affected by the change or had linking errors. Their declarations stay
+        // the same, so they do not affect the global scope of other documents.
+        const relinked = new Set(changedOrDeleted);
+        for (const document of this.langiumDocuments.all) {
+            const uri = document.uri.toString();
+            if (document.state < DocumentState.Linked && this.referencedDocuments.has(uri)) {
+                relinked.add(uri);
+            }
+        }
+
+        this.invalidate(relinked, changedOrDeleted, this.getPackagesOfDocuments(changedOrDeleted));
+
+        for (const uri of changed) {
+            // We already handled the change, so the new root should not count as a replacement
+            this.roots.delete(uri.toString());
+        }
+        for (const uri of deleted) {
+            this.forgetDocument(uri.toString());
+        }
+    }
+
+    private recordPackages(documents: LangiumDocument[]): void {
+        const replacedDocuments = new Set<string>();
+        const newPackageNames = new Set<string>();
+
+        for (const document of documents) {
+            const uri = document.uri.toString();
+            const root = document.parseResult.value;
+
+            // The document was replaced without an update, so we did not get to invalidate it before
+            const oldRoot = this.roots.get(uri);
+            if (oldRoot && oldRoot !== root) {
+                replacedDocuments.add(uri);
+            }
+            this.roots.set(uri, root);
+
+            if (!isSdsModule(root)) {
+                /* c8 ignore next 2 */
+                continue;
+            }
+
+            // New declarations might now be visible in other documents
+            const packageName = getPackageName(root) ?? '';
+            if (this.packageNames.get(uri) !== packageName || replacedDocuments.has(uri)) {
+                newPackageNames.add(packageName);
+            }
+            this.packageNames.set(uri, packageName);
+
+            const visiblePackageNames = new Set(getImports(root).map((it) => it.package));
+            visiblePackageNames.add(packageName);
+            this.visiblePackageNames.set(uri, visiblePackageNames);
+        }
+
+        if (replacedDocuments.size > 0 || newPackageNames.size > 0) {
+            this.invalidate(replacedDocuments, replacedDocuments, newPackageNames);
+        }
+    }
+
+    private recordReferences(documents: LangiumDocument[]): void {
+        for (const document of documents) {
+            const uri = document.uri.toString();
+            this.removeReferences(uri);
+
+            const referencedDocuments = new Set<string>();
+            for (const reference of document.references) {
+                const targetUri = reference.$nodeDescription?.documentUri?.toString();
+                if (targetUri && targetUri !== uri) {
+                    referencedDocuments.add(targetUri);
+                }
+            }
+
+            this.referencedDocuments.set(uri, referencedDocuments);
+            for (const targetUri of referencedDocuments) {
+                if (!this.referencingDocuments.has(targetUri)) {
+                    this.referencingDocuments.set(targetUri, new Set());
+                }
+                this.referencingDocuments.get(targetUri)!.add(uri);
+            }
+        }
+    }
+
+    private invalidate(referenceSeeds: Set<string>, visibilitySeeds: Set<string>, packageNames: Set<string>): void {
+        if (this.listeners.size === 0) {
+            /* c8 ignore next 2 */
+            return;
+        }
+
+        const invalidation: DocumentInvalidation = {
+            references: this.getReferencingDocuments(referenceSeeds),
+            visibility: this.getDocumentsWithVisiblePackages(visibilitySeeds, packageNames),
+        };
+        this.listeners.forEach((listener) => listener(invalidation));
+    }
+
+    private getReferencingDocuments(uris: Iterable<string>): Set<string> {
+        const result = new Set(uris);
+        const queue = Array.from(result);
+
+        while (queue.length > 0) {
+            const current = queue.pop()!;
+            for (const referencingUri of this.referencingDocuments.get(current) ?? []) {
+                if (!result.has(referencingUri)) {
+                    result.add(referencingUri);
+                    queue.push(referencingUri);
+                }
+            }
+        }
+
+        return result;
+    }
+
+    private getDocumentsWithVisiblePackages(uris: Iterable<string>, packageNames: Set<string>): Set<string> | 'all' {
+        // Builtin declarations are visible everywhere
+        if (Array.from(packageNames).some((it) => it === BUILTINS_ROOT_PACKAGE || it.startsWith('safeds.'))) {
+            return 'all';
+        }
+
+        const result = new Set(uris);
+        if (packageNames.size === 0) {
+            return result;
+        }
+
+        for (const [uri, visiblePackageNames] of this.visiblePackageNames) {
+            if (Array.from(visiblePackageNames).some((it) => packageNames.has(it))) {
+                result.add(uri);
+            }
+        }
+
+        return result;
+    }
+
+    private getPackagesOfDocuments(uris: Iterable<string>): Set<string> {
+        const result = new Set<string>();
+        for (const uri of uris) {
+            const packageName = this.packageNames.get(uri);
+            if (packageName !== undefined) {
+                result.add(packageName);
+            }
+        }
+        return result;
+    }
+
+    private forgetDocument(uri: string): void {
+        this.removeReferences(uri);
+        this.packageNames.delete(uri);
+        this.visiblePackageNames.delete(uri);
+        this.roots.delete(uri);
+    }
+
+    private removeReferences(uri: string): void {
+        for (const targetUri of this.referencedDocuments.get(uri) ?? []) {
+            this.referencingDocuments.get(targetUri)?.delete(uri);
+        }
+        this.referencedDocuments.delete(uri);
+    }
+}
+
+/**
+ * The kind of dependency between documents (see {@link SafeDsDocumentDependencies}).
+ */
+export type DependencyKind = 'references' | 'visibility';
+
+/**
+ * The URIs of documents whose cached values must be dropped, grouped by the kind of dependency. The value `all` means
+ * that all documents are affected.
+ */
+export type DocumentInvalidation = Record<DependencyKind, Set<string> | 'all'>;
+
+/**
+ * A cache for values that are computed for a document. Keys must start with the URI of the document, followed by `~`.
+ * If a document changes, only the entries of this document and the documents that depend on it are removed.
+ */
+export class DependencyTrackedCache<V> {
+    private readonly entries = new Map<string, Map<string, V>>();
+
+    constructor(services: SafeDsServices, kind: DependencyKind = 'references') {
+        services.workspace.DocumentDependencies.onInvalidate((invalidation) => {
+            const uris = invalidation[kind];
+            if (uris === 'all') {
+                this.entries.clear();
+            } else {
+                uris.forEach((uri) => this.entries.delete(uri));
+            }
+        });
+    }
+
+    has(key: string): boolean {
+        return this.entries.get(getDocumentUri(key))?.has(key) ?? false;
+    }
+
+    get(key: string): V | undefined;
+    get(key: string, provider: () => V): V;
+    get(key: string, provider?: () => V): V | undefined {
+        const documentEntries = this.entries.get(getDocumentUri(key));
+        if (documentEntries?.has(key)) {
+            return documentEntries.get(key);
+        } else if (provider) {
+            const value = provider();
+            this.set(key, value);
+            return value;
+        } else {
+            return undefined;
+        }
+    }
+
+    set(key: string, value: V): void {
+        const uri = getDocumentUri(key);
+        if (!this.entries.has(uri)) {
+            this.entries.set(uri, new Map());
+        }
+        this.entries.get(uri)!.set(key, value);
+    }
+
+    clear(): void {
+        this.entries.clear();
+    }
+}
+
+/**
+ * A cache for values that are computed for AST nodes. Entries are keyed by the identity of the node (see
+ * {@link SafeDsNodeIdentities}), so a lookup does not have to compute the path of the node. If a document changes, only
+ * the entries of this document and the documents that depend on it are removed.
+ */
+export class DependencyTrackedNodeCache<V> {
+    private readonly nodeIdentities: SafeDsNodeIdentities;
+    private readonly entries = new Map<NodeId, V>();
+
+    /**
+     * Maps the URI of a document to the IDs of the nodes whose entries must be dropped if the document changes. These
+     * are the nodes of the document and nodes whose entries depend on the document (see {@link addDependencies}).
+     */
+    private readonly idsByDocument = new Map<string, Set<NodeId>>();
+
+    constructor(services: SafeDsServices, kind: DependencyKind = 'references') {
+        this.nodeIdentities = services.workspace.NodeIdentities;
+
+        services.workspace.DocumentDependencies.onInvalidate((invalidation) => {
+            const uris = invalidation[kind];
+            if (uris === 'all') {
+                this.clear();
+            } else {
+                uris.forEach((uri) => {
+                    this.idsByDocument.get(uri)?.forEach((id) => this.entries.delete(id));
+                    this.idsByDocument.delete(uri);
+                });
+            }
+        });
+    }
+
+    has(node: AstNode): boolean {
+        return this.entries.has(this.nodeIdentities.getIdentity(node).id);
+    }
+
+    get(node: AstNode): V | undefined;
+    get(node: AstNode, provider: () => V): V;
+    get(node: AstNode, provider?: () => V): V | undefined {
+        const id = this.nodeIdentities.getIdentity(node).id;
+        if (this.entries.has(id)) {
+            return this.entries.get(id);
+        } else if (provider) {
+            const value = provider();
+            this.set(node, value);
+            return value;
+        } else {
+            return undefined;
+        }
+    }
+
+    set(node: AstNode, value: V): void {
+        const { id, documentUri } = this.nodeIdentities.getIdentity(node);
+        this.addId(documentUri, id);
+        this.entries.set(id, value);
+    }
+
+    /**
+     * Also drops the entry of the node if a document that contains one of the given nodes changes. This is needed if
+     * the value depends on nodes that the node itself does not reference, e.g. on the values of parameters that are
+     * passed by a caller. Otherwise, the entry would keep the old nodes alive once the document changes.
+     */
+    addDependencies(node: AstNode, dependencies: Iterable<AstNode>): void {
+        const { id, documentUri } = this.nodeIdentities.getIdentity(node);
+        if (!this.entries.has(id)) {
+            return;
+        }
+
+        for (const dependency of dependencies) {
+            const dependencyUri = AstUtils.findRootNode(dependency).$document?.uri.toString();
+            if (dependencyUri && dependencyUri !== documentUri) {
+                this.addId(dependencyUri, id);
+            }
+        }
+    }
+
+    clear(): void {
+        this.entries.clear();
+        this.idsByDocument.clear();
+    }
+
+    private addId(documentUri: string, id: NodeId): void {
+        if (!this.idsByDocument.has(documentUri)) {
+            this.idsByDocument.set(documentUri, new Set());
+        }
+        this.idsByDocument.get(documentUri)!.add(id);
+    }
+}
+
+const getDocumentUri = (key: string): string => {
+    const separatorIndex = key.lastIndexOf('~');
+    return separatorIndex === -1 ? key : key.substring(0, separatorIndex);
+};
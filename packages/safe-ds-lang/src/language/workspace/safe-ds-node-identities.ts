@@ -0,0 +1,45 @@
+import { AstNode, AstUtils } from 'langium';
+
+/**
+ * Assigns compact identities to AST nodes, so caches can use them as keys instead of strings that are built from the
+ * URI of the document and the path of the node. Identities are stored in a weak map, so they are computed only once
+ * per node and are dropped together with it. Since a document gets new nodes whenever it is parsed again, an identity
+ * is only valid for one version of a document.
+ */
+export class SafeDsNodeIdentities {
+    private readonly identities = new WeakMap<AstNode, NodeIdentity>();
+    private nextId: NodeId = 0;
+
+    /**
+     * Returns the identity of the given node. The node must be part of a document.
+     */
+    getIdentity(node: AstNode): NodeIdentity {
+        let identity = this.identities.get(node);
+        if (!identity) {
+            identity = { id: this.nextId++, documentUri: AstUtils.getDocument(node).uri.toString() };
+            this.identities.set(node, identity);
+        }
+
+        return identity;
+    }
+}
+
+/**
+ * A number that identifies an AST node.
+ */
+export type NodeId = number;
+
+/**
+ * The identity of an AST node.
+ */
+export interface NodeIdentity {
+    /**
+     * A number that is unique among all nodes.
+     */
+    readonly id: NodeId;
+
+    /**
+     * The URI of the document that contains the node.
+     */
+    readonly documentUri: string;
+}
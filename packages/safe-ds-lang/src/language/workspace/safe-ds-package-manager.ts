@@ -6,6 +6,7 @@ import {
     AstReflection,
     DocumentState,
     IndexManager,
+    LangiumDocument,
     LangiumDocuments,
 } from 'langium';
 import { isSdsDeclaration } from '../generated/ast.js';
@@ -20,6 +21,16 @@ export class SafeDsPackageManager {
     private readonly packageNames: PackageNames;
     private readonly packageContents: PackageContents;
 
+    /**
+     * Maps the URI of a document to the declarations it contributes to the package tree.
+     */
+    private readonly entriesByDocument = new Map<string, PackageEntry[]>();
+
+    /**
+     * Whether the documents that were indexed before the first build phase we see have been added.
+     */
+    private isInitialized = false;
+
     constructor(services: SafeDsServices) {
         this.astNodeLocator = services.workspace.AstNodeLocator;
         this.astReflection = services.shared.AstReflection;
@@ -27,15 +38,18 @@ export class SafeDsPackageManager {
         this.langiumDocuments = services.shared.workspace.LangiumDocuments;
 
         this.packageNames = new Set();
-        this.packageContents = {
-            subpackages: new Map(),
-            ownDeclarations: [],
-        };
-
-        // Update data once documents are indexed
-        services.shared.workspace.DocumentBuilder.onBuildPhase(DocumentState.IndexedContent, () =>
-            this.buildPackageStructures(),
+        this.packageContents = createPackageContents();
+
+        // Update data once documents are indexed or deleted
+        const documentBuilder = services.shared.workspace.DocumentBuilder;
+        documentBuilder.onBuildPhase(DocumentState.IndexedContent, (documents) =>
+            this.updatePackageStructures(documents),
         );
+        documentBuilder.onUpdate((_changed, deleted) => {
+            for (const uri of deleted) {
+                this.removeDocument(uri.toString());
+            }
+        });
     }
 
     /**
@@ -54,16 +68,20 @@ export class SafeDsPackageManager {
 
     /**
      * Returns all declarations that are defined directly in the given package. The options can be used to filter the
-     * results.
+     * results. The result must not be modified.
      */
     getDeclarationsInPackage(packageName: string, options: GetDeclarationsOptions = {}): AstNodeDescription[] {
-        const result = this.getPackageContents(packageName)?.ownDeclarations ?? [];
-        return this.filterDescriptions(result, options);
+        const packageContents = this.getPackageContents(packageName);
+        if (!packageContents) {
+            return [];
+        }
+
+        return this.getView(packageContents, false, options);
     }
 
     /**
      * Returns all declarations that are defined in the given package or any of its (transitive) subpackages. The
-     * options can be used to filter the results.
+     * options can be used to filter the results. The result must not be modified.
      */
     getDeclarationsInPackageOrSubpackage(
         packageName: string,
@@ -74,15 +92,7 @@ export class SafeDsPackageManager {
             return [];
         }
 
-        const result: AstNodeDescription[] = [];
-        const queue: PackageContents[] = [packageContents];
-        while (queue.length > 0) {
-            const current = queue.shift()!;
-            result.push(...current.ownDeclarations);
-            queue.push(...current.subpackages.values());
-        }
-
-        return this.filterDescriptions(result, options);
+        return this.getView(packageContents, true, options);
     }
 
     private getPackageContents(packageName: string): PackageContents | undefined {
@@ -100,6 +110,32 @@ export class SafeDsPackageManager {
         return current;
     }
 
+    /**
+     * Returns the filtered declarations of a package and, if requested, its subpackages. Results are kept until the
+     * declarations of the package or one of its subpackages change.
+     */
+    private getView(
+        packageContents: PackageContents,
+        includeSubpackages: boolean,
+        options: GetDeclarationsOptions,
+    ): AstNodeDescription[] {
+        const key = `${includeSubpackages}|${options.nodeType ?? ''}|${options.hideInternal ?? false}`;
+        let result = packageContents.views.get(key);
+
+        if (!result) {
+            result = this.filterDescriptions(Array.from(packageContents.ownDeclarations.values()).flat(), options);
+            if (includeSubpackages) {
+                for (const subpackage of packageContents.subpackages.values()) {
+                    result.push(...this.getView(subpackage, true, options));
+                }
+            }
+
+            packageContents.views.set(key, result);
+        }
+
+        return result;
+    }
+
     private filterDescriptions(
         descriptions: AstNodeDescription[],
         options: GetDeclarationsOptions,
@@ -118,11 +154,23 @@ export class SafeDsPackageManager {
         return result;
     }
 
-    private buildPackageStructures(): void {
-        this.packageNames.clear();
-        this.packageContents.subpackages.clear();
+    private updatePackageStructures(documents: LangiumDocument[]): void {
+        // Documents that were indexed before the first build phase we see must be added as well
+        if (!this.isInitialized) {
+            this.isInitialized = true;
+            documents = this.langiumDocuments.all.filter((it) => it.state >= DocumentState.IndexedContent).toArray();
+        }
+
+        for (const document of documents) {
+            const uri = document.uri.toString();
+            this.setDocumentEntries(uri, this.computeEntries(uri));
+        }
+    }
+
+    private computeEntries(uri: string): PackageEntry[] {
+        const result: PackageEntry[] = [];
 
-        for (const description of this.indexManager.allElements()) {
+        for (const description of this.indexManager.allElements(undefined, new Set([uri]))) {
             const node = this.loadAstNode(description);
             if (!node) {
                 /* c8 ignore next 2 */
@@ -135,9 +183,10 @@ export class SafeDsPackageManager {
                 continue;
             }
 
-            this.packageNames.add(packageName);
-            this.addToTree(packageName, description, node);
+            result.push({ packageName, description: { ...description, node } });
         }
+
+        return result;
     }
 
     private loadAstNode(nodeDescription: AstNodeDescription): AstNode | undefined {
@@ -161,24 +210,82 @@ export class SafeDsPackageManager {
         return packageName.split('.').every((it) => it !== '');
     }
 
-    private addToTree(packageName: string, description: AstNodeDescription, node: AstNode): void {
-        const descriptionWithResolvedNode = { ...description, node };
+    private removeDocument(uri: string): void {
+        this.setDocumentEntries(uri, []);
+    }
+
+    /**
+     * Replaces the declarations of the document with the given URI. Only the packages that are affected by the change
+     * are updated.
+     */
+    private setDocumentEntries(uri: string, entries: PackageEntry[]): void {
+        const newDeclarations = new Map<string, AstNodeDescription[]>();
+        for (const { packageName, description } of entries) {
+            if (!newDeclarations.has(packageName)) {
+                newDeclarations.set(packageName, []);
+            }
+            newDeclarations.get(packageName)!.push(description);
+        }
+
+        // Remove the document from packages it no longer contributes to
+        for (const { packageName } of this.entriesByDocument.get(uri) ?? []) {
+            if (!newDeclarations.has(packageName)) {
+                this.setOwnDeclarations(packageName, uri, []);
+            }
+        }
+
+        for (const [packageName, descriptions] of newDeclarations) {
+            this.setOwnDeclarations(packageName, uri, descriptions);
+        }
 
+        if (entries.length > 0) {
+            this.entriesByDocument.set(uri, entries);
+        } else {
+            this.entriesByDocument.delete(uri);
+        }
+    }
+
+    private setOwnDeclarations(packageName: string, uri: string, descriptions: AstNodeDescription[]): void {
         const parts = packageName.split('.');
-        let current = this.packageContents;
+        const path: PackageContents[] = [this.packageContents];
 
-        // Traverse the package tree and create missing nodes
+        // Traverse the package tree, create missing nodes, and drop the views that include the package
         for (const part of parts) {
+            const current = path[path.length - 1]!;
+            current.views.clear();
+
             if (!current.subpackages.has(part)) {
-                current.subpackages.set(part, {
-                    subpackages: new Map(),
-                    ownDeclarations: [],
-                });
+                if (descriptions.length === 0) {
+                    return;
+                }
+                current.subpackages.set(part, createPackageContents());
             }
-            current = current.subpackages.get(part)!;
+            path.push(current.subpackages.get(part)!);
+        }
+
+        const target = path[path.length - 1]!;
+        target.views.clear();
+
+        // Updating an existing entry keeps the order of documents stable
+        if (descriptions.length > 0) {
+            target.ownDeclarations.set(uri, descriptions);
+            this.packageNames.add(packageName);
+            return;
         }
 
-        current.ownDeclarations.push(descriptionWithResolvedNode);
+        target.ownDeclarations.delete(uri);
+        if (target.ownDeclarations.size === 0) {
+            this.packageNames.delete(packageName);
+        }
+
+        // Remove nodes that no longer contain any declarations
+        for (let index = parts.length; index > 0; index--) {
+            const node = path[index]!;
+            if (node.ownDeclarations.size > 0 || node.subpackages.size > 0) {
+                break;
+            }
+            path[index - 1]!.subpackages.delete(parts[index - 1]!);
+        }
     }
 }
 
@@ -198,6 +305,19 @@ type PackageNames = Set<string>;
 type PackageContents = {
     subpackages: PackageTree;
     ownDeclarations: OwnDeclarations;
+    views: PackageViews;
 };
 type PackageTree = Map<string, PackageContents>;
-type OwnDeclarations = AstNodeDescription[];
+type OwnDeclarations = Map<string, AstNodeDescription[]>;
+type PackageViews = Map<string, AstNodeDescription[]>;
+
+interface PackageEntry {
+    readonly packageName: string;
+    readonly description: AstNodeDescription;
+}
+
+const createPackageContents = (): PackageContents => ({
+    subpackages: new Map(),
+    ownDeclarations: new Map(),
+    views: new Map(),
+});
@@ -1,6 +1,12 @@
 import { SafeDsServices } from '../safe-ds-module.js';
 import { SafeDsLanguageMetaData } from '../generated/module.js';
 import { ConfigurationProvider, DeepPartial, Disposable } from 'langium';
+import os from 'node:os';
+import path from 'node:path';
+import { type FileReadMemoizationKey } from '../generation/python/safe-ds-python-generator.js';
+import { MemoizationPolicy } from '../runtime/messages.js';
+
+const BYTES_PER_MEGABYTE = 1024 * 1024;
 
 export class SafeDsSettingsProvider {
     private readonly configurationProvider: ConfigurationProvider;
@@ -59,6 +65,55 @@ export class SafeDsSettingsProvider {
         });
     }
 
+    getRunnerPoolSize(): number {
+        /* c8 ignore next 2 */
+        return Math.max(1, Math.floor(this.cachedSettings.runner?.poolSize ?? 1));
+    }
+
+    onRunnerPoolSizeUpdate(callback: (newValue: number | undefined) => void): Disposable {
+        const watcher: SettingsWatcher<number | undefined> = {
+            accessor: (settings) => settings.runner?.poolSize,
+            callback,
+        };
+
+        this.watchers.add(watcher);
+
+        return Disposable.create(() => {
+            /* c8 ignore next */
+            this.watchers.delete(watcher);
+        });
+    }
+
+    getMemoizationPolicy(): MemoizationPolicy {
+        const settings = this.cachedSettings.runner?.memoization;
+        const result: MemoizationPolicy = { eviction: settings?.eviction ?? 'lru' };
+
+        // A size of 0 means that the cache is unbounded
+        const maxSizeInMegabytes = settings?.maxSizeInMegabytes ?? 0;
+        if (maxSizeInMegabytes > 0) {
+            result.maxBytes = Math.floor(maxSizeInMegabytes * BYTES_PER_MEGABYTE);
+        }
+
+        if (settings?.diskCache?.enabled) {
+            const diskMaxSizeInMegabytes = settings.diskCache.maxSizeInMegabytes ?? 0;
+            result.disk = {
+                directory: settings.diskCache.directory || path.join(os.tmpdir(), 'safe-ds-memoization'),
+                maxBytes:
+                    diskMaxSizeInMegabytes > 0 ? Math.floor(diskMaxSizeInMegabytes * BYTES_PER_MEGABYTE) : undefined,
+            };
+        }
+
+        return result;
+    }
+
+    getFileReadMemoizationKey(): FileReadMemoizationKey {
+        return this.cachedSettings.runner?.memoization?.fileKey ?? 'mtime';
+    }
+
+    shouldExecuteInParallel(): boolean {
+        return this.cachedSettings.runner?.parallelExecution?.enabled ?? false;
+    }
+
     shouldValidateCodeStyle(): boolean {
         return this.cachedSettings.validation?.codeStyle?.enabled ?? true;
     }
@@ -112,6 +167,22 @@ export interface SafeDsInlayHintsSettings {
 
 export interface SafeDsRunnerSettings {
     command: string;
+    poolSize: number;
+    memoization: SafeDsMemoizationSettings;
+    parallelExecution: {
+        enabled: boolean;
+    };
+}
+
+export interface SafeDsMemoizationSettings {
+    maxSizeInMegabytes: number;
+    eviction: 'lru' | 'cost_aware';
+    fileKey: FileReadMemoizationKey;
+    diskCache: {
+        enabled: boolean;
+        directory: string;
+        maxSizeInMegabytes: number;
+    };
 }
 
 export interface SafeDsValidationSettings {
@@ -1,14 +1,17 @@
 import { DefaultWorkspaceManager, LangiumDocument, LangiumDocumentFactory } from 'langium';
 import { WorkspaceFolder } from 'vscode-languageserver';
 import { listBuiltinFiles } from '../builtins/fileFinder.js';
-import { type LangiumSharedServices } from 'langium/lsp';
+import type { SafeDsBuiltinSnapshot } from '../builtins/safe-ds-builtin-snapshot.js';
+import type { SafeDsSharedServices } from '../safe-ds-module.js';
 
 export class SafeDsWorkspaceManager extends DefaultWorkspaceManager {
     private documentFactory: LangiumDocumentFactory;
+    private builtinSnapshot: () => SafeDsBuiltinSnapshot;
 
-    constructor(services: LangiumSharedServices) {
+    constructor(services: SafeDsSharedServices) {
         super(services);
         this.documentFactory = services.workspace.LangiumDocumentFactory;
+        this.builtinSnapshot = () => services.ServiceRegistry.getSafeDsServices().builtins.Snapshot;
     }
 
     protected override async loadAdditionalDocuments(
@@ -17,6 +20,15 @@ export class SafeDsWorkspaceManager extends DefaultWorkspaceManager {
     ): Promise<void> {
         await super.loadAdditionalDocuments(folders, collector);
 
+        // Create builtin files from the snapshot if possible, so they need not be parsed
+        const builtinSnapshot = this.builtinSnapshot();
+        if (builtinSnapshot.isAvailable()) {
+            for (const document of builtinSnapshot.createDocuments()) {
+                collector(document);
+            }
+            return;
+        }
+
         // Load builtin files
         for (const uri of listBuiltinFiles()) {
             collector(await this.documentFactory.fromUri(uri));
@@ -0,0 +1,87 @@
+import { AstUtils, DocumentState } from 'langium';
+import { NodeFileSystem } from 'langium/node';
+import { describe, expect, it } from 'vitest';
+import { listBuiltinFiles } from '../../../src/language/builtins/fileFinder.js';
+import { isSdsNamedType, isSdsTypeParameter } from '../../../src/language/generated/ast.js';
+import { createSafeDsServices, getTypeParameters } from '../../../src/language/index.js';
+
+const services = (await createSafeDsServices(NodeFileSystem)).SafeDs;
+const builtinSnapshot = services.builtins.Snapshot;
+
+// Services that load the builtin files from a generated snapshot instead of parsing them
+const snapshotServices = (await createSafeDsServices(NodeFileSystem, { omitBuiltins: true })).SafeDs;
+snapshotServices.builtins.Snapshot.setSnapshot(JSON.parse(JSON.stringify(builtinSnapshot.createSnapshot())));
+await snapshotServices.shared.workspace.WorkspaceManager.initializeWorkspace([]);
+
+describe('SafeDsBuiltinSnapshot', () => {
+    it('should not be available in the sources', () => {
+        expect(builtinSnapshot.isAvailable()).toBeFalsy();
+    });
+
+    describe('createSnapshot', () => {
+        const snapshot = builtinSnapshot.createSnapshot();
+
+        it('should contain all builtin files', () => {
+            expect(snapshot.documents).toHaveLength(listBuiltinFiles().length);
+        });
+
+        it('should contain the serialized ASTs', () => {
+            for (const document of snapshot.documents) {
+                expect(JSON.parse(document.ast).$type).toBe('SdsModule');
+            }
+        });
+    });
+
+    describe('loading builtin files from a snapshot', () => {
+        it('should be available', () => {
+            expect(snapshotServices.builtins.Snapshot.isAvailable()).toBeTruthy();
+        });
+
+        it('should create documents without concrete syntax tree', () => {
+            for (const uri of listBuiltinFiles()) {
+                const document = snapshotServices.shared.workspace.LangiumDocuments.getDocument(uri);
+                expect(document?.parseResult.value.$cstNode).toBeUndefined();
+            }
+        });
+
+        it('should index, scope, and link the documents', () => {
+            for (const uri of listBuiltinFiles()) {
+                const document = snapshotServices.shared.workspace.LangiumDocuments.getDocument(uri);
+                expect(document?.state).toBeGreaterThanOrEqual(DocumentState.IndexedReferences);
+                expect(document?.precomputedScopes).toBeDefined();
+            }
+
+            const names = snapshotServices.shared.workspace.IndexManager.allElements().map((it) => it.name);
+            expect(names.toArray()).toContain('Any');
+        });
+
+        it('should resolve references to type parameters', () => {
+            const list = snapshotServices.builtins.Classes.List;
+            const namedType = AstUtils.streamAllContents(list!)
+                .filter(isSdsNamedType)
+                .find((it) => it.declaration?.$refText === 'E');
+
+            expect(isSdsTypeParameter(namedType?.declaration?.ref)).toBeTruthy();
+            expect(namedType?.declaration?.ref).toBe(getTypeParameters(list)[0]);
+        });
+
+        it('should resolve references to declarations in the same file', () => {
+            const float = snapshotServices.builtins.Classes.Float;
+            const superclasses = snapshotServices.typing.ClassHierarchy.streamProperSuperclasses(float).toArray();
+
+            expect(superclasses).toContain(snapshotServices.builtins.Classes.Number);
+        });
+
+        it('should index subclasses', () => {
+            const number = snapshotServices.builtins.Classes.Number;
+            const subclasses = snapshotServices.typing.ClassHierarchy.streamDirectSubclasses(number).toArray();
+
+            expect(subclasses).toContain(snapshotServices.builtins.Classes.Float);
+        });
+
+        it('should keep the documentation', () => {
+            const number = snapshotServices.builtins.Classes.Number;
+            expect(snapshotServices.documentation.DocumentationProvider.getDocumentation(number!)).toBeTruthy();
+        });
+    });
+});
@@ -6,10 +6,12 @@ import {
     isSdsCallable,
     isSdsExpressionLambda,
     isSdsModule,
+    isSdsSegment,
     SdsCall,
     SdsCallable,
 } from '../../../src/language/generated/ast.js';
-import { createSafeDsServices } from '../../../src/language/index.js';
+import { createSafeDsServices, getParameters } from '../../../src/language/index.js';
+import { BlockLambdaClosure } from '../../../src/language/partialEvaluation/model.js';
 import { createCallGraphTests } from './creator.js';
 import { getNodeOfType } from '../../helpers/nodeFinder.js';
 import { isRangeEqual } from 'langium/test';
@@ -52,9 +54,39 @@ describe('SafeDsCallGraphComputer', () => {
                 }
             }
         });
+
+        it('should drop cached call graphs that depend on the document of a caller if it changes', async () => {
+            const callee = await getNodeOfType(services, calleeCode, isSdsSegment);
+            const lambda = await getNodeOfType(services, callerCode, isSdsBlockLambda);
+            const substitutions = new Map([[getParameters(callee)[0]!, new BlockLambdaClosure(lambda, new Map())]]);
+
+            callGraphComputer.getCallGraph(callee, substitutions);
+            expect(callGraphComputer['callGraphCache'].has(callee)).toBeTruthy();
+
+            await services.shared.workspace.DocumentBuilder.update([], [AstUtils.getDocument(lambda).uri]);
+            expect(callGraphComputer['callGraphCache'].has(callee)).toBeFalsy();
+        });
     });
 });
 
+const calleeCode = `
+    package tests.flow.callGraphCaching.callee
+
+    segment mySegment(f: () -> ()) {
+        f();
+    }
+`;
+
+const callerCode = `
+    package tests.flow.callGraphCaching.caller
+
+    from tests.flow.callGraphCaching.callee import mySegment
+
+    pipeline myPipeline {
+        mySegment(() {});
+    }
+`;
+
 const getActualCallables = (node: SdsCall | SdsCallable): string[] => {
     return callGraphComputer
         .getCallGraph(node)
@@ -0,0 +1,146 @@
+import { describe, expect, it } from 'vitest';
+import { getNodeOfType } from '../../helpers/nodeFinder.js';
+import { isSdsPipeline } from '../../../src/language/generated/ast.js';
+import { createSafeDsServices, getStatements } from '../../../src/language/index.js';
+import { NodeFileSystem } from 'langium/node';
+
+const services = (await createSafeDsServices(NodeFileSystem)).SafeDs;
+const executionPlanner = services.flow.ExecutionPlanner;
+
+describe('computeExecutionStages', async () => {
+    const testCases: ComputeExecutionStagesTest[] = [
+        {
+            testName: 'no statements',
+            code: `
+                pipeline myPipeline {}
+            `,
+            expectedStages: [],
+        },
+        {
+            testName: 'independent statements',
+            code: `
+                @Pure
+                fun g(v: Int) -> r: Int
+
+                pipeline myPipeline {
+                    val a = g(1);
+                    val b = g(2);
+                    val c = g(3);
+                }
+            `,
+            expectedStages: [[0, 1, 2]],
+        },
+        {
+            testName: 'dependency due to reference',
+            code: `
+                @Pure
+                fun g(v: Int) -> r: Int
+
+                pipeline myPipeline {
+                    val a = g(1);
+                    val b = g(a);
+                    val c = g(a);
+                    val d = g(b);
+                }
+            `,
+            expectedStages: [[0], [1, 2], [3]],
+        },
+        {
+            testName: 'dependency due to impurity reasons',
+            code: `
+                @Impure([ImpurityReason.FileWriteToConstantPath("a.txt")])
+                fun write()
+
+                @Impure([ImpurityReason.FileReadFromConstantPath("a.txt")])
+                fun read() -> r: Int
+
+                @Impure([ImpurityReason.FileReadFromConstantPath("b.txt")])
+                fun readOther() -> r: Int
+
+                pipeline myPipeline {
+                    val a = read();
+                    write();
+                    val b = read();
+                    val c = readOther();
+                }
+            `,
+            expectedStages: [[0, 3], [1], [2]],
+        },
+        {
+            testName: 'impure statement after pure statements',
+            code: `
+                @Pure
+                fun g(v: Int) -> r: Int
+
+                @Impure([ImpurityReason.FileWriteToConstantPath("a.txt")])
+                fun write()
+
+                pipeline myPipeline {
+                    val a = g(1);
+                    val b = g(a);
+                    write();
+                    val c = g(2);
+                    val d = g(3);
+                }
+            `,
+            expectedStages: [[0, 2, 3, 4], [1]],
+        },
+        {
+            testName: 'independent reads',
+            code: `
+                @Impure([ImpurityReason.FileReadFromConstantPath("a.txt")])
+                fun read() -> r: Int
+
+                pipeline myPipeline {
+                    val a = read();
+                    val b = read();
+                }
+            `,
+            expectedStages: [[0, 1]],
+        },
+        {
+            testName: 'dependency due to other impurity reasons',
+            code: `
+                @Impure([ImpurityReason.FileReadFromConstantPath("a.txt")])
+                fun read() -> r: Int
+
+                @Impure([ImpurityReason.Other])
+                fun other()
+
+                pipeline myPipeline {
+                    val a = read();
+                    other();
+                    val b = read();
+                }
+            `,
+            expectedStages: [[0], [1], [2]],
+        },
+    ];
+
+    it.each(testCases)('$testName', async ({ code, expectedStages }) => {
+        const pipeline = await getNodeOfType(services, code, isSdsPipeline);
+        const statements = getStatements(pipeline.body);
+
+        const stages = executionPlanner.computeExecutionStages(statements);
+        const actualStages = stages.map((stage) => stage.map((statement) => statement.$containerIndex));
+
+        expect(actualStages).toStrictEqual(expectedStages);
+    });
+});
+
+interface ComputeExecutionStagesTest {
+    /**
+     * A short description of the test.
+     */
+    testName: string;
+
+    /**
+     * The code to plan.
+     */
+    code: string;
+
+    /**
+     * The expected container indices of the statements in each stage.
+     */
+    expectedStages: number[][];
+}
@@ -0,0 +1,191 @@
+import { describe, expect, it } from 'vitest';
+import { getNodeOfType } from '../../helpers/nodeFinder.js';
+import { isSdsAssignment, isSdsPipeline, isSdsPlaceholder } from '../../../src/language/generated/ast.js';
+import { createSafeDsServices, getAssignees, getStatements } from '../../../src/language/index.js';
+import { NodeFileSystem } from 'langium/node';
+
+const services = (await createSafeDsServices(NodeFileSystem)).SafeDs;
+const pipelineOptimizer = services.flow.PipelineOptimizer;
+
+describe('optimizeBlock', async () => {
+    const testCases: OptimizeBlockTest[] = [
+        {
+            testName: 'no statements',
+            code: `
+                pipeline myPipeline {}
+            `,
+            expectedIndices: [],
+        },
+        {
+            testName: 'unused pure assignment',
+            code: `
+                pipeline myPipeline {
+                    val a = 1;
+                }
+            `,
+            expectedIndices: [],
+        },
+        {
+            testName: 'unused pure assignment (observed placeholder)',
+            code: `
+                @Pure
+                fun g(v: Int) -> r: Int
+
+                pipeline myPipeline {
+                    val a = g(1);
+                    val b = g(a);
+                    val c = g(2);
+                }
+            `,
+            observedPlaceholderNames: ['b'],
+            expectedIndices: [0, 1],
+        },
+        {
+            testName: 'impure statement',
+            code: `
+                @Impure([ImpurityReason.FileWriteToConstantPath("a.txt")])
+                fun f()
+
+                pipeline myPipeline {
+                    f();
+                }
+            `,
+            expectedIndices: [0],
+        },
+        {
+            testName: 'placeholder needed by impure statement',
+            code: `
+                @Pure
+                fun g() -> r: Int
+
+                @Impure([ImpurityReason.FileWriteToParameterizedPath("p")])
+                fun f(p: String, v: Int)
+
+                pipeline myPipeline {
+                    val a = g();
+                    f("a.txt", a);
+                }
+            `,
+            expectedIndices: [0, 1],
+        },
+        {
+            testName: 'placeholder replaced by constant',
+            code: `
+                @Impure([ImpurityReason.FileWriteToParameterizedPath("p")])
+                fun f(p: String, v: Int)
+
+                pipeline myPipeline {
+                    val a = 1;
+                    f("a.txt", a);
+                }
+            `,
+            expectedIndices: [1],
+        },
+        {
+            testName: 'placeholder needed by output statement',
+            code: `
+                @Pure
+                fun g() -> r: Int
+
+                pipeline myPipeline {
+                    val a = g();
+                    out a;
+                }
+            `,
+            expectedIndices: [0, 1],
+        },
+        {
+            testName: 'placeholder only needed by unused placeholder',
+            code: `
+                @Pure
+                fun g(v: Int) -> r: Int
+
+                pipeline myPipeline {
+                    val a = g(1);
+                    val b = g(a);
+                }
+            `,
+            expectedIndices: [],
+        },
+    ];
+
+    it.each(testCases)('$testName', async ({ code, observedPlaceholderNames = [], expectedIndices }) => {
+        const pipeline = await getNodeOfType(services, code, isSdsPipeline);
+        const statements = getStatements(pipeline.body);
+        const observedPlaceholders = statements
+            .filter(isSdsAssignment)
+            .flatMap(getAssignees)
+            .filter(isSdsPlaceholder)
+            .filter((it) => observedPlaceholderNames.includes(it.name));
+
+        const optimizedBlock = pipelineOptimizer.optimizeBlock(statements, observedPlaceholders);
+        const actualIndices = optimizedBlock.statements.map((statement) => statement.$containerIndex);
+
+        expect(actualIndices).toStrictEqual(expectedIndices);
+    });
+
+    it('should reuse assignments that call a pure function with the same arguments', async () => {
+        const code = `
+            @Pure
+            fun g(a: Int, b: Int = 2) -> r: Int
+
+            pipeline myPipeline {
+                val a = g(1, 2);
+                val b = g(b = 2, a = 1);
+                val c = g(1);
+                out a + b + c;
+            }
+        `;
+        const pipeline = await getNodeOfType(services, code, isSdsPipeline);
+        const statements = getStatements(pipeline.body);
+
+        const optimizedBlock = pipelineOptimizer.optimizeBlock(statements);
+        const actualReusedIndices = Array.from(optimizedBlock.reusedAssignments).map(([assignment, reused]) => [
+            assignment.$containerIndex,
+            reused.$containerIndex,
+        ]);
+
+        expect(actualReusedIndices).toStrictEqual([[1, 0]]);
+    });
+
+    it('should not reuse assignments that call an impure function', async () => {
+        const code = `
+            @Impure([ImpurityReason.FileReadFromConstantPath("a.txt")])
+            fun g() -> r: Int
+
+            pipeline myPipeline {
+                val a = g();
+                val b = g();
+                out a + b;
+            }
+        `;
+        const pipeline = await getNodeOfType(services, code, isSdsPipeline);
+        const statements = getStatements(pipeline.body);
+
+        const optimizedBlock = pipelineOptimizer.optimizeBlock(statements);
+
+        expect(optimizedBlock.reusedAssignments.size).toBe(0);
+    });
+});
+
+interface OptimizeBlockTest {
+    /**
+     * A short description of the test.
+     */
+    testName: string;
+
+    /**
+     * The code to optimize.
+     */
+    code: string;
+
+    /**
+     * The names of the placeholders that are observable from the outside.
+     */
+    observedPlaceholderNames?: string[];
+
+    /**
+     * The expected container indices of the statements that are kept.
+     */
+    expectedIndices: number[];
+}
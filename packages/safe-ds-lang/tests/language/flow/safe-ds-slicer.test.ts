@@ -134,16 +134,73 @@ describe('computeBackwardSliceToTargets', async () => {
             targetIndices: [1],
             expectedIndices: [0, 1],
         },
+        {
+            testName: 'not required due to impurity reason (other file)',
+            code: `
+                package test
+
+                @Impure([ImpurityReason.FileReadFromConstantPath("a.txt")])
+                fun fileRead() -> content: String
+
+                @Impure([ImpurityReason.FileWriteToConstantPath("b.txt")])
+                fun fileWrite()
+
+                pipeline myPipeline {
+                    fileWrite();
+                    val a = fileRead();
+                    fileWrite();
+                    val b = fileRead();
+                }
+            `,
+            targetIndices: [1, 3],
+            expectedIndices: [1, 3],
+        },
+        {
+            testName: 'resident statement',
+            code: `
+                pipeline myPipeline {
+                    val a = 1;
+                    val b = a + 1;
+                    val c = b + 1;
+                }
+            `,
+            targetIndices: [2],
+            residentIndices: [1],
+            expectedIndices: [1, 2],
+        },
+        {
+            testName: 'resident statement (impurity reason)',
+            code: `
+                package test
+
+                @Impure([ImpurityReason.FileReadFromConstantPath("a.txt")])
+                fun fileRead() -> content: String
+
+                @Impure([ImpurityReason.FileWriteToConstantPath("a.txt")])
+                fun fileWrite()
+
+                pipeline myPipeline {
+                    fileWrite();
+                    val a = fileRead();
+                    val b = a;
+                }
+            `,
+            targetIndices: [2],
+            residentIndices: [1],
+            expectedIndices: [1, 2],
+        },
     ];
 
-    it.each(testCases)('$testName', async ({ code, targetIndices, expectedIndices }) => {
+    it.each(testCases)('$testName', async ({ code, targetIndices, residentIndices, expectedIndices }) => {
         const pipeline = await getNodeOfType(services, code, isSdsPipeline);
         const statements = getStatements(pipeline.body);
         const targets = targetIndices.map(
             (index) => statements[index] ?? fail(`Target index ${index} is out of bounds.`),
         );
 
-        const backwardSlice = slicer.computeBackwardSliceToTargets(statements, targets);
+        const backwardSlice = slicer.computeBackwardSliceToTargets(statements, targets, (statement) =>
+            (residentIndices ?? []).includes(statement.$containerIndex!),
+        );
         const actualIndices = backwardSlice.map((statement) => statement.$containerIndex);
 
         expect(actualIndices).toStrictEqual(expectedIndices);
@@ -166,6 +223,11 @@ interface ComputeBackwardSliceTest {
      */
     targetIndices: number[];
 
+    /**
+     * The container indices of the statements whose results are already available.
+     */
+    residentIndices?: number[];
+
     /**
      * The expected container indices of the statements in the backward slice.
      */
@@ -6,7 +6,8 @@ import { AstUtils, stream, URI } from 'langium';
 import { createSafeDsServices } from '../../../../src/language/index.js';
 import { isEmpty } from '../../../../src/helpers/collections.js';
 import { isSdsStatement } from '../../../../src/language/generated/ast.js';
-import { isRangeEqual } from 'langium/test';
+import { isRangeEqual, parseHelper } from 'langium/test';
+import { SourceMapConsumer } from 'source-map-js';
 
 const services = (await createSafeDsServices(NodeFileSystem)).SafeDs;
 const langiumDocuments = services.shared.workspace.LangiumDocuments;
@@ -72,3 +73,194 @@ describe('generation', async () => {
         expect(actualOutputPaths).toStrictEqual(expectedOutputPaths);
     });
 });
+
+describe('fileReadMemoizationKey', async () => {
+    const code = `
+        package test
+
+        @Impure([ImpurityReason.FileReadFromConstantPath("a.txt")])
+        fun readFile() -> content: String
+
+        pipeline myPipeline {
+            val content = readFile();
+        }
+    `;
+
+    const generate = async (fileReadMemoizationKey: 'mtime' | 'content_hash' | undefined): Promise<string> => {
+        const document = await parseHelper(services)(code);
+        return pythonGenerator
+            .generate(document, {
+                destination: URI.file('/out'),
+                createSourceMaps: false,
+                disableRunnerIntegration: false,
+                fileReadMemoizationKey,
+            })
+            .map((it) => it.getText())
+            .join('\n');
+    };
+
+    it('should use the modification time of files by default', async () => {
+        const generated = await generate(undefined);
+        expect(generated).toContain("safeds_runner.file_mtime('a.txt')");
+        expect(generated).not.toContain('file_content_hash');
+    });
+
+    it('should use the content hash of files if requested', async () => {
+        const generated = await generate('content_hash');
+        expect(generated).toContain("safeds_runner.file_content_hash('a.txt')");
+        expect(generated).not.toContain('file_mtime');
+    });
+});
+
+describe('optimize', async () => {
+    const code = `
+        package test
+
+        @Pure
+        fun g(a: Int) -> r: Int
+
+        @Impure([ImpurityReason.FileWriteToConstantPath("a.txt")])
+        fun f(v: Int)
+
+        pipeline myPipeline {
+            val unused = g(1);
+            val a = g(2);
+            val b = g(2);
+            f(a + b);
+        }
+    `;
+
+    const generate = async (optimize: boolean, disableRunnerIntegration: boolean = true): Promise<string> => {
+        const document = await parseHelper(services)(code);
+        return pythonGenerator
+            .generate(document, {
+                destination: URI.file('/out'),
+                createSourceMaps: false,
+                targetStatements: undefined,
+                disableRunnerIntegration,
+                optimize,
+            })
+            .map((it) => it.getText())
+            .join('\n');
+    };
+
+    it('should keep all statements by default', async () => {
+        const generated = await generate(false);
+        expect(generated).toContain('__gen_placeholder_unused = g(1)');
+        expect(generated).toContain('__gen_placeholder_b = g(2)');
+    });
+
+    it('should omit unused statements and reuse identical pure calls', async () => {
+        const generated = await generate(true);
+        expect(generated).not.toContain('__gen_placeholder_unused');
+        expect(generated).toContain('__gen_placeholder_a = g(2)');
+        expect(generated).toContain('__gen_placeholder_b = __gen_placeholder_a');
+    });
+
+    it('should omit unused placeholders if the runner integration is enabled', async () => {
+        const generated = await generate(true, false);
+        expect(generated).not.toContain('__gen_placeholder_unused');
+        expect(generated).toContain("safeds_runner.save_placeholder('a', __gen_placeholder_a)");
+    });
+});
+
+describe('residentPlaceholders', async () => {
+    const code = `
+        package test
+
+        @Pure
+        fun g(a: Int) -> r: Int
+
+        pipeline myPipeline {
+            val a = g(1);
+            val b = g(a);
+            val c = g(b);
+        }
+    `;
+
+    const generate = async (residentPlaceholders: string[] | undefined): Promise<string> => {
+        const document = await parseHelper(services)(code);
+        return pythonGenerator
+            .generate(document, {
+                destination: URI.file('/out'),
+                createSourceMaps: false,
+                targetStatements: [2],
+                disableRunnerIntegration: false,
+                residentPlaceholders,
+            })
+            .map((it) => it.getText())
+            .join('\n');
+    };
+
+    it('should compute all placeholders by default', async () => {
+        const generated = await generate(undefined);
+        expect(generated).not.toContain('safeds_runner.load_placeholder');
+        expect(generated).toContain('__gen_placeholder_a = ');
+    });
+
+    it('should load resident placeholders instead of computing them', async () => {
+        const generated = await generate(['b']);
+        expect(generated).toContain("__gen_placeholder_b = safeds_runner.load_placeholder('b')");
+        expect(generated).not.toContain('__gen_placeholder_a');
+        expect(generated).toContain('__gen_placeholder_c = ');
+    });
+});
+
+describe('parallelize', async () => {
+    const code = `
+        package test
+
+        @Pure
+        fun g(a: Int) -> r: Int
+
+        pipeline myPipeline {
+            val a = g(1);
+            val b = g(2);
+            val c = g(a);
+        }
+    `;
+
+    const generate = async (createSourceMaps: boolean): Promise<Map<string, string>> => {
+        const document = await parseHelper(services)(code);
+        return stream(
+            pythonGenerator.generate(document, {
+                destination: URI.file('/out'),
+                createSourceMaps,
+                targetStatements: undefined,
+                disableRunnerIntegration: false,
+                parallelize: true,
+            }),
+        ).toMap(
+            (it) => it.uri,
+            (it) => it.getText(),
+        );
+    };
+
+    it('should submit independent pure assignments together', async () => {
+        const generated = Array.from((await generate(false)).values()).join('\n');
+
+        expect(generated).toContain('__gen_placeholder_a, __gen_placeholder_b = safeds_runner.run_parallel(\n');
+        expect(generated.match(/^ +lambda: /gmu)).toHaveLength(2);
+        expect(generated).toContain("safeds_runner.save_placeholder('a', __gen_placeholder_a)");
+        expect(generated).toContain("safeds_runner.save_placeholder('b', __gen_placeholder_b)");
+        expect(generated).toContain('__gen_placeholder_c = ');
+    });
+
+    it('should map errors in a task to its assignment', async () => {
+        const generated = await generate(true);
+        const [pythonUri, pythonCode] = Array.from(generated).find(([, text]) => text.includes('run_parallel'))!;
+        const sourceMap = generated.get(`${pythonUri}.map`)!;
+
+        // Look up the line of the second task like the runner does for stack frames
+        const pythonLines = pythonCode.split('\n');
+        const secondTaskLine = pythonLines.findLastIndex((it) => it.trimStart().startsWith('lambda: ')) + 1;
+        const position = new SourceMapConsumer(JSON.parse(sourceMap)).originalPositionFor({
+            line: secondTaskLine,
+            column: 0,
+            bias: SourceMapConsumer.LEAST_UPPER_BOUND,
+        });
+
+        const expectedLine = code.split('\n').findIndex((it) => it.includes('val b = g(2);')) + 1;
+        expect(position.line).toBe(expectedLine);
+    });
+});
@@ -25,6 +25,7 @@ import {
     NamedCallable,
     NullConstant,
     StringConstant,
+    SubstitutionsMap,
     UnknownEvaluatedNode,
 } from '../../../src/language/partialEvaluation/model.js';
 import { getNodeOfType } from '../../helpers/nodeFinder.js';
@@ -604,6 +605,49 @@ describe('partial evaluation model', async () => {
             });
         });
     });
+
+    describe('SubstitutionsMap', () => {
+        it('should find values for equal substitutions', () => {
+            const map = new SubstitutionsMap<number>();
+            map.set(new Map([[enumVariantParameter, new IntConstant(1n)]]), 1);
+
+            expect(map.get(new Map([[enumVariantParameter, new IntConstant(1n)]]))).toBe(1);
+        });
+
+        it('should not find values for substitutions with the same hash that are not equal', () => {
+            const map = new SubstitutionsMap<number>();
+            map.set(new Map([[enumVariantParameter, new ExpressionLambdaClosure(expressionLambda1, new Map())]]), 1);
+
+            const otherClosure = new ExpressionLambdaClosure(expressionLambda2, new Map());
+            const otherSubstitutions = new Map([[enumVariantParameter, otherClosure]]);
+            expect(map.has(otherSubstitutions)).toBeFalsy();
+        });
+
+        it('should compute missing values with the provider', () => {
+            const map = new SubstitutionsMap<number>();
+            expect(map.get(new Map(), () => 1)).toBe(1);
+            expect(map.get(new Map(), () => 2)).toBe(1);
+        });
+
+        it('should delete values', () => {
+            const map = new SubstitutionsMap<number>();
+            map.set(new Map(), 1);
+            map.delete(new Map());
+
+            expect(map.has(new Map())).toBeFalsy();
+        });
+
+        it('should count the stored substitutions', () => {
+            const map = new SubstitutionsMap<number>();
+            map.set(new Map(), 1);
+            map.set(new Map(), 2);
+            map.set(new Map([[enumVariantParameter, new IntConstant(1n)]]), 3);
+            expect(map.size).toBe(2);
+
+            map.delete(new Map());
+            expect(map.size).toBe(1);
+        });
+    });
 });
 
 /**
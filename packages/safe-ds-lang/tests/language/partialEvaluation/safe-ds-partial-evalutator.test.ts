@@ -1,11 +1,20 @@
 import { AssertionError } from 'assert';
 import { NodeFileSystem } from 'langium/node';
-import { describe, it } from 'vitest';
+import { AstUtils } from 'langium';
+import { describe, expect, it } from 'vitest';
 import { locationToString } from '../../../src/helpers/locations.js';
-import { getNodeByLocation } from '../../helpers/nodeFinder.js';
+import { getNodeByLocation, getNodeOfType } from '../../helpers/nodeFinder.js';
 import { loadDocuments } from '../../helpers/testResources.js';
 import { createPartialEvaluationTests } from './creator.js';
-import { createSafeDsServices } from '../../../src/language/index.js';
+import { createSafeDsServices, getParameters } from '../../../src/language/index.js';
+import {
+    isSdsBlockLambda,
+    isSdsCall,
+    isSdsIndexedAccess,
+    isSdsReference,
+    isSdsSegment,
+} from '../../../src/language/generated/ast.js';
+import { BlockLambdaClosure, IntConstant } from '../../../src/language/partialEvaluation/model.js';
 
 const services = (await createSafeDsServices(NodeFileSystem)).SafeDs;
 const partialEvaluator = services.evaluation.PartialEvaluator;
@@ -60,4 +69,80 @@ describe('partial evaluation', async () => {
             }
         }
     });
+
+    it('should drop cached values that depend on the document of a caller if it changes', async () => {
+        const callee = await getNodeOfType(services, calleeCode, isSdsSegment);
+        const reference = AstUtils.streamAst(callee).find(isSdsReference)!;
+        const lambda = await getNodeOfType(services, callerCode, isSdsBlockLambda);
+        const substitutions = new Map([[getParameters(callee)[0]!, new BlockLambdaClosure(lambda, new Map())]]);
+
+        partialEvaluator.evaluate(reference, substitutions);
+        expect(partialEvaluator['cache'].has(reference)).toBeTruthy();
+
+        await services.shared.workspace.DocumentBuilder.update([], [AstUtils.getDocument(lambda).uri]);
+        expect(partialEvaluator['cache'].has(reference)).toBeFalsy();
+    });
+
+    it('should not cache results that depend on a cut-off recursion of an enclosing node', async () => {
+        const indexedAccess = await getNodeOfType(services, recursionCode, isSdsIndexedAccess);
+        const callOfB = AstUtils.streamAst(AstUtils.getDocument(indexedAccess).parseResult.value)
+            .filter(isSdsCall)
+            .head()!;
+
+        // The evaluation of `b()` is cut off when it reaches `a()[0]` again
+        expect(partialEvaluator.evaluate(indexedAccess)).toStrictEqual(new IntConstant(1n));
+
+        // Without this context, `a()[0]` is evaluated completely
+        expect(partialEvaluator.evaluate(callOfB)).toStrictEqual(new IntConstant(1n));
+    });
+
+    it('should cache a limited number of results with parameter substitutions per node', async () => {
+        const segment = await getNodeOfType(services, cappedCode, isSdsSegment);
+        const reference = AstUtils.streamAst(segment).find(isSdsReference)!;
+        const parameter = getParameters(segment)[0]!;
+
+        for (let i = 0; i < 100; i++) {
+            partialEvaluator.evaluate(reference, new Map([[parameter, new IntConstant(BigInt(i))]]));
+        }
+
+        expect(partialEvaluator['cache'].get(reference)!.size).toBeLessThanOrEqual(32);
+    });
 });
+
+const recursionCode = `
+    package tests.partialEvaluation.caching.recursion
+
+    segment a() -> r: List<Int> {
+        yield r = [1, b()];
+    }
+
+    segment b() -> s: Int {
+        yield s = a()[0];
+    }
+`;
+
+const cappedCode = `
+    package tests.partialEvaluation.caching.capped
+
+    segment mySegment(p: Int) -> r: Int {
+        yield r = p;
+    }
+`;
+
+const calleeCode = `
+    package tests.partialEvaluation.caching.callee
+
+    segment mySegment(f: () -> ()) {
+        f();
+    }
+`;
+
+const callerCode = `
+    package tests.partialEvaluation.caching.caller
+
+    from tests.partialEvaluation.caching.callee import mySegment
+
+    pipeline myPipeline {
+        mySegment(() {});
+    }
+`;
@@ -16,6 +16,7 @@ import { createSafeDsServices } from '../../../src/language/index.js';
 
 const services = (await createSafeDsServices(NodeFileSystem)).SafeDs;
 const parameter = await getNodeOfType(services, 'fun f(p: Int)', isSdsParameter);
+const parameterWithSameName = await getNodeOfType(services, 'fun f(p: Int)', isSdsParameter);
 
 describe('purity model', async () => {
     const equalsTests: EqualsTest<ImpurityReason>[] = [
@@ -125,4 +126,32 @@ describe('purity model', async () => {
             expect(value.toString()).toStrictEqual(expectedString);
         });
     });
+
+    describe('toKey', () => {
+        it.each(equalsTests)('should return the same key for equal reasons', ({ value }) => {
+            expect(value().toKey()).toStrictEqual(value().toKey());
+        });
+
+        it.each(equalsTests.filter((it) => it.unequalValueOfSameType))(
+            'should return different keys for unequal reasons of the same type',
+            ({ value, unequalValueOfSameType }) => {
+                expect(value().toKey()).not.toStrictEqual(unequalValueOfSameType!().toKey());
+            },
+        );
+
+        it.each(equalsTests.filter((it) => it.valueOfOtherType))(
+            'should return different keys for reasons of other types',
+            ({ value, valueOfOtherType }) => {
+                expect(value().toKey()).not.toStrictEqual(valueOfOtherType!().toKey());
+            },
+        );
+
+        it('should return different keys for different parameters with the same qualified name', () => {
+            expect(new FileRead(parameter).toKey()).not.toStrictEqual(new FileRead(parameterWithSameName).toKey());
+        });
+
+        it('should return different keys for a parameter and a path that looks like its qualified name', () => {
+            expect(new FileRead(parameter).toKey()).not.toStrictEqual(new FileRead('f.p').toKey());
+        });
+    });
 });
@@ -0,0 +1,171 @@
+import { describe, expect, it } from 'vitest';
+import { decodeColumnarTable, parseBinaryMessage } from '../../../src/language/runtime/columnar.js';
+import { ColumnarTable } from '../../../src/language/runtime/messages.js';
+
+describe('parseBinaryMessage', () => {
+    it('should decode a table in the columnar format', () => {
+        const ints = new Int32Array([1, 2, 3]);
+        const floats = new Float64Array([1.5, 2.5, 3.5]);
+        const body = concat(new Uint8Array(ints.buffer), new Uint8Array(4), new Uint8Array(floats.buffer));
+
+        const message = parseBinaryMessage(
+            createFrame(
+                {
+                    format: 'columnar',
+                    rowCount: 3,
+                    columns: [
+                        { name: 'a', dataType: 'int32', data: { offset: 0, length: 12 } },
+                        { name: 'b', dataType: 'float64', data: { offset: 16, length: 24 } },
+                    ],
+                },
+                body,
+            ),
+        );
+
+        expect(message.type).toBe('placeholder_value');
+        const value = (<any>message.data).value;
+        expect(value.a).toBeInstanceOf(Int32Array);
+        expect(Array.from(value.a)).toStrictEqual([1, 2, 3]);
+        expect(value.b).toBeInstanceOf(Float64Array);
+        expect(Array.from(value.b)).toStrictEqual([1.5, 2.5, 3.5]);
+    });
+
+    it('should not copy aligned numeric columns', () => {
+        const frame = createFrame(
+            {
+                format: 'columnar',
+                rowCount: 1,
+                columns: [{ name: 'a', dataType: 'float64', data: { offset: 0, length: 8 } }],
+            },
+            new Uint8Array(new Float64Array([1]).buffer),
+        );
+
+        const value = (<any>parseBinaryMessage(frame).data).value;
+        expect(value.a.buffer).toBe(frame.buffer);
+    });
+
+    it('should return other messages unchanged', () => {
+        const header = { type: 'placeholder_value', id: 'id', data: { name: 'a', type: 'Int', value: 1 } };
+        expect(parseBinaryMessage(createFrameFromHeader(header, new Uint8Array()))).toStrictEqual(header);
+    });
+
+    it('should throw if the frame is too short', () => {
+        expect(() => parseBinaryMessage(new Uint8Array(2))).toThrowError();
+    });
+
+    it('should throw if the header length exceeds the frame', () => {
+        const frame = new Uint8Array(8);
+        new DataView(frame.buffer).setUint32(0, 100, true);
+        expect(() => parseBinaryMessage(frame)).toThrowError();
+    });
+});
+
+describe('decodeColumnarTable', () => {
+    it('should decode boolean columns', () => {
+        const table: ColumnarTable = {
+            format: 'columnar',
+            rowCount: 2,
+            columns: [{ name: 'a', dataType: 'bool', data: { offset: 0, length: 2 } }],
+        };
+
+        expect(decodeColumnarTable(table, new Uint8Array([1, 0]))).toStrictEqual({ a: [true, false] });
+    });
+
+    it('should decode string columns', () => {
+        const data = new TextEncoder().encode('abcdé');
+        const offsets = new Int32Array([0, 3, 3, 6]);
+        const table: ColumnarTable = {
+            format: 'columnar',
+            rowCount: 3,
+            columns: [
+                {
+                    name: 'a',
+                    dataType: 'utf8',
+                    offsets: { offset: 0, length: 16 },
+                    data: { offset: 16, length: data.byteLength },
+                },
+            ],
+        };
+
+        expect(decodeColumnarTable(table, concat(new Uint8Array(offsets.buffer), data))).toStrictEqual({
+            a: ['abc', '', 'dé'],
+        });
+    });
+
+    it('should replace missing values with null', () => {
+        const values = new Int32Array([1, 0, 3]);
+        const table: ColumnarTable = {
+            format: 'columnar',
+            rowCount: 3,
+            columns: [
+                {
+                    name: 'a',
+                    dataType: 'int32',
+                    data: { offset: 0, length: 12 },
+                    validity: { offset: 12, length: 1 },
+                },
+            ],
+        };
+
+        const body = concat(new Uint8Array(values.buffer), new Uint8Array([0b101]));
+        expect(decodeColumnarTable(table, body)).toStrictEqual({ a: [1, null, 3] });
+    });
+
+    it('should copy unaligned numeric columns', () => {
+        const values = new Float64Array([42]);
+        const table: ColumnarTable = {
+            format: 'columnar',
+            rowCount: 1,
+            columns: [{ name: 'a', dataType: 'float64', data: { offset: 1, length: 8 } }],
+        };
+
+        const result = decodeColumnarTable(table, concat(new Uint8Array(1), new Uint8Array(values.buffer)));
+        expect(Array.from(result['a']!)).toStrictEqual([42]);
+    });
+
+    it('should throw if a buffer lies outside the body', () => {
+        const table: ColumnarTable = {
+            format: 'columnar',
+            rowCount: 1,
+            columns: [{ name: 'a', dataType: 'float64', data: { offset: 0, length: 8 } }],
+        };
+
+        expect(() => decodeColumnarTable(table, new Uint8Array(4))).toThrowError();
+    });
+
+    it('should throw if the data type is unknown', () => {
+        const table: ColumnarTable = {
+            format: 'columnar',
+            rowCount: 1,
+            columns: [{ name: 'a', dataType: <any>'int64', data: { offset: 0, length: 8 } }],
+        };
+
+        expect(() => decodeColumnarTable(table, new Uint8Array(8))).toThrowError();
+    });
+});
+
+const createFrame = (table: ColumnarTable, body: Uint8Array): Uint8Array => {
+    const header = { type: 'placeholder_value', id: 'id', data: { name: 'table', type: 'Table', value: table } };
+    return createFrameFromHeader(header, body);
+};
+
+const createFrameFromHeader = (header: object, body: Uint8Array): Uint8Array => {
+    const headerBytes = new TextEncoder().encode(JSON.stringify(header));
+    const bodyStart = Math.ceil((4 + headerBytes.byteLength) / 8) * 8;
+
+    const frame = new Uint8Array(bodyStart + body.byteLength);
+    new DataView(frame.buffer).setUint32(0, headerBytes.byteLength, true);
+    frame.set(headerBytes, 4);
+    frame.set(body, bodyStart);
+    return frame;
+};
+
+const concat = (...parts: Uint8Array[]): Uint8Array => {
+    const result = new Uint8Array(parts.reduce((sum, part) => sum + part.byteLength, 0));
+    let offset = 0;
+    for (const part of parts) {
+        result.set(part, offset);
+        offset += part.byteLength;
+    }
+    return result;
+};
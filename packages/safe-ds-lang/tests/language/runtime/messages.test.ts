@@ -1,8 +1,14 @@
 import { describe, expect, it } from 'vitest';
 import { ToStringTest } from '../../helpers/testDescription.js';
 import {
+    createCancelMessage,
+    createCapabilitiesQueryMessage,
+    createPlaceholderQuery,
+    createPlaceholderQueryBatchMessage,
     createPlaceholderQueryMessage,
+    createProfilingQueryMessage,
     createProgramMessage,
+    createSessionCloseMessage,
     createShutdownMessage,
     PythonServerMessage,
 } from '../../../src/language/runtime/messages.js';
@@ -40,6 +46,55 @@ describe('runner messages', async () => {
             value: () => createPlaceholderQueryMessage('abcdefg', 'value1'),
             expectedString: '{"type":"placeholder_query","id":"abcdefg","data":{"name":"value1","window":{}}}',
         },
+        {
+            value: () => createPlaceholderQueryMessage('abcdefg', 'value1', undefined, undefined, 'columnar'),
+            expectedString:
+                '{"type":"placeholder_query","id":"abcdefg","data":{"name":"value1","window":{},"format":"columnar"}}',
+        },
+        {
+            value: () =>
+                createPlaceholderQueryBatchMessage('abcdefg', [
+                    createPlaceholderQuery('value1'),
+                    createPlaceholderQuery('value2', 1, 2),
+                ]),
+            expectedString:
+                '{"type":"placeholder_query_batch","id":"abcdefg","data":[{"name":"value1","window":{}},{"name":"value2","window":{"begin":1,"size":2}}]}',
+        },
+        {
+            value: () =>
+                createProfilingQueryMessage('abcdefg', {
+                    name: 'table',
+                    histogramBins: 10,
+                    quantiles: [0.5],
+                    maxCategories: 10,
+                }),
+            expectedString:
+                '{"type":"profiling_query","id":"abcdefg","data":{"name":"table","histogramBins":10,"quantiles":[0.5],"maxCategories":10}}',
+        },
+        {
+            value: () =>
+                createProfilingQueryMessage('abcdefg', {
+                    name: 'table',
+                    histogramBins: 10,
+                    quantiles: [0.5],
+                    maxCategories: 10,
+                    approximate: true,
+                }),
+            expectedString:
+                '{"type":"profiling_query","id":"abcdefg","data":{"name":"table","histogramBins":10,"quantiles":[0.5],"maxCategories":10,"approximate":true}}',
+        },
+        {
+            value: () => createCapabilitiesQueryMessage('abcdefg'),
+            expectedString: '{"type":"capabilities_query","id":"abcdefg","data":""}',
+        },
+        {
+            value: () => createSessionCloseMessage('abcdefg'),
+            expectedString: '{"type":"session_close","id":"abcdefg","data":""}',
+        },
+        {
+            value: () => createCancelMessage('abcdefg'),
+            expectedString: '{"type":"cancel","id":"abcdefg","data":""}',
+        },
         {
             value: () => createShutdownMessage(),
             expectedString: '{"type":"shutdown","id":"","data":""}',
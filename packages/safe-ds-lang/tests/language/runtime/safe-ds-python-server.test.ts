@@ -0,0 +1,82 @@
+import { NodeFileSystem } from 'langium/node';
+import { afterEach, describe, expect, it, vi } from 'vitest';
+import { createSafeDsServices } from '../../../src/language/index.js';
+import { MemoizationStats } from '../../../src/language/runtime/messages.js';
+
+const services = (await createSafeDsServices(NodeFileSystem)).SafeDs;
+const pythonServer = services.runtime.PythonServer;
+
+describe('SafeDsPythonServer', async () => {
+    describe('getMemoizationStats', async () => {
+        const stats: MemoizationStats = {
+            hits: 1,
+            diskHits: 2,
+            misses: 3,
+            evictions: 4,
+            entryCount: 5,
+            sizeBytes: 6,
+            diskSizeBytes: 7,
+        };
+
+        const createWorkers = (count: number) => {
+            const workers = Array.from({ length: count }, (_, index) => pythonServer['createWorker'](index, count));
+            pythonServer['workers'] = workers;
+            return workers;
+        };
+
+        afterEach(() => {
+            pythonServer['workers'] = [];
+        });
+
+        it('should return undefined if no process reported statistics', () => {
+            createWorkers(2);
+            expect(pythonServer.getMemoizationStats()).toBeUndefined();
+        });
+
+        it('should sum the statistics of all processes', () => {
+            for (const worker of createWorkers(2)) {
+                pythonServer['handleMessage'](worker, { type: 'memoization_stats', id: 'execution', data: stats });
+            }
+
+            expect(pythonServer.getMemoizationStats()).toStrictEqual({
+                hits: 2,
+                diskHits: 4,
+                misses: 6,
+                evictions: 8,
+                entryCount: 10,
+                sizeBytes: 12,
+                diskSizeBytes: 7,
+            });
+        });
+    });
+
+    describe('handleConnected', async () => {
+        const connect = (ownsProcess: boolean) => {
+            const worker = pythonServer['createWorker'](0, 1);
+            if (ownsProcess) {
+                worker['state'] = { type: 'started', serverProcess: {} as any, serverConnection: {} as any };
+            }
+            const send = vi.spyOn(worker, 'send').mockImplementation(() => {});
+
+            pythonServer['handleConnected'](worker);
+            return { worker, sentTypes: send.mock.calls.map(([message]) => message.type) };
+        };
+
+        afterEach(() => {
+            vi.restoreAllMocks();
+            pythonServer['executionOwners'].clear();
+        });
+
+        it('should query the capabilities and warm up processes that were started by this server', () => {
+            const { worker, sentTypes } = connect(true);
+            expect(sentTypes).toStrictEqual(['capabilities_query', 'program']);
+            expect(worker.runningExecutions.size).toBe(1);
+        });
+
+        it('should only query the capabilities of processes that were started by someone else', () => {
+            const { worker, sentTypes } = connect(false);
+            expect(sentTypes).toStrictEqual(['capabilities_query']);
+            expect(worker.runningExecutions.size).toBe(0);
+        });
+    });
+});
@@ -1,9 +1,11 @@
-import { describe, expect, it } from 'vitest';
+import { afterEach, beforeEach, describe, expect, it, vi } from 'vitest';
 import { NodeFileSystem } from 'langium/node';
-import { URI } from 'langium';
+import { CancellationTokenSource, URI } from 'langium';
 import { createSafeDsServices } from '../../../src/language/index.js';
+import { ProfilingQuery, PythonServerMessage, TableProfiling } from '../../../src/language/runtime/messages.js';
 
 const services = (await createSafeDsServices(NodeFileSystem)).SafeDs;
+const pythonServer = services.runtime.PythonServer;
 const runner = services.runtime.Runner;
 
 describe('SafeDsRunner', async () => {
@@ -38,5 +40,155 @@ describe('SafeDsRunner', async () => {
                 '{"a":{"gen_b":"# Pipelines --------------------------------------------------------------------\\n\\ndef mainpipeline():\\n    pass\\n","gen_b_mainpipeline":"from .gen_b import mainpipeline\\n\\nif __name__ == \'__main__\':\\n    mainpipeline()\\n"}}',
             );
         });
+        it('should reuse the code for unchanged documents', async () => {
+            const code = 'package a\n\npipeline mainpipeline {}';
+            const document1 = services.shared.workspace.LangiumDocumentFactory.fromString(code, URI.file('/c.sdsdev'));
+            const document2 = services.shared.workspace.LangiumDocumentFactory.fromString(code, URI.file('/c.sdsdev'));
+
+            const [programCodeMap1] = runner.generateCodeForRunner(document1, undefined);
+            const [programCodeMap2] = runner.generateCodeForRunner(document2, undefined);
+            expect(programCodeMap2).toBe(programCodeMap1);
+        });
+        it('should generate code again for changed documents', async () => {
+            const document1 = services.shared.workspace.LangiumDocumentFactory.fromString(
+                'package a\n\npipeline mainpipeline {}',
+                URI.file('/d.sdsdev'),
+            );
+            const document2 = services.shared.workspace.LangiumDocumentFactory.fromString(
+                'package a\n\npipeline otherpipeline {}',
+                URI.file('/d.sdsdev'),
+            );
+
+            const [programCodeMap1] = runner.generateCodeForRunner(document1, undefined);
+            const [programCodeMap2] = runner.generateCodeForRunner(document2, undefined);
+            expect(programCodeMap2).not.toStrictEqual(programCodeMap1);
+        });
+        it('should generate code again for other target statements', async () => {
+            const document = services.shared.workspace.LangiumDocumentFactory.fromString(
+                'package a\n\npipeline mainpipeline {}',
+                URI.file('/e.sdsdev'),
+            );
+
+            const [programCodeMap1] = runner.generateCodeForRunner(document, undefined);
+            const [programCodeMap2] = runner.generateCodeForRunner(document, 0);
+            expect(programCodeMap2).not.toBe(programCodeMap1);
+        });
+    });
+    describe('getProfiling', async () => {
+        const query: ProfilingQuery = { name: 'table', histogramBins: 10, quantiles: [0.5], maxCategories: 10 };
+        const profiling: TableProfiling = { name: 'table', rowCount: 0, columns: [] };
+
+        /**
+         * Let the runner process answer the given number of profiling queries.
+         */
+        const answerProfilingQueries = (count: number) => {
+            let remaining = count;
+            return vi.spyOn(pythonServer, 'sendMessageToPythonServer').mockImplementation((message) => {
+                if (message.type === 'profiling_query' && remaining-- > 0) {
+                    const response: PythonServerMessage = { type: 'profiling', id: message.id, data: profiling };
+                    pythonServer['dispatchMessage'](response);
+                }
+            });
+        };
+
+        afterEach(() => {
+            vi.useRealTimers();
+            vi.restoreAllMocks();
+        });
+
+        it('should not query runners without the capability', async () => {
+            const sendMessage = answerProfilingQueries(1);
+
+            expect(runner.supportsProfiling()).toBeFalsy();
+            expect(await runner.getProfiling('execution', query)).toBeUndefined();
+            expect(sendMessage).not.toHaveBeenCalled();
+        });
+
+        it('should return the profiling sent by the runner', async () => {
+            vi.spyOn(pythonServer, 'supports').mockImplementation((capability) => capability === 'profiling_query');
+            answerProfilingQueries(1);
+
+            expect(runner.supportsProfiling()).toBeTruthy();
+            expect(await runner.getProfiling('execution', query)).toStrictEqual(profiling);
+        });
+
+        it('should keep using the runner after a timeout', async () => {
+            vi.useFakeTimers();
+            vi.spyOn(pythonServer, 'supports').mockImplementation((capability) => capability === 'profiling_query');
+            const sendMessage = answerProfilingQueries(0);
+
+            const result = runner.getProfiling('execution', query);
+            await vi.runAllTimersAsync();
+            expect(await result).toBeUndefined();
+
+            sendMessage.mockRestore();
+            answerProfilingQueries(1);
+
+            expect(runner.supportsProfiling()).toBeTruthy();
+            expect(await runner.getProfiling('execution', query)).toStrictEqual(profiling);
+        });
+    });
+    describe('runWithCallbacks', async () => {
+        /**
+         * Start an execution that does nothing and return the ID of the execution and whether it is finished.
+         */
+        const startExecution = async (cancelToken?: CancellationTokenSource) => {
+            let id = '';
+            const state = { isFinished: false };
+            const execution = runner
+                .runWithCallbacks(
+                    'test',
+                    async (pipelineExecutionId) => {
+                        id = pipelineExecutionId;
+                    },
+                    undefined,
+                    cancelToken?.token,
+                )
+                .then(() => {
+                    state.isFinished = true;
+                });
+
+            await vi.waitFor(() => expect(id).not.toBe(''));
+            return { id, state, execution };
+        };
+
+        beforeEach(() => {
+            vi.spyOn(runner, 'isReady').mockReturnValue(true);
+        });
+
+        afterEach(() => {
+            vi.restoreAllMocks();
+        });
+
+        it('should stay pending until the runner reports that the execution is done', async () => {
+            const { id, state, execution } = await startExecution();
+            await new Promise((resolve) => setTimeout(resolve, 10));
+            expect(state.isFinished).toBeFalsy();
+
+            pythonServer['dispatchMessage']({ type: 'runtime_progress', id, data: 'done' });
+            await execution;
+            expect(state.isFinished).toBeTruthy();
+        });
+
+        it('should finish if the execution fails', async () => {
+            const { id, execution } = await startExecution();
+            pythonServer['dispatchMessage']({
+                type: 'runtime_error',
+                id,
+                data: { message: 'error', backtrace: [] },
+            });
+            await execution;
+        });
+
+        it('should send a cancel message if the token is cancelled', async () => {
+            const sendMessage = vi.spyOn(pythonServer, 'sendMessageToPythonServer').mockImplementation(() => {});
+            const cancelTokenSource = new CancellationTokenSource();
+
+            const { id, execution } = await startExecution(cancelTokenSource);
+            cancelTokenSource.cancel();
+            await execution;
+
+            expect(sendMessage).toHaveBeenCalledWith({ type: 'cancel', id, data: '' });
+        });
     });
 });
@@ -0,0 +1,131 @@
+import { AstUtils, LangiumDocument, Scope } from 'langium';
+import { NodeFileSystem } from 'langium/node';
+import { clearDocuments, parseHelper } from 'langium/test';
+import { afterEach, describe, expect, it } from 'vitest';
+import { isSdsNamedType, SdsNamedType } from '../../../src/language/generated/ast.js';
+import { createSafeDsServices } from '../../../src/language/index.js';
+import { SafeDsScopeProvider } from '../../../src/language/scoping/safe-ds-scope-provider.js';
+
+const services = (await createSafeDsServices(NodeFileSystem)).SafeDs;
+const documentBuilder = services.shared.workspace.DocumentBuilder;
+const scopeProvider = services.references.ScopeProvider as SafeDsScopeProvider;
+
+const declaringCode = `
+package myPackage
+
+class MyClass
+`;
+
+const usingCode = (packageName: string, segmentName: string) => `
+package ${packageName}
+
+segment ${segmentName}(p: MyClass) {}
+`;
+
+describe('SafeDsScopeProvider', async () => {
+    let documents: LangiumDocument[] = [];
+
+    const parse = async (code: string): Promise<LangiumDocument> => {
+        const document = await parseHelper(services)(code);
+        documents.push(document);
+        return document;
+    };
+
+    afterEach(async () => {
+        await clearDocuments(services, documents);
+        documents = [];
+    });
+
+    describe('getGlobalScope', () => {
+        it('should share the scope of builtin declarations between documents', async () => {
+            const document1 = await parse(usingCode('myPackage', 'mySegment1'));
+            const document2 = await parse(usingCode('otherPackage', 'mySegment2'));
+
+            expect(getScopeOfBuiltins(document1)).toBe(getScopeOfBuiltins(document2));
+            expect(getScopeOfBuiltins(document1).getElement('Int')).toBeDefined();
+        });
+
+        it('should share the scope of declarations in the same package between documents', async () => {
+            await parse(declaringCode);
+            const document1 = await parse(usingCode('myPackage', 'mySegment1'));
+            const document2 = await parse(usingCode('myPackage', 'mySegment2'));
+
+            expect(getScopeOfPackage(document1)).toBe(getScopeOfPackage(document2));
+            expect(getScopeOfPackage(document1).getElement('MyClass')).toBeDefined();
+        });
+
+        it('should return the first declaration with a given name', async () => {
+            const declaring = await parse(declaringCode);
+            await parse(declaringCode);
+            const document = await parse(usingCode('myPackage', 'mySegment'));
+
+            const element = getScopeOfPackage(document).getElement('MyClass');
+            expect(element?.documentUri.toString()).toStrictEqual(declaring.uri.toString());
+        });
+
+        it('should create a new scope if a declaration is added to the package', async () => {
+            const document = await parse(usingCode('myPackage', 'mySegment'));
+            const scopeBefore = getScopeOfPackage(document);
+            expect(scopeBefore.getElement('MyClass')).toBeUndefined();
+
+            await parse(declaringCode);
+
+            const scopeAfter = getScopeOfPackage(document);
+            expect(scopeAfter).not.toBe(scopeBefore);
+            expect(scopeAfter.getElement('MyClass')).toBeDefined();
+        });
+
+        it('should create a new scope if a document of the package is deleted', async () => {
+            const declaring = await parse(declaringCode);
+            const document = await parse(usingCode('myPackage', 'mySegment'));
+            const scopeBefore = getScopeOfPackage(document);
+            expect(scopeBefore.getElement('MyClass')).toBeDefined();
+
+            await documentBuilder.update([], [declaring.uri]);
+            documents = documents.filter((it) => it !== declaring);
+
+            const scopeAfter = getScopeOfPackage(document);
+            expect(scopeAfter).not.toBe(scopeBefore);
+            expect(scopeAfter.getElement('MyClass')).toBeUndefined();
+        });
+
+        it('should not keep the scope of a document whose package lost a declaration', async () => {
+            const declaring = await parse(declaringCode);
+            const document = await parse(usingCode('myPackage', 'mySegment'));
+            const namedType = findNamedType(document);
+            const context = { reference: namedType.declaration!, container: namedType, property: 'declaration' };
+            expect(scopeProvider.getScope(context).getElement('MyClass')).toBeDefined();
+
+            await documentBuilder.update([], [declaring.uri]);
+            documents = documents.filter((it) => it !== declaring);
+
+            expect(scopeProvider.getScope(context).getElement('MyClass')).toBeUndefined();
+        });
+    });
+});
+
+const findNamedType = (document: LangiumDocument): SdsNamedType => {
+    return AstUtils.streamAst(document.parseResult.value).filter(isSdsNamedType).head()!;
+};
+
+/**
+ * Returns the part of the global scope of the named type in the given document that starts at the declarations in the
+ * same package. The scope of the explicitly imported declarations is skipped.
+ */
+const getScopeOfPackage = (document: LangiumDocument): Scope => {
+    const globalScope = scopeProvider['getGlobalScopeForNode']('SdsNamedTypeDeclaration', findNamedType(document));
+    return (globalScope as NestedScope).outerScope!;
+};
+
+/**
+ * Returns the part of the global scope of the named type in the given document that only contains the builtin
+ * declarations.
+ */
+const getScopeOfBuiltins = (document: LangiumDocument): Scope => {
+    return (getScopeOfPackage(document) as NestedScope).outerScope!;
+};
+
+/**
+ * A scope that delegates to an outer scope, like the stream and map scopes of Langium.
+ */
+type NestedScope = Scope & { outerScope?: Scope };
@@ -1,4 +1,6 @@
 import { NodeFileSystem } from 'langium/node';
+import { AstUtils } from 'langium';
+import { parseHelper } from 'langium/test';
 import { describe, expect, it } from 'vitest';
 import {
     isSdsAttribute,
@@ -530,6 +532,20 @@ describe('SafeDsClassHierarchy', async () => {
             const firstClass = await getNodeOfType(services, code, isSdsClass);
             expect(directSubclassNames(firstClass)).toStrictEqual(expected);
         });
+
+        it('should consider subclasses in other documents until they are removed', async () => {
+            const parse = parseHelper(services);
+            const parentDocument = await parse('package test; class A', { documentUri: 'file:///parent.sdsdev' });
+            const childDocument = await parse('package test; class B sub A', { documentUri: 'file:///child.sdsdev' });
+
+            const parentClass = AstUtils.streamAst(parentDocument.parseResult.value).find(isSdsClass);
+            expect(directSubclassNames(parentClass)).toStrictEqual(['B']);
+
+            await services.shared.workspace.DocumentBuilder.update([], [childDocument.uri]);
+            expect(directSubclassNames(parentClass)).toStrictEqual([]);
+
+            await services.shared.workspace.DocumentBuilder.update([], [parentDocument.uri]);
+        });
     });
 });
 
@@ -0,0 +1,73 @@
+import { NodeFileSystem } from 'langium/node';
+import { describe, expect, it } from 'vitest';
+import { isSdsClass } from '../../../src/language/generated/ast.js';
+import { createSafeDsServices, getTypeParameters } from '../../../src/language/index.js';
+import { IntConstant, NullConstant, StringConstant } from '../../../src/language/partialEvaluation/model.js';
+import { NamedTupleEntry, TypeParameterSubstitutions, UnknownType } from '../../../src/language/typing/model.js';
+import { getNodeOfType } from '../../helpers/nodeFinder.js';
+
+const services = (await createSafeDsServices(NodeFileSystem)).SafeDs;
+const factory = services.typing.TypeFactory;
+
+const code = `
+    class C1
+    class C2<T>
+`;
+const class1 = await getNodeOfType(services, code, isSdsClass, 0);
+const class2 = await getNodeOfType(services, code, isSdsClass, 1);
+const typeParameter = getTypeParameters(class2)[0]!;
+
+describe('SafeDsTypeFactory', () => {
+    describe('interning', () => {
+        it('should return the same instance for structurally equal types', () => {
+            const createType = () =>
+                factory.createUnionType(
+                    factory.createClassType(
+                        class2,
+                        new Map([[typeParameter, factory.createClassType(class1, new Map(), false)]]),
+                        true,
+                    ),
+                    factory.createLiteralType(new IntConstant(1n), NullConstant),
+                    factory.createNamedTupleType(new NamedTupleEntry(undefined, 'a', UnknownType)),
+                );
+
+            expect(createType()).toBe(createType());
+        });
+
+        it('should return different instances for different types', () => {
+            expect(factory.createClassType(class1, new Map(), false)).not.toBe(
+                factory.createClassType(class1, new Map(), true),
+            );
+        });
+
+        it('should distinguish constants with similar string representations', () => {
+            expect(factory.createLiteralType(new StringConstant('a", "b'))).not.toBe(
+                factory.createLiteralType(new StringConstant('a'), new StringConstant('b')),
+            );
+        });
+
+        it('should not be affected by later changes of the given substitutions', () => {
+            const substitutions: TypeParameterSubstitutions = new Map();
+            const type = factory.createClassType(class2, substitutions, false);
+            substitutions.set(typeParameter, UnknownType);
+
+            expect(type.substitutions.size).toBe(0);
+            expect(factory.createClassType(class2, substitutions, false)).not.toBe(type);
+        });
+    });
+
+    describe('substituteTypeParameters', () => {
+        it('should substitute type parameters and reuse the result', () => {
+            const type = factory.createClassType(
+                class2,
+                new Map([[typeParameter, factory.createTypeVariable(typeParameter, false)]]),
+                false,
+            );
+            const substitutions = new Map([[typeParameter, factory.createClassType(class1, new Map(), false)]]);
+
+            const result = factory.substituteTypeParameters(type, substitutions);
+            expect(result.toString()).toBe('C2<C1>');
+            expect(factory.substituteTypeParameters(type, new Map(substitutions))).toBe(result);
+        });
+    });
+});
@@ -0,0 +1,132 @@
+import { DocumentState, EmptyFileSystem, LangiumDocument } from 'langium';
+import { clearDocuments, parseHelper } from 'langium/test';
+import { afterEach, beforeEach, describe, expect, it, vi } from 'vitest';
+import { WorkDoneProgressReporter } from 'vscode-languageserver';
+import { TextDocument } from 'vscode-languageserver-textdocument';
+import { createSafeDsServices } from '../../../src/language/index.js';
+import { SafeDsDocumentBuilder } from '../../../src/language/workspace/safe-ds-document-builder.js';
+
+const services = (await createSafeDsServices(EmptyFileSystem, { omitBuiltins: true })).SafeDs;
+const documentBuilder = services.shared.workspace.DocumentBuilder as SafeDsDocumentBuilder;
+const messagingProvider = services.communication.MessagingProvider;
+const workspaceLock = services.shared.workspace.WorkspaceLock;
+
+const declaringCode = `
+package myPackage1
+
+class MyClass
+`;
+
+const openCode = `
+package myPackage2
+
+from myPackage1 import MyClass
+
+segment mySegment1(p: MyClass) {}
+`;
+
+const otherCode = `
+package myPackage3
+
+from myPackage1 import MyClass
+
+segment mySegment2(p: MyClass) {}
+`;
+
+describe('SafeDsDocumentBuilder', () => {
+    let declaring: LangiumDocument;
+    let open: LangiumDocument;
+    let other: LangiumDocument;
+
+    beforeEach(async () => {
+        const parse = parseHelper(services);
+        declaring = await parse(declaringCode, { validation: true });
+        open = await parse(openCode, { validation: true });
+        other = await parse(otherCode, { validation: true });
+
+        // Pretend that one document is open
+        vi.spyOn(services.shared.workspace.TextDocuments, 'all').mockReturnValue([
+            TextDocument.create(open.uri.toString(), 'safe-ds', 0, openCode),
+        ]);
+    });
+
+    afterEach(async () => {
+        vi.restoreAllMocks();
+        clearTimeout(documentBuilder['backgroundValidationTimeout']);
+        documentBuilder['deferredUris'].clear();
+        await clearDocuments(services);
+    });
+
+    describe('update', () => {
+        it('should only validate open documents right away', async () => {
+            await documentBuilder.update([], [declaring.uri]);
+
+            expect(open.state).toBe(DocumentState.Validated);
+            expect(other.state).toBeLessThan(DocumentState.Validated);
+        });
+
+        it('should not publish diagnostics of deferred documents until they are validated again', async () => {
+            // The language server publishes the diagnostics of all documents that reach this phase
+            const validatedUris: string[] = [];
+            const disposable = documentBuilder.onBuildPhase(DocumentState.Validated, (documents) => {
+                validatedUris.push(...documents.map((it) => it.uri.toString()));
+            });
+
+            try {
+                await documentBuilder.update([], [declaring.uri]);
+
+                expect(validatedUris).toContain(open.uri.toString());
+                expect(validatedUris).not.toContain(other.uri.toString());
+            } finally {
+                disposable.dispose();
+            }
+        });
+
+        it('should validate deferred documents in the background', async () => {
+            await documentBuilder.update([], [declaring.uri]);
+
+            await vi.waitFor(() => expect(other.state).toBe(DocumentState.Validated), { timeout: 5000 });
+            expect(other.diagnostics).toBeDefined();
+        });
+
+        it('should cancel the background validation if documents change again', async () => {
+            const progress = { report: vi.fn(), done: vi.fn() } as unknown as WorkDoneProgressReporter;
+            let startValidation: () => void = () => {};
+            const showProgress = vi.spyOn(messagingProvider, 'showProgress').mockReturnValue(
+                new Promise((resolve) => {
+                    startValidation = () => resolve(progress);
+                }),
+            );
+
+            await documentBuilder.update([], [declaring.uri]);
+            await vi.waitFor(() => expect(showProgress).toHaveBeenCalled(), { timeout: 5000 });
+
+            const update = workspaceLock.write((token) => documentBuilder.update([], [], token));
+            startValidation();
+            await update;
+
+            expect(other.state).toBeLessThan(DocumentState.Validated);
+            expect(progress.done).toHaveBeenCalled();
+            expect(documentBuilder['backgroundValidationTimeout']).toBeDefined();
+        });
+    });
+
+    describe('build', () => {
+        it('should validate all documents right away if validation is requested', async () => {
+            const document = await parseHelper(services)(otherCode.replace('mySegment2', 'mySegment3'));
+            await documentBuilder.build([document, other], { validation: true });
+
+            expect(document.state).toBe(DocumentState.Validated);
+            expect(other.state).toBe(DocumentState.Validated);
+            expect(documentBuilder['deferredUris'].size).toBe(0);
+        });
+
+        it('should not keep documents deferred that were validated explicitly', async () => {
+            await documentBuilder.update([], [declaring.uri]);
+            await documentBuilder.build([other], { validation: true });
+
+            expect(other.state).toBe(DocumentState.Validated);
+            expect(documentBuilder['deferredUris'].has(other.uri.toString())).toBeFalsy();
+        });
+    });
+});
@@ -0,0 +1,175 @@
+import { EmptyFileSystem, LangiumDocument, URI } from 'langium';
+import { clearDocuments, parseHelper } from 'langium/test';
+import { afterEach, beforeEach, describe, expect, it } from 'vitest';
+import { createSafeDsServices } from '../../../src/language/index.js';
+import { SdsModule } from '../../../src/language/generated/ast.js';
+import {
+    DependencyTrackedCache,
+    DependencyTrackedNodeCache,
+} from '../../../src/language/workspace/safe-ds-document-dependencies.js';
+
+const services = (await createSafeDsServices(EmptyFileSystem, { omitBuiltins: true })).SafeDs;
+const documentBuilder = services.shared.workspace.DocumentBuilder;
+const documentDependencies = services.workspace.DocumentDependencies;
+const langiumDocuments = services.shared.workspace.LangiumDocuments;
+
+const declaringDocument = `
+package myPackage1
+
+class MyClass
+`;
+
+const referencingDocument = `
+package myPackage2
+
+from myPackage1 import MyClass
+
+segment mySegment(p: MyClass) {}
+`;
+
+const transitivelyReferencingDocument = `
+package myPackage3
+
+from myPackage2 import mySegment
+
+pipeline myPipeline {
+    mySegment(1);
+}
+`;
+
+const unrelatedDocument = `
+package myPackage4
+
+class MyOtherClass
+`;
+
+describe('SafeDsDocumentDependencies', () => {
+    let declaring: string;
+    let referencing: string;
+    let transitivelyReferencing: string;
+    let unrelated: string;
+
+    beforeEach(async () => {
+        const parse = parseHelper(services);
+        const uriOf = (document: LangiumDocument) => document.uri.toString();
+
+        declaring = uriOf(await parse(declaringDocument));
+        referencing = uriOf(await parse(referencingDocument));
+        transitivelyReferencing = uriOf(await parse(transitivelyReferencingDocument));
+        unrelated = uriOf(await parse(unrelatedDocument));
+    });
+
+    afterEach(async () => {
+        await clearDocuments(services);
+    });
+
+    describe('getDependentDocuments', () => {
+        it('should return all documents that reference the given ones transitively', () => {
+            const result = documentDependencies.getDependentDocuments([declaring], 'references');
+            expect(result).toStrictEqual(new Set([declaring, referencing, transitivelyReferencing]));
+        });
+
+        it('should return all documents that can see the packages of the given ones', () => {
+            const result = documentDependencies.getDependentDocuments([declaring], 'visibility');
+            expect(result).toStrictEqual(new Set([declaring, referencing]));
+        });
+    });
+
+    describe('getReferencedDocuments', () => {
+        it('should return all documents that the given ones reference transitively', () => {
+            const result = documentDependencies.getReferencedDocuments([transitivelyReferencing]);
+            expect(result).toStrictEqual(new Set([referencing, declaring]));
+        });
+
+        it('should return an empty set for documents without references', () => {
+            const result = documentDependencies.getReferencedDocuments([unrelated]);
+            expect(result).toStrictEqual(new Set());
+        });
+    });
+
+    describe('getDocumentsInVisiblePackages', () => {
+        it('should return the given documents and all documents in their own or imported packages', () => {
+            const result = documentDependencies.getDocumentsInVisiblePackages([referencing]);
+            expect(result).toStrictEqual(new Set([referencing, declaring]));
+        });
+
+        it('should not return documents in packages that are only visible in the returned documents', () => {
+            const result = documentDependencies.getDocumentsInVisiblePackages([transitivelyReferencing]);
+            expect(result).toStrictEqual(new Set([transitivelyReferencing, referencing]));
+        });
+    });
+
+    describe('DependencyTrackedCache', () => {
+        it('should only drop entries of affected documents (references)', async () => {
+            const cache = new DependencyTrackedCache<number>(services);
+            cache.set(`${referencing}~/`, 1);
+            cache.set(`${transitivelyReferencing}~/`, 2);
+            cache.set(`${unrelated}~/`, 3);
+
+            await documentBuilder.update([], [URI.parse(declaring)]);
+
+            expect(cache.has(`${referencing}~/`)).toBeFalsy();
+            expect(cache.has(`${transitivelyReferencing}~/`)).toBeFalsy();
+            expect(cache.get(`${unrelated}~/`)).toBe(3);
+        });
+
+        it('should only drop entries of affected documents (visibility)', async () => {
+            const cache = new DependencyTrackedCache<number>(services, 'visibility');
+            cache.set(`${referencing}~/`, 1);
+            cache.set(`${transitivelyReferencing}~/`, 2);
+            cache.set(`${unrelated}~/`, 3);
+
+            await documentBuilder.update([], [URI.parse(declaring)]);
+
+            expect(cache.has(`${referencing}~/`)).toBeFalsy();
+            expect(cache.get(`${transitivelyReferencing}~/`)).toBe(2);
+            expect(cache.get(`${unrelated}~/`)).toBe(3);
+        });
+
+        it('should compute missing values with the provider', () => {
+            const cache = new DependencyTrackedCache<number>(services);
+            expect(cache.get(`${unrelated}~/`, () => 4)).toBe(4);
+            expect(cache.get(`${unrelated}~/`, () => 5)).toBe(4);
+        });
+    });
+
+    describe('DependencyTrackedNodeCache', () => {
+        const rootOf = (uri: string) => langiumDocuments.getDocument(URI.parse(uri))!.parseResult.value as SdsModule;
+
+        it('should only drop entries of affected documents', async () => {
+            const cache = new DependencyTrackedNodeCache<number>(services);
+            cache.set(rootOf(referencing), 1);
+            cache.set(rootOf(transitivelyReferencing), 2);
+            cache.set(rootOf(unrelated), 3);
+
+            await documentBuilder.update([], [URI.parse(declaring)]);
+
+            expect(cache.has(rootOf(referencing))).toBeFalsy();
+            expect(cache.has(rootOf(transitivelyReferencing))).toBeFalsy();
+            expect(cache.get(rootOf(unrelated))).toBe(3);
+        });
+
+        it('should compute missing values with the provider', () => {
+            const cache = new DependencyTrackedNodeCache<number>(services);
+            expect(cache.get(rootOf(unrelated), () => 4)).toBe(4);
+            expect(cache.get(rootOf(unrelated), () => 5)).toBe(4);
+        });
+
+        it('should drop entries that depend on an affected document', async () => {
+            const cache = new DependencyTrackedNodeCache<number>(services);
+            cache.set(rootOf(unrelated), 1);
+            cache.addDependencies(rootOf(unrelated), [rootOf(declaring).members[0]!]);
+
+            await documentBuilder.update([], [URI.parse(declaring)]);
+
+            expect(cache.has(rootOf(unrelated))).toBeFalsy();
+        });
+
+        it('should distinguish nodes of the same document', () => {
+            const cache = new DependencyTrackedNodeCache<number>(services);
+            const root = rootOf(unrelated);
+            cache.set(root, 1);
+            expect(cache.has(root.members[0]!)).toBeFalsy();
+        });
+    });
+});
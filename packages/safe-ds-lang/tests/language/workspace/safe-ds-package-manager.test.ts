@@ -114,4 +114,28 @@ describe('SafeDsPackageManager', () => {
             expect(result.map((desc) => desc.name)).toStrictEqual(['Class1', 'Class2', 'Enum1', 'Class3', 'Enum2']);
         });
     });
+
+    describe('incremental updates', () => {
+        it('should update the package structures when documents are added or deleted', async () => {
+            const enumNames = () =>
+                packageManager
+                    .getDeclarationsInPackageOrSubpackage('myPackage1', { nodeType: 'SdsEnum' })
+                    .map((desc) => desc.name);
+            expect(enumNames()).toStrictEqual(['Enum1', 'Enum2']);
+
+            const document5 = await parseHelper(services)(`
+                package myPackage1.subPackage2
+
+                enum Enum3
+            `);
+
+            expect(packageManager.hasPackage('myPackage1.subPackage2')).toBeTruthy();
+            expect(enumNames()).toStrictEqual(['Enum1', 'Enum2', 'Enum3']);
+
+            await services.shared.workspace.DocumentBuilder.update([], [document5.uri]);
+
+            expect(packageManager.hasPackage('myPackage1.subPackage2')).toBeFalsy();
+            expect(enumNames()).toStrictEqual(['Enum1', 'Enum2']);
+        });
+    });
 });
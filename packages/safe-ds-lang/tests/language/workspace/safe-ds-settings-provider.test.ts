@@ -72,4 +72,73 @@ describe('SafeDsSettingsProvider', () => {
             expect(callback).not.toHaveBeenCalled();
         });
     });
+
+    describe('getMemoizationPolicy', () => {
+        it('should return an unbounded in-memory cache by default', () => {
+            configurationProvider.updateConfiguration({
+                settings: {
+                    [languageId]: {
+                        runner: {},
+                    },
+                },
+            });
+            expect(settingsProvider.getMemoizationPolicy()).toStrictEqual({ eviction: 'lru' });
+        });
+
+        it('should convert sizes to bytes and include the disk tier if enabled', () => {
+            configurationProvider.updateConfiguration({
+                settings: {
+                    [languageId]: {
+                        runner: {
+                            memoization: {
+                                maxSizeInMegabytes: 2,
+                                eviction: 'cost_aware',
+                                diskCache: {
+                                    enabled: true,
+                                    directory: '/tmp/cache',
+                                    maxSizeInMegabytes: 0,
+                                },
+                            },
+                        },
+                    },
+                },
+            });
+            expect(settingsProvider.getMemoizationPolicy()).toStrictEqual({
+                maxBytes: 2 * 1024 * 1024,
+                eviction: 'cost_aware',
+                disk: {
+                    directory: '/tmp/cache',
+                    maxBytes: undefined,
+                },
+            });
+        });
+    });
+
+    describe('getFileReadMemoizationKey', () => {
+        it('should return the modification time by default', () => {
+            configurationProvider.updateConfiguration({
+                settings: {
+                    [languageId]: {
+                        runner: {},
+                    },
+                },
+            });
+            expect(settingsProvider.getFileReadMemoizationKey()).toBe('mtime');
+        });
+
+        it('should return the configured key', () => {
+            configurationProvider.updateConfiguration({
+                settings: {
+                    [languageId]: {
+                        runner: {
+                            memoization: {
+                                fileKey: 'content_hash',
+                            },
+                        },
+                    },
+                },
+            });
+            expect(settingsProvider.getFileReadMemoizationKey()).toBe('content_hash');
+        });
+    });
 });
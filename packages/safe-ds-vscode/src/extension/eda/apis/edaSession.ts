@@ -0,0 +1,252 @@
+import { CODEGEN_PREFIX, SafeDsServices } from '@safe-ds/lang';
+import { AstUtils, CstUtils } from 'langium';
+import crypto from 'crypto';
+import {
+    isSdsAssignment,
+    isSdsModule,
+    isSdsPipeline,
+    isSdsPlaceholder,
+    isSdsReference,
+    SdsExpression,
+    SdsModule,
+    SdsPipeline,
+    SdsStatement,
+} from '../../../../../safe-ds-lang/src/language/generated/ast.js';
+import {
+    getAssignees,
+    getModuleMembers,
+    getPackageName,
+    getStatements,
+    getTypeParameters,
+} from '../../../../../safe-ds-lang/src/language/index.js';
+import { ClassType } from '../../../../../safe-ds-lang/src/language/typing/model.js';
+
+/**
+ * The placeholders that a runner keeps for the actions of an EDA panel. Each action is sent as a delta program that
+ * only contains its new statements. Resident placeholders that it uses are declared by a cheap statement that the
+ * Python generator replaces by a load, so the cost of an action does not depend on the length of the history.
+ */
+export class EdaSession {
+    id: string = crypto.randomUUID();
+
+    /**
+     * The placeholders that the runner keeps for this session.
+     */
+    readonly residentPlaceholders = new Set<string>();
+
+    // Placeholders that were defined by delta programs of this session, keyed by their name
+    private readonly placeholders = new Map<string, SessionPlaceholder>();
+    // Maps the key of an expression to the placeholder that was last defined by it
+    private readonly placeholdersByKey = new Map<string, string>();
+    // Maps placeholders that were replaced by an alias to the resident placeholder with the same value
+    private readonly aliases = new Map<string, string>();
+
+    constructor(private readonly services: SafeDsServices) {}
+
+    /**
+     * Create the program that must be executed for the given lines. Lines that compute the same value as a resident
+     * placeholder are replaced by an alias of this placeholder. Resident placeholders that are used by the remaining
+     * lines or that are targets of the execution are declared in front of them.
+     */
+    createDeltaProgram(addedLines: string, targetPlaceholders: string[] = []): DeltaProgram {
+        const statements = this.parseStatements(addedLines);
+        const definedNames = new Set(statements.flatMap(getPlaceholderNames));
+        const referencedNames = [...targetPlaceholders];
+        const deltaLines: string[] = [];
+
+        for (const statement of statements) {
+            const placeholderName = getPlaceholderNames(statement)[0];
+            if (!isSdsAssignment(statement) || !placeholderName || !statement.expression) {
+                referencedNames.push(...getReferencedNames(statement));
+                deltaLines.push(statement.$cstNode!.text);
+                continue;
+            }
+
+            const key = this.getKey(statement.expression);
+            const residentPlaceholderName = this.placeholdersByKey.get(key);
+            let definition: string;
+            let references: string[];
+            if (residentPlaceholderName && this.residentPlaceholders.has(residentPlaceholderName)) {
+                this.aliases.set(placeholderName, residentPlaceholderName);
+                definition = `val ${placeholderName} = ${residentPlaceholderName};`;
+                references = [residentPlaceholderName];
+            } else {
+                this.placeholdersByKey.set(key, placeholderName);
+                definition = statement.$cstNode!.text;
+                references = getReferencedNames(statement);
+            }
+
+            this.placeholders.set(placeholderName, { definition, references, type: undefined });
+            referencedNames.push(...references);
+            deltaLines.push(definition);
+        }
+
+        const declarations = this.declareResidentPlaceholders(referencedNames, definedNames);
+        return {
+            imports: declarations.imports.map((it) => `${it}\n`).join(''),
+            lines: [...declarations.lines, ...deltaLines].map((it) => `${it}\n`).join(''),
+        };
+    }
+
+    /**
+     * Remember the types of the placeholders that were defined by delta programs, so they can be declared without
+     * their definition later. This must be called with the built pipeline of a delta program.
+     */
+    recordTypes(pipeline: SdsPipeline): void {
+        const typeComputer = this.services.typing.TypeComputer;
+
+        for (const placeholder of getStatements(pipeline.body).flatMap(getAssignees).filter(isSdsPlaceholder)) {
+            const sessionPlaceholder = this.placeholders.get(placeholder.name);
+            if (!sessionPlaceholder || sessionPlaceholder.type) {
+                continue;
+            }
+
+            const type = typeComputer.computeType(placeholder);
+            if (
+                type instanceof ClassType &&
+                isSdsModule(type.declaration.$container) &&
+                getTypeParameters(type.declaration).length === 0
+            ) {
+                sessionPlaceholder.type = {
+                    packageName: getPackageName(type.declaration)!,
+                    className: type.declaration.name,
+                    isNullable: type.isExplicitlyNullable,
+                };
+            }
+        }
+    }
+
+    /**
+     * Remember that the runner keeps the given placeholders.
+     */
+    markResident(placeholderNames: string[]): void {
+        placeholderNames.forEach((it) => this.residentPlaceholders.add(it));
+    }
+
+    /**
+     * Start a new session. The runner no longer keeps any placeholder for it.
+     */
+    reset(): void {
+        this.id = crypto.randomUUID();
+        this.residentPlaceholders.clear();
+        this.placeholders.clear();
+        this.placeholdersByKey.clear();
+        this.aliases.clear();
+    }
+
+    private parseStatements(lines: string): SdsStatement[] {
+        const parseResult = this.services.parser.LangiumParser.parse<SdsModule>(
+            `pipeline ${CODEGEN_PREFIX}delta {\n${lines}\n}`,
+        );
+        const pipeline = getModuleMembers(parseResult.value).find(isSdsPipeline);
+        return getStatements(pipeline?.body);
+    }
+
+    /**
+     * Create the statements that declare the given resident placeholders, unless they are already declared.
+     * Placeholders with a known type are declared by a type cast, which needs no other placeholder. All others are
+     * declared by their definition, so the placeholders it uses must be declared as well.
+     */
+    private declareResidentPlaceholders(
+        names: string[],
+        declaredNames: Set<string>,
+    ): { imports: string[]; lines: string[] } {
+        const imports: string[] = [];
+        const lines: string[] = [];
+        const typeAliases = new Map<string, string>();
+
+        const getTypeAlias = (type: DeclarableType): string => {
+            const qualifiedName = `${type.packageName}.${type.className}`;
+            if (!typeAliases.has(qualifiedName)) {
+                const alias = `${CODEGEN_PREFIX}type_${typeAliases.size}`;
+                typeAliases.set(qualifiedName, alias);
+                imports.push(`from ${type.packageName} import ${type.className} as ${alias}`);
+            }
+            return typeAliases.get(qualifiedName)!;
+        };
+
+        const declare = (name: string): void => {
+            const placeholder = this.placeholders.get(name);
+            if (declaredNames.has(name) || !placeholder || !this.residentPlaceholders.has(name)) {
+                return;
+            }
+            declaredNames.add(name);
+
+            if (placeholder.type) {
+                const typeText = getTypeAlias(placeholder.type) + (placeholder.type.isNullable ? '?' : '');
+                lines.push(`val ${name} = null as (${typeText});`);
+            } else {
+                placeholder.references.forEach(declare);
+                lines.push(placeholder.definition);
+            }
+        };
+
+        names.forEach(declare);
+        return { imports, lines };
+    }
+
+    /**
+     * Returns a key that is equal for expressions that compute the same value. It consists of the tokens of the
+     * expression, where references to placeholders that were replaced by an alias point to the resident placeholder.
+     */
+    private getKey(expression: SdsExpression): string {
+        return CstUtils.flattenCst(expression.$cstNode!)
+            .filter((leaf) => !leaf.hidden)
+            .map((leaf) => (isSdsReference(leaf.astNode) ? (this.aliases.get(leaf.text) ?? leaf.text) : leaf.text))
+            .join(' ');
+    }
+}
+
+const getPlaceholderNames = (statement: SdsStatement): string[] => {
+    if (!isSdsAssignment(statement)) {
+        return [];
+    }
+    return getAssignees(statement)
+        .filter(isSdsPlaceholder)
+        .map((it) => it.name);
+};
+
+const getReferencedNames = (statement: SdsStatement): string[] => {
+    return AstUtils.streamAst(statement)
+        .filter(isSdsReference)
+        .map((it) => it.target.$refText)
+        .toArray();
+};
+
+/**
+ * A program that only computes what an action of the EDA panel adds to the session.
+ */
+export interface DeltaProgram {
+    /**
+     * Import statements that must be added to the pipeline document.
+     */
+    imports: string;
+
+    /**
+     * Statements that must be added to the pipeline.
+     */
+    lines: string;
+}
+
+interface SessionPlaceholder {
+    /**
+     * The statement that defined the placeholder.
+     */
+    definition: string;
+
+    /**
+     * The names that the definition references.
+     */
+    references: string[];
+
+    /**
+     * The type of the placeholder, if it can be declared without the definition.
+     */
+    type: DeclarableType | undefined;
+}
+
+interface DeclarableType {
+    packageName: string;
+    className: string;
+    isNullable: boolean;
+}
@@ -7,9 +7,18 @@ import {
     NumericalFilter,
     PossibleSorts,
     Profiling,
+    ProfilingDetail,
     ProfilingDetailStatistical,
+    StatisticsMode,
     Table,
+    TableWindowSource,
 } from '@safe-ds/eda/types/state.js';
+import {
+    approximateSampleSize,
+    profilingHistogramBins,
+    profilingMaxCategories,
+    tableWindowPageSize,
+} from '@safe-ds/eda/consts.config.js';
 import { CODEGEN_PREFIX, messages, SafeDsServices } from '@safe-ds/lang';
 import { AstUtils, LangiumDocument } from 'langium';
 import * as vscode from 'vscode';
@@ -26,8 +35,16 @@ import {
     isSdsPipeline,
     isSdsStatement,
     SdsModule,
+    SdsPipeline,
 } from '../../../../../safe-ds-lang/src/language/generated/ast.js';
 import { getModuleMembers, getPlaceholderByName } from '../../../../../safe-ds-lang/src/language/index.js';
+import { LruCache } from '../lruCache.ts';
+import { EdaSession } from './edaSession.ts';
+
+/**
+ * The reason with which executions are rejected if they are cancelled.
+ */
+export const EXECUTION_CANCELLED = 'Pipeline execution cancelled';
 
 export class RunnerApi {
     services: SafeDsServices;
@@ -37,6 +54,19 @@ export class RunnerApi {
     tablePlaceholder: string;
     baseDocument: LangiumDocument | undefined;
     placeholderCounter = 0;
+    tableWindowCache = new LruCache<string, { [columnName: string]: any[] }>(64);
+    tableWindowQueues = new Map<string, Promise<unknown>>();
+
+    // In approximate mode, plots are drawn from a sample and profiling may be estimated, unless exact results are asked
+    statisticsMode: StatisticsMode = 'exact';
+
+    // If the runner supports sessions, it keeps the placeholders computed in this session, so later actions only need
+    // to compute their delta
+    session: EdaSession;
+
+    // Running executions can be cancelled, which rejects their promise with EXECUTION_CANCELLED
+    pendingExecutions = new Map<string, (reason: string) => void>(); // Maps execution ids to the reject function
+    executionIdsByHistoryId = new Map<number, string>();
 
     constructor(
         services: SafeDsServices,
@@ -50,6 +80,7 @@ export class RunnerApi {
         this.pipelineName = pipelineName;
         this.pipelineNodeEndOffset = pipelineNodeEndOffset;
         this.tablePlaceholder = tablePlaceholder;
+        this.session = new EdaSession(services);
         getPipelineDocument(this.pipelinePath).then((doc) => {
             // Get here to avoid issues because of changing file
             // Make sure to create new instance of RunnerApi if pipeline execution of fresh pipeline is needed
@@ -59,10 +90,113 @@ export class RunnerApi {
     }
 
     //#region Pipeline execution
+    /**
+     * Add lines to the pipeline and execute it. All placeholders computed by previous actions stay resident on the
+     * runner, so only a delta program with the new lines is sent (see {@link EdaSession}). Lines that compute the same
+     * value as a resident placeholder are replaced by an alias of that placeholder, so replaying the history is cheap.
+     *
+     * The execution can be cancelled with {@link cancelExecution} using the ids of the given history entries.
+     */
     private async addToAndExecutePipeline(
         pipelineExecutionId: string,
         addedLines: string,
         placeholderNames?: string[],
+        historyIds: number[] = [],
+    ): Promise<void> {
+        historyIds.forEach((historyId) => this.executionIdsByHistoryId.set(historyId, pipelineExecutionId));
+        try {
+            await this.addToAndExecutePipelineInSession(pipelineExecutionId, addedLines, placeholderNames);
+        } finally {
+            historyIds.forEach((historyId) => {
+                if (this.executionIdsByHistoryId.get(historyId) === pipelineExecutionId) {
+                    this.executionIdsByHistoryId.delete(historyId);
+                }
+            });
+        }
+    }
+
+    private async addToAndExecutePipelineInSession(
+        pipelineExecutionId: string,
+        addedLines: string,
+        placeholderNames?: string[],
+    ): Promise<void> {
+        if (!this.services.runtime.Runner.supportsSessions()) {
+            return this.executeWithAddedLines(pipelineExecutionId, addedLines, placeholderNames);
+        }
+
+        const hadResidentPlaceholders = this.session.residentPlaceholders.size > 0;
+        try {
+            await this.executeInSession(pipelineExecutionId, addedLines, placeholderNames);
+        } catch (e) {
+            if (!hadResidentPlaceholders || !isSessionMissingError(e)) {
+                throw e;
+            }
+
+            // The runner lost the session, e.g. after a restart, so we compute everything again in a new one
+            safeDsLogger.warn(`Session ${this.session.id} is missing on the runner, retrying in a new session`);
+            this.closeSession();
+            this.session.reset();
+            await this.executeInSession(pipelineExecutionId, addedLines, placeholderNames);
+        }
+    }
+
+    private async executeInSession(
+        pipelineExecutionId: string,
+        addedLines: string,
+        placeholderNames?: string[],
+    ): Promise<void> {
+        const deltaProgram = this.session.createDeltaProgram(addedLines, placeholderNames);
+        const computedPlaceholders: string[] = [];
+        const placeholderTypeCallback = (message: messages.PlaceholderTypeMessage) => {
+            if (message.id === pipelineExecutionId) {
+                computedPlaceholders.push(message.data.name);
+            }
+        };
+
+        this.services.runtime.PythonServer.addMessageCallback('placeholder_type', placeholderTypeCallback);
+        try {
+            await this.executeWithAddedLines(pipelineExecutionId, deltaProgram.lines, placeholderNames, {
+                id: this.session.id,
+                residentPlaceholders: Array.from(this.session.residentPlaceholders),
+                addedImports: deltaProgram.imports,
+                onBuilt: (pipeline) => this.session.recordTypes(pipeline),
+            });
+        } finally {
+            this.services.runtime.PythonServer.removeMessageCallback('placeholder_type', placeholderTypeCallback);
+        }
+
+        this.session.markResident(computedPlaceholders);
+    }
+
+    /**
+     * Let the runner stop the execution of the given history entry. The runner also discards the values that the
+     * execution memoized. Nothing happens if the entry is not being executed.
+     */
+    public cancelExecution(historyId: number): void {
+        const pipelineExecutionId = this.executionIdsByHistoryId.get(historyId);
+        if (!pipelineExecutionId) {
+            return;
+        }
+
+        safeDsLogger.info(`Cancelling execution of history entry ${historyId}`);
+        this.services.runtime.Runner.cancelPipelineExecution(pipelineExecutionId);
+        this.pendingExecutions.get(pipelineExecutionId)?.(EXECUTION_CANCELLED);
+    }
+
+    /**
+     * Let the runner discard all placeholders of this session.
+     */
+    public closeSession(): void {
+        if (this.services.runtime.Runner.supportsSessions()) {
+            this.services.runtime.Runner.closeSession(this.session.id);
+        }
+    }
+
+    private async executeWithAddedLines(
+        pipelineExecutionId: string,
+        addedLines: string,
+        placeholderNames?: string[],
+        session?: SessionExecution,
     ): Promise<void> {
         return new Promise(async (resolve, reject) => {
             if (!this.baseDocument) {
@@ -70,6 +204,24 @@ export class RunnerApi {
                 return;
             }
 
+            let timeout: ReturnType<typeof setTimeout> | undefined;
+            let runtimeCallback: ((message: messages.RuntimeProgressMessage) => void) | undefined;
+            let errorCallback: ((message: messages.RuntimeErrorMessage) => void) | undefined;
+            const cleanUp = () => {
+                if (runtimeCallback) {
+                    this.services.runtime.PythonServer.removeMessageCallback('runtime_progress', runtimeCallback);
+                }
+                if (errorCallback) {
+                    this.services.runtime.PythonServer.removeMessageCallback('runtime_error', errorCallback);
+                }
+                this.pendingExecutions.delete(pipelineExecutionId);
+                clearTimeout(timeout);
+            };
+            this.pendingExecutions.set(pipelineExecutionId, (reason) => {
+                cleanUp();
+                reject(reason);
+            });
+
             const documentText = this.baseDocument.textDocument.getText();
 
             const endOfPipeline = this.pipelineNodeEndOffset;
@@ -82,6 +234,16 @@ export class RunnerApi {
             const afterPipelineEnd = documentText.substring(endOfPipeline - 1);
             newDocumentText = beforePipelineEnd + addedLines + afterPipelineEnd;
 
+            // Imports must precede all module members
+            if (session?.addedImports) {
+                const firstMember = getModuleMembers(this.baseDocument.parseResult.value as SdsModule)[0];
+                const importOffset = firstMember?.$cstNode?.offset ?? 0;
+                newDocumentText =
+                    newDocumentText.substring(0, importOffset) +
+                    session.addedImports +
+                    newDocumentText.substring(importOffset);
+            }
+
             let newDoc = this.services.shared.workspace.LangiumDocumentFactory.fromString(
                 newDocumentText,
                 this.pipelinePath,
@@ -98,6 +260,7 @@ export class RunnerApi {
             let targetStatements: number[] = [];
             for (const moduleMember of getModuleMembers(newDoc.parseResult.value as SdsModule)) {
                 if (isSdsPipeline(moduleMember) && moduleMember.name === this.pipelineName) {
+                    session?.onBuilt(moduleMember);
                     for (const name of placeholderNames ?? []) {
                         const placeholder = getPlaceholderByName(moduleMember.body, name);
                         const statement = AstUtils.getContainerOfType(placeholder, isSdsStatement);
@@ -108,41 +271,54 @@ export class RunnerApi {
                 }
             }
 
-            safeDsLogger.debug(`Executing pipeline ${this.pipelineName} with added lines`);
-            await this.services.runtime.Runner.executePipeline(
-                pipelineExecutionId,
-                newDoc,
-                this.pipelineName,
-                targetStatements,
-            );
+            // The execution might have been cancelled while the document was built
+            const cancelled = !this.pendingExecutions.has(pipelineExecutionId);
+            if (!cancelled) {
+                safeDsLogger.debug(`Executing pipeline ${this.pipelineName} with added lines`);
+                await this.services.runtime.Runner.executePipeline(
+                    pipelineExecutionId,
+                    newDoc,
+                    this.pipelineName,
+                    targetStatements,
+                    session ? { id: session.id, residentPlaceholders: session.residentPlaceholders } : undefined,
+                );
+            }
 
             this.services.shared.workspace.LangiumDocuments.deleteDocument(this.pipelinePath);
             this.services.shared.workspace.LangiumDocuments.addDocument(this.baseDocument);
 
-            const runtimeCallback = (message: messages.RuntimeProgressMessage) => {
+            if (cancelled) {
+                return;
+            }
+
+            runtimeCallback = (message: messages.RuntimeProgressMessage) => {
                 if (message.id !== pipelineExecutionId) {
                     return;
                 }
                 if (message.data === 'done') {
                     safeDsLogger.debug(`Pipeline execution ${this.pipelineName} done`);
-                    this.services.runtime.PythonServer.removeMessageCallback('runtime_progress', runtimeCallback);
-                    this.services.runtime.PythonServer.removeMessageCallback('runtime_error', errorCallback);
+                    cleanUp();
                     resolve();
+                } else if (message.data === 'cancelled') {
+                    cleanUp();
+                    reject(EXECUTION_CANCELLED);
                 }
             };
-            const errorCallback = (message: messages.RuntimeErrorMessage) => {
+            errorCallback = (message: messages.RuntimeErrorMessage) => {
                 if (message.id !== pipelineExecutionId) {
                     return;
                 }
                 safeDsLogger.error(`Pipeline execution ${this.pipelineName} ran into error: ${message.data}`);
-                this.services.runtime.PythonServer.removeMessageCallback('runtime_progress', runtimeCallback);
-                this.services.runtime.PythonServer.removeMessageCallback('runtime_error', errorCallback);
+                cleanUp();
                 reject(message.data);
             };
             this.services.runtime.PythonServer.addMessageCallback('runtime_progress', runtimeCallback);
             this.services.runtime.PythonServer.addMessageCallback('runtime_error', errorCallback);
 
-            setTimeout(() => {
+            // Do not let the runner keep working on a result that nobody waits for anymore
+            timeout = setTimeout(() => {
+                this.services.runtime.Runner.cancelPipelineExecution(pipelineExecutionId);
+                cleanUp();
                 reject('Pipeline execution timed out');
             }, 3000000);
         });
@@ -180,7 +356,13 @@ export class RunnerApi {
     }
 
     //#region Helpers
-    private runnerResultToTable(tableName: string, runnerResult: any, columnIsNumeric: Map<string, boolean>): Table {
+    private runnerResultToTable(
+        tableName: string,
+        runnerResult: any,
+        columnIsNumeric: Map<string, boolean>,
+        windowSource?: TableWindowSource,
+        windowMax?: number,
+    ): Table {
         const table: Table = {
             totalRows: 0,
             name: tableName,
@@ -190,7 +372,8 @@ export class RunnerApi {
 
         let currentMax = 0;
         for (const [columnName, columnValues] of Object.entries(runnerResult)) {
-            if (!Array.isArray(columnValues)) {
+            // Columns received in the columnar format may be typed arrays
+            if (!Array.isArray(columnValues) && !ArrayBuffer.isView(columnValues)) {
                 continue;
             }
             if (currentMax < columnValues.length) {
@@ -201,7 +384,7 @@ export class RunnerApi {
 
             const column: Column = {
                 name: columnName,
-                values: columnValues,
+                values: windowSource ? Array.from(columnValues) : columnValues, // Loaded rows are added later
                 type: columnType,
                 hidden: false,
                 highlighted: false,
@@ -211,8 +394,9 @@ export class RunnerApi {
             };
             table.columns.push(column);
         }
-        table.totalRows = currentMax;
-        table.visibleRows = currentMax;
+        table.totalRows = windowMax ?? currentMax;
+        table.visibleRows = windowMax ?? currentMax;
+        table.windowSource = windowSource;
 
         return table;
     }
@@ -226,6 +410,18 @@ export class RunnerApi {
         sdsString: string;
         placeholderName: string;
     } {
+        if (this.isApproximate(historyEntry)) {
+            // Plots only show the shape of the data, so a random sample of the rows is enough
+            const samplePlaceholderName = this.genPlaceholderName('sample');
+            const sdsStringObj = this.sdsStringForHistoryEntry({ ...historyEntry, exact: true }, samplePlaceholderName);
+            return {
+                sdsString:
+                    this.sdsStringForSample(overrideTablePlaceholder ?? this.tablePlaceholder, samplePlaceholderName) +
+                    sdsStringObj.sdsString,
+                placeholderName: sdsStringObj.placeholderName,
+            };
+        }
+
         const newPlaceholderName = this.genPlaceholderName();
         switch (historyEntry.action) {
             case 'histogram':
@@ -483,46 +679,104 @@ export class RunnerApi {
         return 'val ' + newPlaceholderName + ' = ' + tablePlaceholder + `.removeColumns([${quotedColumns}]); \n`;
     }
 
+    private sdsStringForSample(tablePlaceholder: string, newPlaceholderName: string) {
+        return (
+            'val ' +
+            newPlaceholderName +
+            ' = ' +
+            tablePlaceholder +
+            '.shuffleRows().sliceRows(length = ' +
+            approximateSampleSize +
+            '); \n'
+        );
+    }
+
     private sdsStringForTableSchema(tablePlaceholder: string, newPlaceholderName: string) {
         return 'val ' + newPlaceholderName + ' = ' + tablePlaceholder + '.schema; \n';
     }
     //#endregion
 
     //#region Placeholder handling
+    /**
+     * Whether the given entry is computed on a sample of the rows, because the panel is in approximate statistics mode.
+     */
+    private isApproximate(entry: HistoryEntry | ExternalHistoryEntry): boolean {
+        return entry.type === 'external-visualizing' && this.statisticsMode === 'approximate' && !entry.exact;
+    }
+
     private genPlaceholderName(suffix?: string): string {
         // Filter out non-alphanumeric characters (allowing underscores), considering Unicode characters
         const cleanedSuffix = suffix ? suffix.replace(/[^a-zA-Z0-9_]/gu, '') : undefined;
         return CODEGEN_PREFIX + this.placeholderCounter++ + (cleanedSuffix ? '_' + cleanedSuffix : '');
     }
 
-    private async getPlaceholderValue(placeholder: string, pipelineExecutionId: string): Promise<any | undefined> {
-        return new Promise((resolve) => {
-            if (placeholder === '') {
-                resolve(undefined);
-            }
+    private async getPlaceholderValue(
+        placeholder: string,
+        pipelineExecutionId: string,
+        format: messages.PlaceholderValueFormat = 'json',
+    ): Promise<any | undefined> {
+        const placeholderValue = await this.getPlaceholder(placeholder, pipelineExecutionId, format);
+        return placeholderValue?.value;
+    }
 
-            const placeholderValueCallback = (message: messages.PlaceholderValueMessage) => {
-                if (message.id !== pipelineExecutionId || message.data.name !== placeholder) {
-                    return;
-                }
-                this.services.runtime.PythonServer.removeMessageCallback('placeholder_value', placeholderValueCallback);
-                safeDsLogger.debug(
-                    'Got placeholder value: ' + JSON.stringify(message.data.value).slice(0, 100) + '...',
-                );
-                resolve(message.data.value);
-            };
+    private async getPlaceholder(
+        placeholder: string,
+        pipelineExecutionId: string,
+        format: messages.PlaceholderValueFormat = 'json',
+        window?: { begin: number; size: number },
+    ): Promise<messages.PlaceholderValue | undefined> {
+        safeDsLogger.debug('Requesting placeholder: ' + placeholder);
+        const placeholderValue = await this.services.runtime.Runner.getPlaceholder(
+            pipelineExecutionId,
+            messages.createPlaceholderQuery(placeholder, window?.begin, window?.size, format),
+        );
+        // Avoid stringifying tables received in the columnar format, which can be huge
+        safeDsLogger.debug(`Got placeholder value: ${placeholder} of type ${placeholderValue?.type}`);
+        return placeholderValue;
+    }
 
-            this.services.runtime.PythonServer.addMessageCallback('placeholder_value', placeholderValueCallback);
+    /**
+     * Get the values of several placeholders of the same execution in a single round trip. The values are returned in
+     * the order of the placeholder names.
+     */
+    private async getPlaceholderValues(placeholders: string[], pipelineExecutionId: string): Promise<any[]> {
+        safeDsLogger.debug(`Requesting ${placeholders.length} placeholders`);
+        const placeholderValues = await this.services.runtime.Runner.getPlaceholders(
+            pipelineExecutionId,
+            placeholders.map((placeholder) => messages.createPlaceholderQuery(placeholder)),
+        );
+        return placeholderValues.map((placeholderValue) => placeholderValue?.value);
+    }
 
-            safeDsLogger.debug('Requesting placeholder: ' + placeholder);
-            this.services.runtime.PythonServer.sendMessageToPythonServer(
-                messages.createPlaceholderQueryMessage(pipelineExecutionId, placeholder),
-            );
+    /**
+     * Get a window of rows of a table placeholder. Windows are cached, so scrolling back and forth does not cause new
+     * requests.
+     */
+    private async getTableWindowValue(
+        source: TableWindowSource,
+        begin: number,
+        size: number,
+    ): Promise<messages.PlaceholderValue | undefined> {
+        // Responses are only matched by placeholder name, so windows of the same table must not be requested at once.
+        // Windows of different tables can be requested concurrently, though.
+        const queueKey = `${source.pipelineExecutionId}:${source.placeholderName}`;
+        const queue = this.tableWindowQueues.get(queueKey) ?? Promise.resolve();
+        const result = queue.then(() =>
+            this.getPlaceholder(source.placeholderName, source.pipelineExecutionId, 'columnar', { begin, size }),
+        );
 
-            setTimeout(() => {
-                resolve(undefined);
-            }, 30000);
+        const nextQueue = result.catch(() => undefined);
+        this.tableWindowQueues.set(queueKey, nextQueue);
+        nextQueue.then(() => {
+            if (this.tableWindowQueues.get(queueKey) === nextQueue) {
+                this.tableWindowQueues.delete(queueKey);
+            }
         });
+        return result;
+    }
+
+    private tableWindowCacheKey(source: TableWindowSource, begin: number, size: number): string {
+        return `${source.pipelineExecutionId}:${source.placeholderName}:${begin}:${size}`;
     }
 
     //#region Public API
@@ -535,7 +789,9 @@ export class RunnerApi {
     ): Promise<Table | undefined> {
         safeDsLogger.debug('Getting table by placeholder: ' + tableName);
 
-        const pythonTableColumns = await this.getPlaceholderValue(tableName, pipelineExecutionId);
+        const windowSource = { pipelineExecutionId, placeholderName: tableName };
+        const placeholderValue = await this.getTableWindowValue(windowSource, 0, tableWindowPageSize);
+        const pythonTableColumns = placeholderValue?.value as any;
         if (pythonTableColumns) {
             // Get Column Types
             safeDsLogger.debug('Getting column types for table: ' + tableName);
@@ -550,30 +806,237 @@ export class RunnerApi {
             }
 
             await this.addToAndExecutePipeline(pipelineExecutionId, sdsLines, placeholderNames);
+            const columnTypes = await this.getPlaceholderValues(
+                Array.from(columnNameToPlaceholderIsNumericNameMap.values()),
+                pipelineExecutionId,
+            );
             const columnIsNumeric = new Map<string, boolean>();
-            for (const [columnName, placeholderName] of columnNameToPlaceholderIsNumericNameMap) {
-                const columnType = await this.getPlaceholderValue(placeholderName, pipelineExecutionId);
-                columnIsNumeric.set(columnName, columnType as boolean);
-            }
+            Array.from(columnNameToPlaceholderIsNumericNameMap.keys()).forEach((columnName, index) => {
+                columnIsNumeric.set(columnName, columnTypes[index] as boolean);
+            });
 
-            return this.runnerResultToTable(tableName, pythonTableColumns, columnIsNumeric);
+            return this.tableFromWindowedResult(tableName, windowSource, placeholderValue!, columnIsNumeric);
         } else {
             return undefined;
         }
     }
+
+    /**
+     * Get the rows `begin` to `begin + size` of a table that was previously sent to the webview with a window source.
+     */
+    public async getTableWindow(
+        source: TableWindowSource,
+        begin: number,
+        size: number,
+    ): Promise<{ [columnName: string]: any[] } | undefined> {
+        const cacheKey = this.tableWindowCacheKey(source, begin, size);
+        const cachedColumns = this.tableWindowCache.get(cacheKey);
+        if (cachedColumns) {
+            return cachedColumns;
+        }
+
+        const placeholderValue = await this.getTableWindowValue(source, begin, size);
+        if (!placeholderValue?.value) {
+            return undefined;
+        }
+
+        const columns: { [columnName: string]: any[] } = {};
+        for (const [columnName, columnValues] of Object.entries(<any>placeholderValue.value)) {
+            if (Array.isArray(columnValues) || ArrayBuffer.isView(columnValues)) {
+                columns[columnName] = Array.from(<ArrayLike<any>>columnValues);
+            }
+        }
+        this.tableWindowCache.set(cacheKey, columns);
+        return columns;
+    }
+
+    /**
+     * Create a table from the first window of rows. If the runner did not apply the window and sent the entire table
+     * instead, the table is not loaded lazily.
+     */
+    private tableFromWindowedResult(
+        tableName: string,
+        source: TableWindowSource,
+        placeholderValue: messages.PlaceholderValue,
+        columnIsNumeric: Map<string, boolean>,
+    ): Table {
+        const window = placeholderValue.window;
+        if (!window) {
+            return this.runnerResultToTable(tableName, placeholderValue.value, columnIsNumeric);
+        }
+
+        const table = this.runnerResultToTable(tableName, placeholderValue.value, columnIsNumeric, source, window.max);
+        const columns = Object.fromEntries(table.columns.map((column) => [column.name, column.values]));
+        this.tableWindowCache.set(this.tableWindowCacheKey(source, window.begin, window.size), columns);
+        return table;
+    }
     //#endregion
 
     //#region Profiling
     public async getProfiling(
         table: Table,
         sdsLinesOverride = '',
+        exact = false,
     ): Promise<{ columnName: string; profiling: Profiling }[]> {
         safeDsLogger.debug('Getting profiling for table: ' + table.name);
+        const approximate = this.statisticsMode === 'approximate' && !exact;
 
+        // Decide before executing anything, so the pipeline is never executed twice
+        if (this.services.runtime.Runner.supportsProfiling()) {
+            return this.getProfilingFromRunner(table, sdsLinesOverride, approximate);
+        } else {
+            return this.getProfilingFromGeneratedCode(table, sdsLinesOverride, approximate);
+        }
+    }
+
+    /**
+     * Let the runner compute the statistics of all columns in a single pass over the table. The histograms are sent as
+     * counts, so the webview draws them itself. If approximate statistics are allowed, the runner may estimate them
+     * with sketches instead of keeping the values of the columns in memory.
+     */
+    private async getProfilingFromRunner(
+        table: Table,
+        sdsLinesOverride: string,
+        approximate: boolean,
+    ): Promise<{ columnName: string; profiling: Profiling }[]> {
+        const pipelineExecutionId = crypto.randomUUID();
+        await this.addToAndExecutePipeline(pipelineExecutionId, sdsLinesOverride, [table.name]);
+
+        const tableProfiling = await this.services.runtime.Runner.getProfiling(pipelineExecutionId, {
+            name: table.name,
+            histogramBins: profilingHistogramBins,
+            quantiles: [0.5],
+            maxCategories: profilingMaxCategories,
+            approximate,
+        });
+        if (!tableProfiling) {
+            throw new Error(`The runner did not send the profiling of table '${table.name}' in time.`);
+        }
+
+        return tableProfiling.columns.map((column) => ({
+            columnName: column.name,
+            profiling: {
+                ...this.columnProfilingToProfiling(column, tableProfiling.rowCount),
+                approximate: tableProfiling.approximate ?? false,
+            },
+        }));
+    }
+
+    /**
+     * Convert the statistics of a column to the profiling that is shown in the webview. The thresholds for showing
+     * category percentages, histograms or only the number of distinct values are the same as in
+     * {@link getProfilingFromGeneratedCode}.
+     */
+    private columnProfilingToProfiling(column: messages.ColumnProfiling, rowCount: number): Profiling {
+        const missingValuesRatio = rowCount === 0 ? 0 : (column.missingCount / rowCount) * 100;
+        const validRatio: ProfilingDetailStatistical = {
+            type: 'numerical',
+            name: 'Valid',
+            value: missingValuesRatio ? (100 - missingValuesRatio).toFixed(2) + '%' : '100%',
+            interpretation: 'good',
+        };
+        const missingRatio: ProfilingDetailStatistical = {
+            type: 'numerical',
+            name: 'Missing',
+            value: missingValuesRatio ? missingValuesRatio.toFixed(2) + '%' : '0%',
+            interpretation: missingValuesRatio > 0 ? 'error' : 'default',
+        };
+
+        const distinctCounts: ProfilingDetail[] = [
+            { type: 'text', value: column.distinctCount + ' Distincts', interpretation: 'default' },
+            { type: 'text', value: rowCount - column.missingCount + ' Total Valids', interpretation: 'default' },
+        ];
+
+        let other: ProfilingDetail[];
+        if (!column.isNumeric) {
+            const categories = column.categories;
+            other = [{ type: 'text', value: 'Categorical', interpretation: 'important' }];
+
+            if (categories && column.distinctCount <= 3) {
+                other.push(
+                    ...categories.map(
+                        (category): ProfilingDetail => ({
+                            type: 'numerical',
+                            name: category.value,
+                            value: ((category.count / rowCount) * 100).toFixed(2) + '%',
+                            interpretation: 'category',
+                        }),
+                    ),
+                );
+            } else if (categories && column.distinctCount <= profilingMaxCategories) {
+                other.push({
+                    type: 'histogram',
+                    value: {
+                        labels: categories.map((category) => category.value),
+                        counts: categories.map((category) => category.count),
+                    },
+                });
+            } else {
+                other.push(...distinctCounts);
+            }
+        } else {
+            other = [
+                { type: 'text', value: 'Numerical', interpretation: 'important' },
+                ...this.numericalStatistics(column),
+            ];
+
+            if (column.distinctCount > rowCount * 0.9 || !column.histogram) {
+                other.push(...distinctCounts);
+            } else {
+                const edges = column.histogram.binEdges;
+                other.push({
+                    type: 'histogram',
+                    value: {
+                        labels: column.histogram.counts.map(
+                            (_count, index) =>
+                                `${formatStatistic(edges[index]!)} - ${formatStatistic(edges[index + 1]!)}`,
+                        ),
+                        counts: column.histogram.counts,
+                    },
+                });
+            }
+        }
+
+        return { validRatio, missingRatio, other };
+    }
+
+    private numericalStatistics(column: messages.ColumnProfiling): ProfilingDetailStatistical[] {
+        const statistics: [string, number | undefined][] = [
+            ['Min', column.min],
+            ['Max', column.max],
+            ['Mean', column.mean],
+            ['Median', column.quantiles?.[0]],
+        ];
+
+        // Statistics that are not finite, like the mean of a column without valid values, are sent as null
+        return statistics.flatMap(([name, value]): ProfilingDetailStatistical[] =>
+            value === undefined || value === null
+                ? []
+                : [{ type: 'numerical', name, value: formatStatistic(value), interpretation: 'default' }],
+        );
+    }
+
+    /**
+     * Compute the profiling by generating one Safe-DS statement per column for the missing value ratio and one for the
+     * histogram. This is only used if the runner cannot profile tables itself. If approximate statistics are allowed,
+     * large tables are profiled on a random sample of their rows.
+     */
+    private async getProfilingFromGeneratedCode(
+        table: Table,
+        sdsLinesOverride: string,
+        approximate: boolean,
+    ): Promise<{ columnName: string; profiling: Profiling }[]> {
         const columns = table.columns;
 
         let sdsStrings = sdsLinesOverride;
 
+        const sampled = approximate && table.totalRows > approximateSampleSize;
+        let profiledTablePlaceholder = table.name;
+        if (sampled) {
+            profiledTablePlaceholder = this.genPlaceholderName('sample');
+            sdsStrings += this.sdsStringForSample(table.name, profiledTablePlaceholder);
+        }
+
         let placeholderNames: string[] = [];
 
         const columnNameToPlaceholderMVNameMap = new Map<string, string>(); // Mapping random placeholder name for missing value ratio back to column name
@@ -589,7 +1052,11 @@ export class RunnerApi {
             const newMvPlaceholderName = this.genPlaceholderName(column.name + '_mv');
             placeholderNames.push(newMvPlaceholderName);
             columnNameToPlaceholderMVNameMap.set(column.name, newMvPlaceholderName);
-            sdsStrings += this.sdsStringForMissingValueRatioByColumnName(column.name, table.name, newMvPlaceholderName);
+            sdsStrings += this.sdsStringForMissingValueRatioByColumnName(
+                column.name,
+                profiledTablePlaceholder,
+                newMvPlaceholderName,
+            );
 
             // Find unique values
             // TODO reevaluate when image stuck problem fixed
@@ -617,7 +1084,11 @@ export class RunnerApi {
             const newHistogramPlaceholderName = this.genPlaceholderName(column.name + '_hist');
             placeholderNames.push(newHistogramPlaceholderName);
             columnNameToPlaceholderHistogramNameMap.set(column.name, newHistogramPlaceholderName);
-            sdsStrings += this.sdsStringForHistogramByColumnName(column.name, table.name, newHistogramPlaceholderName);
+            sdsStrings += this.sdsStringForHistogramByColumnName(
+                column.name,
+                profiledTablePlaceholder,
+                newHistogramPlaceholderName,
+            );
         }
 
         // Execute with generated SDS code
@@ -628,21 +1099,27 @@ export class RunnerApi {
             throw e;
         }
 
-        // Get missing value ratio for each column
-        for (const [, placeholderName] of columnNameToPlaceholderMVNameMap) {
-            const missingValueRatio = await this.getPlaceholderValue(placeholderName, pipelineExecutionId);
+        // Get missing value ratio and histogram for each column in a single round trip
+        const mvPlaceholderNames = Array.from(columnNameToPlaceholderMVNameMap.values());
+        const histogramPlaceholderNames = Array.from(columnNameToPlaceholderHistogramNameMap.values());
+        const placeholderValues = await this.getPlaceholderValues(
+            [...mvPlaceholderNames, ...histogramPlaceholderNames],
+            pipelineExecutionId,
+        );
+
+        mvPlaceholderNames.forEach((placeholderName, index) => {
+            const missingValueRatio = placeholderValues[index];
             if (missingValueRatio) {
                 missingValueRatioMap.set(placeholderName, missingValueRatio as number);
             }
-        }
+        });
 
-        // Get histogram for each column
-        for (const [, placeholderName] of columnNameToPlaceholderHistogramNameMap) {
-            const histogram = await this.getPlaceholderValue(placeholderName, pipelineExecutionId);
+        histogramPlaceholderNames.forEach((placeholderName, index) => {
+            const histogram = placeholderValues[mvPlaceholderNames.length + index];
             if (histogram) {
                 histogramMap.set(placeholderName, histogram as Base64Image);
             }
-        }
+        });
 
         // Create profiling data
         const profiling: { columnName: string; profiling: Profiling }[] = [];
@@ -790,11 +1267,12 @@ export class RunnerApi {
             }
         }
 
-        return profiling;
+        return profiling.map((it) => ({ ...it, profiling: { ...it.profiling, approximate: sampled } }));
     }
 
     public async getFreshProfiling(
         historyEntries: HistoryEntry[],
+        exact = false,
     ): Promise<{ columnName: string; profiling: Profiling }[]> {
         let sdsLines = '';
         const filteredEntries = this.filterPastEntries(historyEntries);
@@ -821,7 +1299,7 @@ export class RunnerApi {
 
         const table = await this.getTableByPlaceholder(placeholderOverride, pipelineExecutionId, sdsLines);
         if (!table) throw new Error('Table not found');
-        return this.getProfiling(table, sdsLines);
+        return this.getProfiling(table, sdsLines, exact);
     }
     //#endregion
 
@@ -885,6 +1363,7 @@ export class RunnerApi {
                 pipelineExecutionId,
                 sdsLines,
                 placeholderNameNeeded ? [placeholderNameNeeded] : undefined,
+                [newEntry.id],
             );
         } catch (e) {
             throw e;
@@ -903,6 +1382,7 @@ export class RunnerApi {
                         type: newEntry.action,
                         columnNumber: newEntry.columnNumber,
                         imageTab: true,
+                        approximate: this.isApproximate(newEntry),
                         isInGeneration: false,
                         id: newEntry.existingTabId ?? newEntry.newTabId,
                         content: { encodedImage: image },
@@ -919,6 +1399,7 @@ export class RunnerApi {
                         type: newEntry.action,
                         columnNumber: newEntry.columnNumber,
                         imageTab: true,
+                        approximate: this.isApproximate(newEntry),
                         isInGeneration: false,
                         id: newEntry.existingTabId ?? newEntry.newTabId,
                         outdated: false,
@@ -939,6 +1420,7 @@ export class RunnerApi {
                         type: newEntry.action,
                         columnNumber: newEntry.columnNumber,
                         imageTab: true,
+                        approximate: this.isApproximate(newEntry),
                         isInGeneration: false,
                         id: newEntry.existingTabId ?? newEntry.newTabId,
                         content: { encodedImage: image, columnName: newEntry.columnName },
@@ -948,7 +1430,9 @@ export class RunnerApi {
                 };
             }
         } else if (placeholderNameNeeded) {
-            const newTable = await this.getPlaceholderValue(placeholderNameNeeded, pipelineExecutionId);
+            const windowSource = { pipelineExecutionId, placeholderName: placeholderNameNeeded };
+            const placeholderValue = await this.getTableWindowValue(windowSource, 0, tableWindowPageSize);
+            const newTable = placeholderValue?.value as any;
             // const schema = await this.getPlaceholderValue(schemaPlaceHolder, pipelineExecutionId); // Not displayable yet, waiting
 
             if (!newTable) throw new Error('Table not found');
@@ -956,9 +1440,10 @@ export class RunnerApi {
             return {
                 type: 'table',
                 historyId: newEntry.id,
-                content: this.runnerResultToTable(
+                content: this.tableFromWindowedResult(
                     this.tablePlaceholder,
-                    newTable,
+                    windowSource,
+                    placeholderValue!,
                     new Map<string, boolean>(
                         Object.keys(newTable).map((col) => [
                             col,
@@ -1022,18 +1507,42 @@ export class RunnerApi {
 
         const pipelineExecutionId = crypto.randomUUID();
         try {
-            await this.addToAndExecutePipeline(pipelineExecutionId, sdsLines, placeholderNames);
+            await this.addToAndExecutePipeline(
+                pipelineExecutionId,
+                sdsLines,
+                placeholderNames,
+                filteredEntries.map((entry) => entry.entry.id),
+            );
         } catch (e) {
             throw e;
         }
 
+        // Fetch all images in a single round trip and the first window of all tables concurrently
+        const imageEntries = filteredEntries.filter(
+            (entry) => entry.entry.type === 'external-visualizing' && entry.entry.action !== 'infoPanel',
+        );
+        const imageValues = await this.getPlaceholderValues(
+            imageEntries.map((entry) => entryIdToPlaceholderNames.get(entry.entry.id)!),
+            pipelineExecutionId,
+        );
+        const images = new Map(imageEntries.map((entry, index) => [entry.entry.id, imageValues[index]]));
+
+        const tableWindowSources = new Map<number, TableWindowSource>();
+        const tableWindowValues = new Map<number, Promise<messages.PlaceholderValue | undefined>>();
         for (const entry of filteredEntries) {
-            if (entry.entry.type === 'external-visualizing' && entry.entry.action !== 'infoPanel') {
-                const result = await this.getPlaceholderValue(
-                    entryIdToPlaceholderNames.get(entry.entry.id)!,
+            if (entry.entry.type === 'external-manipulating') {
+                const windowSource = {
                     pipelineExecutionId,
-                );
-                const image = result as Base64Image;
+                    placeholderName: entryIdToPlaceholderNames.get(entry.entry.id)!,
+                };
+                tableWindowSources.set(entry.entry.id, windowSource);
+                tableWindowValues.set(entry.entry.id, this.getTableWindowValue(windowSource, 0, tableWindowPageSize));
+            }
+        }
+
+        for (const entry of filteredEntries) {
+            if (entry.entry.type === 'external-visualizing' && entry.entry.action !== 'infoPanel') {
+                const image = images.get(entry.entry.id) as Base64Image;
 
                 if (entry.entry.columnNumber === 'none') {
                     results.push({
@@ -1044,6 +1553,7 @@ export class RunnerApi {
                             type: entry.entry.action,
                             columnNumber: entry.entry.columnNumber,
                             imageTab: true,
+                            approximate: this.isApproximate(entry.entry),
                             isInGeneration: false,
                             id: entry.entry.existingTabId ?? entry.entry.newTabId,
                             content: { encodedImage: image },
@@ -1060,6 +1570,7 @@ export class RunnerApi {
                             type: entry.entry.action,
                             columnNumber: entry.entry.columnNumber,
                             imageTab: true,
+                            approximate: this.isApproximate(entry.entry),
                             isInGeneration: false,
                             id: entry.entry.existingTabId ?? entry.entry.newTabId,
                             outdated: false,
@@ -1080,6 +1591,7 @@ export class RunnerApi {
                             type: entry.entry.action,
                             columnNumber: entry.entry.columnNumber,
                             imageTab: true,
+                            approximate: this.isApproximate(entry.entry),
                             isInGeneration: false,
                             id: entry.entry.existingTabId ?? entry.entry.newTabId,
                             content: { encodedImage: image, columnName: entry.entry.columnName },
@@ -1089,19 +1601,19 @@ export class RunnerApi {
                     });
                 }
             } else if (entry.entry.type === 'external-manipulating') {
-                const newTable = await this.getPlaceholderValue(
-                    entryIdToPlaceholderNames.get(entry.entry.id)!,
-                    pipelineExecutionId,
-                );
+                const windowSource = tableWindowSources.get(entry.entry.id)!;
+                const placeholderValue = await tableWindowValues.get(entry.entry.id);
+                const newTable = placeholderValue?.value as any;
 
                 if (!newTable) throw new Error('Table not found');
 
                 results.push({
                     type: 'table',
                     historyId: entry.entry.id,
-                    content: this.runnerResultToTable(
+                    content: this.tableFromWindowedResult(
                         this.tablePlaceholder,
-                        newTable,
+                        windowSource,
+                        placeholderValue!,
                         new Map<string, boolean>(
                             Object.keys(newTable).map((col) => [col, typeof newTable[col][0] === 'number']),
                         ), // temp until schema works as otherwise we would need another execution to get column names
@@ -1255,3 +1767,36 @@ export class RunnerApi {
     //#endregion
     //#endregion // Public API
 }
+
+const formatStatistic = (value: number): string => {
+    return Number.isInteger(value) ? value.toString() : value.toFixed(2);
+};
+
+/**
+ * Returns whether the error reports that the runner does not keep a resident placeholder of the session anymore.
+ */
+/**
+ * An execution that belongs to the session of the panel.
+ */
+interface SessionExecution {
+    id: string;
+    residentPlaceholders: string[];
+
+    /**
+     * Import statements that the delta program needs.
+     */
+    addedImports: string;
+
+    /**
+     * Called with the pipeline once the document with the added lines is built.
+     */
+    onBuilt: (pipeline: SdsPipeline) => void;
+}
+
+const isSessionMissingError = (error: unknown): boolean => {
+    return (
+        typeof error === 'object' &&
+        error !== null &&
+        (<messages.RuntimeErrorDescription>error).kind === 'session_missing'
+    );
+};
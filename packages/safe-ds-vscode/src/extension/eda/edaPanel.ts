@@ -1,9 +1,9 @@
 import * as vscode from 'vscode';
 import { ToExtensionMessage } from '@safe-ds/eda/types/messaging.js';
 import * as webviewApi from './apis/webviewApi.ts';
-import { Table } from '@safe-ds/eda/types/state.ts';
+import { StatisticsMode, Table } from '@safe-ds/eda/types/state.ts';
 import { SafeDsServices } from '@safe-ds/lang';
-import { RunnerApi } from './apis/runnerApi.ts';
+import { EXECUTION_CANCELLED, RunnerApi } from './apis/runnerApi.ts';
 import { safeDsLogger } from '../helpers/logging.js';
 
 export class EDAPanel {
@@ -107,6 +107,7 @@ export class EDAPanel {
                                     token.onCancellationRequested(() => {
                                         if (data.value.newEntry) {
                                             safeDsLogger.info('User canceled execution.');
+                                            this.runnerApi.cancelExecution(data.value.newEntry.id);
                                             webviewApi.postMessage(this.panel.webview, {
                                                 command: 'cancelRunnerExecution',
                                                 value: data.value.newEntry,
@@ -124,8 +125,17 @@ export class EDAPanel {
                         }
                     }, 1000);
 
-                    const result = await resultPromise;
-                    alreadyComplete = true;
+                    let result;
+                    try {
+                        result = await resultPromise;
+                    } catch (e) {
+                        if (e === EXECUTION_CANCELLED) {
+                            return; // The webview already discarded the entry
+                        }
+                        throw e;
+                    } finally {
+                        alreadyComplete = true;
+                    }
 
                     webviewApi.postMessage(this.panel.webview, {
                         command: 'runnerExecutionResult',
@@ -140,7 +150,10 @@ export class EDAPanel {
 
                     let alreadyComplete = false;
                     // Execute the runner
-                    const resultPromise = this.runnerApi.getFreshProfiling(data.value.historyEntries);
+                    const resultPromise = this.runnerApi.getFreshProfiling(
+                        data.value.historyEntries,
+                        data.value.exact,
+                    );
 
                     setTimeout(() => {
                         if (!alreadyComplete) {
@@ -168,6 +181,40 @@ export class EDAPanel {
                     });
                     break;
                 }
+                case 'cancelRunner': {
+                    if (!data.value) {
+                        return;
+                    }
+
+                    this.runnerApi.cancelExecution(data.value.historyId);
+                    break;
+                }
+                case 'setStatisticsMode': {
+                    if (!data.value) {
+                        return;
+                    }
+
+                    this.runnerApi.statisticsMode = data.value;
+                    break;
+                }
+                case 'getTableWindow': {
+                    if (!data.value) {
+                        return;
+                    }
+
+                    // The webview must always get an answer, so it can request rows again that could not be loaded
+                    const { source, begin, size } = data.value;
+                    const columns = await this.runnerApi.getTableWindow(source, begin, size).catch(() => undefined);
+                    if (!columns) {
+                        safeDsLogger.error(`Could not load rows ${begin} to ${begin + size} of the table.`);
+                    }
+
+                    webviewApi.postMessage(this.panel.webview, {
+                        command: 'setTableWindow',
+                        value: { source, begin, columns },
+                    });
+                    break;
+                }
                 case 'executeRunnerAll': {
                     if (!data.value) {
                         return;
@@ -196,8 +243,17 @@ export class EDAPanel {
                         }
                     }, 1000);
 
-                    const results = await resultPromise;
-                    alreadyComplete = true;
+                    let results;
+                    try {
+                        results = await resultPromise;
+                    } catch (e) {
+                        if (e === EXECUTION_CANCELLED) {
+                            return; // The webview already discarded the entries
+                        }
+                        throw e;
+                    } finally {
+                        alreadyComplete = true;
+                    }
 
                     webviewApi.postMessage(this.panel.webview, {
                         command: 'multipleRunnerExecutionResult',
@@ -240,8 +296,17 @@ export class EDAPanel {
                         }
                     }, 1000);
 
-                    const results = await resultPromise;
-                    alreadyComplete = true;
+                    let results;
+                    try {
+                        results = await resultPromise;
+                    } catch (e) {
+                        if (e === EXECUTION_CANCELLED) {
+                            return; // The webview already discarded the entries
+                        }
+                        throw e;
+                    } finally {
+                        alreadyComplete = true;
+                    }
 
                     webviewApi.postMessage(this.panel.webview, {
                         command: 'multipleRunnerExecutionResult',
@@ -282,7 +347,10 @@ export class EDAPanel {
             panel.panel.reveal(panel.column);
             panel.tableIdentifier = tableIdentifier;
             panel.startPipelineExecutionId = startPipelineExecutionId;
+            const statisticsMode = panel.runnerApi.statisticsMode;
+            panel.runnerApi.closeSession();
             panel.runnerApi = new RunnerApi(services, pipelinePath, pipelineName, pipelineNodeEndOffset, tableName);
+            panel.runnerApi.statisticsMode = statisticsMode;
             panel.tableName = tableName;
             EDAPanel.panelsMap.set(tableIdentifier, panel);
 
@@ -322,6 +390,12 @@ export class EDAPanel {
                 dark: vscode.Uri.joinPath(edaPanel.extensionUri, 'img', 'binoculars-solid.png'),
             };
             await edaPanel.waitForUpdateHtmlDone(10000);
+            edaPanel.runnerApi.statisticsMode = EDAPanel.getDefaultStatisticsMode();
+            webviewApi.postMessage(edaPanel!.panel.webview, {
+                command: 'setStatisticsMode',
+                value: edaPanel.runnerApi.statisticsMode,
+            });
+
             const table = await edaPanel.getBaseTable();
             webviewApi.postMessage(edaPanel!.panel.webview, {
                 command: 'setInitialTable',
@@ -336,6 +410,10 @@ export class EDAPanel {
             });
         }
     }
+
+    private static getDefaultStatisticsMode(): StatisticsMode {
+        return vscode.workspace.getConfiguration('safe-ds.eda').get<StatisticsMode>('statisticsMode') ?? 'exact';
+    }
     //#endregion
 
     //#region Disposal
@@ -351,6 +429,7 @@ export class EDAPanel {
     public dispose() {
         safeDsLogger.info('dispose ' + this.tableIdentifier);
         EDAPanel.panelsMap.delete(this.tableIdentifier);
+        this.runnerApi.closeSession();
 
         // Clean up our panel
         this.panel.dispose();
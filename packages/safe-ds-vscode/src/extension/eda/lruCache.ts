@@ -0,0 +1,32 @@
+/**
+ * A map with a maximum number of entries. If it is full, the least recently used entry is evicted.
+ */
+export class LruCache<K, V> {
+    // Maps iterate in insertion order, so the first key is always the least recently used one
+    private readonly entries = new Map<K, V>();
+
+    constructor(private readonly maxSize: number) {}
+
+    get(key: K): V | undefined {
+        const value = this.entries.get(key);
+        if (value !== undefined) {
+            this.entries.delete(key);
+            this.entries.set(key, value);
+        }
+        return value;
+    }
+
+    set(key: K, value: V): void {
+        this.entries.delete(key);
+        this.entries.set(key, value);
+
+        while (this.entries.size > this.maxSize) {
+            const oldestKey = this.entries.keys().next().value!;
+            this.entries.delete(oldestKey);
+        }
+    }
+
+    clear(): void {
+        this.entries.clear();
+    }
+}
@@ -0,0 +1,127 @@
+import { NodeFileSystem } from 'langium/node';
+import { parseHelper } from 'langium/test';
+import { describe, expect, it } from 'vitest';
+import { EdaSession } from '../../../src/extension/eda/apis/edaSession.ts';
+import { isSdsPipeline, SdsModule } from '../../../../safe-ds-lang/src/language/generated/ast.js';
+import { createSafeDsServices, getModuleMembers } from '../../../../safe-ds-lang/src/language/index.js';
+
+const services = (await createSafeDsServices(NodeFileSystem)).SafeDs;
+
+/**
+ * Build a pipeline with the given lines and let the session record the types of its placeholders.
+ */
+const recordTypes = async (session: EdaSession, lines: string) => {
+    const code = `
+        package test
+
+        from safeds.data.tabular.containers import Table
+
+        pipeline myPipeline {
+            val table = Table({"a": [1, 2]});
+            ${lines}
+        }
+    `;
+    const document = await parseHelper(services)(code);
+    const pipeline = getModuleMembers(document.parseResult.value as SdsModule).find(isSdsPipeline)!;
+    session.recordTypes(pipeline);
+};
+
+describe('EdaSession', () => {
+    describe('createDeltaProgram', () => {
+        it('should keep lines that compute new values', () => {
+            const session = new EdaSession(services);
+            const deltaProgram = session.createDeltaProgram('val __gen_0 = table.removeColumns(["a"]);\n');
+
+            expect(deltaProgram.imports).toBe('');
+            expect(deltaProgram.lines).toBe('val __gen_0 = table.removeColumns(["a"]);\n');
+        });
+
+        it('should replace lines that compute the value of a resident placeholder by an alias', () => {
+            const session = new EdaSession(services);
+            session.createDeltaProgram('val __gen_0 = table.removeColumns(["a"]);');
+            session.markResident(['__gen_0']);
+
+            const deltaProgram = session.createDeltaProgram(
+                'val __gen_1 = table.removeColumns(["a"]);\nval __gen_2 = __gen_1.removeColumns(["b"]);',
+            );
+            expect(deltaProgram.lines).toBe(
+                'val __gen_0 = table.removeColumns(["a"]);\n' +
+                    'val __gen_1 = __gen_0;\n' +
+                    'val __gen_2 = __gen_1.removeColumns(["b"]);\n',
+            );
+        });
+
+        it('should recognize replayed lines that use aliased placeholders', () => {
+            const session = new EdaSession(services);
+            session.createDeltaProgram('val __gen_0 = table.removeColumns(["a"]);\nval __gen_1 = __gen_0.sample();');
+            session.markResident(['__gen_0', '__gen_1']);
+
+            const deltaProgram = session.createDeltaProgram(
+                'val __gen_2 = table.removeColumns(["a"]);\nval __gen_3 = __gen_2.sample();',
+            );
+            expect(deltaProgram.lines).toContain('val __gen_3 = __gen_1;');
+        });
+
+        it('should not treat strings that look like placeholders as references', () => {
+            const session = new EdaSession(services);
+            session.createDeltaProgram(
+                'val __gen_0 = table.removeColumns(["a"]);\nval __gen_1 = table.getColumn("__gen_0");',
+            );
+            session.markResident(['__gen_0', '__gen_1']);
+
+            const deltaProgram = session.createDeltaProgram(
+                'val __gen_2 = table.removeColumns(["a"]);\nval __gen_3 = table.getColumn("__gen_2");',
+            );
+            expect(deltaProgram.lines).toContain('val __gen_3 = table.getColumn("__gen_2");');
+        });
+
+        it('should declare used resident placeholders with a known type by a type cast', async () => {
+            const session = new EdaSession(services);
+            const firstDeltaProgram = session.createDeltaProgram('val __gen_0 = table.removeColumns(["a"]);');
+            await recordTypes(session, firstDeltaProgram.lines);
+            session.markResident(['table', '__gen_0']);
+
+            const deltaProgram = session.createDeltaProgram('val __gen_1 = __gen_0.removeColumns(["b"]);');
+            expect(deltaProgram.imports).toBe('from safeds.data.tabular.containers import Table as __gen_type_0\n');
+            expect(deltaProgram.lines).toBe(
+                'val __gen_0 = null as (__gen_type_0);\nval __gen_1 = __gen_0.removeColumns(["b"]);\n',
+            );
+        });
+
+        it('should declare used resident placeholders with an unknown type by their definition', () => {
+            const session = new EdaSession(services);
+            session.createDeltaProgram('val __gen_0 = table.removeColumns(["a"]);');
+            session.markResident(['table', '__gen_0']);
+
+            const deltaProgram = session.createDeltaProgram('val __gen_1 = __gen_0.removeColumns(["b"]);');
+            expect(deltaProgram.lines).toBe(
+                'val __gen_0 = table.removeColumns(["a"]);\nval __gen_1 = __gen_0.removeColumns(["b"]);\n',
+            );
+        });
+
+        it('should declare resident targets', () => {
+            const session = new EdaSession(services);
+            session.createDeltaProgram('val __gen_0 = table.removeColumns(["a"]);');
+            session.markResident(['table', '__gen_0']);
+
+            expect(session.createDeltaProgram('', ['__gen_0']).lines).toBe(
+                'val __gen_0 = table.removeColumns(["a"]);\n',
+            );
+        });
+    });
+
+    describe('reset', () => {
+        it('should forget all resident placeholders', () => {
+            const session = new EdaSession(services);
+            const id = session.id;
+            session.createDeltaProgram('val __gen_0 = table.removeColumns(["a"]);');
+            session.markResident(['__gen_0']);
+            session.reset();
+
+            expect(session.id).not.toBe(id);
+            expect(session.createDeltaProgram('val __gen_1 = table.removeColumns(["a"]);').lines).toBe(
+                'val __gen_1 = table.removeColumns(["a"]);\n',
+            );
+        });
+    });
+});
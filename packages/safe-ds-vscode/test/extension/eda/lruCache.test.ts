@@ -0,0 +1,53 @@
+import { describe, expect, it } from 'vitest';
+import { LruCache } from '../../../src/extension/eda/lruCache.ts';
+
+describe('LruCache', () => {
+    it('should return the stored values', () => {
+        const cache = new LruCache<string, number>(2);
+        cache.set('a', 1);
+
+        expect(cache.get('a')).toBe(1);
+        expect(cache.get('b')).toBeUndefined();
+    });
+
+    it('should evict the least recently used entry once it is full', () => {
+        const cache = new LruCache<string, number>(2);
+        cache.set('a', 1);
+        cache.set('b', 2);
+        cache.set('c', 3);
+
+        expect(cache.get('a')).toBeUndefined();
+        expect(cache.get('b')).toBe(2);
+        expect(cache.get('c')).toBe(3);
+    });
+
+    it('should count reading an entry as a use', () => {
+        const cache = new LruCache<string, number>(2);
+        cache.set('a', 1);
+        cache.set('b', 2);
+        cache.get('a');
+        cache.set('c', 3);
+
+        expect(cache.get('a')).toBe(1);
+        expect(cache.get('b')).toBeUndefined();
+    });
+
+    it('should count overwriting an entry as a use', () => {
+        const cache = new LruCache<string, number>(2);
+        cache.set('a', 1);
+        cache.set('b', 2);
+        cache.set('a', 3);
+        cache.set('c', 4);
+
+        expect(cache.get('a')).toBe(3);
+        expect(cache.get('b')).toBeUndefined();
+    });
+
+    it('should remove all entries when it is cleared', () => {
+        const cache = new LruCache<string, number>(2);
+        cache.set('a', 1);
+        cache.clear();
+
+        expect(cache.get('a')).toBeUndefined();
+    });
+});